@@ -0,0 +1,40 @@
+"""grade stats drop global scope
+
+Revision ID: 2e7c9a4f1b36
+Revises: d6a1e4b8c2f7
+Create Date: 2026-10-19 09:14:27.603118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2e7c9a4f1b36'
+down_revision: Union[str, Sequence[str], None] = 'd6a1e4b8c2f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # os totais globais passam a ser a soma das linhas 'quiz'
+    op.execute("DELETE FROM grade_stats WHERE scope = 'global'")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("""
+    INSERT INTO grade_stats (
+        scope, scope_id, score_sum, attempt_count,
+        bucket_0_20, bucket_21_40, bucket_41_60, bucket_61_80, bucket_81_100
+    )
+    SELECT
+        'global', '', SUM(score_sum), SUM(attempt_count),
+        SUM(bucket_0_20), SUM(bucket_21_40), SUM(bucket_41_60), SUM(bucket_61_80), SUM(bucket_81_100)
+    FROM grade_stats
+    WHERE scope = 'quiz'
+    HAVING COUNT(*) > 0
+    """)
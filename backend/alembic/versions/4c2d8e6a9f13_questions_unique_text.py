@@ -0,0 +1,45 @@
+"""questions unique text
+
+Revision ID: 4c2d8e6a9f13
+Revises: e3a8f5c2b1d4
+Create Date: 2026-10-18 19:41:08.203517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c2d8e6a9f13'
+down_revision: Union[str, Sequence[str], None] = 'e3a8f5c2b1d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A unicidade do texto só era verificada no QuestionService. Perguntas repetidas por
+    # escritas concorrentes têm de ser resolvidas à mão (podem ter respostas): a migração
+    # falha e lista-as em vez de mexer no texto.
+    duplicates = op.get_bind().execute(sa.text("""
+        SELECT left(text, 80) AS text, count(*) AS n, string_agg(id, ', ' ORDER BY created_at, id) AS ids
+        FROM questions
+        GROUP BY text
+        HAVING count(*) > 1
+        ORDER BY n DESC, text
+    """)).all()
+    if duplicates:
+        listing = "\n".join(f"  {row.n}x {row.text!r}: {row.ids}" for row in duplicates)
+        raise RuntimeError(
+            f"questions.text has {len(duplicates)} duplicated values; rename or merge them before "
+            f"upgrading:\n{listing}"
+        )
+    # textos longos não cabem numa entrada de btree (~2.7 kB): o índice é sobre o md5
+    op.create_index('uq_questions_text_md5', 'questions', [sa.text('md5(text)')], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_questions_text_md5', table_name='questions')
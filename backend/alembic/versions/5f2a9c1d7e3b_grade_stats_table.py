@@ -0,0 +1,69 @@
+"""grade stats table
+
+Revision ID: 5f2a9c1d7e3b
+Revises: 74d9ec3da8c4
+Create Date: 2026-10-18 10:12:41.204318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f2a9c1d7e3b'
+down_revision: Union[str, Sequence[str], None] = '74d9ec3da8c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('grade_stats',
+    sa.Column('scope', sa.String(length=10), nullable=False),
+    sa.Column('scope_id', sa.String(length=36), nullable=False),
+    sa.Column('score_sum', sa.Float(), nullable=False),
+    sa.Column('attempt_count', sa.Integer(), nullable=False),
+    sa.Column('bucket_0_20', sa.Integer(), nullable=False),
+    sa.Column('bucket_21_40', sa.Integer(), nullable=False),
+    sa.Column('bucket_41_60', sa.Integer(), nullable=False),
+    sa.Column('bucket_61_80', sa.Integer(), nullable=False),
+    sa.Column('bucket_81_100', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('scope', 'scope_id')
+    )
+
+    # backfill a partir das tentativas já terminadas
+    op.execute("""
+    WITH a AS (
+        SELECT qa.score, qa.quiz_id, qa.user_id, q.course_id
+        FROM quiz_attempts qa
+        JOIN quizzes q ON q.id = qa.quiz_id
+        WHERE qa.finished_at IS NOT NULL
+    ),
+    s AS (
+        SELECT 'quiz' AS scope, quiz_id AS scope_id, score FROM a
+        UNION ALL SELECT 'course', course_id, score FROM a
+        UNION ALL SELECT 'user', user_id, score FROM a
+        UNION ALL SELECT 'global', '', score FROM a
+    )
+    INSERT INTO grade_stats (
+        scope, scope_id, score_sum, attempt_count,
+        bucket_0_20, bucket_21_40, bucket_41_60, bucket_61_80, bucket_81_100
+    )
+    SELECT
+        scope, scope_id, SUM(score), COUNT(*),
+        COUNT(*) FILTER (WHERE score <= 20),
+        COUNT(*) FILTER (WHERE score > 20 AND score <= 40),
+        COUNT(*) FILTER (WHERE score > 40 AND score <= 60),
+        COUNT(*) FILTER (WHERE score > 60 AND score <= 80),
+        COUNT(*) FILTER (WHERE score > 80)
+    FROM s
+    GROUP BY scope, scope_id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('grade_stats')
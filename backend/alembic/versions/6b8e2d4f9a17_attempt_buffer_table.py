@@ -0,0 +1,38 @@
+"""attempt buffer table
+
+Revision ID: 6b8e2d4f9a17
+Revises: 2e7c9a4f1b36
+Create Date: 2026-10-19 14:02:51.318406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6b8e2d4f9a17'
+down_revision: Union[str, Sequence[str], None] = '2e7c9a4f1b36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # buffer das respostas em curso partilhado pelos workers; UNLOGGED: sem WAL
+    op.create_table(
+        'attempt_buffer',
+        sa.Column('attempt_id', sa.String(length=36), nullable=False),
+        sa.Column('question_id', sa.String(length=36), nullable=False),
+        sa.Column('option_id', sa.String(length=36), nullable=True),
+        sa.Column('answered_at', sa.Float(), nullable=False),
+        sa.Column('leased_until', sa.Float(), server_default='0', nullable=False),
+        sa.PrimaryKeyConstraint('attempt_id', 'question_id'),
+        prefixes=['UNLOGGED'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('attempt_buffer')
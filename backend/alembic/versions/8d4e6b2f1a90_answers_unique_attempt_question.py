@@ -0,0 +1,36 @@
+"""answers unique attempt question
+
+Revision ID: 8d4e6b2f1a90
+Revises: 5f2a9c1d7e3b
+Create Date: 2026-10-18 14:03:27.518042
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d4e6b2f1a90'
+down_revision: Union[str, Sequence[str], None] = '5f2a9c1d7e3b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # remove respostas repetidas à mesma pergunta na mesma tentativa antes de criar a constraint
+    op.execute("""
+    DELETE FROM answers a
+    USING answers b
+    WHERE a.attempt_id = b.attempt_id
+      AND a.question_id = b.question_id
+      AND a.id < b.id
+    """)
+    op.create_unique_constraint('uq_answer_attempt_question', 'answers', ['attempt_id', 'question_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_answer_attempt_question', 'answers', type_='unique')
@@ -0,0 +1,48 @@
+"""trigram search indexes
+
+Revision ID: b7c1e9a4d2f6
+Revises: 8d4e6b2f1a90
+Create Date: 2026-10-18 16:21:09.204417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c1e9a4d2f6'
+down_revision: Union[str, Sequence[str], None] = '8d4e6b2f1a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (índice, tabela, coluna) pesquisados com ILIKE '%termo%' e <% (word_similarity)
+_TRGM_INDEXES = [
+    ('ix_users_name_trgm', 'users', 'name'),
+    ('ix_users_username_trgm', 'users', 'username'),
+    ('ix_users_email_trgm', 'users', 'email'),
+    ('ix_courses_title_trgm', 'courses', 'title'),
+    ('ix_quizzes_title_trgm', 'quizzes', 'title'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in _TRGM_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(_TRGM_INDEXES):
+        op.drop_index(name, table_name=table)
+    # a extensão fica: pode estar a ser usada por outros objetos da base de dados
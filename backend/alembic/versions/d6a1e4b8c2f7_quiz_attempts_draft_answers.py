@@ -0,0 +1,29 @@
+"""quiz attempts draft answers
+
+Revision ID: d6a1e4b8c2f7
+Revises: 9b3f7d1c5e28
+Create Date: 2026-10-18 22:31:16.550912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd6a1e4b8c2f7'
+down_revision: Union[str, Sequence[str], None] = '9b3f7d1c5e28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('quiz_attempts', sa.Column('draft_answers', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('quiz_attempts', 'draft_answers')
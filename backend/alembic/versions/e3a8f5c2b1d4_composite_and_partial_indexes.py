@@ -0,0 +1,67 @@
+"""composite and partial indexes
+
+Revision ID: e3a8f5c2b1d4
+Revises: b7c1e9a4d2f6
+Create Date: 2026-10-18 17:02:44.871230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a8f5c2b1d4'
+down_revision: Union[str, Sequence[str], None] = 'b7c1e9a4d2f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# keyset das listagens: ORDER BY created_at DESC, id DESC
+_KEYSET_TABLES = ['users', 'courses', 'quizzes', 'questions']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # tentativas de um user ordenadas por finished_at (list_by_user); substitui o índice só em user_id
+    op.create_index(
+        'ix_quiz_attempts_user_id_finished_at',
+        'quiz_attempts',
+        ['user_id', sa.text('finished_at DESC NULLS LAST')],
+    )
+    op.execute("DROP INDEX IF EXISTS ix_quiz_attempts_user_id")
+
+    # dashboard e grade_stats só olham para tentativas terminadas
+    op.create_index(
+        'ix_quiz_attempts_quiz_id_finished',
+        'quiz_attempts',
+        ['quiz_id', 'finished_at'],
+        postgresql_where=sa.text('finished_at IS NOT NULL'),
+    )
+    op.create_index(
+        'ix_quiz_attempts_finished_at',
+        'quiz_attempts',
+        ['finished_at'],
+        postgresql_where=sa.text('finished_at IS NOT NULL'),
+    )
+
+    # uq_answer_attempt_question (attempt_id, question_id) já serve as pesquisas por attempt_id
+    op.execute("DROP INDEX IF EXISTS ix_answers_attempt_id")
+
+    for table in _KEYSET_TABLES:
+        op.create_index(f'ix_{table}_created_at_id', table, ['created_at', 'id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(_KEYSET_TABLES):
+        op.drop_index(f'ix_{table}_created_at_id', table_name=table)
+
+    op.execute("CREATE INDEX IF NOT EXISTS ix_answers_attempt_id ON answers (attempt_id)")
+
+    op.drop_index('ix_quiz_attempts_finished_at', table_name='quiz_attempts')
+    op.drop_index('ix_quiz_attempts_quiz_id_finished', table_name='quiz_attempts')
+
+    op.execute("CREATE INDEX IF NOT EXISTS ix_quiz_attempts_user_id ON quiz_attempts (user_id)")
+    op.drop_index('ix_quiz_attempts_user_id_finished_at', table_name='quiz_attempts')
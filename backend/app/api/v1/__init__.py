@@ -20,6 +20,8 @@ from app.api.v1.routers.question_option_meta import router as question_option_me
 from app.api.v1.routers.dashboard import router as dashboard_router
 from app.api.v1.routers.badges import router as badges_router
 from app.api.v1.routers.quiz_badge_awards import router as quiz_badge_awards_router
+from app.api.v1.routers.metrics import router as metrics_router
+from app.api.v1.routers.jobs import router as jobs_router
 
 api_router = APIRouter()
 
@@ -43,4 +45,6 @@ api_router.include_router(uploads_router, prefix="/upload", tags=["Upload"])
 api_router.include_router(auth_refresh_router, prefix="/auth", tags=["Auth"])
 api_router.include_router(dashboard_router, prefix="/dashboard", tags=["Dashboard"])
 api_router.include_router(badges_router, prefix="/badges", tags=["Badges"])
-api_router.include_router(quiz_badge_awards_router, prefix="/quiz_badge_awards", tags=["Quiz Badge Awards"])
\ No newline at end of file
+api_router.include_router(quiz_badge_awards_router, prefix="/quiz_badge_awards", tags=["Quiz Badge Awards"])
+api_router.include_router(metrics_router, prefix="/metrics", tags=["Metrics"])
+api_router.include_router(jobs_router, prefix="/jobs", tags=["Jobs"])
\ No newline at end of file
@@ -1,20 +1,22 @@
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
+from app.core.config import settings
 from app.core.deps import get_db
+from app.schemas.pagination import Page
 from app.schemas.answer import AnswerCreate, AnswerUpdate, AnswerOut
 from app.services.answer_service import service as answer_service
 
 router = APIRouter()
 
 
-@router.get("/", response_model=List[AnswerOut])
+@router.get("/", response_model=Page[AnswerOut])
 async def list_answers(
     db: AsyncSession = Depends(get_db),
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=100)
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
 ):
-    return await answer_service.list(db, skip=skip, limit=limit)
+    return await answer_service.list(db, cursor=cursor, limit=limit)
 
 
 @router.get("/{answer_id}", response_model=AnswerOut)
@@ -1,23 +1,21 @@
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
+from app.core.config import settings
 from app.core.deps import get_db
+from app.schemas.pagination import Page
 from app.schemas.area import AreaCreate, AreaOut, AreaUpdate
 from app.services.area_service import service as area_service
 
 router = APIRouter()
 
-@router.get("/", response_model=List[AreaOut])
+@router.get("/", response_model=Page[AreaOut])
 async def list_areas(
     db: AsyncSession = Depends(get_db),
-    skip: int = Query(0, ge=0),
-    limit: Optional[int] = Query(None, ge=1)
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
 ):
-    return await area_service.list(
-        db,
-        skip=skip,
-        limit=limit
-    )
+    return await area_service.list(db, cursor=cursor, limit=limit)
 
 @router.get("/{area_id}", response_model=AreaOut)
 async def get_area(
@@ -1,18 +1,26 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.security import OAuth2PasswordRequestForm
 from app.core.deps import get_db
 from app.services.auth_login_service import auth_service
 from app.schemas.auth_login import UserLogin, TokenOut
 from app.core.security import get_current_user
+from app.core.rate_limit import rate_limiter, LOGIN_PER_IP, LOGIN_PER_USERNAME
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
 
-@router.post("/login", response_model=TokenOut, status_code=status.HTTP_200_OK)
-async def login(payload: UserLogin, db: AsyncSession = Depends(get_db)):
+@router.post(
+    "/login",
+    response_model=TokenOut,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(rate_limiter(LOGIN_PER_IP, LOGIN_PER_USERNAME))],
+)
+async def login(payload: UserLogin, request: Request, db: AsyncSession = Depends(get_db)):
     #login com user + pass e retorna o token jwt
-    return await auth_service.login(db, payload)
+    token = await auth_service.login(db, payload)
+    await rate_limiter.refund(request, LOGIN_PER_USERNAME)
+    return token
 
 
 @router.get("/me")
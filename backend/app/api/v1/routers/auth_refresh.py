@@ -5,7 +5,9 @@ from app.core.deps import get_db
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.crud.user_repo import UserRepository
 from sqlalchemy import select
+from sqlalchemy.orm import joinedload
 from app.models.user import User
+from app.core.rate_limit import rate_limiter, REFRESH_PER_IP
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
@@ -18,7 +20,7 @@ class TokenOutRefresh(BaseModel):
     token_type: str = "bearer"
 
 
-@router.post("/refresh", response_model=TokenOutRefresh)
+@router.post("/refresh", response_model=TokenOutRefresh, dependencies=[Depends(rate_limiter(REFRESH_PER_IP))])
 async def refresh_token(payload: RefreshIn, db: AsyncSession = Depends(get_db)):
     token = payload.refresh_token
     payload_data = decode_token(token)
@@ -32,7 +34,7 @@ async def refresh_token(payload: RefreshIn, db: AsyncSession = Depends(get_db)):
     if not user_id:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token payload")
 
-    result = await db.execute(select(User).where(User.id == user_id))
+    result = await db.execute(select(User).options(joinedload(User.role)).where(User.id == user_id))
     user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
@@ -40,6 +42,10 @@ async def refresh_token(payload: RefreshIn, db: AsyncSession = Depends(get_db)):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user")
 
     # cria novos tokens
-    access_token = create_access_token(subject=str(user.id), role_id=user.role_id)
+    access_token = create_access_token(
+        subject=str(user.id),
+        role_id=user.role_id,
+        role_name=user.role.name if user.role else None,
+    )
     new_refresh = create_refresh_token(subject=str(user.id))
     return TokenOutRefresh(access_token=access_token, refresh_token=new_refresh)
\ No newline at end of file
@@ -4,9 +4,15 @@ from app.schemas.auth_register import UserRegister
 from app.schemas.auth_login import TokenOut
 from app.services.auth_register_service import auth_register_service
 from app.core.deps import get_db
+from app.core.rate_limit import rate_limiter, REGISTER_PER_IP
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
-@router.post("/register", response_model=TokenOut, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/register",
+    response_model=TokenOut,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(rate_limiter(REGISTER_PER_IP))],
+)
 async def register(payload: UserRegister, db: AsyncSession = Depends(get_db)):
     return await auth_register_service.register_guest(db, payload)
\ No newline at end of file
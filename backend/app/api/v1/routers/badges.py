@@ -2,19 +2,21 @@ from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
+from app.core.config import settings
 from app.core.deps import get_db
+from app.schemas.pagination import Page
 from app.schemas.badge import BadgeCreate, BadgeUpdate, BadgeOut
 from app.services.badge_service import service as badge_service
 
 router = APIRouter()
 
-@router.get("/", response_model=List[BadgeOut])
+@router.get("/", response_model=Page[BadgeOut])
 async def list_badges(
     db: AsyncSession = Depends(get_db),
-    skip: int = Query(0, ge=0),
-    limit: Optional[int] = Query(None, ge=1),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
 ):
-    return await badge_service.list(db, skip=skip, limit=limit)
+    return await badge_service.list(db, cursor=cursor, limit=limit)
 
 @router.get("/{badge_id}", response_model=BadgeOut)
 async def get_badge(
@@ -2,9 +2,15 @@ from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
+from app.core.config import settings
 from app.core.deps import get_db
+from app.core.responses import ORJSONResponse
+from app.schemas.pagination import Page
 from app.schemas.course import CourseCreate, CourseUpdate, CourseOut
-from app.services.course_service import service as course_service
+from app.services.course_service import service as course_service, EXPORT_HEADER, export_row
+from app.services.job_service import service as job_service
+from app.core.security import Principal, require_roles
+from app.schemas.job import JobOut
 
 from datetime import datetime
 from app.schemas.course import StatusEnum
@@ -14,47 +20,40 @@ router = APIRouter()
 
 @router.get("/export/csv")
 async def export_courses_csv(
-    db: AsyncSession = Depends(get_db),
     q: Optional[str] = Query(None),
     area_id: Optional[str] = Query(None),
     modality_id: Optional[str] = Query(None),
     status: Optional[StatusEnum] = Query(None),
 ):
-    courses = await course_service.export(
-        db, q=q, area_id=area_id, modality_id=modality_id, status=status
+    courses = course_service.export(
+        q=q, area_id=area_id, modality_id=modality_id, status=status
     )
 
     filename = f"courses_{datetime.utcnow().strftime('%Y-%m-%d_%H-%M')}.csv"
-    header = [
-        "ID", "Título", "Descrição", "Áreas", "Modalidade", "Status",
-        "Horas", "Créditos", "Preço", "Criado em"
-    ]
+    return stream_csv(filename, EXPORT_HEADER, courses, export_row)
 
-    return stream_csv(
-        filename,
-        header,
-        courses,
-        lambda c: [
-            c.id,
-            c.title,
-            c.description or "",
-            ", ".join([a.name for a in (c.areas or [])]) if getattr(c, "areas", None) else "",
-            c.modality.name if c.modality else "",
-            c.status,
-            c.num_hours or "",
-            c.credits or "",
-            c.price or "",
-            c.created_at.isoformat() if c.created_at else "",
-        ],
-    )
+@router.post("/export/csv/jobs", response_model=JobOut, status_code=status.HTTP_202_ACCEPTED)
+async def export_courses_csv_job(
+    q: Optional[str] = Query(None),
+    area_id: Optional[str] = Query(None),
+    modality_id: Optional[str] = Query(None),
+    status: Optional[StatusEnum] = Query(None),
+    principal: Principal = Depends(require_roles("Admin")),
+    db: AsyncSession = Depends(get_db),
+):
+    # o mesmo CSV gerado em background; descarregar em GET /jobs/{id}/download
+    payload = {"q": q, "area_id": area_id, "modality_id": modality_id, "status": status.value if status else None}
+    return await job_service.enqueue(db, "courses.export_csv", payload, created_by=principal.id)
 
-@router.get("/", response_model=List[CourseOut])
+@router.get("/", response_model=Page[CourseOut])
 async def list_courses(
     db: AsyncSession = Depends(get_db),
-    skip: int = Query(0, ge=0),
-    limit: Optional[int] = Query(None, ge=1)
+    q: Optional[str] = Query(None, max_length=100, description="Pesquisa ordenada por relevância"),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
 ):
-    return await course_service.list(db, skip=skip, limit=limit)
+    page = await course_service.list(db, q=q, cursor=cursor, limit=limit)
+    return ORJSONResponse(Page[CourseOut].model_validate(page, from_attributes=True))
 
 
 @router.get("/{course_id}", response_model=CourseOut)
@@ -1,15 +1,40 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from app.services.dashboard_service import service as dashboard_service
 from app.core.deps import get_db
-from app.schemas.dashboard import SummaryOut, AverageGradeOut, LabelValue, GradeDistributionOut
+from app.core.security import Principal, require_roles
+from app.services.job_service import service as job_service
+from app.schemas.job import JobOut
+from app.schemas.dashboard import SummaryOut, AverageGradeOut, LabelValue, GradeDistributionOut, DashboardSnapshotOut
 from app.models.course import Course
 from app.models.area import Area
 from app.models.area_course import AreaCourse
 
 router = APIRouter()
 
+@router.get("/snapshot", response_model=DashboardSnapshotOut)
+async def get_snapshot(
+    course_id: str | None = None,
+    quiz_id: str | None = None,
+    role_id: str | None = None,
+    users_range: str = Query("1m", regex="^(1m|6m|1y)$"),
+    attempts_range: str = Query("1m", regex="^(1m|6m|1y)$"),
+    top_limit: int = Query(5, ge=1),
+):
+    """
+    Todos os painéis do dashboard num só pedido.
+    As queries correm em paralelo, cada uma na sua ligação do pool.
+    """
+    return await dashboard_service.get_snapshot(
+        course_id=course_id,
+        quiz_id=quiz_id,
+        role_id=role_id,
+        users_range=users_range,
+        attempts_range=attempts_range,
+        top_limit=top_limit,
+    )
+
 @router.get("/summary", response_model=SummaryOut)
 async def get_summary(db: AsyncSession = Depends(get_db)):
     return await dashboard_service.get_summary(db)
@@ -70,4 +95,14 @@ async def get_top_students(limit: int = Query(5, ge=1), db: AsyncSession = Depen
 
 @router.get("/courses-by-area", response_model=list[LabelValue])
 async def courses_by_area(db: AsyncSession = Depends(get_db)):
-    return await dashboard_service.get_courses_by_area(db)
\ No newline at end of file
+    return await dashboard_service.get_courses_by_area(db)
+
+@router.post("/rebuild-stats", response_model=JobOut, status_code=status.HTTP_202_ACCEPTED)
+async def rebuild_stats(
+    principal: Principal = Depends(require_roles("Admin")),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Recalcula os agregados do dashboard (grade_stats) a partir das tentativas, em background.
+    """
+    return await job_service.enqueue(db, "grade_stats.rebuild", {}, created_by=principal.id)
\ No newline at end of file
@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.deps import get_db
+from app.core.security import Principal, get_current_principal
+from app.schemas.job import JobOut
+from app.services.job_service import service as job_service
+
+router = APIRouter()
+
+
+@router.get("/{job_id}", response_model=JobOut)
+async def get_job(
+    job_id: str,
+    principal: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_db),
+):
+    # estado e progresso (0..1); o cliente faz polling até succeeded/failed
+    return await job_service.get(db, job_id, principal)
+
+
+@router.get("/{job_id}/download")
+async def download_job_file(
+    job_id: str,
+    principal: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_db),
+):
+    path, filename = await job_service.get_file(db, job_id, principal)
+    return FileResponse(path, filename=filename)
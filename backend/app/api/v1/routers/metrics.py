@@ -0,0 +1,94 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.db.session import engine
+from app.db.pool_metrics import pool_stats
+from app.core.passwords import password_hasher
+from app.core.observability import route_metrics
+from app.core.rate_limit import rate_limiter
+from app.core.jobs import job_runner
+from app.core.attempt_buffer import attempt_buffer
+
+router = APIRouter()
+
+
+def _labels(**labels) -> str:
+    def escape(value) -> str:
+        return str(value).replace("\\", "\\\\").replace('"', '\\"')
+
+    return "{" + ",".join(f'{k}="{escape(v)}"' for k, v in labels.items()) + "}"
+
+
+@router.get("", response_class=PlainTextResponse)
+async def get_prometheus_metrics():
+    # formato de exposição de texto do Prometheus (scrape em /api/v1/metrics)
+    lines: list[str] = []
+
+    lines.append("# TYPE http_requests_total counter")
+    for (method, route, status_code), count in sorted(route_metrics.requests.items()):
+        lines.append(f"http_requests_total{_labels(method=method, route=route, status=status_code)} {count}")
+
+    lines.append("# TYPE http_request_duration_seconds histogram")
+    for (method, route), hist in sorted(route_metrics.latency.items()):
+        for upper, count in hist.cumulative():
+            lines.append(f"http_request_duration_seconds_bucket{_labels(method=method, route=route, le=upper)} {count}")
+        lines.append(f"http_request_duration_seconds_sum{_labels(method=method, route=route)} {hist.sum:.6f}")
+        lines.append(f"http_request_duration_seconds_count{_labels(method=method, route=route)} {hist.count}")
+
+    lines.append("# TYPE db_queries_total counter")
+    for (method, route), count in sorted(route_metrics.queries.items()):
+        lines.append(f"db_queries_total{_labels(method=method, route=route)} {count}")
+
+    lines.append("# TYPE db_query_duration_seconds_total counter")
+    for (method, route), seconds in sorted(route_metrics.db_time.items()):
+        lines.append(f"db_query_duration_seconds_total{_labels(method=method, route=route)} {seconds:.6f}")
+
+    pool = pool_stats(engine.sync_engine.pool)
+    for key in ("size", "checked_out", "checked_in", "overflow"):
+        lines.append(f"# TYPE db_pool_{key} gauge")
+        lines.append(f"db_pool_{key} {pool[key]}")
+    lines.append("# TYPE db_pool_checkout_timeouts_total counter")
+    lines.append(f"db_pool_checkout_timeouts_total {pool['checkout_timeouts']}")
+    lines.append("# TYPE db_pool_wait_seconds histogram")
+    for upper, count in pool["wait_seconds_buckets"].items():
+        lines.append(f"db_pool_wait_seconds_bucket{_labels(le=upper)} {count}")
+    lines.append(f"db_pool_wait_seconds_sum {pool['wait_seconds_sum']}")
+    lines.append(f"db_pool_wait_seconds_count {pool['checkouts']}")
+
+    hasher = password_hasher.stats()
+    for key in ("in_flight", "queue_depth"):
+        lines.append(f"# TYPE password_hasher_{key} gauge")
+        lines.append(f"password_hasher_{key} {hasher[key]}")
+    for key in ("completed", "rejected"):
+        lines.append(f"# TYPE password_hasher_{key}_total counter")
+        lines.append(f"password_hasher_{key}_total {hasher[key]}")
+
+    lines.append("# TYPE rate_limit_rejected_total counter")
+    for name, count in sorted(rate_limiter.rejected.items()):
+        lines.append(f"rate_limit_rejected_total{_labels(policy=name)} {count}")
+
+    jobs = job_runner.stats()
+    lines.append("# TYPE jobs_running gauge")
+    for name, count in sorted(jobs["running"].items()):
+        lines.append(f"jobs_running{_labels(type=name)} {count}")
+    lines.append("# TYPE jobs_finished_total counter")
+    for (name, outcome), count in sorted(jobs["finished"].items()):
+        lines.append(f"jobs_finished_total{_labels(type=name, outcome=outcome)} {count}")
+
+    buffer = attempt_buffer.stats()
+    lines.append("# TYPE attempt_buffer_checkpointed_total counter")
+    lines.append(f"attempt_buffer_checkpointed_total {buffer['checkpointed']}")
+    lines.append("# TYPE attempt_buffer_skipped_total counter")
+    lines.append(f"attempt_buffer_skipped_total {buffer['skipped']}")
+    lines.append("# TYPE attempt_buffer_flush_errors_total counter")
+    lines.append(f"attempt_buffer_flush_errors_total {buffer['flush_errors']}")
+
+    return "\n".join(lines) + "\n"
+
+
+@router.get("/pool")
+async def get_pool_metrics():
+    return {
+        "db_pool": pool_stats(engine.sync_engine.pool),
+        "password_hasher": password_hasher.stats(),
+    }
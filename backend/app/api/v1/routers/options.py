@@ -1,20 +1,22 @@
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
+from app.core.config import settings
 from app.core.deps import get_db
+from app.schemas.pagination import Page
 from app.schemas.option import OptionCreate, OptionOut, OptionUpdate
 from app.services.option_service import service as option_service
 
 router = APIRouter()
 
 
-@router.get("/", response_model=List[OptionOut])
+@router.get("/", response_model=Page[OptionOut])
 async def list_options(
     db: AsyncSession = Depends(get_db),
-    skip: int = Query(0, ge=0),
-    limit: Optional[int] = Query(None, ge=1)
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
 ):
-    return await option_service.list(db, skip=skip, limit=limit)
+    return await option_service.list(db, cursor=cursor, limit=limit)
 
 
 @router.get("/{option_id}", response_model=OptionOut)
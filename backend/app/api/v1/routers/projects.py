@@ -1,20 +1,22 @@
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
+from app.core.config import settings
 from app.core.deps import get_db
+from app.schemas.pagination import Page
 from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectOut
 from app.services.project_service import service as project_service
 
 router = APIRouter()
 
 
-@router.get("/", response_model=List[ProjectOut])
+@router.get("/", response_model=Page[ProjectOut])
 async def list_projects(
     db: AsyncSession = Depends(get_db),
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=100)
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
 ):
-    return await project_service.list(db, skip=skip, limit=limit)
+    return await project_service.list(db, cursor=cursor, limit=limit)
 
 
 @router.get("/{project_id}", response_model=ProjectOut)
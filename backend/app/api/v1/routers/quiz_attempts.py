@@ -1,21 +1,24 @@
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
+from app.core.config import settings
 from app.core.deps import get_db
+from app.schemas.pagination import Page
 from app.schemas.quiz_attempt import QuizAttemptCreate, QuizAttemptUpdate, QuizAttemptOut
 from app.services.quiz_attempt_service import service as quiz_attempt_service
 from app.schemas.quiz_attempt_finish import QuizAttemptFinishOut
+from app.schemas.quiz_attempt_answers import AttemptAnswersIn, AttemptAnswersOut, AttemptDraftIn, AttemptDraftOut
 
 router = APIRouter()
 
 
-@router.get("/", response_model=List[QuizAttemptOut])
+@router.get("/", response_model=Page[QuizAttemptOut])
 async def list_quiz_attempts(
     db: AsyncSession = Depends(get_db),
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=100)
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
 ):
-    return await quiz_attempt_service.list(db, skip=skip, limit=limit)
+    return await quiz_attempt_service.list(db, cursor=cursor, limit=limit)
 
 
 @router.get("/{attempt_id}", response_model=QuizAttemptOut)
@@ -74,4 +77,44 @@ async def finish_attempt(attempt_id: str, db: AsyncSession = Depends(get_db)):
     return {
         "attempt": attempt,
         "badge_awarded": badge, 
-    }
\ No newline at end of file
+    }
+
+
+@router.post("/{attempt_id}/answers", response_model=AttemptAnswersOut)
+async def submit_attempt_answers(
+    attempt_id: str,
+    payload: AttemptAnswersIn,
+    db: AsyncSession = Depends(get_db),
+):
+    answers, attempt, badge = await quiz_attempt_service.submit_answers(
+        db,
+        attempt_id,
+        [(a.question_id, a.option_id) for a in payload.answers],
+        finish=payload.finish,
+    )
+
+    return {
+        "answers": answers,
+        "attempt": attempt,
+        "badge_awarded": badge,
+    }
+
+
+@router.put("/{attempt_id}/draft", status_code=status.HTTP_204_NO_CONTENT)
+async def save_attempt_draft(
+    attempt_id: str,
+    payload: AttemptDraftIn,
+    db: AsyncSession = Depends(get_db),
+):
+    # respostas em curso (trocar de opção durante o exame); só vão para answers no finish
+    await quiz_attempt_service.save_draft(
+        db,
+        attempt_id,
+        [(a.question_id, a.option_id) for a in payload.answers],
+    )
+    return None
+
+
+@router.get("/{attempt_id}/draft", response_model=AttemptDraftOut)
+async def get_attempt_draft(attempt_id: str, db: AsyncSession = Depends(get_db)):
+    return await quiz_attempt_service.get_draft(db, attempt_id)
@@ -2,19 +2,21 @@ from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
+from app.core.config import settings
 from app.core.deps import get_db
+from app.schemas.pagination import Page
 from app.schemas.quiz_badge_award import QuizBadgeAwardCreate, QuizBadgeAwardOut
 from app.services.quiz_badge_award_service import service as award_service
 
 router = APIRouter()
 
-@router.get("/", response_model=List[QuizBadgeAwardOut])
+@router.get("/", response_model=Page[QuizBadgeAwardOut])
 async def list_awards(
     db: AsyncSession = Depends(get_db),
-    skip: int = Query(0, ge=0),
-    limit: Optional[int] = Query(None, ge=1),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
 ):
-    return await award_service.list(db, skip=skip, limit=limit)
+    return await award_service.list(db, cursor=cursor, limit=limit)
 
 @router.get("/by_user/{user_id}", response_model=List[QuizBadgeAwardOut])
 async def list_by_user(
@@ -1,23 +1,26 @@
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
+from app.core.config import settings
 from app.core.deps import get_db
+from app.core.responses import ORJSONResponse
+from app.schemas.pagination import Page
 from app.schemas.quiz import QuizCreate, QuizOut, QuizUpdate
 from app.services.quiz_service import service as quiz_service
-from app.core.security import get_current_user
-from app.models.user import User
+from app.core.security import get_current_principal, Principal
 from app.schemas.quiz_full import QuizFullOut
 
 router = APIRouter()
 
 
-@router.get("/", response_model=List[QuizOut])
+@router.get("/", response_model=Page[QuizOut])
 async def list_quizzes(
     db: AsyncSession = Depends(get_db),
-    skip: int = Query(0, ge=0),
-    limit: Optional[int] = Query(None, ge=1),
+    q: Optional[str] = Query(None, max_length=100, description="Pesquisa ordenada por relevância"),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
 ):
-    return await quiz_service.list(db, skip=skip, limit=limit)
+    return await quiz_service.list(db, q=q, cursor=cursor, limit=limit)
 
 
 @router.get("/{quiz_id}", response_model=QuizOut)
@@ -32,7 +35,7 @@ async def get_quiz(
 async def create_quiz(
     payload: QuizCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)   
+    current_user: Principal = Depends(get_current_principal)
 ):
     return await quiz_service.create(
         db,
@@ -50,7 +53,7 @@ async def update_quiz(
     quiz_id: str,
     payload: QuizUpdate,
     db: AsyncSession = Depends(get_db),
-    #current_user: User = Depends(get_current_user)
+    #current_user: Principal = Depends(get_current_principal)
 ):
 
     return await quiz_service.update(
@@ -82,9 +85,19 @@ async def get_quiz_by_course(
 @router.get("/{quiz_id}/full", response_model=QuizFullOut)
 async def get_quiz_full(
     quiz_id: str,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
-    return await quiz_service.get_full(db, quiz_id)
+    etag, body = await quiz_service.get_full_json(db, quiz_id)
+    # no-cache: o browser guarda a resposta mas revalida sempre com If-None-Match
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if_none_match = request.headers.get("if-none-match", "")
+    candidates = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+    if etag in candidates or "*" in candidates:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return ORJSONResponse(body, headers=headers)
 
 @router.get("/active_by_course/{course_id}", response_model=QuizOut | None)
 async def get_active_quiz_by_course(
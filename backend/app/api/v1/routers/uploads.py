@@ -1,7 +1,10 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, UploadFile, File, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
+from app.core.deps import get_db
+from app.services.job_service import service as job_service
+from app.utils.media import save_upload, thumbnail_name
 import os
-import uuid
 from typing import Literal
 
 router = APIRouter()
@@ -9,27 +12,18 @@ router = APIRouter()
 @router.post("/{kind}", summary="Upload de imagem (curso, usuário, etc)")
 async def upload_image(
     kind: Literal["courses", "users"],  
-    file: UploadFile = File(...)
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_db),
 ):
-    if file.content_type not in ("image/jpeg", "image/png", "image/webp"):
-        raise HTTPException(status_code=400, detail="Formato de imagem inválido")
-
-    ext = os.path.splitext(file.filename or "")[1].lower()
-    if ext not in (".jpg", ".jpeg", ".png", ".webp"):
-        ext = ".jpg"
-
-    filename = f"{uuid.uuid4().hex}{ext}"
-
     upload_dir = os.path.join(settings.MEDIA_ROOT, kind)
-    os.makedirs(upload_dir, exist_ok=True)
-
-    file_path = os.path.join(upload_dir, filename)
+    filename = await save_upload(file, upload_dir, settings.MEDIA_MAX_UPLOAD_BYTES)
 
-    contents = await file.read()
-    with open(file_path, "wb") as f:
-        f.write(contents)
+    # miniaturas geradas num job em background (não se perdem num restart do processo)
+    sizes = settings.MEDIA_THUMBNAIL_SIZES
+    await job_service.enqueue(db, "media.thumbnails", {"upload_dir": upload_dir, "filename": filename, "sizes": sizes})
 
     base = settings.MEDIA_URL.rstrip("/")  
     url = f"{base}/{kind}/{filename}"
+    thumbnails = {str(size): f"{base}/{kind}/{thumbnail_name(filename, size)}" for size in sizes}
 
-    return {"url": url}
\ No newline at end of file
+    return {"url": url, "thumbnails": thumbnails}
@@ -1,52 +1,122 @@
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Body, Depends, File, HTTPException, Query, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Optional
+from typing import Any, List, Optional
 from datetime import datetime
 
+from app.core.config import settings
 from app.core.deps import get_db
-from app.schemas.user import UserCreate, UserUpdate, UserOut, StatusEnum
-from app.services.user_service import service as user_service
+from app.core.responses import ORJSONResponse
+from app.schemas.pagination import Page
+from app.core.security import Principal, require_roles
+from app.schemas.job import JobOut
+from app.schemas.user import UserCreate, UserUpdate, UserOut, StatusEnum, UserImportReport
+from app.services.user_service import service as user_service, EXPORT_HEADER, export_row
+from app.services.job_service import service as job_service
 from app.utils.csv_export import stream_csv
+from app.utils.csv_import import read_csv_rows
 
 router = APIRouter()
 
-@router.get("/", response_model=List[UserOut])
+# cabeçalhos aceites na importação CSV: os do export e os nomes dos campos
+IMPORT_COLUMNS = {
+    "nome": "name", "name": "name",
+    "username": "username",
+    "email": "email",
+    "função": "role", "role": "role", "role_id": "role_id",
+    "status": "status",
+    "gênero": "gender", "gender": "gender",
+    "nascimento": "birthdate", "birthdate": "birthdate",
+    "password": "password", "palavra-passe": "password",
+    "photo": "photo",
+}
+
+@router.get("/", response_model=Page[UserOut])
 async def list_users(
     db: AsyncSession = Depends(get_db),
-    skip: int = Query(0, ge=0),
-    limit: Optional[int] = Query(None, ge=1),
+    q: Optional[str] = Query(None, max_length=100, description="Pesquisa ordenada por relevância"),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
 ):
-    return await user_service.list(db, skip=skip, limit=limit)
+    page = await user_service.list(db, q=q, cursor=cursor, limit=limit)
+    return ORJSONResponse(Page[UserOut].model_validate(page, from_attributes=True))
 
 @router.get("/export/csv")
 async def export_users_csv(
-    db: AsyncSession = Depends(get_db),
     q: Optional[str] = Query(None),
     role_id: Optional[str] = Query(None),
     status: Optional[StatusEnum] = Query(None),
 ):
-    users = await user_service.export(db, q=q, role_id=role_id, status=status)
+    users = user_service.export(q=q, role_id=role_id, status=status)
 
     filename = f"users_{datetime.utcnow().strftime('%Y-%m-%d_%H-%M')}.csv"
-    header = ["ID", "Nome", "Username", "Email", "Função", "Status", "Gênero", "Nascimento", "Criado em"]
-
-
-    return stream_csv(
-        filename,
-        header,
-        users,
-        lambda u: [
-            u.id,
-            u.name,
-            u.username,
-            u.email,
-            (u.role.name if u.role else "Guest"),
-            u.status,
-            u.gender or "",
-            u.birthdate.isoformat() if u.birthdate else "",
-            u.created_at.isoformat() if u.created_at else "",
-        ],
-    )
+    return stream_csv(filename, EXPORT_HEADER, users, export_row)
+
+@router.post("/export/csv/jobs", response_model=JobOut, status_code=status.HTTP_202_ACCEPTED)
+async def export_users_csv_job(
+    q: Optional[str] = Query(None),
+    role_id: Optional[str] = Query(None),
+    status: Optional[StatusEnum] = Query(None),
+    principal: Principal = Depends(require_roles("Admin")),
+    db: AsyncSession = Depends(get_db),
+):
+    # o mesmo CSV gerado em background; descarregar em GET /jobs/{id}/download
+    payload = {"q": q, "role_id": role_id, "status": status.value if status else None}
+    return await job_service.enqueue(db, "users.export_csv", payload, created_by=principal.id)
+
+async def _read_import_csv(file: UploadFile) -> list[dict[str, str]]:
+    # o mesmo formato do /export/csv, mais uma coluna com a password
+    data = await file.read(settings.USER_IMPORT_MAX_BYTES + 1)
+    if len(data) > settings.USER_IMPORT_MAX_BYTES:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="File too large")
+    try:
+        return read_csv_rows(data, IMPORT_COLUMNS)
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="CSV must be UTF-8")
+
+@router.post("/import", response_model=UserImportReport, dependencies=[Depends(require_roles("Admin"))])
+async def import_users(
+    rows: List[dict[str, Any]] = Body(...),
+    dry_run: bool = Query(False, description="Só valida; não cria nenhum utilizador"),
+    db: AsyncSession = Depends(get_db),
+):
+    return await user_service.import_users(db, rows, dry_run=dry_run)
+
+@router.post("/import/csv", response_model=UserImportReport, dependencies=[Depends(require_roles("Admin"))])
+async def import_users_csv(
+    file: UploadFile = File(...),
+    dry_run: bool = Query(False, description="Só valida; não cria nenhum utilizador"),
+    db: AsyncSession = Depends(get_db),
+):
+    rows = await _read_import_csv(file)
+    return await user_service.import_users(db, rows, dry_run=dry_run)
+
+def _check_import_size(rows: list) -> None:
+    # recusado já, em vez de só quando o job correr
+    if len(rows) > settings.USER_IMPORT_MAX_ROWS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.USER_IMPORT_MAX_ROWS} rows per import",
+        )
+
+@router.post("/import/jobs", response_model=JobOut, status_code=status.HTTP_202_ACCEPTED)
+async def import_users_job(
+    rows: List[dict[str, Any]] = Body(...),
+    principal: Principal = Depends(require_roles("Admin")),
+    db: AsyncSession = Depends(get_db),
+):
+    # como /import, em background; o relatório fica no result do job
+    _check_import_size(rows)
+    return await user_service.enqueue_import(db, rows, created_by=principal.id)
+
+@router.post("/import/csv/jobs", response_model=JobOut, status_code=status.HTTP_202_ACCEPTED)
+async def import_users_csv_job(
+    file: UploadFile = File(...),
+    principal: Principal = Depends(require_roles("Admin")),
+    db: AsyncSession = Depends(get_db),
+):
+    rows = await _read_import_csv(file)
+    _check_import_size(rows)
+    return await user_service.enqueue_import(db, rows, created_by=principal.id)
 
 @router.get("/{user_id}", response_model=UserOut)
 async def get_user(
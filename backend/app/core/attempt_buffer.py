@@ -0,0 +1,211 @@
+# Buffer das respostas das tentativas em curso (PUT /quiz_attempts/{id}/draft).
+# Trocar de resposta só escreve no buffer; a cada ATTEMPT_BUFFER_FLUSH_SECONDS as
+# alterações de todas as tentativas são gravadas em quiz_attempts.draft_answers num só
+# statement (checkpoint), e a tabela answers só é escrita uma vez, no finish.
+#
+# Por omissão o buffer é a tabela UNLOGGED attempt_buffer (DatabaseAttemptBufferBackend),
+# comum a todos os workers: um upsert sem WAL por pedido em vez de reescrever a linha da
+# tentativa. Com ATTEMPT_BUFFER_BACKEND vazio fica em memória (um só worker). Com
+# ATTEMPT_BUFFER_ENABLED=false cada alteração é logo um checkpoint.
+#
+# Cada resposta leva o instante em que chegou ({"o": option_id, "t": epoch}); o
+# checkpoint e o finish ficam com a mais recente por pergunta, por isso a ordem em que
+# buffers de workers diferentes são gravados não importa.
+
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from app.core.cache import load_backend
+from app.core.config import settings
+from app.db.session import async_session
+from app.db.uow import unit_of_work
+from app.repositories.crud.attempt_buffer_repo import AttemptBufferRepository
+from app.repositories.crud.quiz_attempt_repo import QuizAttemptRepository
+
+logger = logging.getLogger(__name__)
+
+# question_id -> {"o": option_id | None, "t": epoch}
+Draft = dict[str, dict]
+
+
+def merge_latest(*drafts: Optional[Draft]) -> Draft:
+    merged: Draft = {}
+    for draft in drafts:
+        for question_id, answer in (draft or {}).items():
+            current = merged.get(question_id)
+            if current is None or current["t"] <= answer["t"]:
+                merged[question_id] = answer
+    return merged
+
+
+class AttemptBufferBackend:
+    # Guarda as alterações ainda não gravadas. O finish lê-as com get(), por isso um
+    # backend usado por vários workers tem de ser partilhado (DatabaseAttemptBufferBackend,
+    # ou ex.: Redis HSET por tentativa + SET das tentativas sujas).
+
+    async def put(self, attempt_id: str, changes: Draft) -> None:
+        raise NotImplementedError
+
+    async def get(self, attempt_id: str) -> Draft:
+        raise NotImplementedError
+
+    async def snapshot(self) -> dict[str, Draft]:
+        # cópia das alterações de todas as tentativas; continuam no buffer até ao ack
+        raise NotImplementedError
+
+    async def ack(self, drafts: dict[str, Draft]) -> None:
+        # retira as respostas gravadas, exceto as que mudaram entretanto (t mais recente)
+        raise NotImplementedError
+
+    async def discard(self, attempt_id: str) -> None:
+        raise NotImplementedError
+
+
+class LocalAttemptBufferBackend(AttemptBufferBackend):
+    # em memória: só com um worker (o finish noutro worker não veria estas respostas)
+
+    def __init__(self):
+        self._pending: dict[str, Draft] = {}
+
+    async def put(self, attempt_id: str, changes: Draft) -> None:
+        self._pending[attempt_id] = merge_latest(self._pending.get(attempt_id), changes)
+
+    async def get(self, attempt_id: str) -> Draft:
+        return dict(self._pending.get(attempt_id, {}))
+
+    async def snapshot(self) -> dict[str, Draft]:
+        return {attempt_id: dict(draft) for attempt_id, draft in self._pending.items()}
+
+    async def ack(self, drafts: dict[str, Draft]) -> None:
+        for attempt_id, draft in drafts.items():
+            pending = self._pending.get(attempt_id)
+            if pending is None:
+                continue
+            for question_id, answer in draft.items():
+                current = pending.get(question_id)
+                if current is not None and current["t"] <= answer["t"]:
+                    del pending[question_id]
+            if not pending:
+                del self._pending[attempt_id]
+
+    async def discard(self, attempt_id: str) -> None:
+        self._pending.pop(attempt_id, None)
+
+
+class DatabaseAttemptBufferBackend(AttemptBufferBackend):
+    # Tabela attempt_buffer (ver app.models.attempt_buffer_entry). O snapshot reserva as
+    # linhas por lease_seconds, por isso cada alteração entra no checkpoint de um só worker;
+    # se esse checkpoint falhar, a reserva expira e outro worker volta a apanhá-las.
+
+    def __init__(self, repo: AttemptBufferRepository = AttemptBufferRepository(), lease_seconds: float = 60.0):
+        self.repo = repo
+        self.lease_seconds = lease_seconds
+
+    async def put(self, attempt_id: str, changes: Draft) -> None:
+        async with async_session() as db:
+            async with unit_of_work(db):
+                await self.repo.put(db, attempt_id, changes)
+
+    async def get(self, attempt_id: str) -> Draft:
+        async with async_session() as db:
+            rows = await self.repo.list_by_attempt(db, attempt_id)
+        return {row.question_id: {"o": row.option_id, "t": row.answered_at} for row in rows}
+
+    async def snapshot(self) -> dict[str, Draft]:
+        async with async_session() as db:
+            async with unit_of_work(db):
+                rows = await self.repo.lease(db, self.lease_seconds)
+        drafts: dict[str, Draft] = {}
+        for row in rows:
+            drafts.setdefault(row.attempt_id, {})[row.question_id] = {"o": row.option_id, "t": row.answered_at}
+        return drafts
+
+    async def ack(self, drafts: dict[str, Draft]) -> None:
+        async with async_session() as db:
+            async with unit_of_work(db):
+                await self.repo.ack(db, drafts)
+
+    async def discard(self, attempt_id: str) -> None:
+        async with async_session() as db:
+            async with unit_of_work(db):
+                await self.repo.delete_by_attempt(db, attempt_id)
+
+
+class AttemptBuffer:
+    def __init__(self, backend: AttemptBufferBackend, repo: QuizAttemptRepository = QuizAttemptRepository()):
+        self.backend = backend
+        self.repo = repo
+        self.checkpointed = 0
+        # checkpoints ignorados porque a tentativa já tinha terminado (ou foi apagada)
+        self.skipped = 0
+        self.flush_errors = 0
+        self._task: Optional[asyncio.Task] = None
+
+    async def put(self, attempt_id: str, answers: list[tuple[str, Optional[str]]]) -> None:
+        now = time.time()
+        changes = {question_id: {"o": option_id, "t": now} for question_id, option_id in answers}
+        if not settings.ATTEMPT_BUFFER_ENABLED:
+            # sem buffer: cada alteração é logo um checkpoint (continua a não tocar em answers)
+            await self._checkpoint({attempt_id: changes})
+            return
+        await self.backend.put(attempt_id, changes)
+
+    async def pending(self, attempt_id: str) -> Draft:
+        return await self.backend.get(attempt_id)
+
+    async def discard(self, attempt_id: str) -> None:
+        await self.backend.discard(attempt_id)
+
+    async def flush(self) -> int:
+        # As alterações só saem do buffer depois do commit do checkpoint: até lá um finish
+        # continua a vê-las em pending(). Um finish que bloqueie a linha entre o snapshot e
+        # o UPDATE já as juntou às answers; o checkpoint dessas tentativas é ignorado
+        # (finished_at IS NULL) e o ack limpa-as. Se o checkpoint falhar, ficam para o próximo.
+        changes = await self.backend.snapshot()
+        if not changes:
+            return 0
+        await self._checkpoint(changes)
+        await self.backend.ack(changes)
+        return len(changes)
+
+    async def _checkpoint(self, drafts: dict[str, Draft]) -> None:
+        async with async_session() as db:
+            async with unit_of_work(db):
+                updated = await self.repo.checkpoint_drafts(db, drafts)
+        self.checkpointed += updated
+        self.skipped += len(drafts) - updated
+
+    async def start(self) -> None:
+        if settings.ATTEMPT_BUFFER_ENABLED and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        # último checkpoint no shutdown
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Final attempt buffer checkpoint failed")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(settings.ATTEMPT_BUFFER_FLUSH_SECONDS)
+            try:
+                await self.flush()
+            except Exception:
+                self.flush_errors += 1
+                logger.exception("Attempt buffer checkpoint failed")
+
+    def stats(self) -> dict:
+        return {"checkpointed": self.checkpointed, "skipped": self.skipped, "flush_errors": self.flush_errors}
+
+
+attempt_buffer = AttemptBuffer(
+    load_backend(settings.ATTEMPT_BUFFER_BACKEND) if settings.ATTEMPT_BUFFER_BACKEND else LocalAttemptBufferBackend()
+)
@@ -0,0 +1,120 @@
+import importlib
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    # Cache LRU em memória com expiração por entrada.
+    # Pensada para o event loop (um só thread), por isso não usa locks.
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        # ttl desta entrada; sem ttl usa o da cache
+        if self.maxsize <= 0:
+            return
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class CacheBackend:
+    # Armazenamento de um VersionedCache. A implementação por omissão vive no processo;
+    # uma partilhada (ex.: Redis: GET/SETEX/INCR) torna valores e versões comuns a
+    # todos os workers.
+
+    async def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        raise NotImplementedError
+
+    async def get_counter(self, key: str) -> int:
+        raise NotImplementedError
+
+    async def incr(self, key: str) -> int:
+        raise NotImplementedError
+
+
+class LocalCacheBackend(CacheBackend):
+    def __init__(self, maxsize: int = 1024):
+        # o TTL vem em cada set (o do VersionedCache)
+        self._values = TTLCache(maxsize=maxsize)
+        # contadores sem expiração: se uma versão voltasse a 0 podia reaparecer um valor antigo
+        self._counters: dict[str, int] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._values.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._values.set(key, value, ttl)
+
+    async def get_counter(self, key: str) -> int:
+        return self._counters.get(key, 0)
+
+    async def incr(self, key: str) -> int:
+        self._counters[key] = self._counters.get(key, 0) + 1
+        return self._counters[key]
+
+
+class VersionedCache:
+    # Invalidar é incrementar a versão da chave (ou a geração do namespace inteiro):
+    # as entradas antigas deixam de ser lidas e saem por LRU/TTL.
+    # Quem preenche lê a versão *antes* de ir à BD e grava com essa versão, por isso uma
+    # invalidação a meio da leitura nunca deixa um valor velho visível.
+
+    def __init__(self, namespace: str, backend: CacheBackend, ttl: float = 3600.0):
+        self.namespace = namespace
+        self.backend = backend
+        self.ttl = ttl
+
+    async def version(self, key: str) -> str:
+        generation = await self.backend.get_counter(f"{self.namespace}:gen")
+        key_version = await self.backend.get_counter(f"{self.namespace}:ver:{key}")
+        return f"{generation}.{key_version}"
+
+    async def get(self, key: str, version: str) -> Optional[bytes]:
+        return await self.backend.get(f"{self.namespace}:{key}:{version}")
+
+    async def set(self, key: str, version: str, value: bytes) -> None:
+        await self.backend.set(f"{self.namespace}:{key}:{version}", value, self.ttl)
+
+    async def invalidate(self, key: str) -> None:
+        await self.backend.incr(f"{self.namespace}:ver:{key}")
+
+    async def invalidate_all(self) -> None:
+        await self.backend.incr(f"{self.namespace}:gen")
+
+
+def load_backend(path: str) -> CacheBackend:
+    # "pacote.modulo:fabrica" -> fabrica(); permite ligar um backend partilhado via Settings
+    module_name, _, attr = path.partition(":")
+    factory = getattr(importlib.import_module(module_name), attr)
+    return factory()
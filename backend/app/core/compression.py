@@ -0,0 +1,37 @@
+from typing import Sequence
+
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class CompressionMiddleware:
+    # GZip acima de minimum_size, exceto nos caminhos excluídos: exports CSV em streaming
+    # (o gzip acumula blocos e atrasa o primeiro byte) e media, que já vem comprimida
+    # ou tem variantes .br/.gz servidas pelo MediaFiles.
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        compresslevel: int = 6,
+        exclude_paths: Sequence[str] = (),
+    ):
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size, compresslevel=compresslevel)
+        self.exclude_paths = tuple(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and not self._excluded(scope["path"]):
+            await self.gzip(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+    def _excluded(self, path: str) -> bool:
+        for pattern in self.exclude_paths:
+            # "/media" exclui por prefixo; "*/export/csv" por sufixo
+            if pattern.startswith("*"):
+                if path.endswith(pattern[1:]):
+                    return True
+            elif path.startswith(pattern):
+                return True
+        return False
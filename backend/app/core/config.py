@@ -1,3 +1,4 @@
+from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -8,15 +9,131 @@ class Settings(BaseSettings):
     FRONTEND_ORIGIN: str = "http://localhost:4200"
     DATABASE_URL: str 
 
+    # Pool de ligações (por worker)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    # segundos até uma ligação ser substituída (-1 = nunca)
+    DB_POOL_RECYCLE: int = 1800
+    # valida cada ligação no checkout (+1 round trip); False confia só no recycle
+    DB_POOL_PRE_PING: bool = True
+    # ligações do pool que os painéis do GET /dashboard/snapshot ocupam ao mesmo tempo
+    # (no total do worker, não por pedido)
+    DASHBOARD_SNAPSHOT_CONCURRENCY: int = 2
+
     # JWT
     JWT_SECRET: str
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
 
+    # Cache do utilizador autenticado (evita ir à BD em cada pedido)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+    # Confia no role_name assinado no access token (zero queries; alterações de role/status
+    # só têm efeito quando o token expira)
+    JWT_TRUST_ROLE_CLAIMS: bool = False
+
+    # Argon2: sem valor ficam os custos de omissão do passlib; só se fixam depois de medir
+    # no servidor (alterar os custos faz rehash transparente no próximo login)
+    ARGON2_TIME_COST: Optional[int] = None
+    ARGON2_MEMORY_COST: Optional[int] = None
+    ARGON2_PARALLELISM: Optional[int] = None
+    # Pool dedicado para hash/verify fora do event loop
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
+    # Processos para o argon2 das importações em massa; 0 = nº de CPUs
+    PASSWORD_HASH_PROCESSES: int = 0
+
+    # Importação em massa de utilizadores (POST /users/import e /users/import/csv)
+    USER_IMPORT_MAX_ROWS: int = 10000
+    USER_IMPORT_MAX_BYTES: int = 5242880
+
+    # Jobs em background (tabela jobs, sem broker; ver app.core.jobs). Cada processo com
+    # JOBS_ENABLED executa jobs; vários processos partilham a fila.
+    JOBS_ENABLED: bool = True
+    JOBS_POLL_SECONDS: float = 1.0
+    # concorrência por tipo neste processo, ex.: {"users.export_csv": 4}; omissão = a do handler
+    JOBS_CONCURRENCY: dict[str, int] = {}
+    JOBS_MAX_ATTEMPTS: int = 3
+    # espera antes do retry: base * 2^(tentativa-1), até ao máximo
+    JOBS_RETRY_BASE_SECONDS: float = 10.0
+    JOBS_RETRY_MAX_SECONDS: float = 600.0
+    # heartbeat dos jobs a correr; sem heartbeat há JOBS_STALE_SECONDS o job volta à fila
+    JOBS_HEARTBEAT_SECONDS: int = 30
+    JOBS_STALE_SECONDS: int = 300
+    # jobs terminados e os ficheiros que geraram são apagados ao fim deste tempo
+    JOBS_RETENTION_HOURS: int = 24
+    # fora de MEDIA_ROOT: os exports só saem por GET /jobs/{id}/download
+    JOBS_FILES_DIR: str = "job_files"
+
+    # Respostas das tentativas em curso (PUT /quiz_attempts/{id}/draft) ficam no buffer e
+    # vão para quiz_attempts.draft_answers a cada FLUSH_SECONDS; answers só é escrita no
+    # finish. O backend por omissão é a tabela UNLOGGED attempt_buffer, partilhada pelos
+    # workers (um crash do Postgres perde no máximo um intervalo); vazio = em memória, só
+    # com um worker; outro "modulo:fabrica" liga um backend próprio. Desligado, cada
+    # pedido grava logo o checkpoint.
+    ATTEMPT_BUFFER_ENABLED: bool = True
+    ATTEMPT_BUFFER_BACKEND: str = "app.core.attempt_buffer:DatabaseAttemptBufferBackend"
+    ATTEMPT_BUFFER_FLUSH_SECONDS: float = 30.0
+    # perguntas/opções válidas de cada tentativa, para validar o draft sem ir à BD
+    ATTEMPT_ANSWER_KEY_CACHE_TTL_SECONDS: int = 300
+    ATTEMPT_ANSWER_KEY_CACHE_MAX_SIZE: int = 10000
+
+    # Limiares dos badges em memória (invalidados pelo BadgeService nesta instância)
+    BADGE_CACHE_TTL_SECONDS: int = 300
+
+    # Cache do JSON de /quizzes/{id}/full. Backend vazio = LRU em memória, com TTL curto
+    # porque as invalidações não chegam aos outros workers; "modulo:fabrica" liga um
+    # backend partilhado (ver app.core.cache.CacheBackend) e aí o TTL pode subir
+    QUIZ_FULL_CACHE_BACKEND: str = ""
+    QUIZ_FULL_CACHE_TTL_SECONDS: int = 30
+    QUIZ_FULL_CACHE_MAX_SIZE: int = 1000
+
+    # Paginação das listagens (keyset); limit acima do máximo é rejeitado com 422
+    PAGE_SIZE_DEFAULT: int = 50
+    PAGE_SIZE_MAX: int = 200
+
+    # Rate limiting (token buckets "pedidos/segundos"). Backend vazio = em memória por
+    # worker; "modulo:fabrica" liga um partilhado (ver app.core.rate_limit.RateLimitBackend)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = ""
+    # usar X-Forwarded-For (só atrás de proxies de confiança): o IP do cliente é a entrada
+    # RATE_LIMIT_TRUSTED_PROXY_HOPS a contar da direita (1 = só um proxy, ex.: nginx)
+    RATE_LIMIT_TRUST_FORWARDED: bool = False
+    RATE_LIMIT_TRUSTED_PROXY_HOPS: int = 1
+    RATE_LIMIT_LOGIN_PER_IP: str = "20/60"
+    # só as passwords erradas gastam do limite por username
+    RATE_LIMIT_LOGIN_PER_USERNAME: str = "5/60"
+    RATE_LIMIT_REGISTER_PER_IP: str = "5/300"
+    RATE_LIMIT_REFRESH_PER_IP: str = "30/60"
+
+    # Observabilidade: cabeçalho Server-Timing (app/db) e log dos pedidos lentos
+    SERVER_TIMING_ENABLED: bool = True
+    SLOW_REQUEST_MS: int = 500
+    # Guarda N+1: máximo de queries por pedido (0 = desligado; em dev só regista no log)
+    # e ficheiro com o nº de queries aceite por endpoint (ver app.testing.pytest_query_guard)
+    QUERY_GUARD_MAX_QUERIES: int = 0
+    QUERY_BASELINE_PATH: str = "query_baseline.json"
+
+    # Compressão gzip das respostas (bytes mínimos, nível 1-9, caminhos excluídos:
+    # prefixo ou "*sufixo")
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_LEVEL: int = 6
+    COMPRESSION_EXCLUDE_PATHS: list[str] = ["/media", "*/export/csv"]
 
     MEDIA_ROOT: str = "media"
     MEDIA_URL: str = "/media"
+    # max-age dos ficheiros de media com nome imutável (hash/uuid)
+    MEDIA_CACHE_MAX_AGE: int = 31536000
+    # "X-Accel-Redirect" (nginx) ou "X-Sendfile" para o proxy servir os ficheiros; vazio = Python
+    MEDIA_SENDFILE_HEADER: str = ""
+    # prefixo da location interna do nginx usado com X-Accel-Redirect
+    MEDIA_SENDFILE_PREFIX: str = "/protected-media"
+    # tamanho máximo de cada upload de imagem e lados das miniaturas WebP geradas
+    MEDIA_MAX_UPLOAD_BYTES: int = 5 * 1024 * 1024
+    MEDIA_THUMBNAIL_SIZES: list[int] = [200]
 
     model_config = SettingsConfigDict(
         env_file=".env",
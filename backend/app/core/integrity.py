@@ -0,0 +1,68 @@
+# Unicidade garantida pelas constraints da BD em vez de um SELECT de verificação antes
+# de cada escrita (que custava um round trip e falhava com escritas concorrentes).
+# A IntegrityError da constraint violada é convertida na mesma resposta 400/409 que a
+# verificação antiga dava; ver app.db.uow.unit_of_work.
+
+from typing import Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
+
+# (tabela, coluna) -> mensagem. O nome da constraint depende de onde veio: create_all
+# (<tabela>_<coluna>_key), migrações (uq_<tabela>_<coluna>) ou unique=True + index=True
+# (ix_<tabela>_<coluna>), por isso registam-se os três.
+_UNIQUE_COLUMNS = {
+    ("users", "email"): "Email already registered",
+    ("users", "username"): "Username already registered",
+    ("courses", "title"): "Course title must be unique",
+    ("quizzes", "title"): "Quiz title must be unique",
+    ("questions", "text"): "Question text must be unique",
+    ("options", "text"): "Option text must be unique",
+    ("videos", "title"): "Video title must be unique",
+    ("projects", "title"): "Project title must be unique",
+    ("areas", "name"): "Area name must be unique",
+    ("modalities", "name"): "Modality name must be unique",
+    ("roles", "name"): "Role name must be unique",
+    ("badges", "code"): "Badge code must be unique",
+}
+
+CONSTRAINT_ERRORS: dict[str, tuple[int, str]] = {
+    name: (status.HTTP_400_BAD_REQUEST, detail)
+    for (table, column), detail in _UNIQUE_COLUMNS.items()
+    for name in (f"{table}_{column}_key", f"uq_{table}_{column}", f"ix_{table}_{column}")
+}
+# questions.text é único por um índice sobre md5(text) (textos sem limite de tamanho)
+CONSTRAINT_ERRORS["uq_questions_text_md5"] = (
+    status.HTTP_400_BAD_REQUEST,
+    _UNIQUE_COLUMNS[("questions", "text")],
+)
+# corrida entre dois pedidos que ativam quizzes do mesmo curso (a verificação no
+# QuizService dá a mensagem detalhada; isto cobre o que lhe escapa)
+CONSTRAINT_ERRORS["uq_quizzes_one_active_per_course"] = (
+    status.HTTP_409_CONFLICT,
+    "Já existe um quiz ativo para este curso.",
+)
+# POST /answers para uma pergunta já respondida na tentativa (o upsert_many do
+# submit_answers não chega aqui)
+CONSTRAINT_ERRORS["uq_answer_attempt_question"] = (
+    status.HTTP_409_CONFLICT,
+    "Question already answered in this attempt",
+)
+
+
+def constraint_name(exc: IntegrityError) -> Optional[str]:
+    # asyncpg: exc.orig é o adaptador do SQLAlchemy e a exceção do driver vem em __cause__;
+    # psycopg guarda o nome em diag
+    for err in (exc.orig, getattr(exc.orig, "__cause__", None)):
+        name = getattr(err, "constraint_name", None) or getattr(getattr(err, "diag", None), "constraint_name", None)
+        if name:
+            return name
+    return None
+
+
+def http_error_for(exc: IntegrityError) -> Optional[HTTPException]:
+    mapped = CONSTRAINT_ERRORS.get(constraint_name(exc) or "")
+    if mapped is None:
+        return None
+    status_code, detail = mapped
+    return HTTPException(status_code=status_code, detail=detail)
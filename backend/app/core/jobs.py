@@ -0,0 +1,248 @@
+# Fila de jobs em background, sem broker: os jobs vivem na tabela jobs e cada processo
+# com JOBS_ENABLED corre um JobRunner que os reclama (SELECT ... FOR UPDATE SKIP LOCKED)
+# e executa no próprio event loop, com concorrência limitada por tipo.
+#
+#   @job_runner.handler("users.export_csv", concurrency=2)
+#   async def export_job(job: JobContext) -> dict: ...
+#
+#   job = await job_runner.enqueue(db, "users.export_csv", {"q": q}, created_by=principal.id)
+#
+# Falhas voltam à fila com backoff exponencial até max_attempts; HTTPException conta como
+# erro definitivo (dados inválidos não melhoram com retry). Jobs de um worker que morreu
+# voltam à fila quando o heartbeat (updated_at) passa de JOBS_STALE_SECONDS.
+
+import asyncio
+import datetime as dt
+import logging
+import os
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import async_session
+from app.db.uow import unit_of_work
+from app.models.job import Job
+from app.repositories.crud.job_repo import JobRepository
+
+logger = logging.getLogger(__name__)
+
+# intervalo mínimo entre escritas de progresso do mesmo job
+PROGRESS_INTERVAL = 1.0
+
+
+class JobContext:
+    def __init__(self, runner: "JobRunner", job: Job):
+        self.runner = runner
+        self.id = job.id
+        self.type = job.type
+        self.payload: dict = job.payload or {}
+        self.attempt = job.attempts
+        self._last_progress = 0.0
+
+    async def progress(self, value: float) -> None:
+        # 0..1; também conta como heartbeat
+        now = time.monotonic()
+        if now - self._last_progress < PROGRESS_INTERVAL and value < 1:
+            return
+        self._last_progress = now
+        async with async_session() as db:
+            async with unit_of_work(db):
+                await self.runner.repo.set_progress(db, self.id, self.attempt, max(0.0, min(1.0, value)))
+
+    def file_path(self, ext: str) -> str:
+        # ficheiro gerado pelo job; apagado com o job ao fim de JOBS_RETENTION_HOURS
+        os.makedirs(settings.JOBS_FILES_DIR, exist_ok=True)
+        return os.path.join(settings.JOBS_FILES_DIR, f"{self.id}.{ext}")
+
+
+JobHandler = Callable[[JobContext], Awaitable[Optional[dict]]]
+
+
+@dataclass(frozen=True)
+class JobType:
+    name: str
+    handler: JobHandler
+    concurrency: int
+    max_attempts: int
+    # o payload tem dados sensíveis (ex.: passwords de uma importação): limpo no fim
+    clear_payload: bool = False
+
+
+class JobRunner:
+    def __init__(self, repo: JobRepository = JobRepository()):
+        self.repo = repo
+        self.types: dict[str, JobType] = {}
+        self.running: dict[str, int] = {}
+        # (tipo, "succeeded" | "failed" | "retried" | "lost") -> nº de jobs
+        self.finished: dict[tuple[str, str], int] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop_task: Optional[asyncio.Task] = None
+
+    def handler(
+        self,
+        name: str,
+        *,
+        concurrency: int = 1,
+        max_attempts: Optional[int] = None,
+        clear_payload: bool = False,
+    ) -> Callable[[JobHandler], JobHandler]:
+        def register(fn: JobHandler) -> JobHandler:
+            self.types[name] = JobType(
+                name=name,
+                handler=fn,
+                concurrency=settings.JOBS_CONCURRENCY.get(name, concurrency),
+                max_attempts=max_attempts or settings.JOBS_MAX_ATTEMPTS,
+                clear_payload=clear_payload,
+            )
+            return fn
+
+        return register
+
+    async def enqueue(self, db: AsyncSession, name: str, payload: dict[str, Any], *, created_by: Optional[str] = None) -> Job:
+        job_type = self.types[name]
+        async with unit_of_work(db):
+            job = await self.repo.create(
+                db, type=name, payload=payload, max_attempts=job_type.max_attempts, created_by=created_by
+            )
+        # neste processo não espera pelo próximo poll
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return job
+
+    def stats(self) -> dict:
+        return {"running": dict(self.running), "finished": dict(self.finished)}
+
+    async def start(self) -> None:
+        if not settings.JOBS_ENABLED or self._loop_task is not None:
+            return
+        self._wakeup = asyncio.Event()
+        self._loop_task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        # os jobs a meio são cancelados e devolvidos à fila (ver _execute)
+        if self._loop_task is None:
+            return
+        self._loop_task.cancel()
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(self._loop_task, *tasks, return_exceptions=True)
+        self._loop_task = None
+
+    async def _run(self) -> None:
+        last_maintenance = 0.0
+        while True:
+            self._wakeup.clear()
+            try:
+                if time.monotonic() - last_maintenance >= settings.JOBS_HEARTBEAT_SECONDS:
+                    await self._maintenance()
+                    last_maintenance = time.monotonic()
+                await self._claim()
+            except Exception:
+                logger.exception("Job runner poll failed")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), settings.JOBS_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _claim(self) -> None:
+        free = {
+            name: job_type.concurrency - self.running.get(name, 0)
+            for name, job_type in self.types.items()
+        }
+        if not any(n > 0 for n in free.values()):
+            return
+
+        claimed: list[Job] = []
+        async with async_session() as db:
+            async with unit_of_work(db):
+                for name in await self.repo.ready_types(db):
+                    if free.get(name, 0) > 0:
+                        claimed.extend(await self.repo.claim(db, name, free[name]))
+
+        for job in claimed:
+            self.running[job.type] = self.running.get(job.type, 0) + 1
+            self._tasks[job.id] = asyncio.create_task(self._execute(job))
+
+    async def _maintenance(self) -> None:
+        async with async_session() as db:
+            async with unit_of_work(db):
+                await self.repo.heartbeat(db, list(self._tasks))
+                requeued = await self.repo.requeue_stale(
+                    db,
+                    dt.timedelta(seconds=settings.JOBS_STALE_SECONDS),
+                    clear_payload_types=[name for name, job_type in self.types.items() if job_type.clear_payload],
+                )
+                results = await self.repo.purge(db, dt.timedelta(hours=settings.JOBS_RETENTION_HOURS))
+        if requeued:
+            logger.warning("Requeued %d stale jobs", requeued)
+        for result in results:
+            if result and result.get("file"):
+                try:
+                    os.remove(os.path.join(settings.JOBS_FILES_DIR, result["file"]))
+                except FileNotFoundError:
+                    pass
+
+    async def _execute(self, job: Job) -> None:
+        job_type = self.types[job.type]
+        outcome = "failed"
+        written = True
+        try:
+            result = await job_type.handler(JobContext(self, job))
+        except asyncio.CancelledError:
+            outcome = "released"
+            await self._write(self.repo.release, job.id, job.attempts)
+            raise
+        except HTTPException as exc:
+            written = await self._write(
+                self.repo.fail, job.id, job.attempts, str(exc.detail), clear_payload=job_type.clear_payload
+            )
+        except Exception as exc:
+            logger.exception("Job %s (%s) failed on attempt %d", job.id, job.type, job.attempts)
+            error = f"{type(exc).__name__}: {exc}"
+            if job.attempts < job.max_attempts:
+                outcome = "retried"
+                written = await self._write(self.repo.retry, job.id, job.attempts, error, self._retry_at(job.attempts))
+            else:
+                written = await self._write(
+                    self.repo.fail, job.id, job.attempts, error, clear_payload=job_type.clear_payload
+                )
+        else:
+            outcome = "succeeded"
+            written = await self._write(
+                self.repo.succeed, job.id, job.attempts, result, clear_payload=job_type.clear_payload
+            )
+        finally:
+            self.running[job.type] -= 1
+            self._tasks.pop(job.id, None)
+            if outcome != "released":
+                if not written:
+                    # perdeu o job para outro worker: o resultado desta tentativa é descartado
+                    logger.warning(
+                        "Job %s (%s) attempt %d was requeued meanwhile; %s discarded",
+                        job.id, job.type, job.attempts, outcome,
+                    )
+                    outcome = "lost"
+                key = (job.type, outcome)
+                self.finished[key] = self.finished.get(key, 0) + 1
+                self._wakeup.set()
+
+    async def _write(self, fn: Callable[..., Awaitable[bool]], *args, **kwargs) -> bool:
+        async with async_session() as db:
+            async with unit_of_work(db):
+                return await fn(db, *args, **kwargs)
+
+    def _retry_at(self, attempt: int) -> dt.datetime:
+        # backoff exponencial com jitter (evita retries em sincronia após uma falha geral)
+        delay = min(settings.JOBS_RETRY_MAX_SECONDS, settings.JOBS_RETRY_BASE_SECONDS * 2 ** (attempt - 1))
+        delay *= random.uniform(0.5, 1.0)
+        return dt.datetime.now(dt.timezone.utc) + dt.timedelta(seconds=delay)
+
+
+job_runner = JobRunner()
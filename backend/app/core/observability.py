@@ -0,0 +1,160 @@
+# Métricas por pedido: latência, nº de queries, tempo total na BD e a query mais lenta.
+# Os hooks do SQLAlchemy somam no RequestStats do pedido atual (contextvar); o middleware
+# envia-os em Server-Timing, agrega-os para o /metrics (formato Prometheus) e regista
+# no log os pedidos acima de SLOW_REQUEST_MS.
+
+import logging
+import time
+from contextvars import ContextVar
+from typing import Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger("app.slow_requests")
+
+# limites superiores (segundos) dos buckets de latência dos pedidos
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class RequestStats:
+    __slots__ = ("query_count", "db_time", "slowest_sql", "slowest_time")
+
+    def __init__(self):
+        self.query_count = 0
+        self.db_time = 0.0
+        self.slowest_sql: Optional[str] = None
+        self.slowest_time = 0.0
+
+    def observe_query(self, statement: str, seconds: float) -> None:
+        self.query_count += 1
+        self.db_time += seconds
+        if seconds > self.slowest_time:
+            self.slowest_time = seconds
+            self.slowest_sql = statement
+
+
+current_request: ContextVar[Optional[RequestStats]] = ContextVar("current_request", default=None)
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)  # último = +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        for i, upper in enumerate(self.buckets):
+            if value <= upper:
+                self.bucket_counts[i] += 1
+                return
+        self.bucket_counts[-1] += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        out, total = [], 0
+        for upper, count in zip((*map(str, self.buckets), "+Inf"), self.bucket_counts):
+            total += count
+            out.append((upper, total))
+        return out
+
+
+class RouteMetrics:
+    # agregados por (método, rota); a rota é o template ("/api/v1/users/{user_id}"),
+    # nunca o caminho concreto, para o nº de séries ficar limitado
+
+    def __init__(self):
+        self.requests: dict[tuple[str, str, int], int] = {}
+        self.latency: dict[tuple[str, str], Histogram] = {}
+        self.queries: dict[tuple[str, str], int] = {}
+        self.db_time: dict[tuple[str, str], float] = {}
+
+    def observe(self, method: str, route: str, status: int, seconds: float, stats: RequestStats) -> None:
+        key = (method, route)
+        self.requests[(method, route, status)] = self.requests.get((method, route, status), 0) + 1
+        self.latency.setdefault(key, Histogram()).observe(seconds)
+        self.queries[key] = self.queries.get(key, 0) + stats.query_count
+        self.db_time[key] = self.db_time.get(key, 0.0) + stats.db_time
+
+
+route_metrics = RouteMetrics()
+
+# chamados no fim de cada pedido com (método, rota, status, stats); ex.: app.core.query_guard
+request_listeners: list[Callable[[str, str, int, RequestStats], None]] = []
+
+
+def instrument_engine(sync_engine: Engine) -> None:
+    # O início fica no contexto de execução do statement (e não numa pilha em conn.info):
+    # um statement que falha não chega ao after_cursor_execute e não deixa nada para trás.
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        context._query_start = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._query_start
+        stats = current_request.get()
+        if stats is not None:
+            stats.observe_query(statement, elapsed)
+
+
+def _route_label(scope: Scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class TimingMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = current_request.set(stats)
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if settings.SERVER_TIMING_ENABLED:
+                    # nas respostas em streaming conta só até aos cabeçalhos
+                    elapsed_ms = (time.perf_counter() - start) * 1000
+                    value = (
+                        f'app;dur={elapsed_ms:.1f}, '
+                        f'db;dur={stats.db_time * 1000:.1f};desc="{stats.query_count} queries"'
+                    )
+                    message["headers"] = [*message.get("headers", []), (b"server-timing", value.encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_request.reset(token)
+            elapsed = time.perf_counter() - start
+            route = _route_label(scope)
+            route_metrics.observe(scope["method"], route, status_code, elapsed, stats)
+            for listener in request_listeners:
+                listener(scope["method"], route, status_code, stats)
+
+            if elapsed * 1000 >= settings.SLOW_REQUEST_MS:
+                logger.warning(
+                    "slow request %s %s status=%s %.1fms queries=%d db=%.1fms slowest=%.1fms %s",
+                    scope["method"],
+                    route,
+                    status_code,
+                    elapsed * 1000,
+                    stats.query_count,
+                    stats.db_time * 1000,
+                    stats.slowest_time * 1000,
+                    (stats.slowest_sql or "")[:500],
+                )
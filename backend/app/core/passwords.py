@@ -0,0 +1,114 @@
+import asyncio
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, Sequence
+
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+
+from app.core.config import settings
+
+# deprecated="auto" + custos vindos dos Settings: hashes com parâmetros antigos
+# são reconhecidos por verify_and_update e refeitos no login. Os custos não definidos
+# ficam com os valores de omissão do passlib.
+_ARGON2_COSTS = {
+    "argon2__rounds": settings.ARGON2_TIME_COST,
+    "argon2__memory_cost": settings.ARGON2_MEMORY_COST,
+    "argon2__parallelism": settings.ARGON2_PARALLELISM,
+}
+pwd_context = CryptContext(
+    schemes=["argon2"],
+    deprecated="auto",
+    **{key: value for key, value in _ARGON2_COSTS.items() if value is not None},
+)
+
+
+def _hash_batch(passwords: Sequence[str]) -> list[str]:
+    # corre num processo do pool de importação (função de módulo para passar no pickle)
+    return [pwd_context.hash(p) for p in passwords]
+
+
+class PasswordHasher:
+    # Corre o argon2 num pool de threads limitado (o argon2-cffi liberta o GIL),
+    # para não bloquear o event loop. Acima de max_pending pedidos em espera/execução
+    # responde 503 em vez de deixar a fila crescer.
+
+    def __init__(self, workers: int, max_pending: int, processes: int = 0):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.processes = processes or os.cpu_count() or 1
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="argon2")
+        # criado só na primeira importação em massa
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+
+    async def _run(self, fn, *args):
+        if self.in_flight >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server busy, try again later",
+                headers={"Retry-After": "1"},
+            )
+
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(pwd_context.hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(pwd_context.verify, plain_password, hashed_password)
+
+    async def verify_and_update(self, plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+        # devolve (válida, novo_hash); novo_hash só vem preenchido se os parâmetros mudaram
+        return await self._run(pwd_context.verify_and_update, plain_password, hashed_password)
+
+    async def hash_many(self, passwords: Sequence[str]) -> list[str]:
+        # Importações em massa: milhares de hashes não passam pelo pool de threads (pequeno
+        # e partilhado com os logins); vão em lotes para um pool de processos próprio.
+        # "spawn" porque fazer fork de um processo com threads e ligações abertas não é seguro.
+        if not passwords:
+            return []
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        # alguns lotes por processo, para equilibrar a carga sem pagar o pickle por hash
+        size = max(1, math.ceil(len(passwords) / (self.processes * 4)))
+        batches = [passwords[i:i + size] for i in range(0, len(passwords), size)]
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(self._process_pool, _hash_batch, batch) for batch in batches)
+        )
+        self.completed += len(passwords)
+        return [h for batch in results for h in batch]
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "processes": self.processes,
+            "max_pending": self.max_pending,
+            "in_flight": self.in_flight,
+            "queue_depth": max(0, self.in_flight - self.workers),
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    processes=settings.PASSWORD_HASH_PROCESSES,
+)
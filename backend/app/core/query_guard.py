@@ -0,0 +1,88 @@
+# Guarda contra N+1: conta as queries de cada pedido (via app.core.observability) e
+# assinala os que passam do limite; em testes pode também proibir lazy loads implícitos.
+
+import json
+import logging
+import os
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Mapper, RelationshipProperty
+
+from app.core.observability import RequestStats, request_listeners
+
+logger = logging.getLogger("app.query_guard")
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+def endpoint_key(method: str, route: str) -> str:
+    return f"{method} {route}"
+
+
+def load_baseline(path: str) -> dict[str, int]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(path: str, counts: dict[str, int]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(counts.items())), f, indent=2)
+        f.write("\n")
+
+
+class QueryGuard:
+    # Limite por endpoint = o valor do baseline (se existir) ou max_queries.
+    # raise_on_exceed=True levanta QueryBudgetExceeded (testes); False só regista no log (dev).
+
+    def __init__(self, max_queries: int, baseline: Optional[dict[str, int]] = None, *, raise_on_exceed: bool = False):
+        self.max_queries = max_queries
+        self.baseline = baseline or {}
+        self.raise_on_exceed = raise_on_exceed
+        # maior nº de queries visto por endpoint
+        self.observed: dict[str, int] = {}
+
+    def limit_for(self, key: str) -> int:
+        return self.baseline.get(key, self.max_queries)
+
+    def __call__(self, method: str, route: str, status_code: int, stats: RequestStats) -> None:
+        key = endpoint_key(method, route)
+        self.observed[key] = max(self.observed.get(key, 0), stats.query_count)
+
+        limit = self.limit_for(key)
+        if limit <= 0 or stats.query_count <= limit:
+            return
+
+        message = (
+            f"{key} ran {stats.query_count} queries (limit {limit}); "
+            f"slowest: {(stats.slowest_sql or '')[:200]}"
+        )
+        if self.raise_on_exceed:
+            raise QueryBudgetExceeded(message)
+        logger.error("query budget exceeded: %s", message)
+
+    def install(self) -> None:
+        request_listeners.append(self)
+
+    def uninstall(self) -> None:
+        if self in request_listeners:
+            request_listeners.remove(self)
+
+
+def enable_lazy_raise() -> None:
+    # Relações com o lazy="select" por omissão passam a lazy="raise": um acesso não
+    # carregado explicitamente (selectinload/joinedload) rebenta logo em vez de fazer
+    # uma query por objeto. lazy="selectin"/"joined" declarados nos modelos ficam iguais.
+    # Tem de correr antes de os mappers serem configurados (primeira query/instância).
+
+    @event.listens_for(Mapper, "before_mapper_configured")
+    def _lazy_raise(mapper, class_):
+        # _props e não iterate_properties: este não pode disparar a configuração dos mappers
+        for prop in list(mapper._props.values()):
+            if isinstance(prop, RelationshipProperty) and prop.lazy in ("select", True):
+                prop.lazy = "raise"
+                prop.strategy_key = (("lazy", "raise"),)
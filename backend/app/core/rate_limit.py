@@ -0,0 +1,141 @@
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+from fastapi import HTTPException, Request, status
+
+from app.core.cache import load_backend
+from app.core.config import settings
+
+KeyFunc = Callable[[Request], Awaitable[Optional[str]]]
+
+
+class RateLimitBackend:
+    # Guarda os token buckets. A implementação por omissão vive no processo (cada worker
+    # tem os seus); uma partilhada (ex.: Redis + script Lua) torna os limites globais.
+
+    async def take(self, key: str, capacity: float, refill_rate: float, cost: float = 1.0) -> tuple[bool, float]:
+        # devolve (permitido, segundos até haver tokens suficientes); um cost negativo
+        # devolve tokens ao bucket, sem passar da capacidade
+        raise NotImplementedError
+
+
+class LocalRateLimitBackend(RateLimitBackend):
+    def __init__(self, maxsize: int = 100_000):
+        self.maxsize = maxsize
+        # key -> (tokens, instante do último cálculo); LRU para não crescer sem limite
+        self._buckets: "OrderedDict[str, tuple[float, float]]" = OrderedDict()
+
+    async def take(self, key: str, capacity: float, refill_rate: float, cost: float = 1.0) -> tuple[bool, float]:
+        now = time.monotonic()
+        tokens, last = self._buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - last) * refill_rate)
+
+        allowed = tokens >= cost
+        if allowed:
+            tokens = min(capacity, tokens - cost)
+
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.maxsize:
+            self._buckets.popitem(last=False)
+
+        return allowed, 0.0 if allowed else (cost - tokens) / refill_rate
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    # capacity pedidos de rajada, recarregados ao ritmo de capacity por per_seconds
+    name: str
+    capacity: int
+    per_seconds: float
+    key: KeyFunc
+
+    @property
+    def refill_rate(self) -> float:
+        return self.capacity / self.per_seconds
+
+    @classmethod
+    def parse(cls, name: str, spec: str, key: KeyFunc) -> "RateLimit":
+        # "20/60" = 20 pedidos por 60 segundos
+        capacity, _, seconds = spec.partition("/")
+        return cls(name=name, capacity=int(capacity), per_seconds=float(seconds or 1), key=key)
+
+
+async def client_ip(request: Request) -> Optional[str]:
+    # Cada proxy acrescenta à direita o IP de quem lhe ligou; as entradas à esquerda vêm do
+    # cliente e podem ser forjadas. Com N proxies de confiança o IP do cliente é o N-ésimo
+    # a contar da direita.
+    if settings.RATE_LIMIT_TRUST_FORWARDED:
+        hops = [
+            ip.strip()
+            for header in request.headers.getlist("x-forwarded-for")
+            for ip in header.split(",")
+            if ip.strip()
+        ]
+        if hops:
+            return hops[-min(max(settings.RATE_LIMIT_TRUSTED_PROXY_HOPS, 1), len(hops))]
+    return request.client.host if request.client else None
+
+
+def body_field(field: str) -> KeyFunc:
+    # campo do corpo JSON (ex.: username); o FastAPI guarda o corpo, por isso ler aqui é grátis
+    async def key(request: Request) -> Optional[str]:
+        try:
+            body = await request.json()
+        except ValueError:
+            return None
+        value = body.get(field) if isinstance(body, dict) else None
+        return value.strip().lower() if isinstance(value, str) and value.strip() else None
+
+    return key
+
+
+class RateLimiter:
+    def __init__(self, backend: RateLimitBackend):
+        self.backend = backend
+        self.rejected: dict[str, int] = {}
+
+    def __call__(self, *limits: RateLimit) -> Callable[[Request], Awaitable[None]]:
+        # dependência para declarar na rota: dependencies=[Depends(rate_limiter(LIMITE, ...))]
+        async def dependency(request: Request) -> None:
+            if not settings.RATE_LIMIT_ENABLED:
+                return
+            for limit in limits:
+                key = await limit.key(request)
+                if key is None:
+                    continue
+                allowed, retry_after = await self.backend.take(f"{limit.name}:{key}", limit.capacity, limit.refill_rate)
+                if not allowed:
+                    self.rejected[limit.name] = self.rejected.get(limit.name, 0) + 1
+                    raise HTTPException(
+                        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                        detail="Too many requests, try again later",
+                        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+                    )
+
+        return dependency
+
+    async def refund(self, request: Request, *limits: RateLimit) -> None:
+        # devolve o token gasto pelo pedido (ex.: o login correu bem e só as falhas contam)
+        if not settings.RATE_LIMIT_ENABLED:
+            return
+        for limit in limits:
+            key = await limit.key(request)
+            if key is not None:
+                await self.backend.take(f"{limit.name}:{key}", limit.capacity, limit.refill_rate, cost=-1.0)
+
+
+rate_limiter = RateLimiter(
+    load_backend(settings.RATE_LIMIT_BACKEND) if settings.RATE_LIMIT_BACKEND else LocalRateLimitBackend()
+)
+
+# Políticas das rotas de autenticação (por IP trava rajadas; por username trava a
+# tentativa de passwords numa só conta vinda de muitos IPs). O login devolve o token
+# por username quando a password está certa: só as tentativas falhadas contam.
+LOGIN_PER_IP = RateLimit.parse("login-ip", settings.RATE_LIMIT_LOGIN_PER_IP, client_ip)
+LOGIN_PER_USERNAME = RateLimit.parse("login-username", settings.RATE_LIMIT_LOGIN_PER_USERNAME, body_field("username"))
+REGISTER_PER_IP = RateLimit.parse("register-ip", settings.RATE_LIMIT_REGISTER_PER_IP, client_ip)
+REFRESH_PER_IP = RateLimit.parse("refresh-ip", settings.RATE_LIMIT_REFRESH_PER_IP, client_ip)
@@ -0,0 +1,27 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    # o orjson já trata datetime/UUID/dataclass; modelos Pydantic passam pelo pydantic-core
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    # Resposta por omissão da app. Aceita modelos Pydantic diretamente, por isso uma rota
+    # pode devolver ORJSONResponse(modelo) e saltar o jsonable_encoder do FastAPI (o
+    # response_model fica só para o OpenAPI). Bytes já serializados (ex.: de uma cache)
+    # passam tal como estão.
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -5,13 +6,15 @@ from jose import jwt, JWTError
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 from sqlalchemy import select
 
 from app.core.config import settings
 from app.repositories.crud.user_repo import UserRepository
 from app.models.user import User
 from app.core.deps import get_db
+from app.db.session import async_session
+from app.core.cache import TTLCache
 
 SECRET_KEY = getattr(settings, "JWT_SECRET", "supersecretkey")
 ALGORITHM = getattr(settings, "JWT_ALGORITHM", "HS256")
@@ -21,6 +24,39 @@ REFRESH_TOKEN_EXPIRE_DAYS = int(getattr(settings, "REFRESH_TOKEN_EXPIRE_DAYS", 7
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_PREFIX}/auth/login")
 
 
+@dataclass(frozen=True)
+class Principal:
+    # o mínimo do utilizador autenticado de que as verificações de acesso precisam
+    id: str
+    role_id: Optional[str]
+    role_name: Optional[str]
+    status: str
+
+
+# sub -> Principal; invalidado pelo UserService/RoleService quando role ou status mudam
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_principal(user_id: str) -> None:
+    principal_cache.delete(str(user_id))
+
+
+def clear_principals() -> None:
+    principal_cache.clear()
+
+
+def principal_from_user(user: User) -> Principal:
+    return Principal(
+        id=str(user.id),
+        role_id=user.role_id,
+        role_name=user.role.name if user.role else None,
+        status=user.status,
+    )
+
+
 def _now() -> datetime:
     return datetime.utcnow()
 
@@ -64,45 +100,82 @@ def decode_token(token: str) -> Optional[dict]:
         return None
 
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)) -> User:
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+
+def _access_token_payload(token: str) -> dict:
     payload = decode_token(token)
     if payload is None:
-        raise credentials_exception
+        raise _credentials_exception()
 
     # Ensure token is of type "access"
     if payload.get("type") != "access":
-        raise credentials_exception
+        raise _credentials_exception()
 
-    user_id = payload.get("sub")
-    if user_id is None:
-        raise credentials_exception
+    if payload.get("sub") is None:
+        raise _credentials_exception()
 
+    return payload
+
+
+async def _load_user(db: AsyncSession, user_id: str) -> User:
     result = await db.execute(
         select(User)
-        .options(selectinload(User.role))
+        .options(joinedload(User.role))
         .where(User.id == user_id)
     )
     user = result.scalar_one_or_none()
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
+
+    principal_cache.set(str(user.id), principal_from_user(user))
+    return user
+
 
-    if getattr(user, "status", None) != "active":
+def _ensure_active(principal: Principal) -> Principal:
+    if principal.status != "active":
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user")
+    return principal
+
 
+async def get_current_principal(token: str = Depends(oauth2_scheme)) -> Principal:
+    # Sem dependência de get_db: em regime estável não abre sessão nem faz queries.
+    payload = _access_token_payload(token)
+    user_id = str(payload["sub"])
+
+    if settings.JWT_TRUST_ROLE_CLAIMS and payload.get("role_name") is not None:
+        return Principal(
+            id=user_id,
+            role_id=payload.get("role_id"),
+            role_name=payload.get("role_name"),
+            status="active",
+        )
+
+    principal = principal_cache.get(user_id)
+    if principal is None:
+        async with async_session() as db:
+            principal = principal_from_user(await _load_user(db, user_id))
+
+    return _ensure_active(principal)
+
+
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)) -> User:
+    # Devolve o User completo (ex.: /auth/me); para verificações de acesso usar get_current_principal.
+    payload = _access_token_payload(token)
+    user = await _load_user(db, payload["sub"])
+    _ensure_active(principal_from_user(user))
     return user
 
 
 def require_roles(*allowed_role_names: str):
-    async def _require(current_user: User = Depends(get_current_user)) -> User:
-        role_name = getattr(current_user.role, "name", None)
-        if role_name is None or role_name not in allowed_role_names:
+    async def _require(principal: Principal = Depends(get_current_principal)) -> Principal:
+        if principal.role_name is None or principal.role_name not in allowed_role_names:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
-        return current_user
+        return principal
 
-    return _require
\ No newline at end of file
+    return _require
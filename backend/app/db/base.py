@@ -16,4 +16,7 @@ from app.models.answer import Answer
 from app.models.modality import Modality
 from app.models.video import Video
 from app.models.badges import Badge
-from app.models.quiz_badge_award import QuizBadgeAward
\ No newline at end of file
+from app.models.quiz_badge_award import QuizBadgeAward
+from app.models.grade_stat import GradeStat
+from app.models.job import Job
+from app.models.attempt_buffer_entry import AttemptBufferEntry
\ No newline at end of file
@@ -0,0 +1,66 @@
+# Métricas do pool de ligações: tempo de espera por uma ligação (histograma),
+# checkouts, timeouts e o estado atual (em uso / overflow / livres).
+
+import time
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# limites superiores (segundos) dos buckets do histograma de espera
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class PoolMetrics:
+    def __init__(self, buckets: tuple[float, ...] = WAIT_BUCKETS):
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)  # último = +Inf
+        self.wait_sum = 0.0
+        self.checkouts = 0
+        self.timeouts = 0
+
+    def observe_wait(self, seconds: float) -> None:
+        self.checkouts += 1
+        self.wait_sum += seconds
+        for i, upper in enumerate(self.buckets):
+            if seconds <= upper:
+                self.bucket_counts[i] += 1
+                return
+        self.bucket_counts[-1] += 1
+
+    def histogram(self) -> list[tuple[str, int]]:
+        # cumulativo, no formato dos histogramas Prometheus (le -> contagem)
+        out, total = [], 0
+        for upper, count in zip((*map(str, self.buckets), "+Inf"), self.bucket_counts):
+            total += count
+            out.append((upper, total))
+        return out
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    # mede quanto tempo cada checkout esperou por uma ligação livre
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except PoolTimeoutError:
+            pool_metrics.timeouts += 1
+            raise
+        pool_metrics.observe_wait(time.perf_counter() - start)
+        return conn
+
+
+def pool_stats(pool) -> dict:
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+        "max_overflow": pool._max_overflow,
+        "checkouts": pool_metrics.checkouts,
+        "checkout_timeouts": pool_metrics.timeouts,
+        "wait_seconds_sum": round(pool_metrics.wait_sum, 6),
+        "wait_seconds_buckets": dict(pool_metrics.histogram()),
+    }
@@ -6,10 +6,27 @@
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from app.core.config import settings
+from app.db.pool_metrics import InstrumentedQueuePool
 
 class Base(DeclarativeBase):
-    pass
+    # valores gerados pela BD (created_at, updated_at) voltam no RETURNING do próprio
+    # INSERT/UPDATE, sem um SELECT de refresh depois do flush (ver app.db.uow)
+    __mapper_args__ = {"eager_defaults": True}
 
-engine = create_async_engine(settings.DATABASE_URL, pool_pre_ping=True, future=True, echo=False)
+# pool_size + max_overflow por worker; somado em todos os workers tem de caber no
+# max_connections do Postgres. Por omissão cada checkout faz pre-ping (DB_POOL_PRE_PING,
+# +1 round trip); com DB_POOL_PRE_PING=false as ligações só são renovadas pela
+# reciclagem (DB_POOL_RECYCLE).
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    poolclass=InstrumentedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    future=True,
+    echo=False,
+)
 
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
@@ -0,0 +1,40 @@
+# Unit of work: uma transação por operação de serviço.
+# Os repositórios só fazem flush(); o serviço envolve as escritas em
+#   async with unit_of_work(db):
+# e o commit acontece uma vez no fim (rollback se alguma coisa falhar, incluindo as
+# HTTPException de validação). Chamadas encadeadas (ex.: submit_answers -> finish)
+# reutilizam a transação de fora em vez de fazerem commit a meio. Violações de
+# constraints conhecidas saem como HTTPException (app.core.integrity).
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.integrity import http_error_for
+
+_DEPTH_KEY = "uow_depth"
+
+
+@asynccontextmanager
+async def unit_of_work(db: AsyncSession) -> AsyncIterator[AsyncSession]:
+    depth = db.info.get(_DEPTH_KEY, 0)
+    db.info[_DEPTH_KEY] = depth + 1
+    try:
+        yield db
+        if depth == 0:
+            await db.commit()
+    except IntegrityError as exc:
+        if depth == 0:
+            await db.rollback()
+            http_error = http_error_for(exc)
+            if http_error is not None:
+                raise http_error from exc
+        raise
+    except BaseException:
+        if depth == 0:
+            await db.rollback()
+        raise
+    finally:
+        db.info[_DEPTH_KEY] = depth
@@ -3,10 +3,33 @@ from app.core.config import settings
 from app.api.v1 import api_router
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from app.core.compression import CompressionMiddleware
+from app.core.observability import TimingMiddleware, instrument_engine
+from app.core.query_guard import QueryGuard, load_baseline
+from app.db.session import engine
+from app.core.responses import ORJSONResponse
+from app.utils.static_media import MediaFiles
+from app.core.jobs import job_runner
+from app.core.attempt_buffer import attempt_buffer
+from contextlib import asynccontextmanager
 import os
 
-app = FastAPI(title="Islanders University API", version="0.1.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # runner dos jobs em background neste processo (JOBS_ENABLED) e checkpoints do
+    # buffer das tentativas (o último no shutdown)
+    await job_runner.start()
+    await attempt_buffer.start()
+    yield
+    await attempt_buffer.stop()
+    await job_runner.stop()
+
+app = FastAPI(
+    title="Islanders University API",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 origins = [
     "http://localhost:4200",  # Angular
@@ -23,8 +46,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        compresslevel=settings.COMPRESSION_LEVEL,
+        exclude_paths=settings.COMPRESSION_EXCLUDE_PATHS,
+    )
+
+# por fora de tudo: mede o pedido inteiro (incluindo compressão) e conta as queries
+instrument_engine(engine.sync_engine)
+app.add_middleware(TimingMiddleware)
+
+if settings.QUERY_GUARD_MAX_QUERIES > 0:
+    QueryGuard(settings.QUERY_GUARD_MAX_QUERIES, load_baseline(settings.QUERY_BASELINE_PATH)).install()
+
 os.makedirs(settings.MEDIA_ROOT, exist_ok=True)
-app.mount(settings.MEDIA_URL, StaticFiles(directory=settings.MEDIA_ROOT), name="media")
+app.mount(settings.MEDIA_URL, MediaFiles(directory=settings.MEDIA_ROOT), name="media")
 
 # Inclui todos os routers da API
 app.include_router(api_router, prefix="/api/v1")
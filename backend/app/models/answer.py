@@ -1,7 +1,7 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, UniqueConstraint
 from app.db.session import Base
 from app.models.common import IdMixin
 
@@ -12,10 +12,15 @@ if TYPE_CHECKING:
 
 class Answer(IdMixin, Base):
     __tablename__ = "answers"
-    attempt_id: Mapped[str] = mapped_column(ForeignKey("quiz_attempts.id", ondelete="CASCADE"), index=True, nullable=False)
+    # indexado pelo prefixo de uq_answer_attempt_question
+    attempt_id: Mapped[str] = mapped_column(ForeignKey("quiz_attempts.id", ondelete="CASCADE"), nullable=False)
     question_id: Mapped[str] = mapped_column(ForeignKey("questions.id", ondelete="CASCADE"), index=True, nullable=False)
     option_id: Mapped[str | None] = mapped_column(ForeignKey("options.id", ondelete="SET NULL"), index=True, nullable=True)
 
+    __table_args__ = (
+        UniqueConstraint("attempt_id", "question_id", name="uq_answer_attempt_question"),
+    )
+
     attempt: Mapped[QuizAttempt] = relationship(
         "QuizAttempt", 
         back_populates="answers", 
@@ -0,0 +1,20 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, Float
+from app.db.session import Base
+
+
+class AttemptBufferEntry(Base):
+    # Respostas das tentativas em curso ainda por gravar no checkpoint
+    # (app.core.attempt_buffer.DatabaseAttemptBufferBackend), partilhadas por todos os workers.
+    # UNLOGGED: sem WAL, cada PUT do draft é um upsert barato; um crash do Postgres esvazia
+    # a tabela e perde-se no máximo um intervalo de checkpoint.
+    # answered_at: o "t" (epoch) da resposta no draft; leased_until: epoch até ao qual a
+    # linha está reservada pelo checkpoint de um worker
+    __tablename__ = "attempt_buffer"
+    __table_args__ = {"prefixes": ["UNLOGGED"]}
+
+    attempt_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    question_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    option_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
+    answered_at: Mapped[float] = mapped_column(Float, nullable=False)
+    leased_until: Mapped[float] = mapped_column(Float, nullable=False, default=0.0, server_default="0")
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Text, Enum, ForeignKey, Integer, Float
+from sqlalchemy import String, Text, Enum, ForeignKey, Integer, Float, Index
 from app.db.session import Base
 from app.models.common import IdMixin, TimestampMixin
 
@@ -16,6 +16,13 @@ if TYPE_CHECKING:
 class Course(IdMixin, TimestampMixin, Base):
     __tablename__ = "courses"
 
+    __table_args__ = (
+        # keyset das listagens (app.utils.pagination)
+        Index("ix_courses_created_at_id", "created_at", "id"),
+        # pesquisa por trigramas (pg_trgm), ver app.utils.search
+        Index("ix_courses_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+    )
+
     title: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
     description: Mapped[str | None] = mapped_column(Text(), nullable=True)
     content: Mapped[str | None] = mapped_column(Text(), nullable=True)
@@ -0,0 +1,24 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, Integer, Float, DateTime, func
+from app.db.session import Base
+import datetime as dt
+
+
+class GradeStat(Base):
+    # Agregados das tentativas terminadas (soma, contagem e histograma),
+    # mantidos incrementalmente pelo QuizAttemptService.
+    # scope: "quiz" | "course" | "user" (os totais globais somam as linhas "quiz")
+    __tablename__ = "grade_stats"
+
+    scope: Mapped[str] = mapped_column(String(10), primary_key=True)
+    scope_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    score_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    attempt_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    bucket_0_20: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    bucket_21_40: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    bucket_41_60: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    bucket_61_80: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    bucket_81_100: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), onupdate=func.now(), server_default=func.now(), nullable=False
+    )
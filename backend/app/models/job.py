@@ -0,0 +1,32 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, Text, Integer, Float, DateTime, ForeignKey, Index, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from app.db.session import Base
+from app.models.common import IdMixin, TimestampMixin
+import datetime as dt
+
+
+class Job(IdMixin, TimestampMixin, Base):
+    # Trabalho em background executado pelo app.core.jobs.JobRunner.
+    # status: "queued" -> "running" -> "succeeded" | "failed" (ou "queued" de novo para retry)
+    # updated_at serve de heartbeat enquanto está "running"
+    __tablename__ = "jobs"
+
+    __table_args__ = (
+        # a fila: só os jobs por reclamar
+        Index("ix_jobs_queued", "type", "run_after", postgresql_where=text("status = 'queued'")),
+        Index("ix_jobs_status_updated_at", "status", "updated_at"),
+    )
+
+    type: Mapped[str] = mapped_column(String(60), nullable=False)
+    status: Mapped[str] = mapped_column(String(12), nullable=False, default="queued")
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
+    result: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    error: Mapped[str | None] = mapped_column(Text(), nullable=True)
+    progress: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    run_after: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    started_at: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_by: Mapped[str | None] = mapped_column(ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
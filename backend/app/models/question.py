@@ -1,7 +1,7 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import Text, ForeignKey
+from sqlalchemy import Text, ForeignKey, Index, text as sql_text
 from app.db.session import Base
 from app.models.common import IdMixin, TimestampMixin
 
@@ -13,6 +13,11 @@ if TYPE_CHECKING:
 
 class Question(IdMixin, TimestampMixin, Base):
     __tablename__ = "questions"
+    __table_args__ = (
+        Index("ix_questions_created_at_id", "created_at", "id"),
+        # índice sobre o md5: textos longos não cabem numa entrada de btree
+        Index("uq_questions_text_md5", sql_text("md5(text)"), unique=True),
+    )
     text: Mapped[str] = mapped_column(Text(), nullable=False)
     quiz_id: Mapped[str] = mapped_column(ForeignKey("quizzes.id", ondelete="CASCADE"), index=True, nullable=False)
 
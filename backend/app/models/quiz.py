@@ -23,6 +23,9 @@ class Quiz(IdMixin, TimestampMixin, Base):
             unique=True,
             postgresql_where=text("status = 'active'"),
         ),
+        # keyset das listagens (app.utils.pagination)
+        Index("ix_quizzes_created_at_id", "created_at", "id"),
+        Index("ix_quizzes_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
     )
 
     title: Mapped[str] = mapped_column(String(200), unique=True, nullable=False)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import ForeignKey, DateTime
+from sqlalchemy import ForeignKey, DateTime, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from app.db.session import Base
 from app.models.common import IdMixin
 import datetime as dt
@@ -14,10 +15,20 @@ if TYPE_CHECKING:
 
 class QuizAttempt(IdMixin, Base):
     __tablename__ = "quiz_attempts"
+
+    __table_args__ = (
+        Index("ix_quiz_attempts_user_id_finished_at", "user_id", text("finished_at DESC NULLS LAST")),
+        # só tentativas terminadas (dashboard, grade_stats)
+        Index("ix_quiz_attempts_quiz_id_finished", "quiz_id", "finished_at", postgresql_where=text("finished_at IS NOT NULL")),
+        Index("ix_quiz_attempts_finished_at", "finished_at", postgresql_where=text("finished_at IS NOT NULL")),
+    )
+
     score: Mapped[float] = mapped_column(nullable=False, default=0.0)
     finished_at: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    user_id: Mapped[str] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), index=True, nullable=False)
+    user_id: Mapped[str] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     quiz_id: Mapped[str] = mapped_column(ForeignKey("quizzes.id", ondelete="CASCADE"), index=True, nullable=False)
+    # checkpoint das respostas em curso (app.core.attempt_buffer); vai para answers no finish
+    draft_answers: Mapped[dict | None] = mapped_column(JSONB, nullable=True, deferred=True)
 
     user: Mapped[User] = relationship(
         "User", 
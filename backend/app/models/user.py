@@ -1,7 +1,7 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, ForeignKey, Enum, Date
+from sqlalchemy import String, ForeignKey, Enum, Date, Index
 from app.db.session import Base
 from app.models.common import IdMixin, TimestampMixin
 
@@ -16,6 +16,15 @@ if TYPE_CHECKING:
 class User(IdMixin, TimestampMixin, Base):
     __tablename__ = "users"
 
+    __table_args__ = (
+        # keyset das listagens (app.utils.pagination)
+        Index("ix_users_created_at_id", "created_at", "id"),
+        # pesquisa por trigramas (pg_trgm), ver app.utils.search
+        Index("ix_users_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("ix_users_username_trgm", "username", postgresql_using="gin", postgresql_ops={"username": "gin_trgm_ops"}),
+        Index("ix_users_email_trgm", "email", postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"}),
+    )
+
     name: Mapped[str] = mapped_column(String(120), nullable=False)
     username: Mapped[str] = mapped_column(String(120), unique=True, nullable=False)
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
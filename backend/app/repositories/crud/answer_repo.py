@@ -1,13 +1,22 @@
 from typing import Sequence, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from app.models.answer import Answer
+from app.models.common import uuid4_str
+from app.core.config import settings
+from app.utils.pagination import paginate
 
 
 class AnswerRepository:
-    async def list(self, db: AsyncSession, *, skip: int = 0, limit: int = 100) -> Sequence[Answer]:
-        result = await db.execute(select(Answer).offset(skip).limit(limit))
-        return result.scalars().all()
+    async def list(
+        self,
+        db: AsyncSession,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+    ) -> dict:
+        return await paginate(db, select(Answer), Answer, cursor=cursor, limit=limit)
 
     async def get(self, db: AsyncSession, answer_id: str) -> Optional[Answer]:
         return await db.get(Answer, answer_id)
@@ -26,10 +35,30 @@ class AnswerRepository:
             option_id=option_id,
         )
         db.add(obj)
-        await db.commit()
-        await db.refresh(obj)
+        await db.flush()
         return obj
 
+    async def upsert_many(
+        self,
+        db: AsyncSession,
+        *,
+        attempt_id: str,
+        answers: Sequence[tuple[str, Optional[str]]],
+    ) -> Sequence[Answer]:
+        # um único INSERT multi-linha; responder de novo à mesma pergunta troca a opção.
+        # Sem commit: quem chama decide (ex.: terminar a tentativa na mesma transação)
+        stmt = insert(Answer).values([
+            {"id": uuid4_str(), "attempt_id": attempt_id, "question_id": question_id, "option_id": option_id}
+            for question_id, option_id in answers
+        ])
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_answer_attempt_question",
+            set_={"option_id": stmt.excluded.option_id},
+        ).returning(Answer)
+
+        res = await db.execute(stmt, execution_options={"populate_existing": True})
+        return res.scalars().all()
+
     async def update(
         self,
         db: AsyncSession,
@@ -41,13 +70,12 @@ class AnswerRepository:
             answer.option_id = option_id
 
         db.add(answer)
-        await db.commit()
-        await db.refresh(answer)
+        await db.flush()
         return answer
 
     async def delete(self, db: AsyncSession, answer: Answer) -> bool:
         if not answer:
             return None
         await db.delete(answer)
-        await db.commit()
+        await db.flush()
         return True
@@ -2,16 +2,19 @@ from typing import Sequence, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete
 from app.models.area import Area
+from app.core.config import settings
+from app.utils.pagination import paginate
 
 class AreaRepository:
-    async def list(self, db: AsyncSession, *, skip: int = 0, limit: Optional[int] = None) -> Sequence[Area]:
-        stmt = select(Area).offset(skip)
-        if limit is not None:
-            stmt = stmt.limit(limit)
+    async def list(
+        self,
+        db: AsyncSession,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+    ) -> dict:
+        return await paginate(db, select(Area), Area, cursor=cursor, limit=limit)
 
-        result = await db.execute(stmt)
-        return result.scalars().all()
-    
     async def get(self, db: AsyncSession, area_id: str) -> Optional[Area]:
         return await db.get(Area, area_id)
     
@@ -23,8 +26,7 @@ class AreaRepository:
     async def create(self, db: AsyncSession, *, name: str, description: Optional [str]) -> Area:
         obj = Area(name=name, description=description)
         db.add(obj)
-        await db.commit()
-        await db.refresh(obj)
+        await db.flush()
         return obj
     
     async def update(self, db: AsyncSession, area: Area, *, name: Optional[str] = None, description: Optional[str] = None) -> Area:
@@ -33,12 +35,11 @@ class AreaRepository:
         if description is not None:
             area.description = description
         db.add(area)
-        await db.commit()
-        await db.refresh(area)
+        await db.flush()
         return area
     
     async def delete(self, db: AsyncSession, area: Area) -> bool:
         if not area:
             return None
         await db.delete(area)
-        await db.commit()
\ No newline at end of file
+        await db.flush()
\ No newline at end of file
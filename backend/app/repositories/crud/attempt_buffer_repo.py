@@ -0,0 +1,62 @@
+import json
+from typing import Sequence
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, select, text
+from sqlalchemy.dialects.postgresql import insert
+from app.models.attempt_buffer_entry import AttemptBufferEntry
+
+# Reserva as linhas livres (ou com a reserva expirada) para o checkpoint de um worker;
+# os outros workers não as voltam a ler enquanto a reserva durar. Usa o relógio da BD,
+# comum a todos os workers.
+_LEASE_SQL = """
+UPDATE attempt_buffer
+SET leased_until = extract(epoch FROM clock_timestamp()) + :lease_seconds
+WHERE leased_until < extract(epoch FROM clock_timestamp())
+RETURNING attempt_id, question_id, option_id, answered_at
+"""
+
+# Apaga as respostas gravadas, exceto as que mudaram entretanto (answered_at mais recente)
+_ACK_SQL = """
+DELETE FROM attempt_buffer b
+USING jsonb_to_recordset(CAST(:acked AS jsonb)) AS a(attempt_id text, question_id text, t float8)
+WHERE b.attempt_id = a.attempt_id AND b.question_id = a.question_id AND b.answered_at <= a.t
+"""
+
+
+class AttemptBufferRepository:
+    async def put(self, db: AsyncSession, attempt_id: str, changes: dict[str, dict]) -> None:
+        # um upsert multi-linha; uma resposta mais antiga não substitui a atual.
+        # leased_until volta a 0 para o próximo checkpoint apanhar a alteração
+        stmt = insert(AttemptBufferEntry).values([
+            {"attempt_id": attempt_id, "question_id": question_id, "option_id": a["o"], "answered_at": a["t"], "leased_until": 0.0}
+            for question_id, a in changes.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AttemptBufferEntry.attempt_id, AttemptBufferEntry.question_id],
+            set_={"option_id": stmt.excluded.option_id, "answered_at": stmt.excluded.answered_at, "leased_until": 0.0},
+            where=AttemptBufferEntry.answered_at <= stmt.excluded.answered_at,
+        )
+        await db.execute(stmt)
+
+    async def list_by_attempt(self, db: AsyncSession, attempt_id: str) -> Sequence:
+        res = await db.execute(
+            select(AttemptBufferEntry.question_id, AttemptBufferEntry.option_id, AttemptBufferEntry.answered_at)
+            .where(AttemptBufferEntry.attempt_id == attempt_id)
+        )
+        return res.all()
+
+    async def lease(self, db: AsyncSession, lease_seconds: float) -> Sequence:
+        res = await db.execute(text(_LEASE_SQL), {"lease_seconds": lease_seconds})
+        return res.all()
+
+    async def ack(self, db: AsyncSession, drafts: dict[str, dict]) -> None:
+        acked = [
+            {"attempt_id": attempt_id, "question_id": question_id, "t": a["t"]}
+            for attempt_id, draft in drafts.items()
+            for question_id, a in draft.items()
+        ]
+        if acked:
+            await db.execute(text(_ACK_SQL), {"acked": json.dumps(acked)})
+
+    async def delete_by_attempt(self, db: AsyncSession, attempt_id: str) -> None:
+        await db.execute(delete(AttemptBufferEntry).where(AttemptBufferEntry.attempt_id == attempt_id))
@@ -1,17 +1,24 @@
 from typing import Sequence, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
 
 from app.models.badges import Badge
+from app.core.config import settings
+from app.utils.pagination import paginate
 
 
 class BadgeRepository:
-    async def list(self, db: AsyncSession, skip: int = 0, limit: Optional[int] = None) -> Sequence[Badge]:
-        stmt = select(Badge).offset(skip).order_by(Badge.min_score.asc())
-        if limit is not None:
-            stmt = stmt.limit(limit)
-        res = await db.execute(stmt)
+    async def list(
+        self,
+        db: AsyncSession,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+    ) -> dict:
+        return await paginate(db, select(Badge), Badge, cursor=cursor, limit=limit)
+
+    async def list_all(self, db: AsyncSession) -> Sequence[Badge]:
+        res = await db.execute(select(Badge).order_by(Badge.min_score.asc()))
         return res.scalars().all()
 
     async def get(self, db: AsyncSession, badge_id: str) -> Optional[Badge]:
@@ -24,12 +31,7 @@ class BadgeRepository:
     async def create(self, db: AsyncSession, *, code: str, name: str, min_score: int, image: Optional[str] = None) -> Badge:
         obj = Badge(code=code, name=name, min_score=min_score, image=image)
         db.add(obj)
-        try:
-            await db.commit()
-        except IntegrityError:
-            await db.rollback()
-            raise
-        await db.refresh(obj)
+        await db.flush()
         return obj
 
     async def update(
@@ -49,17 +51,12 @@ class BadgeRepository:
             badge.image = image
 
         db.add(badge)
-        try:
-            await db.commit()
-        except IntegrityError:
-            await db.rollback()
-            raise
-        await db.refresh(badge)
+        await db.flush()
         return badge
 
     async def delete(self, db: AsyncSession, badge: Optional[Badge]) -> bool:
         if not badge:
             return False
         await db.delete(badge)
-        await db.commit()
+        await db.flush()
         return True
@@ -1,19 +1,31 @@
-from typing import Sequence, Optional
+from typing import AsyncIterator, Sequence, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_
+from sqlalchemy import select, func, Row
 from sqlalchemy.orm import selectinload
 from app.models.course import Course
+from app.models.area import Area
+from app.models.area_course import AreaCourse
+from app.models.modality import Modality
 from app.schemas.course import CourseCreate, CourseUpdate, StatusEnum
+from app.core.config import settings
+from app.utils.pagination import paginate
+from app.utils.search import search_clause, search_rank
 
 class CourseRepository:
-    async def list(self, db: AsyncSession, skip: int = 0, limit: Optional[int] = None) -> Sequence[Course]:
-        stmt = select(Course).options(selectinload(Course.areas)).offset(skip)
-
-        if limit is not None:
-            stmt = stmt.limit(limit)
-
-        result = await db.execute(stmt)
-        return result.scalars().all()
+    async def list(
+        self,
+        db: AsyncSession,
+        *,
+        q: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+    ) -> dict:
+        stmt = select(Course).options(selectinload(Course.areas))
+        if q and q.strip():
+            stmt = stmt.where(search_clause(q, Course.title))
+            rank = search_rank(q, Course.title)
+            return await paginate(db, stmt, Course, cursor=cursor, limit=limit, rank=rank)
+        return await paginate(db, stmt, Course, cursor=cursor, limit=limit)
 
     async def get(self, db: AsyncSession, course_id: str) -> Optional[Course]:
         return await db.get(Course, course_id)
@@ -28,8 +40,7 @@ class CourseRepository:
 
         course = Course(**data)
         db.add(course)
-        await db.commit()
-        await db.refresh(course)
+        await db.flush()
         return course
 
     async def update(self, db: AsyncSession, *, course: Course, obj_in: CourseUpdate) -> Course:
@@ -40,15 +51,14 @@ class CourseRepository:
             setattr(course, field, value)
 
         db.add(course)
-        await db.commit()
-        await db.refresh(course)
+        await db.flush()
         return course
 
     async def delete(self, db: AsyncSession, course: Course) -> None:
         if not course:
             return None
         await db.delete(course)
-        await db.commit()
+        await db.flush()
 
     def _status_value(self, status: Optional[StatusEnum | str]) -> Optional[str]:
         if status is None:
@@ -63,19 +73,33 @@ class CourseRepository:
         area_id: Optional[str] = None,
         modality_id: Optional[str] = None,
         status: Optional[StatusEnum | str] = None,
-    ) -> Sequence[Course]:
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Row]:
+        # Uma linha por curso com as áreas já agregadas pela BD, lida por cursor do lado
+        # do servidor em blocos de `batch_size`.
         stmt = (
-            select(Course)
-            .options(
-                selectinload(Course.areas),
-                selectinload(Course.modality),
+            select(
+                Course.id,
+                Course.title,
+                Course.description,
+                func.string_agg(Area.name, ", ").label("area_names"),
+                Modality.name.label("modality_name"),
+                Course.status,
+                Course.num_hours,
+                Course.credits,
+                Course.price,
+                Course.created_at,
             )
+            .outerjoin(Modality, Modality.id == Course.modality_id)
+            .outerjoin(AreaCourse, AreaCourse.course_id == Course.id)
+            .outerjoin(Area, Area.id == AreaCourse.area_id)
+            .group_by(Course.id, Modality.name)
             .order_by(Course.created_at.desc())
+            .execution_options(yield_per=batch_size)
         )
 
-        if q:
-            term = f"%{q.strip().lower()}%"
-            stmt = stmt.where(Course.title.ilike(term))
+        if q and q.strip():
+            stmt = stmt.where(search_clause(q, Course.title))
 
         if modality_id:
             stmt = stmt.where(Course.modality_id == modality_id)
@@ -86,5 +110,6 @@ class CourseRepository:
         if area_id:
             stmt = stmt.where(Course.areas.any(id=area_id))
 
-        result = await db.execute(stmt)
-        return result.scalars().all()
+        result = await db.stream(stmt)
+        async for row in result:
+            yield row
@@ -17,32 +17,50 @@ from app import db
 class DashboardRepository:
 
     async def summary(self, db: AsyncSession):
-        users = await db.execute(text("SELECT COUNT(*) FROM users"))
-        courses = await db.execute(text("SELECT COUNT(*) FROM courses"))
-        quizzes = await db.execute(text("SELECT COUNT(*) FROM quizzes"))
+        query = """
+        SELECT
+            (SELECT COUNT(*) FROM users) AS users,
+            (SELECT COUNT(*) FROM courses) AS courses,
+            (SELECT COUNT(*) FROM quizzes) AS quizzes
+        """
+        row = (await db.execute(text(query))).one()
 
         return {
-            "users": users.scalar(),
-            "courses": courses.scalar(),
-            "quizzes": quizzes.scalar()
+            "users": row.users,
+            "courses": row.courses,
+            "quizzes": row.quizzes
         }
 
+    # As notas lêem de grade_stats (agregados mantidos no finish das tentativas),
+    # ou seja O(#grupos) em vez de varrer quiz_attempts a cada pedido.
+
     async def average_grade(self, db: AsyncSession, course_id: str | None = None, quiz_id: str | None = None):
-        query = """
-        SELECT ROUND(AVG(qa.score)::numeric, 2) AS avg_score
-        FROM quiz_attempts qa
-        JOIN quizzes q ON q.id = qa.quiz_id
-        WHERE qa.finished_at IS NOT NULL
-        """
         params = {}
 
-        if course_id:
-            query += " AND q.course_id = :course_id"
-            params["course_id"] = course_id
-
         if quiz_id:
-            query += " AND qa.quiz_id = :quiz_id"
+            query = """
+            SELECT ROUND((SUM(gs.score_sum) / NULLIF(SUM(gs.attempt_count), 0))::numeric, 2) AS avg_score
+            FROM grade_stats gs
+            JOIN quizzes q ON q.id = gs.scope_id
+            WHERE gs.scope = 'quiz' AND gs.scope_id = :quiz_id
+            """
             params["quiz_id"] = quiz_id
+            if course_id:
+                query += " AND q.course_id = :course_id"
+                params["course_id"] = course_id
+        elif course_id:
+            query = """
+            SELECT ROUND((SUM(gs.score_sum) / NULLIF(SUM(gs.attempt_count), 0))::numeric, 2) AS avg_score
+            FROM grade_stats gs
+            WHERE gs.scope = 'course' AND gs.scope_id = :course_id
+            """
+            params["course_id"] = course_id
+        else:
+            query = """
+            SELECT ROUND((SUM(gs.score_sum) / NULLIF(SUM(gs.attempt_count), 0))::numeric, 2) AS avg_score
+            FROM grade_stats gs
+            WHERE gs.scope = 'quiz'
+            """
 
         result = await db.execute(text(query), params)
         return result.scalar() or 0.0
@@ -51,12 +69,10 @@ class DashboardRepository:
         query = """
         SELECT
         c.title AS label,
-        ROUND(AVG(qa.score)::numeric, 2) AS value
-        FROM quiz_attempts qa
-        JOIN quizzes q ON q.id = qa.quiz_id
-        JOIN courses c ON c.id = q.course_id
-        WHERE qa.finished_at IS NOT NULL
-        GROUP BY c.title
+        ROUND((gs.score_sum / gs.attempt_count)::numeric, 2) AS value
+        FROM grade_stats gs
+        JOIN courses c ON c.id = gs.scope_id
+        WHERE gs.scope = 'course' AND gs.attempt_count > 0
         ORDER BY c.title
         """
 
@@ -68,10 +84,10 @@ class DashboardRepository:
         query = """
         SELECT
         q.title AS label,
-        ROUND(AVG(qa.score)::numeric, 2) AS value
-        FROM quiz_attempts qa
-        JOIN quizzes q ON q.id = qa.quiz_id
-        WHERE qa.finished_at IS NOT NULL
+        ROUND((gs.score_sum / gs.attempt_count)::numeric, 2) AS value
+        FROM grade_stats gs
+        JOIN quizzes q ON q.id = gs.scope_id
+        WHERE gs.scope = 'quiz' AND gs.attempt_count > 0
         """
         params = {}
 
@@ -79,7 +95,7 @@ class DashboardRepository:
             query += " AND q.course_id = :course_id"
             params["course_id"] = course_id
 
-        query += " GROUP BY q.title ORDER BY q.title"
+        query += " ORDER BY q.title"
 
         result = await db.execute(text(query), params)
         return [{"label": r.label, "value": float(r.value)} for r in result.all()]
@@ -89,30 +105,36 @@ class DashboardRepository:
     async def grade_distribution(self, db: AsyncSession):
         query = """
         SELECT
-        CASE
-            WHEN score <= 20 THEN '0-20'
-            WHEN score <= 40 THEN '21-40'
-            WHEN score <= 60 THEN '41-60'
-            WHEN score <= 80 THEN '61-80'
-            ELSE '81-100'
-        END AS range,
-        COUNT(*) AS total
-        FROM quiz_attempts
-        WHERE finished_at IS NOT NULL
-        GROUP BY range
-        ORDER BY range
+        SUM(bucket_0_20) AS bucket_0_20,
+        SUM(bucket_21_40) AS bucket_21_40,
+        SUM(bucket_41_60) AS bucket_41_60,
+        SUM(bucket_61_80) AS bucket_61_80,
+        SUM(bucket_81_100) AS bucket_81_100
+        FROM grade_stats
+        WHERE scope = 'quiz'
         """
         result = await db.execute(text(query))
-        return {r.range: r.total for r in result.all()}
+        row = result.first()
+        if row is None or row.bucket_0_20 is None:
+            return {}
+
+        buckets = {
+            "0-20": row.bucket_0_20,
+            "21-40": row.bucket_21_40,
+            "41-60": row.bucket_41_60,
+            "61-80": row.bucket_61_80,
+            "81-100": row.bucket_81_100,
+        }
+        return {k: v for k, v in buckets.items() if v > 0}
 
     async def grades_by_user(self, db: AsyncSession):
         query = """
         SELECT
         u.name AS label,
-        ROUND(AVG(qa.score)::numeric, 2) AS value
-        FROM quiz_attempts qa
-        JOIN users u ON u.id = qa.user_id
-        WHERE qa.finished_at IS NOT NULL
+        ROUND((SUM(gs.score_sum) / SUM(gs.attempt_count))::numeric, 2) AS value
+        FROM grade_stats gs
+        JOIN users u ON u.id = gs.scope_id
+        WHERE gs.scope = 'user' AND gs.attempt_count > 0
         GROUP BY u.name
         ORDER BY u.name
         """
@@ -123,12 +145,10 @@ class DashboardRepository:
         query = """
         SELECT
             u.name AS label,
-            ROUND(AVG(qa.score)::numeric, 2) AS value
-        FROM quiz_attempts qa
-        JOIN users u ON u.id = qa.user_id
-        WHERE qa.finished_at IS NOT NULL
-        GROUP BY u.id, u.name
-        HAVING COUNT(qa.id) >= 1
+            ROUND((gs.score_sum / gs.attempt_count)::numeric, 2) AS value
+        FROM grade_stats gs
+        JOIN users u ON u.id = gs.scope_id
+        WHERE gs.scope = 'user' AND gs.attempt_count >= 1
         ORDER BY value DESC
         LIMIT :limit
         """
@@ -0,0 +1,102 @@
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import text
+
+SCOPE_QUIZ = "quiz"
+SCOPE_COURSE = "course"
+SCOPE_USER = "user"
+
+# Soma (sign = 1) ou subtrai (sign = -1) as tentativas terminadas que passam no
+# filtro aos agregados de cada quiz, curso e user, num único statement. Não há linha
+# global: seria um lock partilhado por todos os finish concorrentes até ao commit; os
+# totais globais são a soma das linhas 'quiz' (DashboardRepository).
+_APPLY_SQL = """
+WITH a AS (
+    SELECT qa.score, qa.quiz_id, qa.user_id, q.course_id
+    FROM quiz_attempts qa
+    JOIN quizzes q ON q.id = qa.quiz_id
+    WHERE qa.finished_at IS NOT NULL{where}
+),
+s AS (
+    SELECT 'quiz' AS scope, quiz_id AS scope_id, score FROM a
+    UNION ALL SELECT 'course', course_id, score FROM a
+    UNION ALL SELECT 'user', user_id, score FROM a
+)
+INSERT INTO grade_stats (
+    scope, scope_id, score_sum, attempt_count,
+    bucket_0_20, bucket_21_40, bucket_41_60, bucket_61_80, bucket_81_100, updated_at
+)
+SELECT
+    scope,
+    scope_id,
+    CAST(:sign AS integer) * SUM(score),
+    CAST(:sign AS integer) * COUNT(*),
+    CAST(:sign AS integer) * COUNT(*) FILTER (WHERE score <= 20),
+    CAST(:sign AS integer) * COUNT(*) FILTER (WHERE score > 20 AND score <= 40),
+    CAST(:sign AS integer) * COUNT(*) FILTER (WHERE score > 40 AND score <= 60),
+    CAST(:sign AS integer) * COUNT(*) FILTER (WHERE score > 60 AND score <= 80),
+    CAST(:sign AS integer) * COUNT(*) FILTER (WHERE score > 80),
+    now()
+FROM s
+GROUP BY scope, scope_id
+ON CONFLICT (scope, scope_id) DO UPDATE SET
+    score_sum = grade_stats.score_sum + EXCLUDED.score_sum,
+    attempt_count = grade_stats.attempt_count + EXCLUDED.attempt_count,
+    bucket_0_20 = grade_stats.bucket_0_20 + EXCLUDED.bucket_0_20,
+    bucket_21_40 = grade_stats.bucket_21_40 + EXCLUDED.bucket_21_40,
+    bucket_41_60 = grade_stats.bucket_41_60 + EXCLUDED.bucket_41_60,
+    bucket_61_80 = grade_stats.bucket_61_80 + EXCLUDED.bucket_61_80,
+    bucket_81_100 = grade_stats.bucket_81_100 + EXCLUDED.bucket_81_100,
+    updated_at = now()
+"""
+
+_FILTERS = {
+    "attempt_id": "qa.id = :attempt_id",
+    "user_id": "qa.user_id = :user_id",
+    "quiz_id": "qa.quiz_id = :quiz_id",
+    "course_id": "q.course_id = :course_id",
+}
+
+
+class GradeStatRepository:
+    # Nenhum método faz commit: as alterações entram na transação de quem chama
+    # (ex.: QuizAttemptService.finish), para que os agregados nunca divirjam das tentativas.
+
+    async def _apply(self, db: AsyncSession, sign: int, **filters: Optional[str]) -> None:
+        params: dict = {"sign": sign}
+        where = ""
+        for key, value in filters.items():
+            if value is None:
+                continue
+            where += f" AND {_FILTERS[key]}"
+            params[key] = value
+
+        await db.execute(text(_APPLY_SQL.format(where=where)), params)
+
+    async def add_attempts(
+        self,
+        db: AsyncSession,
+        *,
+        attempt_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        quiz_id: Optional[str] = None,
+        course_id: Optional[str] = None,
+    ) -> None:
+        await self._apply(db, 1, attempt_id=attempt_id, user_id=user_id, quiz_id=quiz_id, course_id=course_id)
+
+    async def remove_attempts(
+        self,
+        db: AsyncSession,
+        *,
+        attempt_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        quiz_id: Optional[str] = None,
+        course_id: Optional[str] = None,
+    ) -> None:
+        # deve correr antes de apagar/alterar as tentativas, enquanto ainda existem
+        await self._apply(db, -1, attempt_id=attempt_id, user_id=user_id, quiz_id=quiz_id, course_id=course_id)
+        await db.execute(text("DELETE FROM grade_stats WHERE attempt_count <= 0"))
+
+    async def rebuild(self, db: AsyncSession) -> None:
+        await db.execute(text("DELETE FROM grade_stats"))
+        await self._apply(db, 1)
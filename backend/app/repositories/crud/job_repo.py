@@ -0,0 +1,139 @@
+import datetime as dt
+from typing import Optional, Sequence
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, delete, case, cast, func
+from app.models.job import Job
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+class JobRepository:
+    async def get(self, db: AsyncSession, job_id: str) -> Optional[Job]:
+        return await db.get(Job, job_id)
+
+    async def create(
+        self,
+        db: AsyncSession,
+        *,
+        type: str,
+        payload: dict,
+        max_attempts: int,
+        created_by: Optional[str] = None,
+    ) -> Job:
+        job = Job(type=type, payload=payload, max_attempts=max_attempts, created_by=created_by)
+        db.add(job)
+        await db.flush()
+        return job
+
+    async def ready_types(self, db: AsyncSession) -> set[str]:
+        # tipos com jobs à espera (usa o índice parcial ix_jobs_queued); quase sempre vazio
+        res = await db.execute(
+            select(Job.type).where(Job.status == QUEUED, Job.run_after <= func.now()).distinct()
+        )
+        return set(res.scalars().all())
+
+    async def claim(self, db: AsyncSession, job_type: str, limit: int) -> Sequence[Job]:
+        # Reclama até `limit` jobs num só UPDATE. SKIP LOCKED deixa vários workers a ler a
+        # mesma fila sem se bloquearem nem apanharem o mesmo job.
+        ids = (
+            select(Job.id)
+            .where(Job.status == QUEUED, Job.type == job_type, Job.run_after <= func.now())
+            .order_by(Job.run_after)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        res = await db.execute(
+            update(Job)
+            .where(Job.id.in_(ids.scalar_subquery()))
+            .values(status=RUNNING, attempts=Job.attempts + 1, started_at=func.now(), updated_at=func.now())
+            .returning(Job)
+            .execution_options(synchronize_session=False)
+        )
+        return res.scalars().all()
+
+    async def heartbeat(self, db: AsyncSession, job_ids: Sequence[str]) -> None:
+        if job_ids:
+            await db.execute(
+                update(Job).where(Job.id.in_(job_ids), Job.status == RUNNING).values(updated_at=func.now())
+            )
+
+    async def set_progress(self, db: AsyncSession, job_id: str, attempt: int, progress: float) -> None:
+        await db.execute(
+            update(Job).where(*self._current(job_id, attempt)).values(progress=progress, updated_at=func.now())
+        )
+
+    # As escritas de um worker só valem para a tentativa que ele reclamou: se o job foi
+    # dado como perdido (requeue_stale) e reclamado por outro, não há linha a atualizar.
+    # Devolvem False nesse caso.
+
+    async def succeed(
+        self, db: AsyncSession, job_id: str, attempt: int, result: Optional[dict], *, clear_payload: bool = False
+    ) -> bool:
+        values = {"status": SUCCEEDED, "result": result, "error": None, "progress": 1.0, "finished_at": func.now()}
+        if clear_payload:
+            values["payload"] = {}
+        res = await db.execute(update(Job).where(*self._current(job_id, attempt)).values(**values))
+        return res.rowcount > 0
+
+    async def fail(
+        self, db: AsyncSession, job_id: str, attempt: int, error: str, *, clear_payload: bool = False
+    ) -> bool:
+        values = {"status": FAILED, "error": error, "finished_at": func.now()}
+        if clear_payload:
+            values["payload"] = {}
+        res = await db.execute(update(Job).where(*self._current(job_id, attempt)).values(**values))
+        return res.rowcount > 0
+
+    async def retry(self, db: AsyncSession, job_id: str, attempt: int, error: str, run_after: dt.datetime) -> bool:
+        res = await db.execute(
+            update(Job)
+            .where(*self._current(job_id, attempt))
+            .values(status=QUEUED, error=error, progress=0.0, run_after=run_after)
+        )
+        return res.rowcount > 0
+
+    async def release(self, db: AsyncSession, job_id: str, attempt: int) -> bool:
+        # devolve à fila um job interrompido pelo shutdown, sem gastar uma tentativa
+        res = await db.execute(
+            update(Job)
+            .where(*self._current(job_id, attempt))
+            .values(status=QUEUED, attempts=Job.attempts - 1, progress=0.0, run_after=func.now())
+        )
+        return res.rowcount > 0
+
+    @staticmethod
+    def _current(job_id: str, attempt: int) -> tuple:
+        return Job.id == job_id, Job.status == RUNNING, Job.attempts == attempt
+
+    async def requeue_stale(
+        self, db: AsyncSession, stale_after: dt.timedelta, *, clear_payload_types: Sequence[str] = ()
+    ) -> int:
+        # jobs "running" sem heartbeat: o worker morreu. Voltam à fila, ou falham se
+        # já gastaram as tentativas todas (limpando o payload dos tipos clear_payload).
+        exhausted = Job.attempts >= Job.max_attempts
+        cleared = exhausted & Job.type.in_(clear_payload_types)
+        res = await db.execute(
+            update(Job)
+            .where(Job.status == RUNNING, Job.updated_at < func.now() - stale_after)
+            .values(
+                status=case((exhausted, FAILED), else_=QUEUED),
+                error=case((exhausted, "Worker lost"), else_=Job.error),
+                finished_at=case((exhausted, func.now()), else_=None),
+                payload=case((cleared, cast({}, Job.payload.type)), else_=Job.payload),
+                progress=0.0,
+                run_after=func.now(),
+            )
+        )
+        return res.rowcount
+
+    async def purge(self, db: AsyncSession, older_than: dt.timedelta) -> Sequence[Optional[dict]]:
+        # apaga os jobs terminados há mais de older_than; devolve os results (ficheiros a apagar)
+        res = await db.execute(
+            delete(Job)
+            .where(Job.status.in_((SUCCEEDED, FAILED)), Job.finished_at < func.now() - older_than)
+            .returning(Job.result)
+        )
+        return res.scalars().all()
@@ -2,16 +2,18 @@ from typing import Sequence, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.models.modality import Modality
+from app.core.config import settings
+from app.utils.pagination import paginate
 
 class ModalityRepository:
-    async def list(self, db: AsyncSession, skip: int = 0, limit: Optional[int] = None) -> Sequence[Modality]:
-        stmt = select(Modality).offset(skip)
-
-        if limit is not None:
-            stmt = stmt.limit(limit)
-            
-        result = await db.execute(stmt)
-        return result.scalars().all()
+    async def list(
+        self,
+        db: AsyncSession,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+    ) -> dict:
+        return await paginate(db, select(Modality), Modality, cursor=cursor, limit=limit)
 
     async def get(self, db: AsyncSession, modality_id: str) -> Optional[Modality]:
         return await db.get(Modality, modality_id)
@@ -23,8 +25,7 @@ class ModalityRepository:
     async def create(self, db: AsyncSession, *, name: str, description: Optional[str] = None) -> Modality:
         modality = Modality(name=name, description=description)
         db.add(modality)
-        await db.commit()
-        await db.refresh(modality)
+        await db.flush()
         return modality
 
     async def update(self, db: AsyncSession, modality: Modality, *, name: Optional[str] = None, description: Optional[str] = None) -> Modality:
@@ -36,13 +37,12 @@ class ModalityRepository:
             modality.description = description
 
         db.add(modality)
-        await db.commit()
-        await db.refresh(modality)
+        await db.flush()
         return modality
 
     async def delete(self, db: AsyncSession, modality: Modality) -> bool:
         if not modality:
             return None
         await db.delete(modality)
-        await db.commit()
+        await db.flush()
         return True
\ No newline at end of file
@@ -2,17 +2,19 @@ from typing import Sequence, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.models.option import Option
+from app.core.config import settings
+from app.utils.pagination import paginate
 
 
 class OptionRepository:
-    async def list(self, db: AsyncSession, *, skip: int = 0, limit: Optional[int] = None) -> Sequence[Option]:
-        stmt = select(Option).offset(skip)
-
-        if limit is not None:
-            stmt = stmt.limit(limit)
-
-        result = await db.execute(stmt)
-        return result.scalars().all()
+    async def list(
+        self,
+        db: AsyncSession,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+    ) -> dict:
+        return await paginate(db, select(Option), Option, cursor=cursor, limit=limit)
 
     async def get(self, db: AsyncSession, option_id: str) -> Optional[Option]:
         return await db.get(Option, option_id)
@@ -25,21 +27,19 @@ class OptionRepository:
     async def create(self, db: AsyncSession, *, text: str) -> Option:
         obj = Option(text=text)
         db.add(obj)
-        await db.commit()
-        await db.refresh(obj)
+        await db.flush()
         return obj
 
     async def update(self, db: AsyncSession, option: Option, *, text: Optional[str] = None) -> Option:
         if text is not None:
             option.text = text
         db.add(option)
-        await db.commit()
-        await db.refresh(option)
+        await db.flush()
         return option
 
     async def delete(self, db: AsyncSession, option: Option) -> bool:
         if not option:
             return None
         await db.delete(option)
-        await db.commit()
+        await db.flush()
         return True
\ No newline at end of file
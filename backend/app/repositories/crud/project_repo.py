@@ -2,12 +2,19 @@ from typing import Sequence, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.models.project import Project
+from app.core.config import settings
+from app.utils.pagination import paginate
 
 
 class ProjectRepository:
-    async def list(self, db: AsyncSession, *, skip: int = 0, limit: int = 100) -> Sequence[Project]:
-        result = await db.execute(select(Project).offset(skip).limit(limit))
-        return result.scalars().all()
+    async def list(
+        self,
+        db: AsyncSession,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+    ) -> dict:
+        return await paginate(db, select(Project), Project, cursor=cursor, limit=limit)
 
     async def get(self, db: AsyncSession, project_id: str) -> Optional[Project]:
         return await db.get(Project, project_id)
@@ -41,8 +48,7 @@ class ProjectRepository:
             course_id=course_id,
         )
         db.add(obj)
-        await db.commit()
-        await db.refresh(obj)
+        await db.flush()
         return obj
 
     async def update(
@@ -68,13 +74,12 @@ class ProjectRepository:
             project.course_id = course_id
 
         db.add(project)
-        await db.commit()
-        await db.refresh(project)
+        await db.flush()
         return project
 
     async def delete(self, db: AsyncSession, project: Project) -> bool:
         if not project:
             return None
         await db.delete(project)
-        await db.commit()
+        await db.flush()
         return True
@@ -27,7 +27,7 @@ class QuestionOptionRepository:
             delete(QuestionOption)
             .where(QuestionOption.question_id == question_id)
         )
-        await db.commit()
+        await db.flush()
 
     async def bulk_create(
         self,
@@ -35,4 +35,4 @@ class QuestionOptionRepository:
         items: list[QuestionOption]
     ) -> None:
         db.add_all(items)
-        await db.commit()
+        await db.flush()
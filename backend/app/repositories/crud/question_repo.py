@@ -2,16 +2,19 @@ from typing import Sequence, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.models.question import Question
+from app.core.config import settings
+from app.utils.pagination import paginate
 
 
 class QuestionRepository:
-    async def list(self, db: AsyncSession, *, skip: int = 0, limit: Optional[int] = None) -> Sequence[Question]:
-        stmt = select(Question).offset(skip)
-        if limit is not None:
-            stmt = stmt.limit(limit)
-
-        result = await db.execute(stmt)
-        return result.scalars().all()
+    async def list(
+        self,
+        db: AsyncSession,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+    ) -> dict:
+        return await paginate(db, select(Question), Question, cursor=cursor, limit=limit)
 
     async def get(self, db: AsyncSession, question_id: str) -> Optional[Question]:
         return await db.get(Question, question_id)
@@ -23,8 +26,7 @@ class QuestionRepository:
     async def create(self, db: AsyncSession, *, text: str, quiz_id: str) -> Question:
         question = Question(text=text, quiz_id=quiz_id)
         db.add(question)
-        await db.commit()
-        await db.refresh(question)
+        await db.flush()
         return question
 
     async def update(
@@ -41,12 +43,11 @@ class QuestionRepository:
             question.quiz_id = quiz_id
 
         db.add(question)
-        await db.commit()
-        await db.refresh(question)
+        await db.flush()
         return question
 
     async def delete(self, db: AsyncSession, question: Question) -> None:
         if not question:
             return None
         await db.delete(question)
-        await db.commit()
+        await db.flush()
@@ -1,15 +1,116 @@
+import json
 from typing import Sequence, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, text, Row
 from app.models.quiz_attempt import QuizAttempt
+from app.models.question import Question
+from app.models.question_option import QuestionOption
+from app.core.config import settings
+from app.utils.pagination import paginate
+
+# Corrige e termina a tentativa e atribui/melhora o badge num único statement.
+# O "finished_at IS NULL" no UPDATE é a guarda contra finish concorrentes: o segundo
+# espera pelo lock da linha, volta a avaliar a condição e não atualiza nada.
+_FINISH_SQL = """
+WITH graded AS (
+    SELECT
+        qa.id,
+        (SELECT count(*) FROM questions q WHERE q.quiz_id = qa.quiz_id) AS total,
+        (
+            SELECT count(*)
+            FROM answers a
+            JOIN questions_options qo
+              ON qo.question_id = a.question_id AND qo.option_id = a.option_id
+            WHERE a.attempt_id = qa.id AND qo.is_correct
+        ) AS correct
+    FROM quiz_attempts qa
+    WHERE qa.id = :attempt_id AND qa.finished_at IS NULL
+),
+finished AS (
+    UPDATE quiz_attempts qa
+    SET score = round(100.0 * g.correct / g.total, 2),
+        finished_at = now(),
+        draft_answers = NULL
+    FROM graded g
+    WHERE qa.id = g.id AND qa.finished_at IS NULL AND g.total > 0
+    RETURNING qa.id, qa.score, qa.finished_at, qa.user_id, qa.quiz_id
+),
+earned AS (
+    SELECT
+        f.id,
+        f.user_id,
+        f.quiz_id,
+        CASE
+            WHEN f.score = 100 THEN CAST(:gold_id AS varchar)
+            WHEN f.score >= 80 THEN CAST(:silver_id AS varchar)
+            WHEN f.score >= 50 THEN CAST(:bronze_id AS varchar)
+        END AS badge_id
+    FROM finished f
+),
+awarded AS (
+    INSERT INTO quiz_badge_awards (id, user_id, quiz_id, badge_id, attempt_id, awarded_at)
+    SELECT CAST(:award_id AS varchar), e.user_id, e.quiz_id, e.badge_id, e.id, now()
+    FROM earned e
+    WHERE e.badge_id IS NOT NULL
+    ON CONFLICT (user_id, quiz_id) DO UPDATE SET
+        badge_id = EXCLUDED.badge_id,
+        attempt_id = EXCLUDED.attempt_id,
+        awarded_at = EXCLUDED.awarded_at,
+        updated_at = now()
+    WHERE (SELECT min_score FROM badges WHERE id = EXCLUDED.badge_id)
+        > COALESCE((SELECT min_score FROM badges WHERE id = quiz_badge_awards.badge_id), -1)
+    RETURNING badge_id
+)
+SELECT f.id, f.score, f.finished_at, f.user_id, f.quiz_id, (SELECT badge_id FROM awarded) AS badge_id
+FROM finished f
+"""
+
+# Junta um lote de alterações do buffer (app.core.attempt_buffer) ao checkpoint de cada
+# tentativa, ficando por pergunta a resposta mais recente ("t"). Um só statement para o
+# lote inteiro ({attempt_id: alterações}); as linhas são bloqueadas por ordem de id para
+# dois checkpoints concorrentes não se bloquearem um ao outro. Tentativas já terminadas
+# (ou apagadas) não são tocadas e não aparecem no RETURNING.
+_CHECKPOINT_SQL = """
+WITH batch AS (
+    SELECT key AS attempt_id, value AS changes FROM jsonb_each(CAST(:drafts AS jsonb))
+),
+locked AS (
+    SELECT qa.id
+    FROM quiz_attempts qa
+    JOIN batch b ON b.attempt_id = qa.id
+    WHERE qa.finished_at IS NULL
+    ORDER BY qa.id
+    FOR UPDATE OF qa
+)
+UPDATE quiz_attempts qa
+SET draft_answers = (
+    SELECT jsonb_object_agg(latest.k, latest.v)
+    FROM (
+        SELECT DISTINCT ON (k) k, v
+        FROM (
+            SELECT key AS k, value AS v FROM jsonb_each(COALESCE(qa.draft_answers, '{}'::jsonb))
+            UNION ALL
+            SELECT key, value FROM jsonb_each(b.changes)
+        ) s
+        ORDER BY k, (v->>'t')::float8 DESC
+    ) latest
+)
+FROM locked l
+JOIN batch b ON b.attempt_id = l.id
+WHERE qa.id = l.id AND qa.finished_at IS NULL
+RETURNING qa.id
+"""
 
 
 class QuizAttemptRepository:
-    async def list(self, db: AsyncSession, skip: int = 0, limit: int = 100) -> Sequence[QuizAttempt]:
-        result = await db.execute(
-            select(QuizAttempt).offset(skip).limit(limit).order_by(QuizAttempt.id)
-        )
-        return result.scalars().all()
+    async def list(
+        self,
+        db: AsyncSession,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+    ) -> dict:
+        return await paginate(db, select(QuizAttempt), QuizAttempt, cursor=cursor, limit=limit)
 
     async def get(self, db: AsyncSession, attempt_id: str) -> Optional[QuizAttempt]:
         return await db.get(QuizAttempt, attempt_id)
@@ -17,8 +118,7 @@ class QuizAttemptRepository:
     async def create(self, db: AsyncSession, *, score: float, finished_at, user_id: str, quiz_id: str) -> QuizAttempt:
         obj = QuizAttempt(score=score, finished_at=finished_at, user_id=user_id, quiz_id=quiz_id)
         db.add(obj)
-        await db.commit()
-        await db.refresh(obj)
+        await db.flush()
         return obj
 
     async def update(self, db: AsyncSession, attempt: QuizAttempt, *, score=None, finished_at=None) -> QuizAttempt:
@@ -27,13 +127,74 @@ class QuizAttemptRepository:
         if finished_at is not None:
             attempt.finished_at = finished_at
         db.add(attempt)
-        await db.commit()
-        await db.refresh(attempt)
+        await db.flush()
         return attempt
 
+    async def finish(
+        self,
+        db: AsyncSession,
+        attempt_id: str,
+        *,
+        award_id: str,
+        gold_id: Optional[str],
+        silver_id: Optional[str],
+        bronze_id: Optional[str],
+    ) -> Optional[Row]:
+        # sem commit; devolve None se a tentativa não existe, já estava terminada
+        # ou o quiz não tem perguntas
+        res = await db.execute(
+            text(_FINISH_SQL),
+            {
+                "attempt_id": attempt_id,
+                "award_id": award_id,
+                "gold_id": gold_id,
+                "silver_id": silver_id,
+                "bronze_id": bronze_id,
+            },
+        )
+        return res.first()
+
+    async def list_answer_key(self, db: AsyncSession, attempt_id: str) -> Sequence[Row]:
+        # (finished_at, question_id, option_id) de cada par pergunta/opção do quiz da tentativa,
+        # numa só query. Bloqueia a linha da tentativa até ao fim da transação para que um
+        # finish concorrente não a termine a meio da submissão.
+        stmt = (
+            select(QuizAttempt.finished_at, Question.id.label("question_id"), QuestionOption.option_id)
+            .select_from(QuizAttempt)
+            .outerjoin(Question, Question.quiz_id == QuizAttempt.quiz_id)
+            .outerjoin(QuestionOption, QuestionOption.question_id == Question.id)
+            .where(QuizAttempt.id == attempt_id)
+            .with_for_update(of=QuizAttempt)
+        )
+        res = await db.execute(stmt)
+        return res.all()
+
+    async def checkpoint_drafts(self, db: AsyncSession, drafts: dict[str, dict]) -> int:
+        # devolve quantas tentativas foram gravadas (as já terminadas ficam de fora)
+        res = await db.execute(text(_CHECKPOINT_SQL), {"drafts": json.dumps(drafts)})
+        return len(res.all())
+
+    async def get_draft(self, db: AsyncSession, attempt_id: str) -> Optional[Row]:
+        # (finished_at, draft_answers) sem carregar a tentativa inteira
+        res = await db.execute(
+            select(QuizAttempt.finished_at, QuizAttempt.draft_answers).where(QuizAttempt.id == attempt_id)
+        )
+        return res.first()
+
+    async def lock_draft(self, db: AsyncSession, attempt_id: str) -> Optional[Row]:
+        # (draft_answers,) de uma tentativa por terminar (None se não existe ou já terminou),
+        # com a linha bloqueada: um checkpoint concorrente espera pelo finish e depois já
+        # não a encontra por terminar
+        res = await db.execute(
+            select(QuizAttempt.draft_answers)
+            .where(QuizAttempt.id == attempt_id, QuizAttempt.finished_at.is_(None))
+            .with_for_update()
+        )
+        return res.first()
+
     async def delete(self, db: AsyncSession, attempt: QuizAttempt) -> None:
         await db.delete(attempt)
-        await db.commit()
+        await db.flush()
 
     async def list_by_user(self, db: AsyncSession, user_id: str):
         stmt = (
@@ -1,18 +1,21 @@
 from typing import Sequence, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
 from app.models.quiz_badge_award import QuizBadgeAward
+from app.core.config import settings
+from app.utils.pagination import paginate
 
 
 class QuizBadgeAwardRepository:
-    async def list(self, db: AsyncSession, skip: int = 0, limit: Optional[int] = None) -> Sequence[QuizBadgeAward]:
-        stmt = select(QuizBadgeAward).offset(skip).order_by(QuizBadgeAward.awarded_at.desc())
-        if limit is not None:
-            stmt = stmt.limit(limit)
-        res = await db.execute(stmt)
-        return res.scalars().all()
+    async def list(
+        self,
+        db: AsyncSession,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+    ) -> dict:
+        return await paginate(db, select(QuizBadgeAward), QuizBadgeAward, cursor=cursor, limit=limit)
 
     async def get(self, db: AsyncSession, award_id: str) -> Optional[QuizBadgeAward]:
         stmt = (
@@ -65,12 +68,7 @@ class QuizBadgeAwardRepository:
             attempt_id=attempt_id,
         )
         db.add(obj)
-        try:
-            await db.commit()
-        except IntegrityError:
-            await db.rollback()
-            raise
-        await db.refresh(obj)
+        await db.flush()
         return obj
 
     async def update(
@@ -84,17 +82,12 @@ class QuizBadgeAwardRepository:
         award.badge_id = badge_id
         award.attempt_id = attempt_id
         db.add(award)
-        try:
-            await db.commit()
-        except IntegrityError:
-            await db.rollback()
-            raise
-        await db.refresh(award)
+        await db.flush()
         return award
 
     async def delete(self, db: AsyncSession, award: Optional[QuizBadgeAward]) -> bool:
         if not award:
             return False
         await db.delete(award)
-        await db.commit()
+        await db.flush()
         return True
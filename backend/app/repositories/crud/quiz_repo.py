@@ -2,22 +2,24 @@ from typing import Sequence, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.models.quiz import Quiz
+from app.core.config import settings
+from app.utils.pagination import paginate
+from app.utils.search import search_clause, search_rank
 
 class QuizRepository:
     async def list(
         self,
         db: AsyncSession,
         *,
-        skip: int = 0,
-        limit: Optional[int] = None
-    ) -> Sequence[Quiz]:
-        stmt = select(Quiz).offset(skip)
-
-        if limit is not None:
-            stmt = stmt.limit(limit)
-
-        result = await db.execute(stmt)
-        return result.scalars().all()
+        q: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+    ) -> dict:
+        if q and q.strip():
+            stmt = select(Quiz).where(search_clause(q, Quiz.title))
+            rank = search_rank(q, Quiz.title)
+            return await paginate(db, stmt, Quiz, cursor=cursor, limit=limit, rank=rank)
+        return await paginate(db, select(Quiz), Quiz, cursor=cursor, limit=limit)
 
     async def get(self, db: AsyncSession, quiz_id: str) -> Optional[Quiz]:
         return await db.get(Quiz, quiz_id)
@@ -33,6 +35,14 @@ class QuizRepository:
         )
         return res.scalar_one_or_none()
 
+    async def ids_by_course(self, db: AsyncSession, course_id: str) -> Sequence[str]:
+        res = await db.execute(select(Quiz.id).where(Quiz.course_id == course_id))
+        return res.scalars().all()
+
+    async def ids_by_video(self, db: AsyncSession, video_id: str) -> Sequence[str]:
+        res = await db.execute(select(Quiz.id).where(Quiz.video_id == video_id))
+        return res.scalars().all()
+
     async def create(
         self,
         db: AsyncSession,
@@ -53,8 +63,7 @@ class QuizRepository:
             video_id=video_id,
         )
         db.add(obj)
-        await db.commit()
-        await db.refresh(obj)
+        await db.flush()
         return obj
 
     async def update(
@@ -80,8 +89,7 @@ class QuizRepository:
         quiz.video_id = video_id
 
         db.add(quiz)
-        await db.commit()
-        await db.refresh(quiz)
+        await db.flush()
         return quiz
 
 
@@ -89,7 +97,7 @@ class QuizRepository:
         if not quiz:
             return False
         await db.delete(quiz)
-        await db.commit()
+        await db.flush()
         return True
     
     async def get_active_by_course(self, db: AsyncSession, course_id: str) -> Quiz | None:
@@ -2,16 +2,22 @@ from typing import Sequence, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.models.role import Role
+from app.core.config import settings
+from app.utils.pagination import paginate
 
 class RoleRepository:
-    async def list(self, db: AsyncSession, skip: int = 0, limit: Optional[int] = None) -> Sequence[Role]:
-        stmt = select(Role).offset(skip)
-
-        if limit is not None:
-            stmt = stmt.limit(limit)
-        result = await db.execute(stmt)
-        
-        return result.scalars().all()
+    async def list(
+        self,
+        db: AsyncSession,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+    ) -> dict:
+        return await paginate(db, select(Role), Role, cursor=cursor, limit=limit)
+
+    async def list_all(self, db: AsyncSession) -> Sequence[Role]:
+        res = await db.execute(select(Role))
+        return res.scalars().all()
 
     async def get(self, db: AsyncSession, role_id: str) -> Optional[Role]:
         return await db.get(Role, role_id)
@@ -23,8 +29,7 @@ class RoleRepository:
     async def create(self, db: AsyncSession, *, name: str, description: Optional[str] = None) -> Role:
         role = Role(name=name, description=description)
         db.add(role)
-        await db.commit()
-        await db.refresh(role)
+        await db.flush()
         return role
 
     async def update(self, db: AsyncSession, role: Role, *, name: Optional[str] = None, description: Optional[str] = None) -> Role:
@@ -36,13 +41,12 @@ class RoleRepository:
             role.description = description
 
         db.add(role)
-        await db.commit()
-        await db.refresh(role)
+        await db.flush()
         return role
 
     async def delete(self, db: AsyncSession, role: Role) -> bool:
         if not role:
             return None
         await db.delete(role)
-        await db.commit()
+        await db.flush()
         return True
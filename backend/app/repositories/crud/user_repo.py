@@ -1,23 +1,34 @@
-from typing import Sequence, Optional
+from typing import AsyncIterator, Sequence, Optional
 import datetime as dt
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_
-from sqlalchemy.orm import selectinload
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select, update, or_, Row
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import selectinload, joinedload
 
 from app.models.user import User
+from app.models.role import Role
 from app.schemas.user import UserCreate, StatusEnum, GenderEnum
+from app.core.config import settings
+from app.utils.pagination import paginate
+from app.utils.search import search_clause, search_rank
 
+_SEARCH_COLUMNS = (User.name, User.username, User.email)
 
-class UserRepository:
-    async def list(self, db: AsyncSession, skip: int = 0, limit: Optional[int] = None) -> Sequence[User]:
-        stmt = select(User).offset(skip).order_by(User.created_at.desc())
-
-        if limit is not None:
-            stmt = stmt.limit(limit)
 
-        result = await db.execute(stmt)
-        return result.scalars().all()
+class UserRepository:
+    async def list(
+        self,
+        db: AsyncSession,
+        *,
+        q: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+    ) -> dict:
+        if q and q.strip():
+            stmt = select(User).where(search_clause(q, *_SEARCH_COLUMNS))
+            rank = search_rank(q, *_SEARCH_COLUMNS)
+            return await paginate(db, stmt, User, cursor=cursor, limit=limit, rank=rank)
+        return await paginate(db, select(User), User, cursor=cursor, limit=limit)
 
     async def get(self, db: AsyncSession, user_id: str) -> Optional[User]:
         return await db.get(User, user_id)
@@ -26,8 +37,11 @@ class UserRepository:
         result = await db.execute(select(User).where(User.email == email))
         return result.scalar_one_or_none()
 
-    async def get_by_username(self, db: AsyncSession, username: str) -> Optional[User]:
-        result = await db.execute(select(User).where(User.username == username))
+    async def get_by_username(self, db: AsyncSession, username: str, *, with_role: bool = False) -> Optional[User]:
+        stmt = select(User).where(User.username == username)
+        if with_role:
+            stmt = stmt.options(joinedload(User.role))
+        result = await db.execute(stmt)
         return result.scalar_one_or_none()
 
     def _status_value(self, status: Optional[StatusEnum | str]) -> Optional[str]:
@@ -56,12 +70,7 @@ class UserRepository:
         )
 
         db.add(user)
-        try:
-            await db.commit()
-        except IntegrityError:
-            await db.rollback()
-            raise
-        await db.refresh(user)
+        await db.flush()
         return user
 
     async def update(
@@ -102,19 +111,42 @@ class UserRepository:
             user.birthdate = birthdate
 
         db.add(user)
-        try:
-            await db.commit()
-        except IntegrityError:
-            await db.rollback()
-            raise
-        await db.refresh(user)
+        await db.flush()
         return user
 
+    async def rehash_password(self, db: AsyncSession, user_id: str, old_hash: str, new_hash: str) -> None:
+        # só se a password não mudou entretanto (o login verificou old_hash fora da transação)
+        await db.execute(
+            update(User).where(User.id == user_id, User.password == old_hash).values(password=new_hash)
+        )
+
+    async def taken(self, db: AsyncSession, emails: Sequence[str], usernames: Sequence[str]) -> tuple[set[str], set[str]]:
+        # (emails, usernames) que já existem, para uma importação inteira num só SELECT
+        res = await db.execute(
+            select(User.email, User.username).where(or_(User.email.in_(emails), User.username.in_(usernames)))
+        )
+        taken_emails: set[str] = set()
+        taken_usernames: set[str] = set()
+        for email, username in res:
+            taken_emails.add(email)
+            taken_usernames.add(username)
+        return taken_emails, taken_usernames
+
+    async def bulk_create(self, db: AsyncSession, rows: Sequence[dict]) -> set[str]:
+        # INSERT multi-linha (o SQLAlchemy agrupa os parâmetros em lotes de VALUES) com
+        # RETURNING dos emails criados. ON CONFLICT DO NOTHING: uma linha que outro pedido
+        # criou entretanto fica de fora em vez de desfazer o lote inteiro.
+        if not rows:
+            return set()
+        stmt = insert(User).on_conflict_do_nothing().returning(User.email)
+        res = await db.execute(stmt, list(rows))
+        return set(res.scalars().all())
+
     async def delete(self, db: AsyncSession, user: Optional[User]) -> bool:
         if not user:
             return False
         await db.delete(user)
-        await db.commit()
+        await db.flush()
         return True
 
     async def export(
@@ -124,22 +156,29 @@ class UserRepository:
         q: Optional[str] = None,
         role_id: Optional[str] = None,
         status: Optional[StatusEnum | str] = None,
-    ) -> Sequence[User]:
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Row]:
+        # Só as colunas do CSV (com o nome do role via join) lidas por cursor do lado do
+        # servidor, `batch_size` linhas de cada vez, em vez de carregar todos os User.
         stmt = (
-            select(User)
-            .options(selectinload(User.role))
+            select(
+                User.id,
+                User.name,
+                User.username,
+                User.email,
+                Role.name.label("role_name"),
+                User.status,
+                User.gender,
+                User.birthdate,
+                User.created_at,
+            )
+            .outerjoin(Role, Role.id == User.role_id)
             .order_by(User.created_at.desc())
+            .execution_options(yield_per=batch_size)
         )
 
-        if q:
-            term = f"%{q.strip().lower()}%"
-            stmt = stmt.where(
-                or_(
-                    User.name.ilike(term),
-                    User.username.ilike(term),
-                    User.email.ilike(term),
-                )
-            )
+        if q and q.strip():
+            stmt = stmt.where(search_clause(q, *_SEARCH_COLUMNS))
 
         if role_id:
             stmt = stmt.where(User.role_id == role_id)
@@ -148,5 +187,6 @@ class UserRepository:
             s = self._status_value(status)
             stmt = stmt.where(User.status == s)
 
-        result = await db.execute(stmt)
-        return result.scalars().all()
+        result = await db.stream(stmt)
+        async for row in result:
+            yield row
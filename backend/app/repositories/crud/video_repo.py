@@ -2,22 +2,19 @@ from typing import Sequence, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.models.video import Video
+from app.core.config import settings
+from app.utils.pagination import paginate
 
 
 class VideoRepository:
     async def list(
         self,
         db: AsyncSession,
-        skip: int = 0,
-        limit: Optional[int] = None,
-    ) -> Sequence[Video]:
-        stmt = select(Video).offset(skip)
-
-        if limit is not None:
-            stmt = stmt.limit(limit)
-            
-        result = await db.execute(stmt)
-        return result.scalars().all()
+        *,
+        cursor: Optional[str] = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+    ) -> dict:
+        return await paginate(db, select(Video), Video, cursor=cursor, limit=limit)
 
     async def get(
         self,
@@ -50,8 +47,7 @@ class VideoRepository:
             description=description,
         )
         db.add(video)
-        await db.commit()
-        await db.refresh(video)
+        await db.flush()
         return video
 
     async def update(
@@ -74,8 +70,7 @@ class VideoRepository:
             video.description = description
 
         db.add(video)
-        await db.commit()
-        await db.refresh(video)
+        await db.flush()
         return video
 
     async def delete(
@@ -87,5 +82,5 @@ class VideoRepository:
             return False
 
         await db.delete(video)
-        await db.commit()
+        await db.flush()
         return True
@@ -16,4 +16,16 @@ class LabelValue(BaseModel):
 
 class GradeDistributionOut(BaseModel):
     range: str
-    total: int
\ No newline at end of file
+    total: int
+
+class DashboardSnapshotOut(BaseModel):
+    summary: SummaryOut
+    average_grade: AverageGradeOut
+    grades_by_course: List[LabelValue]
+    grades_by_quiz: List[LabelValue]
+    grades_by_user: List[LabelValue]
+    grade_distribution: List[GradeDistributionOut]
+    top_students: List[LabelValue]
+    users_over_time: List[LabelValue]
+    quiz_attempts_over_time: List[LabelValue]
+    courses_by_area: List[LabelValue]
@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+from typing import Any, Optional
+from datetime import datetime
+
+
+class JobOut(BaseModel):
+    id: str
+    type: str
+    status: str
+    progress: float
+    attempts: int
+    max_attempts: int
+    result: Optional[dict[str, Any]] = None
+    error: Optional[str] = None
+    run_after: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,10 @@
+from typing import Generic, List, Optional, TypeVar
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    # cursor opaco para pedir a página seguinte (?cursor=...); None na última página
+    next_cursor: Optional[str] = None
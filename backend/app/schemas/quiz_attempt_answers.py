@@ -0,0 +1,37 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+from app.schemas.answer import AnswerOut
+from app.schemas.quiz_attempt import QuizAttemptOut
+from app.schemas.quiz_attempt_finish import BadgeOut
+
+
+class AttemptAnswerIn(BaseModel):
+    question_id: str
+    option_id: Optional[str] = None
+
+
+class AttemptAnswersIn(BaseModel):
+    answers: List[AttemptAnswerIn] = Field(..., min_length=1, max_length=500)
+    # termina (e corrige) a tentativa na mesma transação
+    finish: bool = False
+
+
+class AttemptDraftIn(BaseModel):
+    # só as perguntas que mudaram; option_id None limpa a resposta
+    answers: List[AttemptAnswerIn] = Field(..., min_length=1, max_length=500)
+
+
+class AttemptDraftOut(BaseModel):
+    attempt_id: str
+    finished: bool
+    answers: List[AttemptAnswerIn]
+
+
+class AttemptAnswersOut(BaseModel):
+    answers: List[AnswerOut]
+    attempt: Optional[QuizAttemptOut] = None
+    badge_awarded: Optional[BadgeOut] = None
+
+    class Config:
+        from_attributes = True
@@ -49,6 +49,20 @@ class UserUpdate(BaseModel):
         from_attributes = True
 
 
+class UserImportRowError(BaseModel):
+    row: int  # posição na lista / linha de dados do CSV, a começar em 1
+    email: Optional[str] = None
+    errors: list[str]
+
+
+class UserImportReport(BaseModel):
+    total: int
+    valid: int
+    created: int
+    dry_run: bool
+    errors: list[UserImportRowError]
+
+
 class UserOut(UserBase):
     id: str
     role_id: Optional[str] = None
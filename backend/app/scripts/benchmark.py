@@ -0,0 +1,245 @@
+# Benchmark reprodutível contra uma API a correr (uvicorn + Postgres local com dados de
+# app.scripts.seed). Simula N alunos em paralelo no percurso
+#   login -> listar cursos -> abrir quiz (full) -> respostas em bloco -> finish -> badges do perfil
+# e um admin a pedir o snapshot do dashboard, e grava p50/p95/p99, throughput e o tamanho
+# médio das respostas (bytes recebidos, já comprimidos) em JSON.
+# Uso (a partir de backend/):
+#   python -m app.scripts.seed --truncate --users 1000 --attempts 5000
+#   RATE_LIMIT_ENABLED=false uvicorn app.main:app --workers 4 &   # o login em massa esgota os limites
+#   python -m app.scripts.benchmark --concurrency 20 --journeys 200 --out bench.json
+#   python -m app.scripts.benchmark ... --compare bench_main.json
+# Para medir a compressão, correr com COMPRESSION_ENABLED=false e depois true (--compare).
+
+import argparse
+import asyncio
+import datetime as dt
+import json
+import math
+import random
+import subprocess
+import time
+from collections import defaultdict
+from typing import Any, Optional
+
+import httpx
+
+from app.scripts.seed import ADMIN_USERNAME, PREFIX
+
+API = "/api/v1"
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        # bytes do corpo tal como chegaram (antes de o httpx descomprimir)
+        self.sizes: dict[str, list[int]] = defaultdict(list)
+
+    async def call(self, name: str, client: httpx.AsyncClient, method: str, url: str, **kwargs) -> Optional[httpx.Response]:
+        start = time.perf_counter()
+        try:
+            res = await client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.errors[name] += 1
+            return None
+        self.latencies[name].append(time.perf_counter() - start)
+        self.sizes[name].append(res.num_bytes_downloaded)
+        if res.status_code >= 400:
+            self.errors[name] += 1
+            return None
+        return res
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    # nearest-rank
+    if not sorted_values:
+        return 0.0
+    k = max(0, min(len(sorted_values) - 1, math.ceil(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[k]
+
+
+def summarize(values: list[float], errors: int, wall: float, sizes: list[int]) -> dict:
+    s = sorted(values)
+    ms = lambda v: round(v * 1000, 2)
+    return {
+        "count": len(s),
+        "errors": errors,
+        "p50_ms": ms(percentile(s, 50)),
+        "p95_ms": ms(percentile(s, 95)),
+        "p99_ms": ms(percentile(s, 99)),
+        "mean_ms": ms(sum(s) / len(s)) if s else 0.0,
+        "max_ms": ms(s[-1]) if s else 0.0,
+        "throughput_rps": round(len(s) / wall, 2) if wall else 0.0,
+        "mean_bytes": round(sum(sizes) / len(sizes)) if sizes else 0,
+    }
+
+
+async def login(rec: Recorder, client: httpx.AsyncClient, username: str, password: str) -> Optional[dict]:
+    res = await rec.call("login", client, "POST", f"{API}/auth/auth/login", json={"username": username, "password": password})
+    if res is None:
+        return None
+    headers = {"Authorization": f"Bearer {res.json()['access_token']}"}
+    me = await rec.call("me", client, "GET", f"{API}/auth/auth/me", headers=headers)
+    if me is None:
+        return None
+    return {"headers": headers, "user_id": me.json()["id"]}
+
+
+async def student_journey(rec: Recorder, client: httpx.AsyncClient, rng: random.Random, args) -> bool:
+    start = time.perf_counter()
+    username = f"{PREFIX}_user_{rng.randrange(args.seed_users):07d}"
+    session = await login(rec, client, username, args.password)
+    if session is None:
+        return False
+    headers = session["headers"]
+
+    courses = await rec.call("list_courses", client, "GET", f"{API}/courses/", params={"limit": 50}, headers=headers)
+    quizzes = await rec.call("list_quizzes", client, "GET", f"{API}/quizzes/", params={"limit": 50}, headers=headers)
+    if courses is None or quizzes is None:
+        return False
+    active = [q for q in quizzes.json()["items"] if q.get("status") == "active"]
+    if not active:
+        return False
+    quiz_id = rng.choice(active)["id"]
+
+    full = await rec.call("quiz_full", client, "GET", f"{API}/quizzes/{quiz_id}/full", headers=headers)
+    if full is None:
+        return False
+    questions = full.json()["questions"]
+
+    attempt = await rec.call(
+        "create_attempt", client, "POST", f"{API}/quiz_attempts/",
+        json={"score": 0, "user_id": session["user_id"], "quiz_id": quiz_id}, headers=headers,
+    )
+    if attempt is None:
+        return False
+    attempt_id = attempt.json()["id"]
+
+    answers = [
+        {"question_id": q["id"], "option_id": rng.choice(q["options"])["id"] if q["options"] else None}
+        for q in questions
+    ]
+    if answers:
+        ok = await rec.call(
+            "bulk_answers", client, "POST", f"{API}/quiz_attempts/{attempt_id}/answers",
+            json={"answers": answers, "finish": False}, headers=headers,
+        )
+        if ok is None:
+            return False
+
+    if await rec.call("finish", client, "POST", f"{API}/quiz_attempts/{attempt_id}/finish", headers=headers) is None:
+        return False
+    if await rec.call(
+        "profile_badges", client, "GET", f"{API}/quiz_badge_awards/by_user/{session['user_id']}", headers=headers
+    ) is None:
+        return False
+
+    rec.latencies["student_journey"].append(time.perf_counter() - start)
+    return True
+
+
+async def admin_dashboard(rec: Recorder, client: httpx.AsyncClient, args) -> None:
+    session = await login(rec, client, ADMIN_USERNAME, args.password)
+    if session is None:
+        return
+    for _ in range(args.dashboard_requests):
+        await rec.call("dashboard_snapshot", client, "GET", f"{API}/dashboard/snapshot", headers=session["headers"])
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args) -> dict:
+    rec = Recorder()
+    rng = random.Random(args.seed)
+    remaining = args.journeys
+    failed = 0
+
+    limits = httpx.Limits(max_connections=args.concurrency + 1)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        # aquecimento, fora das métricas: abre ligações do pool e enche caches
+        warm = Recorder()
+        await asyncio.gather(*(student_journey(warm, client, random.Random(i), args) for i in range(min(args.concurrency, 5))))
+
+        async def worker(worker_rng: random.Random) -> None:
+            nonlocal remaining, failed
+            while remaining > 0:
+                remaining -= 1
+                if not await student_journey(rec, client, worker_rng, args):
+                    failed += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(worker(random.Random(rng.getrandbits(64))) for _ in range(args.concurrency)),
+            admin_dashboard(rec, client, args),
+        )
+        wall = time.perf_counter() - start
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": dt.datetime.now(dt.timezone.utc).isoformat(),
+            "base_url": args.base_url,
+            "concurrency": args.concurrency,
+            "journeys": args.journeys,
+            "dashboard_requests": args.dashboard_requests,
+            "seed": args.seed,
+            "wall_seconds": round(wall, 3),
+            "failed_journeys": failed,
+        },
+        "steps": {
+            name: summarize(rec.latencies.get(name, []), rec.errors.get(name, 0), wall, rec.sizes.get(name, []))
+            for name in sorted({*rec.latencies, *rec.errors})
+        },
+    }
+
+
+def print_report(report: dict, baseline: Optional[dict] = None) -> None:
+    meta = report["meta"]
+    print(f"commit={meta['commit']} wall={meta['wall_seconds']}s failed={meta['failed_journeys']}")
+    print(f"{'step':<20}{'count':>7}{'err':>5}{'p50':>10}{'p95':>10}{'p99':>10}{'rps':>9}{'bytes':>9}")
+    for name, s in report["steps"].items():
+        line = (
+            f"{name:<20}{s['count']:>7}{s['errors']:>5}{s['p50_ms']:>10}{s['p95_ms']:>10}{s['p99_ms']:>10}"
+            f"{s['throughput_rps']:>9}{s.get('mean_bytes', 0):>9}"
+        )
+        old = (baseline or {}).get("steps", {}).get(name)
+        if old and old["p95_ms"]:
+            delta = (s["p95_ms"] - old["p95_ms"]) / old["p95_ms"] * 100
+            line += f"   p95 {delta:+.1f}% vs {baseline['meta'].get('commit')}"
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark do percurso do aluno e do dashboard")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--journeys", type=int, default=200, help="percursos de aluno no total")
+    parser.add_argument("--dashboard-requests", type=int, default=50)
+    parser.add_argument("--seed-users", type=int, default=1000, help="--users usado no app.scripts.seed")
+    parser.add_argument("--password", default="seedpass123")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--out", help="grava o resultado em JSON")
+    parser.add_argument("--compare", help="JSON de uma execução anterior para comparar")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+
+    baseline: Any = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+# Corre EXPLAIN sobre as queries dos repositórios e mostra os planos, assinalando Seq Scans.
+# Cada chamada do catálogo corre numa transação que é sempre desfeita no fim; as queries
+# de escrita (finish, grade_stats) usam ids inexistentes para não tocar em linhas.
+# Uso (a partir de backend/):
+#   python -m app.scripts.explain_audit --out plans_before.json
+#   alembic upgrade head
+#   python -m app.scripts.explain_audit --compare plans_before.json
+# --analyze usa EXPLAIN ANALYZE (executa os SELECT) para ver tempos e linhas reais.
+
+import argparse
+import asyncio
+import json
+import re
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import base  # regista todos os modelos
+from app.db.session import async_session, engine
+from app.repositories.crud.answer_repo import AnswerRepository
+from app.repositories.crud.area_repo import AreaRepository
+from app.repositories.crud.badge_repo import BadgeRepository
+from app.repositories.crud.course_repo import CourseRepository
+from app.repositories.crud.dashboard_repo import DashboardRepository
+from app.repositories.crud.grade_stat_repo import GradeStatRepository
+from app.repositories.crud.modality_repo import ModalityRepository
+from app.repositories.crud.option_repo import OptionRepository
+from app.repositories.crud.project_repo import ProjectRepository
+from app.repositories.crud.question_option_repo import QuestionOptionRepository
+from app.repositories.crud.question_repo import QuestionRepository
+from app.repositories.crud.quiz_attempt_repo import QuizAttemptRepository
+from app.repositories.crud.quiz_badge_award_repo import QuizBadgeAwardRepository
+from app.repositories.crud.quiz_repo import QuizRepository
+from app.repositories.crud.role_repo import RoleRepository
+from app.repositories.crud.user_repo import UserRepository
+from app.repositories.crud.video_repo import VideoRepository
+
+MISSING_ID = "00000000-0000-0000-0000-000000000000"
+_WRITE = re.compile(r"\b(INSERT|UPDATE|DELETE)\b", re.IGNORECASE)
+
+
+class QueryCapture:
+    # guarda (sql, parâmetros) de tudo o que passa pelo driver enquanto active=True
+
+    def __init__(self):
+        self.active = False
+        self.statements: list[tuple[str, Any]] = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if self.active:
+            self.statements.append((statement, parameters))
+
+
+async def _drain(rows: AsyncIterator, limit: int = 100) -> None:
+    n = 0
+    async for _ in rows:
+        n += 1
+        if n >= limit:
+            break
+
+
+async def _samples(db: AsyncSession) -> dict:
+    # um id real de cada tabela, para os planos refletirem filtros com valores existentes
+    async def first(sql: str) -> Any:
+        return (await db.execute(text(sql))).first()
+
+    user = await first("SELECT id, email, username FROM users ORDER BY created_at DESC LIMIT 1")
+    course = await first("SELECT id, title FROM courses ORDER BY created_at DESC LIMIT 1")
+    quiz = await first("SELECT id, title FROM quizzes ORDER BY created_at DESC LIMIT 1")
+    question = await first("SELECT id FROM questions LIMIT 1")
+    attempt = await first("SELECT id FROM quiz_attempts LIMIT 1")
+    return {
+        "user_id": user.id if user else MISSING_ID,
+        "email": user.email if user else "nobody@example.com",
+        "username": user.username if user else "nobody",
+        "course_id": course.id if course else MISSING_ID,
+        "course_title": course.title if course else "none",
+        "quiz_id": quiz.id if quiz else MISSING_ID,
+        "quiz_title": quiz.title if quiz else "none",
+        "question_id": question.id if question else MISSING_ID,
+        "attempt_id": attempt.id if attempt else MISSING_ID,
+    }
+
+
+def _catalogue(s: dict) -> list[tuple[str, Callable[[AsyncSession], Awaitable[Any]]]]:
+    users, courses, quizzes = UserRepository(), CourseRepository(), QuizRepository()
+    attempts, awards, dashboard = QuizAttemptRepository(), QuizBadgeAwardRepository(), DashboardRepository()
+
+    return [
+        ("users.list", lambda db: users.list(db)),
+        ("users.list q", lambda db: users.list(db, q="ana")),
+        ("users.get_by_email", lambda db: users.get_by_email(db, s["email"])),
+        ("users.get_by_username", lambda db: users.get_by_username(db, s["username"], with_role=True)),
+        ("users.export", lambda db: _drain(users.export(db, q="ana"))),
+        ("courses.list", lambda db: courses.list(db)),
+        ("courses.list q", lambda db: courses.list(db, q="curso")),
+        ("courses.get_by_title", lambda db: courses.get_by_title(db, s["course_title"])),
+        ("courses.export", lambda db: _drain(courses.export(db))),
+        ("quizzes.list", lambda db: quizzes.list(db)),
+        ("quizzes.list q", lambda db: quizzes.list(db, q="quiz")),
+        ("quizzes.get_by_title", lambda db: quizzes.get_by_title(db, s["quiz_title"])),
+        ("quizzes.get_active_by_course", lambda db: quizzes.get_active_by_course(db, s["course_id"])),
+        ("questions.list", lambda db: QuestionRepository().list(db)),
+        ("question_options.list_by_question", lambda db: QuestionOptionRepository().list_by_question(db, s["question_id"])),
+        ("options.list", lambda db: OptionRepository().list(db)),
+        ("answers.list", lambda db: AnswerRepository().list(db)),
+        ("quiz_attempts.list", lambda db: attempts.list(db)),
+        ("quiz_attempts.list_by_user", lambda db: attempts.list_by_user(db, s["user_id"])),
+        ("quiz_attempts.list_answer_key", lambda db: attempts.list_answer_key(db, s["attempt_id"])),
+        ("quiz_attempts.get_draft", lambda db: attempts.get_draft(db, s["attempt_id"])),
+        (
+            "quiz_attempts.finish",
+            lambda db: attempts.finish(db, MISSING_ID, award_id=MISSING_ID, gold_id=None, silver_id=None, bronze_id=None),
+        ),
+        ("grade_stats.add_attempts", lambda db: GradeStatRepository().add_attempts(db, quiz_id=MISSING_ID)),
+        ("quiz_badge_awards.list_by_user", lambda db: awards.list_by_user(db, s["user_id"])),
+        ("quiz_badge_awards.get_by_user_quiz", lambda db: awards.get_by_user_quiz(db, s["user_id"], s["quiz_id"])),
+        ("badges.list_all", lambda db: BadgeRepository().list_all(db)),
+        ("areas.list", lambda db: AreaRepository().list(db)),
+        ("modalities.list", lambda db: ModalityRepository().list(db)),
+        ("roles.list", lambda db: RoleRepository().list(db)),
+        ("projects.list", lambda db: ProjectRepository().list(db)),
+        ("videos.list", lambda db: VideoRepository().list(db)),
+        ("dashboard.summary", lambda db: dashboard.summary(db)),
+        ("dashboard.average_grade", lambda db: dashboard.average_grade(db, quiz_id=s["quiz_id"])),
+        ("dashboard.grades_by_course", lambda db: dashboard.grades_by_course(db)),
+        ("dashboard.grades_by_quiz", lambda db: dashboard.grades_by_quiz(db, course_id=s["course_id"])),
+        ("dashboard.grades_by_user", lambda db: dashboard.grades_by_user(db)),
+        ("dashboard.top_students", lambda db: dashboard.top_students(db)),
+        ("dashboard.users_over_time", lambda db: dashboard.users_over_time(db, "1y")),
+        ("dashboard.quiz_attempts_over_time", lambda db: dashboard.quiz_attempts_over_time(db, "1y")),
+        ("dashboard.quiz_attempts_over_time quiz", lambda db: dashboard.quiz_attempts_over_time(db, "1y", quiz_id=s["quiz_id"])),
+        ("dashboard.courses_by_area", lambda db: dashboard.courses_by_area(db)),
+    ]
+
+
+def _walk(node: dict, depth: int = 0) -> list[tuple[int, dict]]:
+    nodes = [(depth, node)]
+    for child in node.get("Plans", []):
+        nodes.extend(_walk(child, depth + 1))
+    return nodes
+
+
+def summarize(plan: dict) -> dict:
+    root = plan["Plan"]
+    nodes = _walk(root)
+    lines = []
+    for depth, n in nodes:
+        label = n["Node Type"]
+        if n.get("Relation Name"):
+            label += f" on {n['Relation Name']}"
+        if n.get("Index Name"):
+            label += f" using {n['Index Name']}"
+        label += f"  (cost={n['Total Cost']:.2f} rows={n['Plan Rows']})"
+        if "Actual Total Time" in n:
+            label += f" (actual={n['Actual Total Time']:.3f}ms rows={n['Actual Rows']})"
+        lines.append("  " * depth + "-> " + label)
+
+    return {
+        "cost": root["Total Cost"],
+        "seq_scans": sorted({n["Relation Name"] for _, n in nodes if n["Node Type"] == "Seq Scan"}),
+        "indexes": sorted({n["Index Name"] for _, n in nodes if n.get("Index Name")}),
+        "tree": lines,
+    }
+
+
+async def audit(analyze: bool) -> dict:
+    capture = QueryCapture()
+    event.listen(engine.sync_engine, "after_cursor_execute", capture)
+    report: dict = {}
+    try:
+        async with async_session() as db:
+            samples = await _samples(db)
+            await db.rollback()
+
+            for name, call in _catalogue(samples):
+                capture.statements.clear()
+                capture.active = True
+                try:
+                    await call(db)
+                except Exception as exc:
+                    report[name] = [{"sql": "", "error": str(exc), "cost": 0.0, "seq_scans": [], "indexes": [], "tree": []}]
+                    await db.rollback()
+                    continue
+                finally:
+                    capture.active = False
+
+                entries = []
+                conn = await db.connection()
+                for statement, params in capture.statements:
+                    # ANALYZE executa a query: só para leituras
+                    options = "ANALYZE, BUFFERS, FORMAT JSON" if analyze and not _WRITE.search(statement) else "FORMAT JSON"
+                    res = await conn.exec_driver_sql(f"EXPLAIN ({options}) {statement}", params)
+                    plan = res.scalar()
+                    if isinstance(plan, str):
+                        plan = json.loads(plan)
+                    entries.append({"sql": statement, **summarize(plan[0])})
+                report[name] = entries
+                await db.rollback()
+    finally:
+        event.remove(engine.sync_engine, "after_cursor_execute", capture)
+        await engine.dispose()
+    return report
+
+
+def print_report(report: dict) -> None:
+    for name, entries in report.items():
+        for i, e in enumerate(entries):
+            label = name if len(entries) == 1 else f"{name} #{i + 1}"
+            if e.get("error"):
+                print(f"{label}: ERRO {e['error']}")
+                continue
+            flag = f"  SEQ SCAN: {', '.join(e['seq_scans'])}" if e["seq_scans"] else ""
+            print(f"{label}: cost={e['cost']:.2f}{flag}")
+            for line in e["tree"]:
+                print(f"    {line}")
+
+
+def print_comparison(before: dict, after: dict) -> None:
+    for name, entries in after.items():
+        old_entries = before.get(name, [])
+        for i, e in enumerate(entries):
+            label = name if len(entries) == 1 else f"{name} #{i + 1}"
+            old = old_entries[i] if i < len(old_entries) else None
+            if old is None:
+                print(f"{label}: (novo) cost={e['cost']:.2f}")
+                continue
+            if old["tree"] == e["tree"]:
+                print(f"{label}: igual (cost={e['cost']:.2f})")
+                continue
+            print(f"{label}: cost {old['cost']:.2f} -> {e['cost']:.2f}")
+            print("  antes:")
+            for line in old["tree"]:
+                print(f"    {line}")
+            print("  depois:")
+            for line in e["tree"]:
+                print(f"    {line}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="EXPLAIN das queries dos repositórios")
+    parser.add_argument("--out", help="grava os planos em JSON (para comparar depois)")
+    parser.add_argument("--compare", help="JSON gravado antes; mostra planos antes/depois")
+    parser.add_argument("--analyze", action="store_true", help="EXPLAIN ANALYZE nos SELECT")
+    args = parser.parse_args()
+
+    report = await audit(args.analyze)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            print_comparison(json.load(f), report)
+    else:
+        print_report(report)
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"planos gravados em {args.out}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,40 @@
+# Gera as miniaturas em falta das imagens já existentes em media/courses e media/users.
+# Uso (a partir de backend/): python -m app.scripts.generate_thumbnails
+
+import os
+
+from app.core.config import settings
+from app.utils.media import generate_thumbnails, thumbnail_name, sniff_image_ext
+
+KINDS = ("courses", "users")
+
+
+def main() -> None:
+    sizes = settings.MEDIA_THUMBNAIL_SIZES
+    done = 0
+    for kind in KINDS:
+        upload_dir = os.path.join(settings.MEDIA_ROOT, kind)
+        if not os.path.isdir(upload_dir):
+            continue
+
+        for filename in sorted(os.listdir(upload_dir)):
+            path = os.path.join(upload_dir, filename)
+            if not os.path.isfile(path):
+                continue
+            with open(path, "rb") as f:
+                if sniff_image_ext(f.read(16)) is None:
+                    continue
+
+            missing = [
+                size for size in sizes
+                if not os.path.exists(os.path.join(upload_dir, thumbnail_name(filename, size)))
+            ]
+            if missing:
+                generate_thumbnails(upload_dir, filename, missing)
+                done += 1
+
+    print(f"thumbnails generated for {done} images")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+# Processo dedicado aos jobs em background, para os tirar dos workers da API.
+# Uso (a partir de backend/):
+#   JOBS_ENABLED=false uvicorn app.main:app --workers 4 &   # a API só põe jobs na fila
+#   JOBS_ENABLED=true python -m app.scripts.job_worker
+
+import asyncio
+import signal
+
+from app.db import base  # regista todos os modelos
+from app.api import v1  # regista os handlers dos jobs (importados pelos services)
+from app.core.config import settings
+from app.core.jobs import job_runner
+from app.db.session import engine
+
+
+async def main() -> None:
+    if not settings.JOBS_ENABLED:
+        raise SystemExit("JOBS_ENABLED=false: nada para correr")
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    await job_runner.start()
+    print(f"job worker: {', '.join(sorted(job_runner.types))}")
+    await stop.wait()
+    # os jobs a meio voltam à fila
+    await job_runner.stop()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,19 @@
+# Recalcula a tabela grade_stats a partir de quiz_attempts.
+# Uso (a partir de backend/): python -m app.scripts.rebuild_grade_stats
+
+import asyncio
+
+from app.db import base  # regista todos os modelos
+from app.db.session import async_session, engine
+from app.services.dashboard_service import service as dashboard_service
+
+
+async def main() -> None:
+    async with async_session() as db:
+        await dashboard_service.rebuild_stats(db)
+    await engine.dispose()
+    print("grade_stats rebuilt")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,327 @@
+# Gera dados sintéticos para benchmarks e testes de índices em todas as tabelas do modelo
+# (users, courses, area_course, quizzes, questions, questions_options, quiz_attempts, answers,
+# quiz_badge_awards, ...). É determinístico: a mesma --seed produz os mesmos ids, nomes,
+# respostas e notas. As tabelas grandes vão por COPY (asyncpg) em blocos, numa só transação.
+# Uso (a partir de backend/):
+#   python -m app.scripts.seed --users 1000 --courses 20 --questions 10 --attempts 5000
+#   python -m app.scripts.seed --users 200000 --courses 500 --questions 20 --attempts 500000  (10M respostas)
+#   python -m app.scripts.seed --truncate ...   (apaga antes os dados gerados por uma seed anterior)
+#   --method insert usa INSERT multi-linha em vez de COPY
+# Todos os users gerados ficam com a password --password; o admin é "seed_admin".
+
+import argparse
+import asyncio
+import datetime as dt
+import random
+import uuid
+from typing import Any, Iterable, Iterator
+
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.passwords import pwd_context
+from app.db import base  # regista todos os modelos
+from app.db.session import async_session, engine
+from app.models.answer import Answer
+from app.models.area import Area
+from app.models.area_course import AreaCourse
+from app.models.badges import Badge
+from app.models.course import Course
+from app.models.modality import Modality
+from app.models.option import Option
+from app.models.question import Question
+from app.models.question_option import QuestionOption
+from app.models.quiz import Quiz
+from app.models.quiz_attempt import QuizAttempt
+from app.models.quiz_badge_award import QuizBadgeAward
+from app.models.role import Role
+from app.models.user import User
+from app.repositories.crud.grade_stat_repo import GradeStatRepository
+
+PREFIX = "seed"
+ADMIN_USERNAME = f"{PREFIX}_admin"
+OPTIONS_PER_QUESTION = 4
+BATCH_SIZE = 5000
+COPY_BATCH_SIZE = 50000
+# (code, nome, nota mínima) criados se ainda não existirem; as imagens estão em media/badges
+BADGES = [("gold", "Ouro", 100), ("silver", "Prata", 80), ("bronze", "Bronze", 50)]
+
+FIRST_NAMES = ["Ana", "João", "Maria", "Pedro", "Inês", "Rui", "Sofia", "Tiago", "Marta", "Diogo", "Rita", "Nuno"]
+LAST_NAMES = ["Silva", "Santos", "Ferreira", "Pereira", "Oliveira", "Costa", "Rodrigues", "Martins", "Sousa", "Gomes"]
+TOPICS = ["Python", "Redes", "Bases de Dados", "Segurança", "Cloud", "Design", "Gestão", "Marketing", "Dados", "Web"]
+
+
+class Generator:
+    def __init__(self, seed: int):
+        self.rng = random.Random(seed)
+        self.now = dt.datetime(2026, 1, 1, tzinfo=dt.timezone.utc)
+
+    def new_id(self) -> str:
+        return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+
+    def past(self, days: int = 365) -> dt.datetime:
+        return self.now - dt.timedelta(seconds=self.rng.randrange(days * 86400))
+
+
+def batched(rows: Iterable[dict], size: int = BATCH_SIZE) -> Iterator[list[dict]]:
+    batch: list[dict] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def bulk_insert(db: AsyncSession, model: Any, rows: Iterable[dict]) -> int:
+    # INSERT multi-linha (insertmanyvalues) em blocos de BATCH_SIZE
+    total = 0
+    for batch in batched(rows):
+        await db.execute(insert(model.__table__), batch)
+        total += len(batch)
+    return total
+
+
+async def copy_rows(db: AsyncSession, model: Any, rows: Iterable[dict]) -> int:
+    # COPY binário pela ligação asyncpg da sessão (mesma transação). Não passa pelos
+    # defaults do lado do Python, por isso cada linha traz todas as colunas sem server_default.
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    driver = raw.driver_connection
+    total = 0
+    for batch in batched(rows, COPY_BATCH_SIZE):
+        columns = list(batch[0].keys())
+        await driver.copy_records_to_table(
+            model.__table__.name,
+            records=[tuple(row[c] for c in columns) for row in batch],
+            columns=columns,
+        )
+        total += len(batch)
+    return total
+
+
+async def get_or_create_role(db: AsyncSession, gen: Generator, name: str) -> str:
+    role_id = (await db.execute(select(Role.id).where(Role.name == name))).scalar_one_or_none()
+    if role_id:
+        return role_id
+    role_id = gen.new_id()
+    await db.execute(insert(Role.__table__), [{"id": role_id, "name": name, "description": None}])
+    return role_id
+
+
+async def get_or_create_badges(db: AsyncSession, gen: Generator) -> list[tuple[str, int]]:
+    # [(badge_id, min_score)] do maior para o menor
+    rows = (await db.execute(select(Badge.code, Badge.id, Badge.min_score))).all()
+    existing = {r.code: (r.id, r.min_score) for r in rows}
+    missing = [
+        {"id": gen.new_id(), "code": code, "name": name, "min_score": min_score,
+         "image": f"{settings.MEDIA_URL}/badges/{code}.png"}
+        for code, name, min_score in BADGES if code not in existing
+    ]
+    if missing:
+        await db.execute(insert(Badge.__table__), missing)
+        existing.update({b["code"]: (b["id"], b["min_score"]) for b in missing})
+    return sorted(existing.values(), key=lambda b: b[1], reverse=True)
+
+
+async def truncate_seed(db: AsyncSession) -> None:
+    # só o que esta ferramenta criou (prefixo nos nomes); tentativas/respostas vão por CASCADE
+    await db.execute(delete(Quiz).where(Quiz.title.like(f"{PREFIX} %")))
+    await db.execute(delete(Course).where(Course.title.like(f"{PREFIX} %")))
+    await db.execute(delete(User).where(User.username.like(f"{PREFIX}\\_%")))
+    await db.execute(delete(Option).where(Option.text.like(f"{PREFIX} %")))
+    await db.execute(delete(Area).where(Area.name.like(f"{PREFIX} %")))
+    await db.execute(delete(Modality).where(Modality.name.like(f"{PREFIX} %")))
+
+
+async def seed(args: argparse.Namespace) -> dict:
+    gen = Generator(args.seed)
+    rng = gen.rng
+    counts: dict[str, int] = {}
+
+    async with async_session() as db:
+        # abre já a transação (o COPY usa a mesma) e não espera pelo fsync no commit
+        await db.execute(text("SET LOCAL synchronous_commit = off"))
+        load = copy_rows if args.method == "copy" else bulk_insert
+
+        if args.truncate:
+            await truncate_seed(db)
+
+        existing = (await db.execute(select(func.count()).where(User.username == ADMIN_USERNAME))).scalar()
+        if existing:
+            raise SystemExit("seed data already present; run again with --truncate")
+
+        admin_role = await get_or_create_role(db, gen, "Admin")
+        student_role = await get_or_create_role(db, gen, "Student")
+        badges = await get_or_create_badges(db, gen)
+
+        # um só hash para todos: o argon2 de 100k users demoraria horas
+        password_hash = pwd_context.hash(args.password)
+
+        user_ids = [gen.new_id() for _ in range(args.users)]
+        admin_id = gen.new_id()
+
+        def users() -> Iterator[dict]:
+            yield {
+                "id": admin_id, "name": "Seed Admin", "username": ADMIN_USERNAME,
+                "email": f"{ADMIN_USERNAME}@example.com", "password": password_hash,
+                "status": "active", "gender": None, "role_id": admin_role, "created_at": gen.past(),
+            }
+            for i, user_id in enumerate(user_ids):
+                username = f"{PREFIX}_user_{i:07d}"
+                yield {
+                    "id": user_id,
+                    "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                    "username": username,
+                    "email": f"{username}@example.com",
+                    "password": password_hash,
+                    "status": "active",
+                    "gender": rng.choice(["male", "female", "other"]),
+                    "role_id": student_role,
+                    "created_at": gen.past(),
+                }
+
+        counts["users"] = await load(db, User, users())
+
+        area_ids = [gen.new_id() for _ in range(args.areas)]
+        counts["areas"] = await load(
+            db, Area, ({"id": a, "name": f"{PREFIX} área {i}"} for i, a in enumerate(area_ids))
+        )
+        modality_ids = [gen.new_id() for _ in range(3)]
+        counts["modalities"] = await load(
+            db, Modality, ({"id": m, "name": f"{PREFIX} modalidade {i}"} for i, m in enumerate(modality_ids))
+        )
+
+        course_ids = [gen.new_id() for _ in range(args.courses)]
+        counts["courses"] = await load(db, Course, (
+            {
+                "id": c,
+                "title": f"{PREFIX} {rng.choice(TOPICS)} {i}",
+                "description": f"Curso gerado {i}",
+                "status": "active",
+                "modality_id": rng.choice(modality_ids),
+                "num_hours": rng.choice([10, 20, 40, 80]),
+                "credits": rng.randint(1, 10),
+                "price": float(rng.choice([0, 49, 99, 199])),
+                "created_at": gen.past(),
+            }
+            for i, c in enumerate(course_ids)
+        ))
+        counts["area_course"] = await load(db, AreaCourse, (
+            {"area_id": a, "course_id": c}
+            for c in course_ids
+            for a in rng.sample(area_ids, k=min(len(area_ids), rng.randint(1, 3)))
+        ))
+
+        # um quiz ativo por curso (uq_quizzes_one_active_per_course)
+        quiz_ids = [gen.new_id() for _ in course_ids]
+        counts["quizzes"] = await load(db, Quiz, (
+            {
+                "id": q, "title": f"{PREFIX} quiz {i}", "description": None,
+                "status": "active", "course_id": c, "user_id": admin_id, "created_at": gen.past(),
+            }
+            for i, (q, c) in enumerate(zip(quiz_ids, course_ids))
+        ))
+
+        option_ids = [gen.new_id() for _ in range(max(args.options, OPTIONS_PER_QUESTION))]
+        counts["options"] = await load(
+            db, Option, ({"id": o, "text": f"{PREFIX} opção {i}"} for i, o in enumerate(option_ids))
+        )
+
+        # quiz -> [(question_id, [option_ids], correct_option_id)]
+        quiz_questions: dict[str, list[tuple[str, list[str], str]]] = {}
+        question_rows, question_option_rows = [], []
+        for quiz_index, quiz_id in enumerate(quiz_ids):
+            questions = []
+            for n in range(args.questions):
+                question_id = gen.new_id()
+                opts = rng.sample(option_ids, OPTIONS_PER_QUESTION)
+                correct = rng.choice(opts)
+                questions.append((question_id, opts, correct))
+                question_rows.append({"id": question_id, "text": f"{PREFIX} q{quiz_index}-{n + 1}", "quiz_id": quiz_id, "created_at": gen.past()})
+                question_option_rows.extend(
+                    {"question_id": question_id, "option_id": o, "is_correct": o == correct} for o in opts
+                )
+            quiz_questions[quiz_id] = questions
+        counts["questions"] = await load(db, Question, question_rows)
+        counts["questions_options"] = await load(db, QuestionOption, question_option_rows)
+
+        # tentativas terminadas; cada user tem uma "habilidade" que define a prob. de acertar
+        skill = {u: rng.uniform(0.3, 0.95) for u in user_ids}
+        # melhor tentativa de cada (user, quiz): dá o badge, como no finish
+        best: dict[tuple[str, str], tuple[float, str, dt.datetime]] = {}
+        attempt_rows, answer_rows = [], []
+        counts["quiz_attempts"] = counts["answers"] = 0
+        for _ in range(args.attempts):
+            attempt_id = gen.new_id()
+            user_id = rng.choice(user_ids)
+            quiz_id = rng.choice(quiz_ids)
+            questions = quiz_questions[quiz_id]
+            correct = 0
+            for question_id, opts, right in questions:
+                chosen = right if rng.random() < skill[user_id] else rng.choice(opts)
+                correct += chosen == right
+                answer_rows.append({"id": gen.new_id(), "attempt_id": attempt_id, "question_id": question_id, "option_id": chosen})
+            score = round(correct / len(questions) * 100, 2) if questions else 0.0
+            finished_at = gen.past()
+            attempt_rows.append({
+                "id": attempt_id,
+                "user_id": user_id,
+                "quiz_id": quiz_id,
+                "score": score,
+                "finished_at": finished_at,
+            })
+            key = (user_id, quiz_id)
+            if key not in best or score > best[key][0]:
+                best[key] = (score, attempt_id, finished_at)
+
+            if len(answer_rows) >= COPY_BATCH_SIZE:
+                counts["quiz_attempts"] += await load(db, QuizAttempt, attempt_rows)
+                counts["answers"] += await load(db, Answer, answer_rows)
+                attempt_rows, answer_rows = [], []
+
+        counts["quiz_attempts"] += await load(db, QuizAttempt, attempt_rows)
+        counts["answers"] += await load(db, Answer, answer_rows)
+
+        def awards() -> Iterator[dict]:
+            for (user_id, quiz_id), (score, attempt_id, finished_at) in best.items():
+                badge_id = next((b_id for b_id, min_score in badges if score >= min_score), None)
+                if badge_id is None:
+                    continue
+                yield {
+                    "id": gen.new_id(), "user_id": user_id, "quiz_id": quiz_id, "badge_id": badge_id,
+                    "attempt_id": attempt_id, "awarded_at": finished_at,
+                }
+
+        counts["quiz_badge_awards"] = await load(db, QuizBadgeAward, awards())
+
+        await GradeStatRepository().rebuild(db)
+        await db.commit()
+
+    await engine.dispose()
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Gera dados sintéticos determinísticos")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--areas", type=int, default=8)
+    parser.add_argument("--courses", type=int, default=20)
+    parser.add_argument("--questions", type=int, default=10, help="perguntas por quiz")
+    parser.add_argument("--options", type=int, default=200, help="opções distintas partilhadas pelas perguntas")
+    parser.add_argument("--attempts", type=int, default=5000)
+    parser.add_argument("--password", default="seedpass123")
+    parser.add_argument("--truncate", action="store_true", help="apaga primeiro os dados de uma seed anterior")
+    parser.add_argument("--method", choices=["copy", "insert"], default="copy")
+    args = parser.parse_args()
+
+    counts = asyncio.run(seed(args))
+    for table, n in counts.items():
+        print(f"{table}: {n}")
+
+
+if __name__ == "__main__":
+    main()
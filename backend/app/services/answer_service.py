@@ -2,15 +2,22 @@ from typing import Sequence, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 from app.repositories.crud.answer_repo import AnswerRepository
+from app.db.uow import unit_of_work
 from app.models.answer import Answer
+from app.core.config import settings
 
 
 class AnswerService:
     def __init__(self):
         self.repo = AnswerRepository()
 
-    async def list(self, db: AsyncSession, skip: int = 0, limit: int = 100) -> Sequence[Answer]:
-        return await self.repo.list(db, skip=skip, limit=limit)
+    async def list(
+        self,
+        db: AsyncSession,
+        cursor: Optional[str] = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+    ) -> dict:
+        return await self.repo.list(db, cursor=cursor, limit=limit)
 
     async def get(self, db: AsyncSession, answer_id: str) -> Answer:
         answer = await self.repo.get(db, answer_id)
@@ -29,12 +36,13 @@ class AnswerService:
         question_id: str,
         option_id: Optional[str] = None
     ) -> Answer:
-        return await self.repo.create(
-            db,
-            attempt_id=attempt_id,
-            question_id=question_id,
-            option_id=option_id,
-        )
+        async with unit_of_work(db):
+            return await self.repo.create(
+                db,
+                attempt_id=attempt_id,
+                question_id=question_id,
+                option_id=option_id,
+            )
 
     async def update(
         self,
@@ -43,12 +51,14 @@ class AnswerService:
         *,
         option_id: Optional[str] = None
     ) -> Answer:
-        answer = await self.get(db, answer_id)
-        return await self.repo.update(db, answer, option_id=option_id)
+        async with unit_of_work(db):
+            answer = await self.get(db, answer_id)
+            return await self.repo.update(db, answer, option_id=option_id)
 
     async def delete(self, db: AsyncSession, answer_id: str) -> None:
-        answer = await self.get(db, answer_id)
-        await self.repo.delete(db, answer)
+        async with unit_of_work(db):
+            answer = await self.get(db, answer_id)
+            await self.repo.delete(db, answer)
 
 
 service = AnswerService()
@@ -2,15 +2,22 @@ from typing import Sequence, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 from app.repositories.crud.area_repo import AreaRepository
+from app.db.uow import unit_of_work
 from app.models.area import Area
+from app.core.config import settings
 
 class AreaService:
     def __init__(self):
         self.repo = AreaRepository()
 
-    async def list(self, db: AsyncSession, skip: int = 0, limit: Optional[int] = None) -> Sequence[Area]:
-        return await self.repo.list(db, skip=skip, limit=limit)
-    
+    async def list(
+        self,
+        db: AsyncSession,
+        cursor: Optional[str] = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+    ) -> dict:
+        return await self.repo.list(db, cursor=cursor, limit=limit)
+
     async def get(self, db: AsyncSession, area_id: str) -> Area:
         area = await self.repo.get(db, area_id)
         if not area:
@@ -24,12 +31,9 @@ class AreaService:
         name: str,
         description: Optional[str] = None,
     ) -> Area:
-        existing_area = await self.repo.get_by_name(db, name)
-        if existing_area:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Area name must be unique")
-        
-        # cria apenas área (sem cursos)
-        area = await self.repo.create(db, name=name, description=description)
+        async with unit_of_work(db):
+            # cria apenas área (sem cursos)
+            area = await self.repo.create(db, name=name, description=description)
         return area
 
     async def update(
@@ -40,18 +44,15 @@ class AreaService:
         name: Optional[str] = None,
         description: Optional[str] = None,
     ) -> Area:
-        area = await self.get(db, area_id)
-        
-        if name:
-            existing_area = await self.repo.get_by_name(db, name)
-            if existing_area and existing_area.id != area_id:
-                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Area name must be unique")
-        
-        area = await self.repo.update(db, area, name=name, description=description)
+        async with unit_of_work(db):
+            area = await self.get(db, area_id)
+
+            area = await self.repo.update(db, area, name=name, description=description)
         return area
     
     async def delete(self, db: AsyncSession, area_id: str) -> None:
-        area = await self.get(db, area_id)
-        await self.repo.delete(db, area)
+        async with unit_of_work(db):
+            area = await self.get(db, area_id)
+            await self.repo.delete(db, area)
 
 service = AreaService()
\ No newline at end of file
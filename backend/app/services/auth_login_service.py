@@ -4,8 +4,10 @@ from fastapi import HTTPException, status
 from datetime import timedelta
 
 from app.services.user_service import service as user_service
+from app.db.uow import unit_of_work
 from app.schemas.auth_login import UserLogin, TokenOut
 from app.core.security import create_access_token, create_refresh_token
+from app.core.passwords import password_hasher
 
 class AuthService:
     def __init__(self):
@@ -13,22 +15,44 @@ class AuthService:
 
     async def login(self, db: AsyncSession, payload: UserLogin) -> TokenOut:
         username = self.user_service._normalize_username(payload.username)
-        user = await self.user_service.repo.get_by_username(db, username)
+        user = await self.user_service.repo.get_by_username(db, username, with_role=True)
 
-        if not user or not self.user_service.verify_password(payload.password, user.password):
+        if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid username or password"
             )
 
-        if getattr(user, "status", None) != "active":
+        user_id, role_id, user_status, stored_hash = user.id, user.role_id, user.status, user.password
+        role_name = user.role.name if user.role else None
+        # o argon2 demora dezenas de ms: fecha a transação de leitura antes, para a
+        # ligação voltar ao pool durante o verify
+        await db.rollback()
+
+        valid, new_hash = await password_hasher.verify_and_update(payload.password, stored_hash)
+        if not valid:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid username or password"
+            )
+
+        if user_status != "active":
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Inactive user"
             )
 
-        access_token = create_access_token(subject=str(user.id), role_id=user.role_id)
-        refresh_token = create_refresh_token(subject=str(user.id))
+        # parâmetros do argon2 mudaram desde o último login: guarda o hash novo
+        if new_hash:
+            async with unit_of_work(db):
+                await self.user_service.repo.rehash_password(db, user_id, stored_hash, new_hash)
+
+        access_token = create_access_token(
+            subject=str(user_id),
+            role_id=role_id,
+            role_name=role_name,
+        )
+        refresh_token = create_refresh_token(subject=str(user_id))
         return TokenOut(access_token=access_token, refresh_token=refresh_token)
 
 
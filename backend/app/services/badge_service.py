@@ -1,17 +1,40 @@
+from dataclasses import dataclass
 from typing import Sequence, Optional
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.crud.badge_repo import BadgeRepository
+from app.db.uow import unit_of_work
 from app.models.badges import Badge
+from app.core.config import settings
+from app.core.cache import TTLCache
+
+
+@dataclass(frozen=True)
+class BadgeThreshold:
+    # cópia imutável de um Badge, segura para guardar entre pedidos
+    id: str
+    code: str
+    name: str
+    min_score: int
+    image: Optional[str]
+
+
+# uma só entrada ("all") com code -> BadgeThreshold; limpa em cada escrita de badges
+badge_cache = TTLCache(maxsize=1, ttl=settings.BADGE_CACHE_TTL_SECONDS)
 
 
 class BadgeService:
     def __init__(self, repo: BadgeRepository = BadgeRepository()):
         self.repo = repo
 
-    async def list(self, db: AsyncSession, skip: int = 0, limit: Optional[int] = None) -> Sequence[Badge]:
-        return await self.repo.list(db, skip=skip, limit=limit)
+    async def list(
+        self,
+        db: AsyncSession,
+        cursor: Optional[str] = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+    ) -> dict:
+        return await self.repo.list(db, cursor=cursor, limit=limit)
 
     async def get(self, db: AsyncSession, badge_id: str) -> Badge:
         obj = await self.repo.get(db, badge_id)
@@ -19,18 +42,37 @@ class BadgeService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Badge not found")
         return obj
 
+    async def thresholds(self, db: AsyncSession) -> dict[str, BadgeThreshold]:
+        cached = badge_cache.get("all")
+        if cached is not None:
+            return cached
+
+        badges = await self.repo.list_all(db)
+        thresholds = {
+            b.code: BadgeThreshold(id=b.id, code=b.code, name=b.name, min_score=b.min_score, image=b.image)
+            for b in badges
+        }
+        badge_cache.set("all", thresholds)
+        return thresholds
+
     async def create(self, db: AsyncSession, *, code: str, name: str, min_score: int, image: Optional[str] = None) -> Badge:
-        if await self.repo.get_by_code(db, code):
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Badge code must be unique")
-        return await self.repo.create(db, code=code, name=name, min_score=min_score, image=image)
+        async with unit_of_work(db):
+            badge = await self.repo.create(db, code=code, name=name, min_score=min_score, image=image)
+        badge_cache.clear()
+        return badge
 
     async def update(self, db: AsyncSession, badge_id: str, *, name: Optional[str] = None, min_score: Optional[int] = None, image: Optional[str] = None) -> Badge:
-        badge = await self.get(db, badge_id)
-        return await self.repo.update(db, badge, name=name, min_score=min_score, image=image)
+        async with unit_of_work(db):
+            badge = await self.get(db, badge_id)
+            badge = await self.repo.update(db, badge, name=name, min_score=min_score, image=image)
+        badge_cache.clear()
+        return badge
 
     async def delete(self, db: AsyncSession, badge_id: str) -> None:
-        badge = await self.get(db, badge_id)
-        await self.repo.delete(db, badge)
+        async with unit_of_work(db):
+            badge = await self.get(db, badge_id)
+            await self.repo.delete(db, badge)
+        badge_cache.clear()
 
 
 service = BadgeService()
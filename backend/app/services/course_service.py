@@ -1,20 +1,59 @@
-from typing import Sequence, Optional
+import os
+import datetime as dt
+from typing import AsyncIterator, Sequence, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import delete
+from sqlalchemy import delete, Row
 from fastapi import HTTPException, status
 
+from app.db.session import async_session
 from app.repositories.crud.course_repo import CourseRepository
+from app.repositories.crud.grade_stat_repo import GradeStatRepository
+from app.repositories.crud.quiz_repo import QuizRepository
+from app.db.uow import unit_of_work
 from app.models.course import Course
 from app.models.area_course import AreaCourse
 from app.schemas.course import CourseCreate, CourseUpdate, StatusEnum
+from app.core.config import settings
+from app.core.jobs import job_runner, JobContext
+from app.utils.csv_export import write_csv
+from app.services.quiz_service import quiz_full_cache
+
+EXPORT_HEADER = [
+    "ID", "Título", "Descrição", "Áreas", "Modalidade", "Status",
+    "Horas", "Créditos", "Preço", "Criado em"
+]
+
+
+def export_row(c: Row) -> list:
+    return [
+        c.id,
+        c.title,
+        c.description or "",
+        c.area_names or "",
+        c.modality_name or "",
+        c.status,
+        c.num_hours or "",
+        c.credits or "",
+        c.price or "",
+        c.created_at.isoformat() if c.created_at else "",
+    ]
+
 
 class CourseService:
     def __init__(self, repo: CourseRepository = CourseRepository()):
         self.repo = repo
+        self.stats_repo = GradeStatRepository()
+        self.quiz_repo = QuizRepository()
+
+    async def list(
+        self,
+        db: AsyncSession,
+        q: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+    ) -> dict:
+        return await self.repo.list(db, q=q, cursor=cursor, limit=limit)
 
-    async def list(self, db: AsyncSession, skip: int = 0, limit: Optional[int] = 100) -> Sequence[Course]:
-        return await self.repo.list(db, skip=skip, limit=limit)
-    
     async def get(self, db: AsyncSession, course_id: str) -> Course:
         course = await self.repo.get(db, course_id)
         if not course:
@@ -30,20 +69,14 @@ class CourseService:
         *,
         obj_in: CourseCreate,
     ) -> Course:
-        existing_course = await self.repo.get_by_title(db, obj_in.title)
-        if existing_course:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Course title must be unique",
-            )   
+        async with unit_of_work(db):
+            course = await self.repo.create(db, obj_in=obj_in)
 
-        course = await self.repo.create(db, obj_in=obj_in)
-
-        if obj_in.area_ids:
-            for area_id in obj_in.area_ids:
-                db.add(AreaCourse(area_id=area_id, course_id=course.id))
-            await db.commit()
-            await db.refresh(course)
+            if obj_in.area_ids:
+                db.add_all(AreaCourse(area_id=area_id, course_id=course.id) for area_id in obj_in.area_ids)
+                await db.flush()
+            # só a relação (as colunas já vieram no RETURNING do INSERT)
+            await db.refresh(course, ["areas"])
 
         return course
 
@@ -54,47 +87,56 @@ class CourseService:
         *,
         obj_in: CourseUpdate,
     ) -> Course:
-        course = await self.get(db, course_id)
-
-        if obj_in.title is not None:
-            existing_course = await self.repo.get_by_title(db, obj_in.title)
-            if existing_course and existing_course.id != course_id:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Course title must be unique",
-                )
-
-        course = await self.repo.update(db, course=course, obj_in=obj_in)
+        async with unit_of_work(db):
+            course = await self.get(db, course_id)
 
-        if obj_in.area_ids is not None:
-            stmt = delete(AreaCourse).where(AreaCourse.course_id == course.id)
-            await db.execute(stmt)
+            course = await self.repo.update(db, course=course, obj_in=obj_in)
 
-            for area_id in obj_in.area_ids:
-                db.add(AreaCourse(area_id=area_id, course_id=course.id))
+            if obj_in.area_ids is not None:
+                stmt = delete(AreaCourse).where(AreaCourse.course_id == course.id)
+                await db.execute(stmt)
 
-            await db.commit()
-            await db.refresh(course)
+                db.add_all(AreaCourse(area_id=area_id, course_id=course.id) for area_id in obj_in.area_ids)
+                await db.flush()
+                await db.refresh(course, ["areas"])
 
         return course
     
     async def delete(self, db: AsyncSession, course_id: str) -> None:
-        course = await self.get(db, course_id)
-        await self.repo.delete(db, course)
+        async with unit_of_work(db):
+            course = await self.get(db, course_id)
+            # os quizzes do curso vão por CASCADE: tirá-los da cache do /full depois do commit
+            quiz_ids = await self.quiz_repo.ids_by_course(db, course.id)
+            await self.stats_repo.remove_attempts(db, course_id=course.id)
+            await self.repo.delete(db, course)
+        for quiz_id in quiz_ids:
+            await quiz_full_cache.invalidate(quiz_id)
     
     async def export(
         self,
-        db: AsyncSession,
         *,
         q: Optional[str] = None,
         area_id: Optional[str] = None,
         modality_id: Optional[str] = None,
         status: Optional[StatusEnum | str] = None,
-    ) -> Sequence[Course]:
-        return await self.repo.export(
-            db, q=q, area_id=area_id, modality_id=modality_id, status=status
-        )
+    ) -> AsyncIterator[Row]:
+        # sessão própria, que vive enquanto o StreamingResponse estiver a ler
+        async with async_session() as db:
+            async for row in self.repo.export(
+                db, q=q, area_id=area_id, modality_id=modality_id, status=status
+            ):
+                yield row
 
 
 
 service = CourseService()
+
+
+@job_runner.handler("courses.export_csv", concurrency=2)
+async def export_courses_job(job: JobContext) -> dict:
+    path = job.file_path("csv")
+    await write_csv(path, EXPORT_HEADER, service.export(**job.payload), export_row)
+    return {
+        "file": os.path.basename(path),
+        "filename": f"courses_{dt.datetime.utcnow().strftime('%Y-%m-%d_%H-%M')}.csv",
+    }
@@ -1,9 +1,18 @@
+import asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.session import async_session
 from app.repositories.crud.dashboard_repo import DashboardRepository
+from app.repositories.crud.grade_stat_repo import GradeStatRepository
+from app.db.uow import unit_of_work
+from app.core.config import settings
+from app.core.jobs import job_runner, JobContext
 
 class DashboardService:
     def __init__(self, repo: DashboardRepository = DashboardRepository()):
         self.repo = repo
+        self.stats_repo = GradeStatRepository()
+        # partilhado por todos os snapshots: 10 painéis x N pedidos não esgotam o pool
+        self._panels = asyncio.Semaphore(settings.DASHBOARD_SNAPSHOT_CONCURRENCY)
 
     async def get_summary(self, db: AsyncSession):
         return await self.repo.summary(db)
@@ -40,4 +49,69 @@ class DashboardService:
     async def get_courses_by_area(self, db: AsyncSession):
         return await self.repo.courses_by_area(db)
 
-service = DashboardService()
\ No newline at end of file
+    async def _run(self, fn, *args):
+        # cada painel usa a sua própria sessão (ligação do pool) para poder correr em
+        # paralelo, até DASHBOARD_SNAPSHOT_CONCURRENCY de cada vez
+        async with self._panels:
+            async with async_session() as db:
+                return await fn(db, *args)
+
+    async def get_snapshot(
+        self,
+        *,
+        course_id: str | None = None,
+        quiz_id: str | None = None,
+        role_id: str | None = None,
+        users_range: str = "1m",
+        attempts_range: str = "1m",
+        top_limit: int = 5,
+    ):
+        (
+            summary,
+            average,
+            by_course,
+            by_quiz,
+            by_user,
+            distribution,
+            top,
+            users_over_time,
+            attempts_over_time,
+            by_area,
+        ) = await asyncio.gather(
+            self._run(self.repo.summary),
+            self._run(self.repo.average_grade, course_id, quiz_id),
+            self._run(self.repo.grades_by_course),
+            self._run(self.repo.grades_by_quiz, course_id),
+            self._run(self.repo.grades_by_user),
+            self._run(self.repo.grade_distribution),
+            self._run(self.repo.top_students, top_limit),
+            self._run(self.repo.users_over_time, users_range, role_id),
+            self._run(self.repo.quiz_attempts_over_time, attempts_range, quiz_id),
+            self._run(self.repo.courses_by_area),
+        )
+
+        return {
+            "summary": summary,
+            "average_grade": {"average": average},
+            "grades_by_course": by_course,
+            "grades_by_quiz": by_quiz,
+            "grades_by_user": by_user,
+            "grade_distribution": [{"range": k, "total": v} for k, v in distribution.items()],
+            "top_students": top,
+            "users_over_time": users_over_time,
+            "quiz_attempts_over_time": attempts_over_time,
+            "courses_by_area": by_area,
+        }
+
+    async def rebuild_stats(self, db: AsyncSession) -> None:
+        # recalcula grade_stats a partir de quiz_attempts (backfills / correções)
+        async with unit_of_work(db):
+            await self.stats_repo.rebuild(db)
+
+service = DashboardService()
+
+
+@job_runner.handler("grade_stats.rebuild")
+async def rebuild_stats_job(job: JobContext) -> None:
+    async with async_session() as db:
+        await service.rebuild_stats(db)
@@ -0,0 +1,39 @@
+import os
+from typing import Any, Optional
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.crud.job_repo import JobRepository, SUCCEEDED
+from app.models.job import Job
+from app.core.config import settings
+from app.core.jobs import job_runner
+from app.core.security import Principal
+
+
+class JobService:
+    def __init__(self, repo: JobRepository = JobRepository()):
+        self.repo = repo
+
+    async def enqueue(self, db: AsyncSession, job_type: str, payload: dict[str, Any], *, created_by: Optional[str] = None) -> Job:
+        return await job_runner.enqueue(db, job_type, payload, created_by=created_by)
+
+    async def get(self, db: AsyncSession, job_id: str, principal: Principal) -> Job:
+        # cada um vê os seus jobs; o Admin vê todos
+        job = await self.repo.get(db, job_id)
+        if not job or (job.created_by != principal.id and principal.role_name != "Admin"):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+        return job
+
+    async def get_file(self, db: AsyncSession, job_id: str, principal: Principal) -> tuple[str, str]:
+        # (caminho, nome para o download) do ficheiro gerado pelo job
+        job = await self.get(db, job_id, principal)
+        if job.status != SUCCEEDED:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Job is {job.status}")
+        file = (job.result or {}).get("file")
+        path = os.path.join(settings.JOBS_FILES_DIR, file) if file else None
+        if not path or not os.path.exists(path):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job has no file")
+        return path, job.result.get("filename") or file
+
+
+service = JobService()
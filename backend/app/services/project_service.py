@@ -2,15 +2,22 @@ from typing import Sequence, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 from app.repositories.crud.project_repo import ProjectRepository
+from app.db.uow import unit_of_work
 from app.models.project import Project
+from app.core.config import settings
 
 
 class ProjectService:
     def __init__(self):
         self.repo = ProjectRepository()
 
-    async def list(self, db: AsyncSession, skip: int = 0, limit: int = 100) -> Sequence[Project]:
-        return await self.repo.list(db, skip=skip, limit=limit)
+    async def list(
+        self,
+        db: AsyncSession,
+        cursor: Optional[str] = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+    ) -> dict:
+        return await self.repo.list(db, cursor=cursor, limit=limit)
 
     async def get(self, db: AsyncSession, project_id: str) -> Project:
         project = await self.repo.get(db, project_id)
@@ -32,23 +39,17 @@ class ProjectService:
         user_id: str,
         course_id: str
     ) -> Project:
-        existing = await self.repo.get_by_title(db, title)
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Project title must be unique"
+        async with unit_of_work(db):
+            return await self.repo.create(
+                db,
+                title=title,
+                description=description,
+                project_url=project_url,
+                file_path=file_path,
+                user_id=user_id,
+                course_id=course_id,
             )
 
-        return await self.repo.create(
-            db,
-            title=title,
-            description=description,
-            project_url=project_url,
-            file_path=file_path,
-            user_id=user_id,
-            course_id=course_id,
-        )
-
     async def update(
         self,
         db: AsyncSession,
@@ -60,29 +61,23 @@ class ProjectService:
         file_path: Optional[str] = None,
         course_id: Optional[str] = None
     ) -> Project:
-        project = await self.get(db, project_id)
-
-        if title:
-            existing = await self.repo.get_by_title(db, title)
-            if existing and existing.id != project_id:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Project title must be unique"
-                )
+        async with unit_of_work(db):
+            project = await self.get(db, project_id)
 
-        return await self.repo.update(
-            db,
-            project,
-            title=title,
-            description=description,
-            project_url=project_url,
-            file_path=file_path,
-            course_id=course_id,
-        )
+            return await self.repo.update(
+                db,
+                project,
+                title=title,
+                description=description,
+                project_url=project_url,
+                file_path=file_path,
+                course_id=course_id,
+            )
 
     async def delete(self, db: AsyncSession, project_id: str) -> None:
-        project = await self.get(db, project_id)
-        await self.repo.delete(db, project)
+        async with unit_of_work(db):
+            project = await self.get(db, project_id)
+            await self.repo.delete(db, project)
 
 
 service = ProjectService()
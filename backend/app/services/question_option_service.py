@@ -2,7 +2,10 @@ from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.crud.question_option_repo import QuestionOptionRepository
+from app.db.uow import unit_of_work
 from app.models.question_option import QuestionOption
+from app.models.question import Question
+from app.services.quiz_service import quiz_full_cache
 
 
 class QuestionOptionService:
@@ -30,19 +33,26 @@ class QuestionOptionService:
                 detail="A question can have at most 4 options"
             )
 
-        await self.repo.delete_by_question(db, question_id)
+        # apagar e voltar a criar na mesma transação: nunca fica uma pergunta sem opções
+        async with unit_of_work(db):
+            await self.repo.delete_by_question(db, question_id)
 
-        items: list[QuestionOption] = []
-        for option_id in option_ids:
-            items.append(
-                QuestionOption(
-                    question_id=question_id,
-                    option_id=option_id,
-                    is_correct=(option_id == correct_option_id)
+            items: list[QuestionOption] = []
+            for option_id in option_ids:
+                items.append(
+                    QuestionOption(
+                        question_id=question_id,
+                        option_id=option_id,
+                        is_correct=(option_id == correct_option_id)
+                    )
                 )
-            )
 
-        await self.repo.bulk_create(db, items)
+            await self.repo.bulk_create(db, items)
+
+            question = await db.get(Question, question_id)
+
+        if question:
+            await quiz_full_cache.invalidate(question.quiz_id)
 
     async def list_by_question(
         self,
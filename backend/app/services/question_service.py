@@ -3,16 +3,24 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import delete
 from fastapi import HTTPException, status
 from app.repositories.crud.question_repo import QuestionRepository
+from app.db.uow import unit_of_work
 from app.models.question import Question
 from app.models.question_option import QuestionOption
+from app.core.config import settings
+from app.services.quiz_service import quiz_full_cache
 
 
 class QuestionService:
     def __init__(self, repo=QuestionRepository()):
         self.repo = repo
 
-    async def list(self, db: AsyncSession, skip: int = 0, limit: Optional[int] = None) -> Sequence[Question]:
-        return await self.repo.list(db, skip=skip, limit=limit)
+    async def list(
+        self,
+        db: AsyncSession,
+        cursor: Optional[str] = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+    ) -> dict:
+        return await self.repo.list(db, cursor=cursor, limit=limit)
 
     async def get(self, db: AsyncSession, question_id: str) -> Question:
         question = await self.repo.get(db, question_id)
@@ -28,19 +36,15 @@ class QuestionService:
         quiz_id: str,
         option_ids: Optional[List[str]] = None
     ) -> Question:
-        existing_question = await self.repo.get_by_text(db, text)
-        if existing_question:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Question text must be unique")
-
-        question = await self.repo.create(db, text=text, quiz_id=quiz_id)
+        async with unit_of_work(db):
+            question = await self.repo.create(db, text=text, quiz_id=quiz_id)
 
-        # associar opções se existirem
-        if option_ids:
-            for option_id in option_ids:
-                db.add(QuestionOption(question_id=question.id, option_id=option_id))
-            await db.commit()
+            # associar opções se existirem
+            if option_ids:
+                db.add_all(QuestionOption(question_id=question.id, option_id=option_id) for option_id in option_ids)
+                await db.flush()
 
-        await db.refresh(question)
+        await quiz_full_cache.invalidate(quiz_id)
         return question
 
     async def update(
@@ -52,31 +56,31 @@ class QuestionService:
         quiz_id: Optional[str] = None,
         option_ids: Optional[List[str]] = None
     ) -> Question:
-        question = await self.get(db, question_id)
-
-        if text:
-            existing_question = await self.repo.get_by_text(db, text)
-            if existing_question and existing_question.id != question_id:
-                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Question text must be unique")
-
-        question = await self.repo.update(db, question, text=text, quiz_id=quiz_id)
+        async with unit_of_work(db):
+            question = await self.get(db, question_id)
+            old_quiz_id = question.quiz_id
 
-        # atualizar opções associadas
-        if option_ids is not None:
-            stmt = delete(QuestionOption).where(QuestionOption.question_id == question.id)
-            await db.execute(stmt)
+            question = await self.repo.update(db, question, text=text, quiz_id=quiz_id)
 
-            for option_id in option_ids:
-                db.add(QuestionOption(question_id=question.id, option_id=option_id))
+            # atualizar opções associadas
+            if option_ids is not None:
+                stmt = delete(QuestionOption).where(QuestionOption.question_id == question.id)
+                await db.execute(stmt)
 
-            await db.commit()
-            await db.refresh(question)
+                db.add_all(QuestionOption(question_id=question.id, option_id=option_id) for option_id in option_ids)
+                await db.flush()
 
+        await quiz_full_cache.invalidate(old_quiz_id)
+        if question.quiz_id != old_quiz_id:
+            await quiz_full_cache.invalidate(question.quiz_id)
         return question
 
     async def delete(self, db: AsyncSession, question_id: str) -> None:
-        question = await self.get(db, question_id)
-        await self.repo.delete(db, question)
+        async with unit_of_work(db):
+            question = await self.get(db, question_id)
+            quiz_id = question.quiz_id
+            await self.repo.delete(db, question)
+        await quiz_full_cache.invalidate(quiz_id)
 
 
 service = QuestionService()
\ No newline at end of file
@@ -1,25 +1,41 @@
 from typing import Sequence, Optional
-from datetime import datetime, timezone
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
+from sqlalchemy import Row
 
 from app.repositories.crud.quiz_attempt_repo import QuizAttemptRepository
-from app.models.quiz_attempt import QuizAttempt
-from app.models.question import Question
+from app.repositories.crud.grade_stat_repo import GradeStatRepository
+from app.repositories.crud.answer_repo import AnswerRepository
+from app.db.uow import unit_of_work
 from app.models.answer import Answer
-from app.models.question_option import QuestionOption
-from app.models.badges import Badge
-from app.models.quiz_badge_award import QuizBadgeAward
+from app.models.common import uuid4_str
+from app.models.quiz_attempt import QuizAttempt
+from app.services.badge_service import service as badge_service, BadgeThreshold
+from app.core.config import settings
+from app.core.cache import TTLCache
+from app.core.attempt_buffer import attempt_buffer, merge_latest
+
 
+# attempt_id -> {question_id: opções válidas}; perguntas/opções de um quiz em exame não mudam
+answer_key_cache = TTLCache(
+    maxsize=settings.ATTEMPT_ANSWER_KEY_CACHE_MAX_SIZE,
+    ttl=settings.ATTEMPT_ANSWER_KEY_CACHE_TTL_SECONDS,
+)
 
 
 class QuizAttemptService:
     def __init__(self):
         self.repo = QuizAttemptRepository()
+        self.stats_repo = GradeStatRepository()
+        self.answer_repo = AnswerRepository()
 
-    async def list(self, db: AsyncSession, skip: int = 0, limit: int = 100) -> Sequence[QuizAttempt]:
-        return await self.repo.list(db, skip=skip, limit=limit)
+    async def list(
+        self,
+        db: AsyncSession,
+        cursor: Optional[str] = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+    ) -> dict:
+        return await self.repo.list(db, cursor=cursor, limit=limit)
 
     async def get(self, db: AsyncSession, attempt_id: str) -> QuizAttempt:
         attempt = await self.repo.get(db, attempt_id)
@@ -28,111 +44,180 @@ class QuizAttemptService:
         return attempt
 
     async def create(self, db: AsyncSession, *, score: float, finished_at, user_id: str, quiz_id: str) -> QuizAttempt:
-        return await self.repo.create(db, score=score, finished_at=finished_at, user_id=user_id, quiz_id=quiz_id)
+        async with unit_of_work(db):
+            attempt = await self.repo.create(db, score=score, finished_at=finished_at, user_id=user_id, quiz_id=quiz_id)
+            if attempt.finished_at is not None:
+                await self.stats_repo.add_attempts(db, attempt_id=attempt.id)
+            return attempt
 
     async def update(self, db: AsyncSession, attempt_id: str, *, score: Optional[float] = None, finished_at=None) -> QuizAttempt:
-        attempt = await self.get(db, attempt_id)
-        return await self.repo.update(db, attempt, score=score, finished_at=finished_at)
+        async with unit_of_work(db):
+            attempt = await self.get(db, attempt_id)
+
+            # retira o estado antigo dos agregados e volta a somar o novo, na mesma transação
+            await self.stats_repo.remove_attempts(db, attempt_id=attempt.id)
+            if score is not None:
+                attempt.score = score
+            if finished_at is not None:
+                attempt.finished_at = finished_at
+            attempt = await self.repo.update(db, attempt)
+            await self.stats_repo.add_attempts(db, attempt_id=attempt.id)
+            return attempt
 
     async def delete(self, db: AsyncSession, attempt_id: str) -> None:
-        attempt = await self.get(db, attempt_id)
-        await self.repo.delete(db, attempt)
-
-    async def finish(self, db: AsyncSession, attempt_id: str) -> tuple[QuizAttempt, Badge | None]:
-        attempt = await self.get(db, attempt_id)
-
-        if attempt.finished_at is not None:
-            return attempt, None
+        async with unit_of_work(db):
+            attempt = await self.get(db, attempt_id)
+            await self.stats_repo.remove_attempts(db, attempt_id=attempt.id)
+            await self.repo.delete(db, attempt)
+
+    async def finish(self, db: AsyncSession, attempt_id: str) -> tuple[QuizAttempt | Row, BadgeThreshold | None]:
+        async with unit_of_work(db):
+            await self._apply_draft(db, attempt_id)
+            result = await self._grade(db, attempt_id)
+        await self._forget_draft(attempt_id)
+        return result
+
+    async def _forget_draft(self, attempt_id: str) -> None:
+        # só depois do commit de fora: se falhar, o draft continua no buffer
+        await attempt_buffer.discard(attempt_id)
+        answer_key_cache.delete(attempt_id)
+
+    async def _apply_draft(self, db: AsyncSession, attempt_id: str) -> None:
+        # checkpoint + buffer -> answers numa só escrita, com a resposta mais recente de cada pergunta
+        row = await self.repo.lock_draft(db, attempt_id)
+        if row is None:
+            return
+        draft = merge_latest(row.draft_answers, await attempt_buffer.pending(attempt_id))
+        if draft:
+            await self.answer_repo.upsert_many(
+                db, attempt_id=attempt_id, answers=[(question_id, a["o"]) for question_id, a in draft.items()]
+            )
 
-        total_q = await db.scalar(
-            select(func.count(Question.id)).where(Question.quiz_id == attempt.quiz_id)
+    async def _grade(self, db: AsyncSession, attempt_id: str) -> tuple[QuizAttempt | Row, BadgeThreshold | None]:
+        badges = await badge_service.thresholds(db)
+
+        def badge_id(code: str) -> Optional[str]:
+            badge = badges.get(code)
+            return badge.id if badge else None
+
+        # 100% => gold, >= 80% => silver, >= 50% => bronze, < 50% => sem badge
+        finished = await self.repo.finish(
+            db,
+            attempt_id,
+            award_id=uuid4_str(),
+            gold_id=badge_id("gold"),
+            silver_id=badge_id("silver"),
+            bronze_id=badge_id("bronze"),
         )
-        total_q = int(total_q or 0)
 
-        if total_q == 0:
+        if finished is None:
+            attempt = await self.get(db, attempt_id)
+            if attempt.finished_at is not None:
+                return attempt, None
             raise HTTPException(status_code=400, detail="Quiz has no questions")
 
-        correct = await db.scalar(
-            select(func.count(Answer.id))
-            .select_from(Answer)
-            .join(
-                QuestionOption,
-                and_(
-                    QuestionOption.question_id == Answer.question_id,
-                    QuestionOption.option_id == Answer.option_id,
-                )
-            )
-            .where(
-                Answer.attempt_id == attempt.id,
-                QuestionOption.is_correct.is_(True),
-            )
-        )
-        correct = int(correct or 0)
-
-        score = round((correct / total_q) * 100, 2)
-        finished_at = datetime.now(timezone.utc)
-
-        updated = await self.repo.update(db, attempt, score=score, finished_at=finished_at)
+        # agregados do dashboard na mesma transação (o statement acima já não os vê)
+        await self.stats_repo.add_attempts(db, attempt_id=attempt_id)
 
-        badge_awarded = await self._award_badge_if_eligible(db, updated)
+        awarded = None
+        if finished.badge_id is not None:
+            awarded = next((b for b in badges.values() if b.id == finished.badge_id), None)
 
-        return updated, badge_awarded
+        return finished, awarded
 
-    async def _award_badge_if_eligible(
+    async def submit_answers(
         self,
         db: AsyncSession,
-        attempt: QuizAttempt,
-    ) -> Badge | None:
-        score = float(attempt.score)
-
-        badge_code: str | None = None
-        if score == 100:
-            badge_code = "gold"
-        elif score >= 80:
-            badge_code = "silver"
-        elif score >= 50:
-            badge_code = "bronze"
-
-        # < 50% => sem badge
-        if badge_code is None:
-            return None
-
-        badge = await db.scalar(select(Badge).where(Badge.code == badge_code))
-        if not badge:
-            return None
-
-        existing_award = await db.scalar(
-            select(QuizBadgeAward).where(
-                QuizBadgeAward.user_id == attempt.user_id,
-                QuizBadgeAward.quiz_id == attempt.quiz_id,
-            )
-        )
+        attempt_id: str,
+        answers: Sequence[tuple[str, Optional[str]]],
+        *,
+        finish: bool = False,
+    ) -> tuple[Sequence[Answer], QuizAttempt | Row | None, BadgeThreshold | None]:
+        async with unit_of_work(db):
+            answer_key = await self.repo.list_answer_key(db, attempt_id)
+            if not answer_key:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Quiz attempt not found")
+            if answer_key[0].finished_at is not None:
+                raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Quiz attempt already finished")
+
+            self._check_answers(self._valid_options(answer_key), answers)
+
+            if finish:
+                # o draft primeiro: as respostas deste pedido são mais recentes
+                await self._apply_draft(db, attempt_id)
+            saved = await self.answer_repo.upsert_many(db, attempt_id=attempt_id, answers=answers)
+
+            attempt, badge = None, None
+            if finish:
+                # a correção corre dentro desta transação: respostas e correção no mesmo commit
+                attempt, badge = await self._grade(db, attempt_id)
+
+        if finish:
+            await self._forget_draft(attempt_id)
+        return saved, attempt, badge
+
+    async def save_draft(self, db: AsyncSession, attempt_id: str, answers: Sequence[tuple[str, Optional[str]]]) -> None:
+        # Respostas em curso: validadas contra a cache das opções e guardadas no buffer,
+        # sem escrever na BD (ver app.core.attempt_buffer). Vão para answers no finish.
+        valid_options = answer_key_cache.get(attempt_id)
+        if valid_options is None:
+            answer_key = await self.repo.list_answer_key(db, attempt_id)
+            # só leitura: liberta já o lock da linha
+            await db.rollback()
+            if not answer_key:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Quiz attempt not found")
+            if answer_key[0].finished_at is not None:
+                raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Quiz attempt already finished")
+            valid_options = self._valid_options(answer_key)
+            answer_key_cache.set(attempt_id, valid_options)
+
+        self._check_answers(valid_options, answers)
+        await attempt_buffer.put(attempt_id, answers)
+
+    async def get_draft(self, db: AsyncSession, attempt_id: str) -> dict:
+        # estado atual das respostas em curso (ex.: retomar depois de recarregar a página)
+        row = await self.repo.get_draft(db, attempt_id)
+        if row is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Quiz attempt not found")
+
+        draft = {} if row.finished_at is not None else merge_latest(row.draft_answers, await attempt_buffer.pending(attempt_id))
+        return {
+            "attempt_id": attempt_id,
+            "finished": row.finished_at is not None,
+            "answers": [{"question_id": q, "option_id": a["o"]} for q, a in draft.items()],
+        }
+
+    def _valid_options(self, answer_key: Sequence[Row]) -> dict[str, set[str]]:
+        valid_options: dict[str, set[str]] = {}
+        for row in answer_key:
+            if row.question_id is None:
+                continue
+            options = valid_options.setdefault(row.question_id, set())
+            if row.option_id is not None:
+                options.add(row.option_id)
+        return valid_options
+
+    def _check_answers(self, valid_options: dict[str, set[str]], answers: Sequence[tuple[str, Optional[str]]]) -> None:
+        seen: set[str] = set()
+        invalid: list[str] = []
+        for question_id, option_id in answers:
+            if question_id in seen:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Duplicate answer for question {question_id}",
+                )
+            seen.add(question_id)
 
-        if not existing_award:
-            new_award = QuizBadgeAward(
-                user_id=attempt.user_id,
-                quiz_id=attempt.quiz_id,
-                badge_id=badge.id,
-                attempt_id=attempt.id,
-                awarded_at=datetime.now(timezone.utc),
+            options = valid_options.get(question_id)
+            if options is None or (option_id is not None and option_id not in options):
+                invalid.append(question_id)
+
+        if invalid:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid answers for questions: {', '.join(invalid)}",
             )
-            db.add(new_award)
-            await db.commit()
-            return badge
-
-        current_badge = await db.scalar(select(Badge).where(Badge.id == existing_award.badge_id))
-        current_min = current_badge.min_score if current_badge else -1
-
-        if badge.min_score > current_min:
-            existing_award.badge_id = badge.id
-            existing_award.attempt_id = attempt.id
-            existing_award.awarded_at = datetime.now(timezone.utc)
-            db.add(existing_award)
-            await db.commit()
-            return badge
-
-        return None
-    
+
     async def list_by_user(self, db: AsyncSession, user_id: str) -> Sequence[QuizAttempt]:
         return await self.repo.list_by_user(db, user_id)
 
@@ -4,7 +4,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.crud.quiz_badge_award_repo import QuizBadgeAwardRepository
 from app.repositories.crud.badge_repo import BadgeRepository
+from app.db.uow import unit_of_work
 from app.models.quiz_badge_award import QuizBadgeAward
+from app.core.config import settings
 
 
 class QuizBadgeAwardService:
@@ -16,8 +18,13 @@ class QuizBadgeAwardService:
         self.repo = repo
         self.badge_repo = badge_repo
 
-    async def list(self, db: AsyncSession, skip: int = 0, limit: Optional[int] = None) -> Sequence[QuizBadgeAward]:
-        return await self.repo.list(db, skip=skip, limit=limit)
+    async def list(
+        self,
+        db: AsyncSession,
+        cursor: Optional[str] = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+    ) -> dict:
+        return await self.repo.list(db, cursor=cursor, limit=limit)
 
     async def get(self, db: AsyncSession, award_id: str) -> QuizBadgeAward:
         obj = await self.repo.get(db, award_id)
@@ -37,37 +44,39 @@ class QuizBadgeAwardService:
         badge_id: str,
         attempt_id: Optional[str] = None,
     ) -> QuizBadgeAward:
-        new_badge = await self.badge_repo.get(db, badge_id)
-        if not new_badge:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid badge_id")
+        async with unit_of_work(db):
+            new_badge = await self.badge_repo.get(db, badge_id)
+            if not new_badge:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid badge_id")
 
-        current = await self.repo.get_by_user_quiz(db, user_id, quiz_id)
+            current = await self.repo.get_by_user_quiz(db, user_id, quiz_id)
 
-        if not current:
-            return await self.repo.create(
-                db,
-                user_id=user_id,
-                quiz_id=quiz_id,
-                badge_id=badge_id,
-                attempt_id=attempt_id,
-            )
+            if not current:
+                return await self.repo.create(
+                    db,
+                    user_id=user_id,
+                    quiz_id=quiz_id,
+                    badge_id=badge_id,
+                    attempt_id=attempt_id,
+                )
 
-        old_badge = await self.badge_repo.get(db, current.badge_id)
-        old_min = old_badge.min_score if old_badge else -1
+            old_badge = await self.badge_repo.get(db, current.badge_id)
+            old_min = old_badge.min_score if old_badge else -1
 
-        if new_badge.min_score > old_min:
-            return await self.repo.update(
-                db,
-                current,
-                badge_id=badge_id,
-                attempt_id=attempt_id,
-            )
+            if new_badge.min_score > old_min:
+                return await self.repo.update(
+                    db,
+                    current,
+                    badge_id=badge_id,
+                    attempt_id=attempt_id,
+                )
 
-        return current
+            return current
 
     async def delete(self, db: AsyncSession, award_id: str) -> None:
-        award = await self.get(db, award_id)
-        await self.repo.delete(db, award)
+        async with unit_of_work(db):
+            award = await self.get(db, award_id)
+            await self.repo.delete(db, award)
 
 
 service = QuizBadgeAwardService()
@@ -1,25 +1,50 @@
+import hashlib
 from typing import Sequence, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 from app.repositories.crud.quiz_repo import QuizRepository
+from app.repositories.crud.grade_stat_repo import GradeStatRepository
+from app.db.uow import unit_of_work
+from app.models.question import Question
+from app.models.question_option import QuestionOption
 from app.models.quiz import Quiz
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 from app.schemas.quiz_full import QuizFullOut, QuestionFull, OptionMini
 from app.schemas.quiz import StatusEnum
+from app.core.config import settings
+from app.core.cache import VersionedCache, LocalCacheBackend, load_backend
+
+
+# JSON serializado de /quizzes/{id}/full por quiz; invalidado pelo QuizService,
+# QuestionService, QuestionOptionService e OptionService em cada alteração de conteúdo e
+# pelo CourseService/VideoService nas alterações em cascata. Com o backend local cada
+# worker só vê as suas invalidações: o TTL curto limita o tempo em que os outros servem
+# uma versão antiga (com vários workers, usar QUIZ_FULL_CACHE_BACKEND partilhado)
+quiz_full_cache = VersionedCache(
+    "quiz_full",
+    backend=(
+        load_backend(settings.QUIZ_FULL_CACHE_BACKEND)
+        if settings.QUIZ_FULL_CACHE_BACKEND
+        else LocalCacheBackend(maxsize=settings.QUIZ_FULL_CACHE_MAX_SIZE)
+    ),
+    ttl=settings.QUIZ_FULL_CACHE_TTL_SECONDS,
+)
 
 
 class QuizService:
     def __init__(self):
         self.repo = QuizRepository()
+        self.stats_repo = GradeStatRepository()
 
     async def list(
         self,
         db: AsyncSession,
-        skip: int = 0,
-        limit: Optional[int] = None
-    ) -> Sequence[Quiz]:
-        return await self.repo.list(db, skip=skip, limit=limit)
+        q: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+    ) -> dict:
+        return await self.repo.list(db, q=q, cursor=cursor, limit=limit)
 
     async def get(self, db: AsyncSession, quiz_id: str) -> Quiz:
         quiz = await self.repo.get(db, quiz_id)
@@ -41,33 +66,27 @@ class QuizService:
         video_id: Optional[str] = None,
         status: StatusEnum | str = StatusEnum.active,
     ) -> Quiz:
-        existing_quiz = await self.repo.get_by_title(db, title)
-        if existing_quiz:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Quiz title must be unique"
-            )
+        async with unit_of_work(db):
+            status_str = status.value if isinstance(status, StatusEnum) else str(status)
 
-        status_str = status.value if isinstance(status, StatusEnum) else str(status)
-        
-        if status_str == "active":
-            current_active = await self.repo.get_active_by_course(db, course_id)
-            if current_active:
-                raise HTTPException(
-                    status_code=409,
-                    detail="Já existe um quiz ativo para este curso. Selecione Inativo ou desative o quiz ativo atual."
-                )
+            if status_str == "active":
+                current_active = await self.repo.get_active_by_course(db, course_id)
+                if current_active:
+                    raise HTTPException(
+                        status_code=409,
+                        detail="Já existe um quiz ativo para este curso. Selecione Inativo ou desative o quiz ativo atual."
+                    )
 
 
-        return await self.repo.create(
-            db,
-            title=title,
-            description=description,
-            user_id=user_id or None,
-            course_id=course_id,
-            video_id=video_id or None,
-            status=status_str,
-        )
+            return await self.repo.create(
+                db,
+                title=title,
+                description=description,
+                user_id=user_id or None,
+                course_id=course_id,
+                video_id=video_id or None,
+                status=status_str,
+            )
 
     async def update(
         self,
@@ -80,50 +99,56 @@ class QuizService:
         video_id: Optional[str] = None,
         status: Optional[StatusEnum | str] = None,
         ) -> Quiz:
-            quiz = await self.get(db, quiz_id)
-
-            if title:
-                existing_quiz = await self.repo.get_by_title(db, title)
-                if existing_quiz and existing_quiz.id != quiz_id:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail="Quiz title must be unique"
-                    )
-
-            status_str = None
-            if status is not None:
-                status_str = status.value if isinstance(status, StatusEnum) else str(status)
-
-            if status_str == "active":
-                current_active = await self.repo.get_active_by_course(db, quiz.course_id)
-                if current_active and current_active.id != quiz.id:
-                    raise HTTPException(
-                        status_code=409,
-                        detail="Já existe um quiz ativo para este curso. Desative o quiz ativo atual antes de ativar este."
-                    )
-
+            async with unit_of_work(db):
+                quiz = await self.get(db, quiz_id)
+
+                status_str = None
+                if status is not None:
+                    status_str = status.value if isinstance(status, StatusEnum) else str(status)
+
+                if status_str == "active":
+                    current_active = await self.repo.get_active_by_course(db, quiz.course_id)
+                    if current_active and current_active.id != quiz.id:
+                        raise HTTPException(
+                            status_code=409,
+                            detail="Já existe um quiz ativo para este curso. Desative o quiz ativo atual antes de ativar este."
+                        )
+
+
+                # as tentativas terminadas mudam de curso: saem dos agregados do antigo
+                # e entram nos do novo, na mesma transação
+                course_changed = course_id is not None and course_id != quiz.course_id
+                if course_changed:
+                    await self.stats_repo.remove_attempts(db, quiz_id=quiz_id)
+
+                quiz = await self.repo.update(
+                    db,
+                    quiz,
+                    title=title,
+                    description=description,
+                    course_id=course_id,
+                    video_id=video_id,
+                    status=status_str, 
+                )
 
-            quiz = await self.repo.update(
-                db,
-                quiz,
-                title=title,
-                description=description,
-                course_id=course_id,
-                video_id=video_id,
-                status=status_str, 
-            )
+                if course_changed:
+                    await self.stats_repo.add_attempts(db, quiz_id=quiz_id)
+            await quiz_full_cache.invalidate(quiz_id)
             return quiz
 
     async def delete(self, db: AsyncSession, quiz_id: str) -> None:
-        quiz = await self.get(db, quiz_id)
+        async with unit_of_work(db):
+            quiz = await self.get(db, quiz_id)
 
-        if quiz.status == "active":
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Não é possível apagar um quiz ativo. Desative-o antes de remover."
-            )
+            if quiz.status == "active":
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Não é possível apagar um quiz ativo. Desative-o antes de remover."
+                )
 
-        await self.repo.delete(db, quiz)
+            await self.stats_repo.remove_attempts(db, quiz_id=quiz.id)
+            await self.repo.delete(db, quiz)
+        await quiz_full_cache.invalidate(quiz_id)
 
 
     async def get_by_course(self, db: AsyncSession, course_id: str) -> Quiz:
@@ -139,8 +164,8 @@ class QuizService:
             .where(Quiz.id == quiz_id)
             .options(
                 selectinload(Quiz.questions)
-                .selectinload("question_options")
-                .selectinload("option")
+                .selectinload(Question.question_options)
+                .selectinload(QuestionOption.option)
             )
         )
         quiz = result.scalar_one_or_none()
@@ -156,6 +181,18 @@ class QuizService:
             questions_out.append(QuestionFull(id=q.id, text=q.text, options=opts))
 
         return QuizFullOut(quiz=quiz, questions=questions_out)
+
+    async def get_full_json(self, db: AsyncSession, quiz_id: str) -> tuple[str, bytes]:
+        # (etag, corpo JSON); o etag vem do conteúdo, igual em todos os workers
+        version = await quiz_full_cache.version(quiz_id)
+        body = await quiz_full_cache.get(quiz_id, version)
+        if body is None:
+            full = await self.get_full(db, quiz_id)
+            body = full.model_dump_json().encode()
+            await quiz_full_cache.set(quiz_id, version, body)
+
+        etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        return etag, body
     
     async def get_active_by_course(self, db: AsyncSession, course_id: str) -> Quiz | None:
             res = await db.execute(
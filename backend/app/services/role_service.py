@@ -2,15 +2,23 @@ from typing import Sequence, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 from app.repositories.crud.role_repo import RoleRepository
+from app.db.uow import unit_of_work
 from app.models.role import Role
+from app.core.security import clear_principals
+from app.core.config import settings
 
 class RoleService:
     def __init__(self, repo= RoleRepository()):
         self.repo = repo
 
-    async def list(self, db: AsyncSession, skip: int = 0, limit: Optional[int] = None) -> Sequence[Role]:
-        return await self.repo.list(db, skip=skip, limit=limit)
-    
+    async def list(
+        self,
+        db: AsyncSession,
+        cursor: Optional[str] = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+    ) -> dict:
+        return await self.repo.list(db, cursor=cursor, limit=limit)
+
     async def get(self, db: AsyncSession, role_id: str) -> Role:
         role = await self.repo.get(db, role_id)
         if not role:
@@ -21,27 +29,21 @@ class RoleService:
         return role
     
     async def create(self, db: AsyncSession, *, name: str, description: Optional[str] = None) -> Role:
-        existing_role = await self.repo.get_by_name(db, name)
-        if existing_role:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Role name must be unique"
-            )
-        return await self.repo.create(db, name=name, description=description)
+        async with unit_of_work(db):
+            return await self.repo.create(db, name=name, description=description)
 
     async def update(self, db: AsyncSession, role_id: str, *, name: Optional[str] = None, description: Optional[str] = None) -> Role:
-        role = await self.get(db, role_id)
-        if name:
-            existing_role = await self.repo.get_by_name(db, name)
-            if existing_role and existing_role.id != role_id:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Role name must be unique"
-                )
-        return await self.repo.update(db, role, name=name, description=description)
+        async with unit_of_work(db):
+            role = await self.get(db, role_id)
+            role = await self.repo.update(db, role, name=name, description=description)
+        # o nome do role está em cache em todos os principals que o usam
+        clear_principals()
+        return role
     
     async def delete(self, db: AsyncSession, role_id: str) -> None:
-        role = await self.get(db, role_id)
-        await self.repo.delete(db, role)
+        async with unit_of_work(db):
+            role = await self.get(db, role_id)
+            await self.repo.delete(db, role)
+        clear_principals()
         
 service = RoleService()
@@ -1,25 +1,59 @@
+import os
 import re
 import datetime as dt
-from typing import Sequence, Optional
+from typing import Annotated, Any, AsyncIterator, Awaitable, Callable, Sequence, Optional
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from passlib.context import CryptContext
+from sqlalchemy import Row
 
+from app.db.session import async_session
 from app.repositories.crud.user_repo import UserRepository
+from app.repositories.crud.grade_stat_repo import GradeStatRepository
+from app.repositories.crud.role_repo import RoleRepository
+from app.db.uow import unit_of_work
 from app.models.user import User
-from app.schemas.user import UserCreate, StatusEnum, GenderEnum
+from app.models.job import Job
+from app.schemas.user import UserCreate, StatusEnum, GenderEnum, UserImportReport, UserImportRowError
+from app.core.security import invalidate_principal
+from app.core.passwords import password_hasher
+from app.core.config import settings
+from app.core.jobs import job_runner, JobContext
+from app.utils.csv_export import write_csv
+
+# as mesmas regras do UserCreate.password, para validar antes de fazer o hash
+_PASSWORD = TypeAdapter(Annotated[str, UserCreate.model_fields["password"]])
+# substitui a password já em hash na validação das linhas do job
+_PREHASHED = "x" * 6
+
+EXPORT_HEADER = ["ID", "Nome", "Username", "Email", "Função", "Status", "Gênero", "Nascimento", "Criado em"]
+
+
+def export_row(u: Row) -> list:
+    return [
+        u.id,
+        u.name,
+        u.username,
+        u.email,
+        (u.role_name or "Guest"),
+        u.status,
+        u.gender or "",
+        u.birthdate.isoformat() if u.birthdate else "",
+        u.created_at.isoformat() if u.created_at else "",
+    ]
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
 
 class UserService:
     def __init__(self, repo: UserRepository = UserRepository()):
         self.repo = repo
+        self.stats_repo = GradeStatRepository()
+        self.role_repo = RoleRepository()
 
-    def _hash(self, password: str) -> str:
-        return pwd_context.hash(password)
+    async def _hash(self, password: str) -> str:
+        return await password_hasher.hash(password)
 
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        return pwd_context.verify(plain_password, hashed_password)
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return await password_hasher.verify(plain_password, hashed_password)
 
     def _normalize_username(self, username: str) -> str:
         s = username.strip().lower()
@@ -27,8 +61,14 @@ class UserService:
         s = s.strip("_")
         return s or "user"
 
-    async def list(self, db: AsyncSession, skip: int = 0, limit: Optional[int] = None) -> Sequence[User]:
-        return await self.repo.list(db, skip=skip, limit=limit)
+    async def list(
+        self,
+        db: AsyncSession,
+        q: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+    ) -> dict:
+        return await self.repo.list(db, q=q, cursor=cursor, limit=limit)
 
     async def get(self, db: AsyncSession, user_id: str) -> User:
         user = await self.repo.get(db, user_id)
@@ -37,14 +77,10 @@ class UserService:
         return user
 
     async def create(self, db: AsyncSession, payload: UserCreate) -> User:
-        if await self.repo.get_by_email(db, payload.email):
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
-
+        # email/username repetidos chegam como IntegrityError do INSERT (app.core.integrity);
+        # o hash é feito antes de abrir a transação para não prender uma ligação do pool
         username = self._normalize_username(payload.username)
-        if await self.repo.get_by_username(db, username):
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Username already registered")
-
-        hashed_password = self._hash(payload.password)
+        hashed_password = await self._hash(payload.password)
 
         data = payload.dict() if hasattr(payload, "dict") else payload.model_dump()
         data.update(
@@ -54,7 +90,8 @@ class UserService:
                 "status": data.get("status") or StatusEnum.active,
             }
         )
-        return await self.repo.create(db, UserCreate(**data))
+        async with unit_of_work(db):
+            return await self.repo.create(db, UserCreate(**data))
 
     async def update(
         self,
@@ -71,50 +108,210 @@ class UserService:
         gender: Optional[GenderEnum | str] = None,
         birthdate: Optional[dt.date] = None,
     ) -> User:
-        user = await self.get(db, user_id)
-
-        if email and email != user.email:
-            if await self.repo.get_by_email(db, email):
-                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
-
-        new_username = None
-        if username and username != user.username:
-            username_normalized = self._normalize_username(username)
-            existing = await self.repo.get_by_username(db, username_normalized)
-            if existing:
-                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Username already registered")
-            new_username = username_normalized
-
-        hashed = self._hash(password) if password is not None else None
-
-        updated = await self.repo.update(
-            db,
-            user,
-            name=name if name is not None else user.name,
-            email=email if email is not None else user.email,
-            password=hashed if hashed is not None else user.password,
-            role_id=role_id if role_id is not None else user.role_id,
-            username=new_username if new_username is not None else user.username,
-            photo=photo if photo is not None else user.photo,
-            status=status if status is not None else user.status,
-            gender=gender if gender is not None else user.gender,
-            birthdate=birthdate if birthdate is not None else user.birthdate,
-        )
+        hashed = await self._hash(password) if password is not None else None
+
+        async with unit_of_work(db):
+            user = await self.get(db, user_id)
+
+            new_username = None
+            if username and username != user.username:
+                new_username = self._normalize_username(username)
+
+            updated = await self.repo.update(
+                db,
+                user,
+                name=name if name is not None else user.name,
+                email=email if email is not None else user.email,
+                password=hashed if hashed is not None else user.password,
+                role_id=role_id if role_id is not None else user.role_id,
+                username=new_username if new_username is not None else user.username,
+                photo=photo if photo is not None else user.photo,
+                status=status if status is not None else user.status,
+                gender=gender if gender is not None else user.gender,
+                birthdate=birthdate if birthdate is not None else user.birthdate,
+            )
+        invalidate_principal(user_id)
         return updated
 
     async def delete(self, db: AsyncSession, user_id: str) -> None:
-        user = await self.get(db, user_id)
-        await self.repo.delete(db, user)
+        async with unit_of_work(db):
+            user = await self.get(db, user_id)
+            # as tentativas caem em cascata; retira-as antes dos agregados do dashboard
+            await self.stats_repo.remove_attempts(db, user_id=user.id)
+            await self.repo.delete(db, user)
+        invalidate_principal(user_id)
 
-    async def export(
+    async def import_users(
         self,
         db: AsyncSession,
+        rows: Sequence[dict[str, Any]],
+        *,
+        dry_run: bool = False,
+        progress: Optional[Callable[[float], Awaitable[None]]] = None,
+        prehashed: bool = False,
+    ) -> UserImportReport:
+        # Importação de uma turma: valida todas as linhas, verifica emails/usernames contra
+        # a BD num só SELECT, faz os hashes em paralelo e insere num INSERT multi-linha.
+        # As linhas com erro ficam no relatório; as restantes são criadas.
+        # prehashed: linhas de enqueue_import, com password_hash em vez de password.
+        if len(rows) > settings.USER_IMPORT_MAX_ROWS:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"At most {settings.USER_IMPORT_MAX_ROWS} rows per import",
+            )
+
+        roles = {role.name.casefold(): role.id for role in await self.role_repo.list_all(db)}
+        errors: dict[int, list[str]] = {}
+        valid: dict[int, UserCreate] = {}
+        seen_emails: dict[str, int] = {}
+        seen_usernames: dict[str, int] = {}
+        given_hashes: dict[int, str] = {}
+
+        for i, raw in enumerate(rows, start=1):
+            data = dict(raw)
+            if prehashed:
+                password_error = data.pop("password_error", None)
+                if password_error:
+                    errors[i] = [f"password: {password_error}"]
+                    continue
+                given_hashes[i] = data.pop("password_hash")
+                data["password"] = _PREHASHED
+            # o export escreve o nome do role ("Função"); aceita-se nome ou role_id
+            role_name = data.pop("role", None)
+            if role_name and not data.get("role_id"):
+                role_id = roles.get(str(role_name).casefold())
+                if role_id is None:
+                    errors.setdefault(i, []).append(f"role: unknown role '{role_name}'")
+                    continue
+                data["role_id"] = role_id
+
+            try:
+                payload = UserCreate.model_validate(data)
+            except ValidationError as exc:
+                errors[i] = [f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in exc.errors()]
+                continue
+
+            payload.username = self._normalize_username(payload.username)
+            if payload.email in seen_emails:
+                errors[i] = [f"email: duplicated in row {seen_emails[payload.email]}"]
+                continue
+            if payload.username in seen_usernames:
+                errors[i] = [f"username: duplicated in row {seen_usernames[payload.username]}"]
+                continue
+            seen_emails[payload.email] = i
+            seen_usernames[payload.username] = i
+            valid[i] = payload
+
+        if valid:
+            taken_emails, taken_usernames = await self.repo.taken(db, list(seen_emails), list(seen_usernames))
+            for i, payload in list(valid.items()):
+                row_errors = []
+                if payload.email in taken_emails:
+                    row_errors.append("Email already registered")
+                if payload.username in taken_usernames:
+                    row_errors.append("Username already registered")
+                if row_errors:
+                    errors[i] = row_errors
+                    del valid[i]
+
+        created = 0
+        if valid and not dry_run:
+            # fecha a transação de leitura: a ligação volta ao pool durante os hashes
+            await db.rollback()
+            if progress:
+                await progress(0.1)
+            if prehashed:
+                hashes = [given_hashes[i] for i in valid]
+            else:
+                hashes = await password_hasher.hash_many([p.password for p in valid.values()])
+            if progress:
+                await progress(0.9)
+            new_rows = [
+                {
+                    "name": p.name,
+                    "email": p.email,
+                    "username": p.username,
+                    "password": hashed,
+                    "role_id": p.role_id,
+                    "photo": p.photo,
+                    "status": self.repo._status_value(p.status) or "active",
+                    "gender": self.repo._gender_value(p.gender),
+                    "birthdate": p.birthdate,
+                }
+                for p, hashed in zip(valid.values(), hashes)
+            ]
+            async with unit_of_work(db):
+                inserted = await self.repo.bulk_create(db, new_rows)
+            created = len(inserted)
+
+            # criados por outro pedido entre o SELECT e o INSERT: passam a erro, e valid
+            # fica igual a created
+            for i, payload in list(valid.items()):
+                if payload.email not in inserted:
+                    errors[i] = ["Email or username already registered"]
+                    del valid[i]
+
+        return UserImportReport(
+            total=len(rows),
+            valid=len(valid),
+            created=created,
+            dry_run=dry_run,
+            errors=[
+                UserImportRowError(row=i, email=str(rows[i - 1].get("email") or "") or None, errors=messages)
+                for i, messages in sorted(errors.items())
+            ],
+        )
+
+    async def enqueue_import(
+        self, db: AsyncSession, rows: Sequence[dict[str, Any]], *, created_by: Optional[str] = None
+    ) -> Job:
+        # O payload fica em jobs.payload até o job terminar: as passwords entram já em hash,
+        # nunca em claro. Uma password inválida segue como erro para o relatório do job.
+        queued = [dict(row) for row in rows]
+        to_hash: list[tuple[dict[str, Any], str]] = []
+        for row in queued:
+            password = row.pop("password", None)
+            if password is None:
+                row["password_error"] = "Field required"
+                continue
+            try:
+                to_hash.append((row, _PASSWORD.validate_python(password)))
+            except ValidationError as exc:
+                row["password_error"] = exc.errors()[0]["msg"]
+        hashes = await password_hasher.hash_many([password for _, password in to_hash])
+        for (row, _), hashed in zip(to_hash, hashes):
+            row["password_hash"] = hashed
+        return await job_runner.enqueue(db, "users.import", {"rows": queued}, created_by=created_by)
+
+    async def export(
+        self,
         *,
         q: Optional[str] = None,
         role_id: Optional[str] = None,
         status: Optional[StatusEnum | str] = None,
-    ) -> Sequence[User]:
-        return await self.repo.export(db, q=q, role_id=role_id, status=status)
+    ) -> AsyncIterator[Row]:
+        # Abre a própria sessão: o StreamingResponse continua a ler depois de a
+        # dependência get_db do pedido já ter fechado a sua.
+        async with async_session() as db:
+            async for row in self.repo.export(db, q=q, role_id=role_id, status=status):
+                yield row
 
 
 service = UserService()
+
+
+@job_runner.handler("users.import", clear_payload=True)
+async def import_users_job(job: JobContext) -> dict:
+    async with async_session() as db:
+        report = await service.import_users(db, job.payload["rows"], progress=job.progress, prehashed=True)
+    return report.model_dump()
+
+
+@job_runner.handler("users.export_csv", concurrency=2)
+async def export_users_job(job: JobContext) -> dict:
+    path = job.file_path("csv")
+    await write_csv(path, EXPORT_HEADER, service.export(**job.payload), export_row)
+    return {
+        "file": os.path.basename(path),
+        "filename": f"users_{dt.datetime.utcnow().strftime('%Y-%m-%d_%H-%M')}.csv",
+    }
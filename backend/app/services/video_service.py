@@ -3,20 +3,25 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
 from app.repositories.crud.video_repo import VideoRepository
+from app.repositories.crud.quiz_repo import QuizRepository
+from app.db.uow import unit_of_work
 from app.models.video import Video
+from app.core.config import settings
+from app.services.quiz_service import quiz_full_cache
 
 
 class VideoService:
     def __init__(self, repo: VideoRepository = VideoRepository()):
         self.repo = repo
+        self.quiz_repo = QuizRepository()
 
     async def list(
         self,
         db: AsyncSession,
-        skip: int = 0,
-        limit: Optional[int] = None,
-    ) -> Sequence[Video]:
-        return await self.repo.list(db, skip=skip, limit=limit)
+        cursor: Optional[str] = None,
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+    ) -> dict:
+        return await self.repo.list(db, cursor=cursor, limit=limit)
 
     async def get(
         self,
@@ -39,20 +44,14 @@ class VideoService:
         video_url: str,
         description: Optional[str] = None,
     ) -> Video:
-        existing_video = await self.repo.get_by_title(db, title)
-        if existing_video:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Video title must be unique",
+        async with unit_of_work(db):
+            return await self.repo.create(
+                db,
+                title=title,
+                video_url=video_url,
+                description=description,
             )
 
-        return await self.repo.create(
-            db,
-            title=title,
-            video_url=video_url,
-            description=description,
-        )
-
     async def update(
         self,
         db: AsyncSession,
@@ -62,31 +61,29 @@ class VideoService:
         video_url: Optional[str] = None,
         description: Optional[str] = None,
     ) -> Video:
-        video = await self.get(db, video_id)
+        async with unit_of_work(db):
+            video = await self.get(db, video_id)
 
-        if title:
-            existing_video = await self.repo.get_by_title(db, title)
-            if existing_video and existing_video.id != video_id:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Video title must be unique",
-                )
-
-        return await self.repo.update(
-            db,
-            video,
-            title=title,
-            video_url=video_url,
-            description=description,
-        )
+            return await self.repo.update(
+                db,
+                video,
+                title=title,
+                video_url=video_url,
+                description=description,
+            )
 
     async def delete(
         self,
         db: AsyncSession,
         video_id: str,
     ) -> None:
-        video = await self.get(db, video_id)
-        await self.repo.delete(db, video)
+        async with unit_of_work(db):
+            video = await self.get(db, video_id)
+            # quizzes.video_id passa a NULL (ON DELETE SET NULL): o /full desses quizzes muda
+            quiz_ids = await self.quiz_repo.ids_by_video(db, video.id)
+            await self.repo.delete(db, video)
+        for quiz_id in quiz_ids:
+            await quiz_full_cache.invalidate(quiz_id)
 
 
 service = VideoService()
@@ -0,0 +1,87 @@
+# Plugin pytest contra N+1. Ativar no conftest.py com
+#   pytest_plugins = ["app.testing.pytest_query_guard"]
+# ou na linha de comandos com -p app.testing.pytest_query_guard.
+#
+# - relações com lazy por omissão passam a lazy="raise" (ver enable_lazy_raise)
+# - cada pedido feito à app (TestClient/httpx) falha com QueryBudgetExceeded se passar
+#   do valor do baseline para esse endpoint, ou de --query-max nos endpoints sem baseline
+# - --update-query-baseline regrava o ficheiro com os máximos observados nesta execução
+
+import pytest
+
+from app.core.config import settings
+from app.core.query_guard import QueryGuard, enable_lazy_raise, load_baseline, save_baseline
+
+_guard_key = pytest.StashKey[QueryGuard]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("query-guard")
+    group.addoption(
+        "--query-baseline",
+        default=settings.QUERY_BASELINE_PATH,
+        help="ficheiro JSON com o nº de queries aceite por endpoint",
+    )
+    group.addoption(
+        "--query-max",
+        type=int,
+        default=settings.QUERY_GUARD_MAX_QUERIES,
+        help="limite de queries por pedido para endpoints sem baseline (0 = sem limite)",
+    )
+    group.addoption(
+        "--update-query-baseline",
+        action="store_true",
+        help="regrava o baseline com os valores observados em vez de falhar",
+    )
+    group.addoption(
+        "--allow-lazy-load",
+        action="store_true",
+        help="não converte as relações lazy por omissão em lazy='raise'",
+    )
+
+
+def pytest_configure(config):
+    if not config.getoption("--allow-lazy-load"):
+        enable_lazy_raise()
+
+    update = config.getoption("--update-query-baseline")
+    guard = QueryGuard(
+        config.getoption("--query-max"),
+        {} if update else load_baseline(config.getoption("--query-baseline")),
+        raise_on_exceed=not update,
+    )
+    guard.install()
+    config.stash[_guard_key] = guard
+
+
+def pytest_unconfigure(config):
+    guard = config.stash.get(_guard_key, None)
+    if guard is not None:
+        guard.uninstall()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    guard = config.stash.get(_guard_key, None)
+    if guard is None or not config.getoption("--update-query-baseline"):
+        return
+
+    path = config.getoption("--query-baseline")
+    # endpoints não exercitados nesta execução mantêm o valor anterior
+    counts = {**load_baseline(path), **guard.observed}
+    save_baseline(path, counts)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    guard = config.stash.get(_guard_key, None)
+    if guard is None or not guard.observed:
+        return
+
+    terminalreporter.section("query counts per endpoint")
+    baseline = load_baseline(config.getoption("--query-baseline"))
+    for key, count in sorted(guard.observed.items()):
+        expected = baseline.get(key)
+        note = "" if expected is None else f" (baseline {expected})"
+        if expected is not None and count < expected:
+            note += " -> pode baixar o baseline"
+        terminalreporter.write_line(f"{count:4d}  {key}{note}")
@@ -0,0 +1,82 @@
+# Dados mínimos para os testes, criados pelo ORM e já com commit (a app usa outras sessões).
+
+import uuid
+from dataclasses import dataclass, field
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.badges import Badge
+from app.models.course import Course
+from app.models.option import Option
+from app.models.question import Question
+from app.models.question_option import QuestionOption
+from app.models.quiz import Quiz
+from app.models.quiz_attempt import QuizAttempt
+from app.models.user import User
+
+# (code, min_score), como os do seed
+BADGES = (("gold", 100), ("silver", 80), ("bronze", 50))
+
+
+def unique(prefix: str) -> str:
+    return f"{prefix} {uuid.uuid4().hex[:8]}"
+
+
+@dataclass
+class QuizQuestion:
+    id: str
+    correct_option_id: str
+    wrong_option_id: str
+
+
+@dataclass
+class QuizData:
+    id: str
+    course_id: str
+    questions: list[QuizQuestion] = field(default_factory=list)
+
+
+async def make_user(db: AsyncSession) -> User:
+    name = unique("user").replace(" ", "_")
+    user = User(name=name, username=name, email=f"{name}@example.com", password="x", status="active")
+    db.add(user)
+    await db.commit()
+    return user
+
+
+async def make_badges(db: AsyncSession) -> dict[str, Badge]:
+    badges = {code: Badge(code=code, name=code.title(), min_score=min_score) for code, min_score in BADGES}
+    db.add_all(badges.values())
+    await db.commit()
+    return badges
+
+
+async def make_quiz(db: AsyncSession, *, questions: int = 2) -> QuizData:
+    # cada pergunta com uma opção certa e uma errada
+    course = Course(title=unique("Curso"), status="active")
+    db.add(course)
+    await db.flush()
+    quiz = Quiz(title=unique("Quiz"), status="active", course_id=course.id)
+    db.add(quiz)
+    await db.flush()
+
+    data = QuizData(id=quiz.id, course_id=course.id)
+    for n in range(questions):
+        question = Question(text=unique(f"Pergunta {n + 1}"), quiz_id=quiz.id)
+        right, wrong = Option(text=unique("certa")), Option(text=unique("errada"))
+        db.add_all([question, right, wrong])
+        await db.flush()
+        db.add_all([
+            QuestionOption(question_id=question.id, option_id=right.id, is_correct=True),
+            QuestionOption(question_id=question.id, option_id=wrong.id, is_correct=False),
+        ])
+        data.questions.append(QuizQuestion(question.id, right.id, wrong.id))
+    await db.commit()
+    return data
+
+
+async def make_attempt(db: AsyncSession, *, user_id: str, quiz_id: str) -> QuizAttempt:
+    attempt = QuizAttempt(user_id=user_id, quiz_id=quiz_id, score=0.0)
+    db.add(attempt)
+    await db.commit()
+    return attempt
@@ -0,0 +1,152 @@
+import datetime as dt
+
+import pytest
+from sqlalchemy import select
+
+from app.core import attempt_buffer as attempt_buffer_module
+from app.core.attempt_buffer import AttemptBuffer, DatabaseAttemptBufferBackend, LocalAttemptBufferBackend
+from app.models.quiz_attempt import QuizAttempt
+from app.repositories.crud.quiz_attempt_repo import QuizAttemptRepository
+from app.tests.factories import make_attempt, make_quiz, make_user
+
+pytestmark = pytest.mark.anyio
+
+
+def answer(option_id, t: float) -> dict:
+    return {"o": option_id, "t": t}
+
+
+@pytest.fixture(params=["local", "database"])
+def buffered(request, monkeypatch):
+    monkeypatch.setattr(attempt_buffer_module.settings, "ATTEMPT_BUFFER_ENABLED", True)
+    if request.param == "local":
+        return AttemptBuffer(LocalAttemptBufferBackend())
+    request.getfixturevalue("db")
+    return AttemptBuffer(DatabaseAttemptBufferBackend())
+
+
+async def draft_of(db, attempt_id: str):
+    res = await db.execute(
+        select(QuizAttempt.draft_answers).where(QuizAttempt.id == attempt_id).execution_options(populate_existing=True)
+    )
+    return res.scalar_one()
+
+
+async def test_ack_keeps_answers_changed_after_the_snapshot(buffered):
+    backend = buffered.backend
+    await backend.put("a1", {"q1": answer("x", 1.0), "q2": answer("y", 1.0)})
+    snapshot = await backend.snapshot()
+
+    # chega uma resposta nova enquanto o checkpoint corre
+    await backend.put("a1", {"q1": answer("z", 2.0), "q3": answer("w", 2.0)})
+    await backend.ack(snapshot)
+
+    assert await backend.get("a1") == {"q1": answer("z", 2.0), "q3": answer("w", 2.0)}
+
+
+async def test_ack_of_a_discarded_attempt_is_a_no_op(buffered):
+    backend = buffered.backend
+    await backend.put("a1", {"q1": answer("x", 1.0)})
+    snapshot = await backend.snapshot()
+    await backend.discard("a1")
+
+    await backend.ack(snapshot)
+
+    assert await backend.snapshot() == {}
+
+
+async def test_flush_acks_only_after_the_checkpoint(buffered, monkeypatch):
+    await buffered.backend.put("a1", {"q1": answer("x", 1.0)})
+    seen = []
+
+    async def checkpoint(drafts):
+        # durante o checkpoint as respostas continuam visíveis para um finish
+        seen.append(await buffered.pending("a1"))
+        await buffered.backend.put("a1", {"q1": answer("y", 2.0)})
+
+    monkeypatch.setattr(buffered, "_checkpoint", checkpoint)
+    assert await buffered.flush() == 1
+
+    assert seen == [{"q1": answer("x", 1.0)}]
+    assert await buffered.pending("a1") == {"q1": answer("y", 2.0)}
+
+
+async def test_failed_checkpoint_keeps_the_answers(buffered, monkeypatch):
+    await buffered.backend.put("a1", {"q1": answer("x", 1.0)})
+
+    async def checkpoint(drafts):
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(buffered, "_checkpoint", checkpoint)
+    with pytest.raises(RuntimeError):
+        await buffered.flush()
+
+    assert await buffered.pending("a1") == {"q1": answer("x", 1.0)}
+
+
+async def test_older_answer_does_not_replace_a_newer_one(buffered):
+    await buffered.backend.put("a1", {"q1": answer("new", 2.0)})
+    await buffered.backend.put("a1", {"q1": answer("old", 1.0), "q2": answer(None, 1.0)})
+
+    assert await buffered.pending("a1") == {"q1": answer("new", 2.0), "q2": answer(None, 1.0)}
+
+
+async def test_database_snapshot_leases_rows_to_one_worker(db):
+    first, second = DatabaseAttemptBufferBackend(), DatabaseAttemptBufferBackend()
+    await first.put("a1", {"q1": answer("x", 1.0)})
+
+    snapshot = await first.snapshot()
+    # outro worker não volta a gravar o que já está reservado
+    assert await second.snapshot() == {}
+
+    # uma alteração depois da reserva volta a estar disponível e sobrevive ao ack
+    await second.put("a1", {"q1": answer("y", 2.0)})
+    await first.ack(snapshot)
+    assert await second.snapshot() == {"a1": {"q1": answer("y", 2.0)}}
+
+
+async def test_database_lease_expires_after_a_failed_checkpoint(db):
+    crashed, other = DatabaseAttemptBufferBackend(lease_seconds=0), DatabaseAttemptBufferBackend()
+    await crashed.put("a1", {"q1": answer("x", 1.0)})
+    await crashed.snapshot()
+
+    assert await other.snapshot() == {"a1": {"q1": answer("x", 1.0)}}
+
+
+async def test_checkpoint_keeps_the_latest_answer_per_question(db):
+    user = await make_user(db)
+    quiz = await make_quiz(db, questions=1)
+    attempt = await make_attempt(db, user_id=user.id, quiz_id=quiz.id)
+    attempt.draft_answers = {"q1": answer("a", 10.0), "q2": answer("b", 30.0)}
+    await db.commit()
+
+    updated = await QuizAttemptRepository().checkpoint_drafts(
+        db, {attempt.id: {"q1": answer("c", 20.0), "q2": answer("d", 25.0), "q3": answer(None, 5.0)}}
+    )
+    await db.commit()
+
+    assert updated == 1
+    assert await draft_of(db, attempt.id) == {
+        "q1": answer("c", 20.0),
+        # a alteração mais antiga do que o checkpoint não o sobrepõe
+        "q2": answer("b", 30.0),
+        "q3": answer(None, 5.0),
+    }
+
+
+async def test_checkpoint_counts_only_unfinished_attempts(db, buffered):
+    user = await make_user(db)
+    quiz = await make_quiz(db, questions=1)
+    first = await make_attempt(db, user_id=user.id, quiz_id=quiz.id)
+    second = await make_attempt(db, user_id=user.id, quiz_id=quiz.id)
+    finished = await make_attempt(db, user_id=user.id, quiz_id=quiz.id)
+    finished.finished_at = dt.datetime.now(dt.timezone.utc)
+    await db.commit()
+
+    change = {"q1": answer("x", 1.0)}
+    await buffered._checkpoint({first.id: change, second.id: change, finished.id: change, "missing": change})
+
+    assert buffered.stats() == {"checkpointed": 2, "skipped": 2, "flush_errors": 0}
+    assert await draft_of(db, first.id) == change
+    assert await draft_of(db, second.id) == change
+    assert await draft_of(db, finished.id) is None
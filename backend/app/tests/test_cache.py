@@ -0,0 +1,42 @@
+import pytest
+
+from app.core import cache
+from app.core.cache import LocalCacheBackend, TTLCache, VersionedCache
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache, "time", clock)
+    return clock
+
+
+def test_ttl_per_entry_overrides_the_cache_ttl(clock):
+    values = TTLCache(ttl=60.0)
+    values.set("default", 1)
+    values.set("short", 2, ttl=5.0)
+
+    clock.now += 10.0
+    assert values.get("default") == 1
+    assert values.get("short") is None
+
+
+async def test_local_backend_expires_entries_with_the_versioned_cache_ttl(clock):
+    versioned = VersionedCache("test", LocalCacheBackend(), ttl=30.0)
+    version = await versioned.version("k")
+    await versioned.set("k", version, b"value")
+
+    clock.now += 29.0
+    assert await versioned.get("k", version) == b"value"
+    clock.now += 2.0
+    assert await versioned.get("k", version) is None
@@ -0,0 +1,41 @@
+import csv
+import io
+
+import pytest
+
+from app.models.user import User
+from app.services.user_service import EXPORT_HEADER
+from app.utils.csv_export import iter_csv
+
+pytestmark = pytest.mark.anyio
+
+
+async def numbers(n: int):
+    for i in range(n):
+        yield i
+
+
+async def test_rows_are_flushed_in_blocks():
+    chunks = [chunk async for chunk in iter_csv(["n"], numbers(5), lambda i: [i], flush_every=2)]
+
+    # BOM e cabeçalho logo no início; depois um bloco a cada flush_every linhas
+    assert chunks == ["\ufeff", "n\r\n", "0\r\n1\r\n", "2\r\n3\r\n", "4\r\n"]
+
+
+async def test_users_export_streams_every_matching_row(client, db):
+    db.add_all(
+        User(name=f"Aluno {n}", username=f"aluno{n}", email=f"aluno{n}@escola.pt", password="x",
+             status="active" if n % 2 else "inactive")
+        for n in range(7)
+    )
+    await db.commit()
+
+    res = await client.get("/api/v1/users/export/csv", params={"status": "active"})
+
+    assert res.status_code == 200
+    assert res.headers["content-type"] == "text/csv; charset=utf-8"
+    assert res.headers["content-disposition"].startswith('attachment; filename="users_')
+    rows = list(csv.reader(io.StringIO(res.content.decode("utf-8-sig")), delimiter=";"))
+    assert rows[0] == EXPORT_HEADER
+    assert sorted(row[2] for row in rows[1:]) == ["aluno1", "aluno3", "aluno5"]
+    assert {row[4] for row in rows[1:]} == {"Guest"}
@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from app.core.config import settings
+from app.services.dashboard_service import service
+from app.tests.factories import make_attempt, make_quiz, make_user
+
+pytestmark = pytest.mark.anyio
+
+
+async def finish_with(client, db, *, user, quiz, correct: int) -> None:
+    attempt = await make_attempt(db, user_id=user.id, quiz_id=quiz.id)
+    answers = [
+        {"question_id": q.id, "option_id": q.correct_option_id if n < correct else q.wrong_option_id}
+        for n, q in enumerate(quiz.questions)
+    ]
+    res = await client.post(f"/api/v1/quiz_attempts/{attempt.id}/answers", json={"answers": answers, "finish": True})
+    assert res.status_code == 200, res.text
+
+
+async def test_empty_snapshot(client, db):
+    res = await client.get("/api/v1/dashboard/snapshot")
+    assert res.status_code == 200
+    body = res.json()
+    assert body["summary"] == {"users": 0, "courses": 0, "quizzes": 0}
+    assert body["average_grade"] == {"average": 0.0}
+    assert body["grade_distribution"] == []
+
+
+async def test_snapshot_reflects_finished_attempts(client, db):
+    alice, bob = await make_user(db), await make_user(db)
+    quiz_a, quiz_b = await make_quiz(db, questions=2), await make_quiz(db, questions=2)
+    await finish_with(client, db, user=alice, quiz=quiz_a, correct=2)  # 100
+    await finish_with(client, db, user=bob, quiz=quiz_a, correct=1)    # 50
+    await finish_with(client, db, user=bob, quiz=quiz_b, correct=0)    # 0
+
+    res = await client.get("/api/v1/dashboard/snapshot")
+    assert res.status_code == 200
+    body = res.json()
+    assert body["summary"] == {"users": 2, "courses": 2, "quizzes": 2}
+    assert body["average_grade"]["average"] == 50.0
+    assert {d["range"]: d["total"] for d in body["grade_distribution"]} == {"0-20": 1, "41-60": 1, "81-100": 1}
+    assert {r["label"]: r["value"] for r in body["grades_by_user"]} == {alice.name: 100.0, bob.name: 25.0}
+    assert body["top_students"][0] == {"label": alice.name, "value": 100.0}
+
+
+async def test_average_grade_filters(client, db):
+    user = await make_user(db)
+    quiz_a, quiz_b = await make_quiz(db, questions=2), await make_quiz(db, questions=2)
+    await finish_with(client, db, user=user, quiz=quiz_a, correct=2)
+    await finish_with(client, db, user=user, quiz=quiz_b, correct=1)
+
+    async def average(**params) -> float:
+        res = await client.get("/api/v1/dashboard/average-grade", params=params)
+        assert res.status_code == 200
+        return res.json()["average"]
+
+    assert await average() == 75.0
+    assert await average(quiz_id=quiz_a.id) == 100.0
+    assert await average(course_id=quiz_b.course_id) == 50.0
+    # quiz de outro curso
+    assert await average(quiz_id=quiz_a.id, course_id=quiz_b.course_id) == 0.0
+
+
+async def test_grade_distribution_endpoint(client, db):
+    user = await make_user(db)
+    quiz = await make_quiz(db, questions=2)
+    await finish_with(client, db, user=user, quiz=quiz, correct=1)
+
+    res = await client.get("/api/v1/dashboard/grade-distribution")
+    assert res.status_code == 200
+    assert res.json() == [{"range": "41-60", "total": 1}]
+
+
+async def test_snapshot_panels_share_a_bounded_number_of_connections(client, db, monkeypatch):
+    running, peak = 0, 0
+    run = service._run.__func__
+
+    async def tracked(self, fn, *args):
+        async def panel(db, *args):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            try:
+                return await fn(db, *args)
+            finally:
+                running -= 1
+
+        return await run(self, panel, *args)
+
+    monkeypatch.setattr(type(service), "_run", tracked)
+    results = await asyncio.gather(*(client.get("/api/v1/dashboard/snapshot") for _ in range(3)))
+
+    assert [r.status_code for r in results] == [200, 200, 200]
+    assert peak == settings.DASHBOARD_SNAPSHOT_CONCURRENCY
@@ -0,0 +1,152 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select
+
+from app.models.quiz_badge_award import QuizBadgeAward
+from app.tests.factories import make_attempt, make_badges, make_quiz, make_user
+
+pytestmark = pytest.mark.anyio
+
+
+def answers_for(quiz, correct: int) -> list[dict]:
+    # as primeiras `correct` perguntas certas, as restantes erradas
+    return [
+        {"question_id": q.id, "option_id": q.correct_option_id if n < correct else q.wrong_option_id}
+        for n, q in enumerate(quiz.questions)
+    ]
+
+
+async def submit_and_finish(client, attempt_id: str, answers: list[dict]) -> dict:
+    res = await client.post(f"/api/v1/quiz_attempts/{attempt_id}/answers", json={"answers": answers, "finish": True})
+    assert res.status_code == 200, res.text
+    return res.json()
+
+
+async def award_for(db, user_id: str, quiz_id: str) -> list[tuple[str, str]]:
+    res = await db.execute(
+        select(QuizBadgeAward.badge_id, QuizBadgeAward.attempt_id).where(
+            QuizBadgeAward.user_id == user_id, QuizBadgeAward.quiz_id == quiz_id
+        )
+    )
+    return [tuple(row) for row in res.all()]
+
+
+async def test_finish_grades_the_draft(client, db):
+    badges = await make_badges(db)
+    user = await make_user(db)
+    quiz = await make_quiz(db, questions=2)
+    attempt = await make_attempt(db, user_id=user.id, quiz_id=quiz.id)
+    q1, q2 = quiz.questions
+
+    # trocar de resposta durante o exame: fica a mais recente
+    for option_id in (q1.wrong_option_id, q1.correct_option_id):
+        res = await client.put(
+            f"/api/v1/quiz_attempts/{attempt.id}/draft",
+            json={"answers": [{"question_id": q1.id, "option_id": option_id}]},
+        )
+        assert res.status_code == 204
+    res = await client.put(
+        f"/api/v1/quiz_attempts/{attempt.id}/draft",
+        json={"answers": [{"question_id": q2.id, "option_id": q2.wrong_option_id}]},
+    )
+    assert res.status_code == 204
+
+    res = await client.post(f"/api/v1/quiz_attempts/{attempt.id}/finish")
+    assert res.status_code == 200, res.text
+    body = res.json()
+    assert body["attempt"]["score"] == 50
+    assert body["attempt"]["finished_at"] is not None
+    assert body["badge_awarded"]["id"] == badges["bronze"].id
+
+    draft = (await client.get(f"/api/v1/quiz_attempts/{attempt.id}/draft")).json()
+    assert draft == {"attempt_id": attempt.id, "finished": True, "answers": []}
+
+
+async def test_finish_twice_returns_the_finished_attempt(client, db):
+    await make_badges(db)
+    user = await make_user(db)
+    quiz = await make_quiz(db)
+    attempt = await make_attempt(db, user_id=user.id, quiz_id=quiz.id)
+
+    first = await submit_and_finish(client, attempt.id, answers_for(quiz, correct=2))
+    res = await client.post(f"/api/v1/quiz_attempts/{attempt.id}/finish")
+    assert res.status_code == 200
+    assert res.json()["attempt"]["score"] == first["attempt"]["score"] == 100
+    assert res.json()["badge_awarded"] is None
+
+
+async def test_quiz_without_questions_cannot_be_finished(client, db):
+    user = await make_user(db)
+    quiz = await make_quiz(db, questions=0)
+    attempt = await make_attempt(db, user_id=user.id, quiz_id=quiz.id)
+
+    res = await client.post(f"/api/v1/quiz_attempts/{attempt.id}/finish")
+    assert res.status_code == 400
+
+
+async def test_badge_is_upgraded_but_never_downgraded(client, db):
+    badges = await make_badges(db)
+    user = await make_user(db)
+    quiz = await make_quiz(db, questions=2)
+
+    bronze_attempt = await make_attempt(db, user_id=user.id, quiz_id=quiz.id)
+    body = await submit_and_finish(client, bronze_attempt.id, answers_for(quiz, correct=1))
+    assert body["badge_awarded"]["code"] == "bronze"
+    assert await award_for(db, user.id, quiz.id) == [(badges["bronze"].id, bronze_attempt.id)]
+
+    gold_attempt = await make_attempt(db, user_id=user.id, quiz_id=quiz.id)
+    body = await submit_and_finish(client, gold_attempt.id, answers_for(quiz, correct=2))
+    assert body["badge_awarded"]["code"] == "gold"
+    assert await award_for(db, user.id, quiz.id) == [(badges["gold"].id, gold_attempt.id)]
+
+    worse_attempt = await make_attempt(db, user_id=user.id, quiz_id=quiz.id)
+    body = await submit_and_finish(client, worse_attempt.id, answers_for(quiz, correct=1))
+    assert body["attempt"]["score"] == 50
+    assert body["badge_awarded"] is None
+    assert await award_for(db, user.id, quiz.id) == [(badges["gold"].id, gold_attempt.id)]
+
+
+async def test_no_badge_below_fifty_percent(client, db):
+    await make_badges(db)
+    user = await make_user(db)
+    quiz = await make_quiz(db, questions=2)
+    attempt = await make_attempt(db, user_id=user.id, quiz_id=quiz.id)
+
+    body = await submit_and_finish(client, attempt.id, answers_for(quiz, correct=0))
+    assert body["attempt"]["score"] == 0
+    assert body["badge_awarded"] is None
+    assert await award_for(db, user.id, quiz.id) == []
+
+
+
+async def test_unanswered_questions_count_as_wrong(client, db):
+    await make_badges(db)
+    user = await make_user(db)
+    quiz = await make_quiz(db, questions=4)
+    attempt = await make_attempt(db, user_id=user.id, quiz_id=quiz.id)
+
+    body = await submit_and_finish(client, attempt.id, answers_for(quiz, correct=1)[:1])
+    assert body["attempt"]["score"] == 25
+    assert body["badge_awarded"] is None
+
+
+async def test_concurrent_finish_grades_and_awards_once(client, db):
+    badges = await make_badges(db)
+    user = await make_user(db)
+    quiz = await make_quiz(db, questions=2)
+    attempt = await make_attempt(db, user_id=user.id, quiz_id=quiz.id)
+    res = await client.post(f"/api/v1/quiz_attempts/{attempt.id}/answers", json={"answers": answers_for(quiz, correct=2)})
+    assert res.status_code == 200, res.text
+
+    first, second = await asyncio.gather(
+        client.post(f"/api/v1/quiz_attempts/{attempt.id}/finish"),
+        client.post(f"/api/v1/quiz_attempts/{attempt.id}/finish"),
+    )
+
+    assert first.status_code == second.status_code == 200
+    assert first.json()["attempt"]["finished_at"] is not None
+    assert first.json()["attempt"]["finished_at"] == second.json()["attempt"]["finished_at"]
+    # só um dos dois pedidos terminou a tentativa e atribuiu o badge
+    assert [r.json()["badge_awarded"] is None for r in (first, second)].count(False) == 1
+    assert await award_for(db, user.id, quiz.id) == [(badges["gold"].id, attempt.id)]
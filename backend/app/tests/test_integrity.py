@@ -0,0 +1,88 @@
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.core.integrity import constraint_name, http_error_for
+from app.tests.factories import make_quiz, unique
+
+
+class DriverError(Exception):
+    # como a exceção do asyncpg: o nome da constraint num atributo
+    def __init__(self, constraint_name):
+        super().__init__(constraint_name)
+        self.constraint_name = constraint_name
+
+
+class AdaptedError(Exception):
+    # como o adaptador do SQLAlchemy para o asyncpg: a exceção do driver vem em __cause__
+    def __init__(self, cause):
+        super().__init__("adapted")
+        self.__cause__ = cause
+
+
+class Diag:
+    def __init__(self, constraint_name):
+        self.constraint_name = constraint_name
+
+
+class PsycopgError(Exception):
+    def __init__(self, constraint_name):
+        super().__init__(constraint_name)
+        self.diag = Diag(constraint_name)
+
+
+def integrity_error(orig: Exception) -> IntegrityError:
+    return IntegrityError("INSERT ...", {}, orig)
+
+
+@pytest.mark.parametrize(
+    "orig",
+    [
+        DriverError("uq_courses_title"),
+        AdaptedError(DriverError("uq_courses_title")),
+        PsycopgError("uq_courses_title"),
+    ],
+)
+def test_constraint_name_from_each_driver(orig):
+    assert constraint_name(integrity_error(orig)) == "uq_courses_title"
+
+
+@pytest.mark.parametrize("name", ["courses_title_key", "uq_courses_title", "ix_courses_title"])
+def test_unique_column_maps_to_400_whatever_the_constraint_name(name):
+    error = http_error_for(integrity_error(DriverError(name)))
+    assert error.status_code == 400
+    assert error.detail == "Course title must be unique"
+
+
+def test_conflicts_map_to_409():
+    error = http_error_for(integrity_error(DriverError("uq_answer_attempt_question")))
+    assert error.status_code == 409
+    error = http_error_for(integrity_error(DriverError("uq_quizzes_one_active_per_course")))
+    assert error.status_code == 409
+
+
+def test_unknown_constraint_is_not_mapped():
+    assert http_error_for(integrity_error(DriverError("fk_something"))) is None
+    assert http_error_for(integrity_error(Exception("no name"))) is None
+
+
+@pytest.mark.anyio
+async def test_duplicate_course_title_is_a_400(client, db):
+    # o primeiro pelo endpoint também: o baseline de queries fica com o POST que correu bem
+    title = unique("Curso")
+    assert (await client.post("/api/v1/courses/", json={"title": title})).status_code == 201
+
+    res = await client.post("/api/v1/courses/", json={"title": title})
+    assert res.status_code == 400
+    assert res.json()["detail"] == "Course title must be unique"
+
+
+@pytest.mark.anyio
+async def test_duplicate_question_text_is_a_400(client, db):
+    quiz = await make_quiz(db, questions=1)
+    # o índice único é sobre md5(text): também cobre textos longos
+    payload = {"text": "Pergunta longa " + "x" * 480, "quiz_id": quiz.id}
+    assert (await client.post("/api/v1/questions/", json=payload)).status_code == 201
+
+    res = await client.post("/api/v1/questions/", json=payload)
+    assert res.status_code == 400
+    assert res.json()["detail"] == "Question text must be unique"
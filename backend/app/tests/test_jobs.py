@@ -0,0 +1,150 @@
+import asyncio
+import datetime as dt
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import func, select, update
+
+from app.core.jobs import JobRunner
+from app.models.job import Job
+
+pytestmark = pytest.mark.anyio
+
+
+def make_runner() -> JobRunner:
+    # runner próprio: os handlers dos testes não ficam registados no job_runner da app
+    runner = JobRunner()
+
+    @runner.handler("test.double", concurrency=2)
+    async def double(job):
+        await job.progress(0.5)
+        return {"n": job.payload["n"] * 2}
+
+    @runner.handler("test.flaky", max_attempts=2)
+    async def flaky(job):
+        raise RuntimeError("boom")
+
+    @runner.handler("test.invalid", max_attempts=3, clear_payload=True)
+    async def invalid(job):
+        raise HTTPException(status_code=400, detail="Invalid payload")
+
+    return runner
+
+
+async def run_once(runner: JobRunner) -> None:
+    # uma volta do loop: reclama o que estiver pronto e espera pelas execuções
+    runner._wakeup = asyncio.Event()
+    await runner._claim()
+    await asyncio.gather(*list(runner._tasks.values()))
+
+
+async def reload(db, job_id: str) -> Job:
+    res = await db.execute(select(Job).where(Job.id == job_id).execution_options(populate_existing=True))
+    return res.scalar_one()
+
+
+async def test_job_succeeds_with_result(db):
+    runner = make_runner()
+    job = await runner.enqueue(db, "test.double", {"n": 21})
+
+    await run_once(runner)
+
+    job = await reload(db, job.id)
+    assert job.status == "succeeded"
+    assert job.result == {"n": 42}
+    assert job.progress == 1.0
+    assert job.attempts == 1
+    assert job.finished_at is not None
+    assert runner.finished == {("test.double", "succeeded"): 1}
+    assert runner.running == {"test.double": 0}
+
+
+async def test_concurrency_per_type(db):
+    runner = make_runner()
+    for n in range(3):
+        await runner.enqueue(db, "test.double", {"n": n})
+
+    await run_once(runner)
+    assert runner.finished[("test.double", "succeeded")] == 2
+
+    await run_once(runner)
+    assert runner.finished[("test.double", "succeeded")] == 3
+
+
+async def test_failure_is_retried_with_backoff_then_fails(db):
+    runner = make_runner()
+    job = await runner.enqueue(db, "test.flaky", {})
+
+    await run_once(runner)
+
+    job = await reload(db, job.id)
+    assert job.status == "queued"
+    assert job.attempts == 1
+    assert job.error == "RuntimeError: boom"
+    assert job.run_after > job.started_at
+    assert runner.finished == {("test.flaky", "retried"): 1}
+
+    # ainda em backoff: não é reclamado
+    await run_once(runner)
+    assert (await reload(db, job.id)).attempts == 1
+
+    await db.execute(update(Job).where(Job.id == job.id).values(run_after=func.now()))
+    await db.commit()
+    await run_once(runner)
+
+    job = await reload(db, job.id)
+    assert job.status == "failed"
+    assert job.attempts == 2
+    assert runner.finished[("test.flaky", "failed")] == 1
+
+
+async def test_http_exception_fails_without_retry(db):
+    runner = make_runner()
+    job = await runner.enqueue(db, "test.invalid", {"password": "secret"})
+
+    await run_once(runner)
+
+    job = await reload(db, job.id)
+    assert job.status == "failed"
+    assert job.attempts == 1
+    assert job.error == "Invalid payload"
+    assert job.payload == {}
+    assert runner.finished == {("test.invalid", "failed"): 1}
+
+
+async def test_stale_job_out_of_attempts_fails_and_clears_payload(db):
+    runner = make_runner()
+    invalid = await runner.enqueue(db, "test.invalid", {"password": "secret"})
+    double = await runner.enqueue(db, "test.double", {"n": 1})
+    # worker morreu a meio da última tentativa
+    await db.execute(
+        update(Job)
+        .where(Job.id.in_([invalid.id, double.id]))
+        .values(status="running", attempts=Job.max_attempts, updated_at=func.now() - dt.timedelta(hours=1))
+    )
+    await db.commit()
+
+    await runner._maintenance()
+
+    invalid, double = await reload(db, invalid.id), await reload(db, double.id)
+    assert (invalid.status, invalid.error, invalid.payload) == ("failed", "Worker lost", {})
+    assert (double.status, double.payload) == ("failed", {"n": 1})
+
+
+async def test_stale_worker_does_not_overwrite_the_new_attempt(db):
+    runner = make_runner()
+    job = await runner.enqueue(db, "test.double", {"n": 21})
+    # o worker antigo (tentativa 1) foi dado como perdido e outro reclamou a tentativa 2
+    await db.execute(update(Job).where(Job.id == job.id).values(status="running", attempts=2))
+    await db.commit()
+
+    stale = await reload(db, job.id)
+    db.expunge(stale)
+    stale.attempts = 1
+    runner._wakeup = asyncio.Event()
+    runner.running["test.double"] = 1
+    await runner._execute(stale)
+
+    job = await reload(db, job.id)
+    assert (job.status, job.attempts, job.result) == ("running", 2, None)
+    assert runner.finished == {("test.double", "lost"): 1}
@@ -0,0 +1,27 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+import app.main  # noqa: F401 (instrumenta a engine)
+from app.core.observability import RequestStats, current_request
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_failed_statement_leaves_no_timing_state(db):
+    stats = RequestStats()
+    token = current_request.set(stats)
+    try:
+        with pytest.raises(DBAPIError):
+            await db.execute(text("SELECT 1 / 0"))
+        await db.rollback()
+        await db.execute(text("SELECT 1"))
+        conn = await db.connection()
+        info = conn.sync_connection.info
+    finally:
+        current_request.reset(token)
+
+    # só o statement que terminou é contado
+    assert stats.query_count == 1
+    assert stats.slowest_sql == "SELECT 1"
+    assert "query_start" not in info
@@ -0,0 +1,96 @@
+import base64
+import datetime as dt
+
+import pytest
+from fastapi import HTTPException
+
+from app.models.course import Course
+from app.tests.factories import make_attempt, make_quiz, make_user, unique
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+async def walk(client, url: str, limit: int, **params) -> list[str]:
+    # segue next_cursor até ao fim e devolve os ids pela ordem das páginas
+    seen, cursor = [], None
+    while True:
+        res = await client.get(url, params={"limit": limit, **params, **({"cursor": cursor} if cursor else {})})
+        assert res.status_code == 200, res.text
+        page = res.json()
+        assert len(page["items"]) <= limit
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return seen
+
+
+def test_cursor_round_trip_keeps_created_at_and_id():
+    created_at = dt.datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=dt.timezone.utc)
+    assert decode_cursor(encode_cursor(created_at, "abc")) == (created_at, "abc")
+
+
+def test_cursor_round_trip_keeps_search_rank():
+    assert decode_cursor(encode_cursor(0.25, "abc")) == (0.25, "abc")
+
+
+def test_cursor_without_key_for_models_paged_by_id():
+    assert decode_cursor(encode_cursor(None, "abc")) == (None, "abc")
+
+
+def test_cursor_has_no_padding():
+    assert "=" not in encode_cursor(None, "a")
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "%%%",
+        base64.urlsafe_b64encode(b"not json").decode(),
+        base64.urlsafe_b64encode(b'{"key": 1}').decode(),
+        base64.urlsafe_b64encode(b'[{"x": 1}, "abc"]').decode(),
+        base64.urlsafe_b64encode(b'["not a date", "abc"]').decode(),
+    ],
+)
+def test_invalid_cursor_is_a_400(cursor):
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(cursor)
+    assert exc.value.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_cursor_from_another_ordering_is_rejected(client, db):
+    # cursor de uma listagem normal (created_at) numa pesquisa (ordenada por relevância)
+    cursor = encode_cursor(dt.datetime.now(dt.timezone.utc), "abc")
+    res = await client.get("/api/v1/courses/", params={"q": "curso", "cursor": cursor})
+    assert res.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_list_pages_follow_the_cursor(client, db):
+    # mesma transação => mesmo created_at: a ordem e o cursor dependem do desempate pelo id
+    courses = [Course(title=unique("Curso"), status="active") for _ in range(5)]
+    db.add_all(courses)
+    await db.commit()
+
+    assert await walk(client, "/api/v1/courses/", 2) == sorted((c.id for c in courses), reverse=True)
+
+
+@pytest.mark.anyio
+async def test_models_without_created_at_are_paged_by_id(client, db):
+    user = await make_user(db)
+    quiz = await make_quiz(db, questions=1)
+    attempts = [await make_attempt(db, user_id=user.id, quiz_id=quiz.id) for _ in range(5)]
+
+    assert await walk(client, "/api/v1/quiz_attempts/", 2) == sorted((a.id for a in attempts), reverse=True)
+
+
+@pytest.mark.anyio
+async def test_list_rejects_a_tampered_cursor(client, db):
+    res = await client.get("/api/v1/courses/", params={"cursor": "not-a-cursor"})
+    assert res.status_code == 400
+    assert res.json()["detail"] == "Invalid cursor"
+
+
+@pytest.mark.anyio
+async def test_list_limit_is_capped(client, db):
+    res = await client.get("/api/v1/courses/", params={"limit": 10_000})
+    assert res.status_code == 422
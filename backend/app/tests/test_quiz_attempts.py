@@ -0,0 +1,75 @@
+import pytest
+
+from app.tests.factories import make_attempt, make_quiz, make_user
+
+pytestmark = pytest.mark.anyio
+
+
+def answers_for(quiz, correct: int) -> list[dict]:
+    # as primeiras `correct` perguntas certas, as restantes erradas
+    return [
+        {"question_id": q.id, "option_id": q.correct_option_id if n < correct else q.wrong_option_id}
+        for n, q in enumerate(quiz.questions)
+    ]
+
+
+async def submit_and_finish(client, attempt_id: str, answers: list[dict]) -> dict:
+    res = await client.post(f"/api/v1/quiz_attempts/{attempt_id}/answers", json={"answers": answers, "finish": True})
+    assert res.status_code == 200, res.text
+    return res.json()
+
+
+async def test_answers_after_finish_are_rejected(client, db):
+    user = await make_user(db)
+    quiz = await make_quiz(db)
+    attempt = await make_attempt(db, user_id=user.id, quiz_id=quiz.id)
+    await submit_and_finish(client, attempt.id, answers_for(quiz, correct=1))
+
+    res = await client.post(f"/api/v1/quiz_attempts/{attempt.id}/answers", json={"answers": answers_for(quiz, correct=2)})
+    assert res.status_code == 409
+
+
+async def test_invalid_option_is_rejected(client, db):
+    user = await make_user(db)
+    quiz, other = await make_quiz(db), await make_quiz(db)
+    attempt = await make_attempt(db, user_id=user.id, quiz_id=quiz.id)
+
+    answers = [{"question_id": quiz.questions[0].id, "option_id": other.questions[0].correct_option_id}]
+    res = await client.post(f"/api/v1/quiz_attempts/{attempt.id}/answers", json={"answers": answers})
+    assert res.status_code == 400
+
+
+async def test_resubmitted_answers_replace_the_previous_ones(client, db):
+    user = await make_user(db)
+    quiz = await make_quiz(db, questions=2)
+    attempt = await make_attempt(db, user_id=user.id, quiz_id=quiz.id)
+    q1, q2 = quiz.questions
+
+    first = [{"question_id": q1.id, "option_id": q1.wrong_option_id}]
+    res = await client.post(f"/api/v1/quiz_attempts/{attempt.id}/answers", json={"answers": first})
+    assert res.status_code == 200, res.text
+
+    # o upsert em bloco troca a resposta de q1 e acrescenta a de q2
+    body = await submit_and_finish(client, attempt.id, [
+        {"question_id": q1.id, "option_id": q1.correct_option_id},
+        {"question_id": q2.id, "option_id": q2.wrong_option_id},
+    ])
+    assert {a["question_id"]: a["option_id"] for a in body["answers"]} == {
+        q1.id: q1.correct_option_id,
+        q2.id: q2.wrong_option_id,
+    }
+    assert body["attempt"]["score"] == 50
+
+
+async def test_second_answer_to_a_question_is_a_409(client, db):
+    user = await make_user(db)
+    quiz = await make_quiz(db, questions=1)
+    attempt = await make_attempt(db, user_id=user.id, quiz_id=quiz.id)
+    question = quiz.questions[0]
+
+    payload = {"attempt_id": attempt.id, "question_id": question.id, "option_id": question.correct_option_id}
+    assert (await client.post("/api/v1/answers/", json=payload)).status_code == 201
+
+    res = await client.post("/api/v1/answers/", json={**payload, "option_id": question.wrong_option_id})
+    assert res.status_code == 409
+    assert res.json()["detail"] == "Question already answered in this attempt"
@@ -0,0 +1,58 @@
+import pytest
+
+from app.tests.factories import make_quiz
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_full_quiz_lists_questions_and_options(client, db):
+    quiz = await make_quiz(db, questions=2)
+
+    res = await client.get(f"/api/v1/quizzes/{quiz.id}/full")
+    assert res.status_code == 200
+    body = res.json()
+    assert body["quiz"]["id"] == quiz.id
+    assert {q["id"] for q in body["questions"]} == {q.id for q in quiz.questions}
+    options = {q["id"]: {o["id"] for o in q["options"]} for q in body["questions"]}
+    for q in quiz.questions:
+        assert options[q.id] == {q.correct_option_id, q.wrong_option_id}
+    # a resposta não revela a opção certa
+    assert "is_correct" not in res.text
+
+
+async def test_full_quiz_revalidates_with_etag(client, db):
+    quiz = await make_quiz(db)
+
+    first = await client.get(f"/api/v1/quizzes/{quiz.id}/full")
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "no-cache"
+
+    res = await client.get(f"/api/v1/quizzes/{quiz.id}/full", headers={"If-None-Match": etag})
+    assert res.status_code == 304
+    assert res.headers["etag"] == etag
+
+    res = await client.get(f"/api/v1/quizzes/{quiz.id}/full", headers={"If-None-Match": f"W/{etag}"})
+    assert res.status_code == 304
+
+
+async def test_full_quiz_changes_when_a_question_is_added(client, db):
+    quiz = await make_quiz(db, questions=1)
+    etag = (await client.get(f"/api/v1/quizzes/{quiz.id}/full")).headers["etag"]
+
+    res = await client.post("/api/v1/questions/", json={"text": "Pergunta nova", "quiz_id": quiz.id})
+    assert res.status_code == 201, res.text
+
+    res = await client.get(f"/api/v1/quizzes/{quiz.id}/full", headers={"If-None-Match": etag})
+    assert res.status_code == 200
+    assert len(res.json()["questions"]) == 2
+
+
+async def test_full_quiz_is_gone_after_its_course_is_deleted(client, db):
+    quiz = await make_quiz(db)
+    assert (await client.get(f"/api/v1/quizzes/{quiz.id}/full")).status_code == 200
+
+    res = await client.delete(f"/api/v1/courses/{quiz.course_id}")
+    assert res.status_code == 204
+
+    res = await client.get(f"/api/v1/quizzes/{quiz.id}/full")
+    assert res.status_code == 404
@@ -0,0 +1,177 @@
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.core import rate_limit
+from app.core.passwords import password_hasher
+from app.core.rate_limit import LOGIN_PER_USERNAME, LocalRateLimitBackend, RateLimit, RateLimiter, body_field, client_ip
+from app.tests.factories import make_user
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limit, "time", clock)
+    return clock
+
+
+def make_request(
+    body: bytes = b"",
+    client: tuple[str, int] = ("10.0.0.1", 5000),
+    forwarded: tuple[str, ...] = (),
+) -> Request:
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    headers = [(b"x-forwarded-for", value.encode()) for value in forwarded]
+    scope = {"type": "http", "method": "POST", "path": "/", "headers": headers, "client": client}
+    return Request(scope, receive)
+
+
+async def by_ip(request: Request):
+    return request.client.host
+
+
+def test_parse():
+    limit = RateLimit.parse("login", "20/60", by_ip)
+    assert (limit.capacity, limit.per_seconds) == (20, 60.0)
+    assert limit.refill_rate == pytest.approx(20 / 60)
+    assert RateLimit.parse("x", "5", by_ip).per_seconds == 1.0
+
+
+async def test_bucket_allows_a_burst_then_refills(clock):
+    backend = LocalRateLimitBackend()
+    for _ in range(3):
+        assert (await backend.take("k", capacity=3, refill_rate=1.0))[0]
+
+    allowed, retry_after = await backend.take("k", capacity=3, refill_rate=1.0)
+    assert not allowed
+    assert retry_after == pytest.approx(1.0)
+
+    clock.now += 1.0
+    assert (await backend.take("k", capacity=3, refill_rate=1.0))[0]
+    assert not (await backend.take("k", capacity=3, refill_rate=1.0))[0]
+
+    # nunca acumula acima da capacidade
+    clock.now += 100.0
+    for _ in range(3):
+        assert (await backend.take("k", capacity=3, refill_rate=1.0))[0]
+    assert not (await backend.take("k", capacity=3, refill_rate=1.0))[0]
+
+
+async def test_buckets_are_per_key_and_bounded(clock):
+    backend = LocalRateLimitBackend(maxsize=2)
+    assert (await backend.take("a", capacity=1, refill_rate=0.1))[0]
+    assert (await backend.take("b", capacity=1, refill_rate=0.1))[0]
+    assert not (await backend.take("a", capacity=1, refill_rate=0.1))[0]
+
+    # "c" empurra o bucket menos recente ("b") para fora
+    assert (await backend.take("c", capacity=1, refill_rate=0.1))[0]
+    assert (await backend.take("b", capacity=1, refill_rate=0.1))[0]
+
+
+async def test_limiter_rejects_with_retry_after(clock):
+    limiter = RateLimiter(LocalRateLimitBackend())
+    dependency = limiter(RateLimit.parse("test-ip", "2/10", by_ip))
+
+    await dependency(make_request())
+    await dependency(make_request())
+    with pytest.raises(HTTPException) as exc:
+        await dependency(make_request())
+
+    assert exc.value.status_code == 429
+    assert exc.value.headers["Retry-After"] == "5"
+    assert limiter.rejected == {"test-ip": 1}
+
+    # outro IP tem o seu próprio bucket
+    await dependency(make_request(client=("10.0.0.2", 5000)))
+
+
+async def test_limiter_skips_requests_without_a_key(clock):
+    limiter = RateLimiter(LocalRateLimitBackend())
+    dependency = limiter(RateLimit.parse("test-user", "1/60", body_field("username")))
+
+    for _ in range(3):
+        await dependency(make_request(b"not json"))
+    await dependency(make_request(b'{"username": "Alice "}'))
+    with pytest.raises(HTTPException):
+        await dependency(make_request(b'{"username": "alice"}'))
+
+
+async def test_refund_gives_the_token_back_up_to_capacity(clock):
+    limiter = RateLimiter(LocalRateLimitBackend())
+    limit = RateLimit.parse("test-user", "2/60", body_field("username"))
+    dependency = limiter(limit)
+    request = make_request(b'{"username": "alice"}')
+
+    # logins certos não gastam o limite
+    for _ in range(5):
+        await dependency(request)
+        await limiter.refund(request, limit)
+
+    # um refund a mais não passa da capacidade
+    await limiter.refund(request, limit)
+    await dependency(request)
+    await dependency(request)
+    with pytest.raises(HTTPException):
+        await dependency(request)
+
+
+async def test_limiter_can_be_disabled(clock, monkeypatch):
+    monkeypatch.setattr(rate_limit.settings, "RATE_LIMIT_ENABLED", False)
+    limiter = RateLimiter(LocalRateLimitBackend())
+    dependency = limiter(RateLimit.parse("test-ip", "1/60", by_ip))
+
+    for _ in range(3):
+        await dependency(make_request())
+    assert limiter.rejected == {}
+
+
+async def test_client_ip_ignores_forwarded_unless_trusted(monkeypatch):
+    monkeypatch.setattr(rate_limit.settings, "RATE_LIMIT_TRUST_FORWARDED", False)
+    assert await client_ip(make_request(forwarded=("203.0.113.7",))) == "10.0.0.1"
+
+
+@pytest.mark.parametrize(
+    "hops, forwarded, expected",
+    [
+        # o cliente forja a entrada da esquerda; o proxy acrescenta o IP real
+        (1, ("6.6.6.6, 203.0.113.7",), "203.0.113.7"),
+        (2, ("6.6.6.6, 203.0.113.7, 10.0.0.2",), "203.0.113.7"),
+        # vários cabeçalhos contam como uma só lista, pela ordem em que chegaram
+        (1, ("6.6.6.6", "203.0.113.7"), "203.0.113.7"),
+        # menos entradas do que proxies: fica a mais à esquerda
+        (3, ("203.0.113.7, 10.0.0.2",), "203.0.113.7"),
+        # sem cabeçalho: o IP da ligação
+        (1, (), "10.0.0.1"),
+    ],
+)
+async def test_client_ip_uses_the_entry_added_by_the_trusted_proxy(monkeypatch, hops, forwarded, expected):
+    monkeypatch.setattr(rate_limit.settings, "RATE_LIMIT_TRUST_FORWARDED", True)
+    monkeypatch.setattr(rate_limit.settings, "RATE_LIMIT_TRUSTED_PROXY_HOPS", hops)
+    assert await client_ip(make_request(forwarded=forwarded)) == expected
+
+
+async def test_login_charges_the_username_only_for_wrong_passwords(client, db, monkeypatch):
+    monkeypatch.setattr(rate_limit.settings, "RATE_LIMIT_ENABLED", True)
+    user = await make_user(db)
+    user.password = await password_hasher.hash("secret123")
+    await db.commit()
+
+    async def login(password: str) -> int:
+        res = await client.post("/api/v1/auth/auth/login", json={"username": user.username, "password": password})
+        return res.status_code
+
+    capacity = LOGIN_PER_USERNAME.capacity
+    assert [await login("secret123") for _ in range(capacity + 1)] == [200] * (capacity + 1)
+    assert [await login("wrong-password") for _ in range(capacity + 1)] == [401] * capacity + [429]
@@ -0,0 +1,71 @@
+import pytest
+
+from app.models.course import Course
+from app.models.user import User
+
+pytestmark = pytest.mark.anyio
+
+
+async def search(client, url: str, q: str, limit: int = 50) -> list[str]:
+    # todas as páginas da pesquisa, pela ordem devolvida
+    titles, cursor = [], None
+    while True:
+        params = {"q": q, "limit": limit, **({"cursor": cursor} if cursor else {})}
+        res = await client.get(url, params=params)
+        assert res.status_code == 200, res.text
+        page = res.json()
+        titles.extend(item.get("title") or item.get("username") for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return titles
+
+
+async def add_courses(db, *titles: str) -> None:
+    db.add_all(Course(title=title, status="active") for title in titles)
+    await db.commit()
+
+
+async def test_course_search_matches_substrings_and_typos(client, db):
+    await add_courses(db, "Matemática", "Introdução à Matemática Aplicada", "Física", "Química")
+
+    # a palavra inteira nos dois títulos; "matemtica" (erro de escrita) pelo pg_trgm
+    assert set(await search(client, "/api/v1/courses/", "Matemática")) == {
+        "Matemática",
+        "Introdução à Matemática Aplicada",
+    }
+    assert "Física" not in await search(client, "/api/v1/courses/", "matemtica")
+    assert "Matemática" in await search(client, "/api/v1/courses/", "matemtica")
+
+
+async def test_like_wildcards_in_the_term_are_literal(client, db):
+    await add_courses(db, "Desconto 100%", "Desconto total", "snake_case", "snakecase")
+
+    # sem escape, "%" e "_" apanhavam todos os títulos
+    assert await search(client, "/api/v1/courses/", "%") == ["Desconto 100%"]
+    assert await search(client, "/api/v1/courses/", "_") == ["snake_case"]
+
+
+async def test_search_orders_by_relevance(client, db):
+    await add_courses(db, "Web Design", "Programação", "Programação Web")
+
+    assert (await search(client, "/api/v1/courses/", "programação web"))[0] == "Programação Web"
+
+
+async def test_search_pages_through_ties_without_repeats(client, db):
+    # relevâncias iguais: o desempate pelo id no cursor não salta nem repete linhas
+    await add_courses(db, *(f"Programação {n}" for n in range(6)))
+
+    paged = await search(client, "/api/v1/courses/", "programação", limit=2)
+    assert len(paged) == len(set(paged)) == 6
+
+
+async def test_user_search_matches_name_username_and_email(client, db):
+    db.add_all([
+        User(name="Ana Silva", username="anasilva", email="ana@escola.pt", password="x", status="active"),
+        User(name="Bruno Costa", username="bcosta", email="bruno.silva@escola.pt", password="x", status="active"),
+        User(name="Carla Dias", username="carlad", email="carla@escola.pt", password="x", status="active"),
+    ])
+    await db.commit()
+
+    assert set(await search(client, "/api/v1/users/", "silva")) == {"anasilva", "bcosta"}
+    assert await search(client, "/api/v1/users/", "carlad") == ["carlad"]
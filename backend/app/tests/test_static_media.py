@@ -0,0 +1,99 @@
+import gzip
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.utils.static_media import MediaFiles
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def media(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "MEDIA_SENDFILE_HEADER", "")
+    (tmp_path / "logo.svg").write_bytes(b"<svg>identity</svg>")
+    (tmp_path / "logo.svg.br").write_bytes(b"brotli")
+    # o httpx descomprime gzip: a variante tem de ser gzip a sério
+    (tmp_path / "logo.svg.gz").write_bytes(gzip.compress(b"<svg>gzip</svg>"))
+    (tmp_path / "plain.txt").write_bytes(b"plain")
+
+    transport = httpx.ASGITransport(app=MediaFiles(directory=str(tmp_path)))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+async def get(client, path: str, accept_encoding: str = "identity", **headers) -> httpx.Response:
+    return await client.get(path, headers={"Accept-Encoding": accept_encoding, **headers})
+
+
+async def test_each_encoding_has_its_own_etag(media):
+    identity = await get(media, "/logo.svg")
+    br = await get(media, "/logo.svg", "br, gzip")
+    gz = await get(media, "/logo.svg", "gzip")
+
+    assert identity.content == b"<svg>identity</svg>"
+    assert br.headers["content-encoding"] == "br"
+    assert gz.headers["content-encoding"] == "gzip"
+    assert gz.content == b"<svg>gzip</svg>"
+
+    tag = identity.headers["etag"].strip('"')
+    assert br.headers["etag"] == f'"{tag}-br"'
+    assert gz.headers["etag"] == f'"{tag}-gzip"'
+
+
+async def test_vary_on_every_response_of_a_path_with_variants(media):
+    identity = await get(media, "/logo.svg")
+    br = await get(media, "/logo.svg", "br")
+    ranged = await get(media, "/logo.svg", "br", Range="bytes=0-3")
+    not_modified = await get(media, "/logo.svg", "br", **{"If-None-Match": br.headers["etag"]})
+
+    for res in (identity, br, ranged, not_modified):
+        assert res.headers["vary"] == "Accept-Encoding"
+    assert ranged.status_code == 206
+    assert "content-encoding" not in ranged.headers
+    assert not_modified.status_code == 304
+
+    plain = await get(media, "/plain.txt", "br, gzip")
+    assert "vary" not in plain.headers
+
+
+async def test_etag_of_one_encoding_does_not_revalidate_another(media):
+    br = await get(media, "/logo.svg", "br")
+
+    res = await get(media, "/logo.svg", "identity", **{"If-None-Match": br.headers["etag"]})
+
+    assert res.status_code == 200
+    assert res.content == b"<svg>identity</svg>"
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("br;q=0, gzip", "gzip"),
+        ("br;q=0, gzip;q=0", None),
+        ("*;q=0.5, br;q=0", "gzip"),
+        ("*", "br"),
+        ("identity", None),
+    ],
+)
+async def test_q_zero_refuses_an_encoding(media, accept_encoding, expected):
+    res = await get(media, "/logo.svg", accept_encoding)
+
+    assert res.status_code == 200
+    assert res.headers.get("content-encoding") == expected
+
+
+async def test_multiple_ranges_are_ignored(media):
+    res = await get(media, "/logo.svg", Range="bytes=0-1, 4-5")
+
+    assert res.status_code == 200
+    assert res.content == b"<svg>identity</svg>"
+    assert "content-range" not in res.headers
+
+
+async def test_unsatisfiable_single_range_is_416(media):
+    res = await get(media, "/logo.svg", Range="bytes=100-")
+
+    assert res.status_code == 416
+    assert res.headers["content-range"] == "bytes */19"
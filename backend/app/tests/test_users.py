@@ -0,0 +1,140 @@
+import pytest
+from passlib.context import CryptContext
+from sqlalchemy import select
+
+from app.core.passwords import password_hasher
+from app.core.security import create_access_token
+from app.db.session import engine
+from app.models.role import Role
+from app.models.user import User
+from app.services.user_service import import_users_job, service as user_service
+from app.tests.factories import make_user, unique
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeJob:
+    def __init__(self, payload: dict):
+        self.payload = payload
+
+    async def progress(self, value: float) -> None:
+        pass
+
+
+def user_row(password) -> dict:
+    name = unique("aluno").replace(" ", "_")
+    return {"name": name, "username": name, "email": f"{name}@example.com", "password": password}
+
+
+async def test_import_job_queues_hashes_not_passwords(db):
+    good, short, missing = user_row("secret123"), user_row("abc"), user_row(None)
+    del missing["password"]
+
+    job = await user_service.enqueue_import(db, [good, short, missing])
+
+    queued = job.payload["rows"]
+    assert "secret123" not in str(queued)
+    assert all("password" not in row for row in queued)
+
+    report = await import_users_job(FakeJob(job.payload))
+
+    assert (report["valid"], report["created"]) == (1, 1)
+    assert [(e["row"], e["errors"]) for e in report["errors"]] == [
+        (2, ["password: String should have at least 6 characters"]),
+        (3, ["password: Field required"]),
+    ]
+    stored = (await db.execute(select(User.password).where(User.email == good["email"]))).scalar_one()
+    assert await password_hasher.verify("secret123", stored)
+
+
+async def test_sync_import_ignores_a_client_supplied_hash(db):
+    row = user_row("secret123") | {"password_hash": "$argon2id$forged"}
+
+    report = await user_service.import_users(db, [row])
+
+    assert report.created == 1
+    stored = (await db.execute(select(User.password).where(User.email == row["email"]))).scalar_one()
+    assert stored != "$argon2id$forged"
+    assert await password_hasher.verify("secret123", stored)
+
+
+async def test_login_verifies_outside_the_transaction_and_rehashes(client, db, monkeypatch):
+    user = await make_user(db)
+    old_hash = CryptContext(schemes=["argon2"], argon2__rounds=1, argon2__memory_cost=1024).hash("secret123")
+    user.password = old_hash
+    await db.commit()
+
+    checked_out = []
+    verify_and_update = password_hasher.verify_and_update
+
+    async def tracked(password, hashed):
+        # nenhuma ligação presa ao pedido durante o argon2
+        checked_out.append(engine.pool.checkedout())
+        return await verify_and_update(password, hashed)
+
+    monkeypatch.setattr(password_hasher, "verify_and_update", tracked)
+    res = await client.post("/api/v1/auth/auth/login", json={"username": user.username, "password": "secret123"})
+
+    assert res.status_code == 200, res.text
+    assert checked_out == [0]
+    stored = (await db.execute(select(User.password).where(User.id == user.id))).scalar_one()
+    assert stored != old_hash
+    assert await password_hasher.verify("secret123", stored)
+
+
+async def test_import_rows_lost_to_a_concurrent_insert_are_not_valid(db, monkeypatch):
+    existing = await make_user(db)
+    row = user_row("secret123") | {"email": existing.email}
+    other = user_row("secret123")
+
+    # o SELECT de verificação não vê o utilizador (criado por outro pedido logo a seguir)
+    async def nothing_taken(db, emails, usernames):
+        return set(), set()
+
+    monkeypatch.setattr(user_service.repo, "taken", nothing_taken)
+    report = await user_service.import_users(db, [row, other])
+
+    assert (report.total, report.valid, report.created) == (2, 1, 1)
+    assert [(e.row, e.errors) for e in report.errors] == [(1, ["Email or username already registered"])]
+
+
+async def admin_headers(db) -> dict:
+    role = Role(name="Admin")
+    db.add(role)
+    await db.flush()
+    admin = await make_user(db)
+    admin.role_id = role.id
+    await db.commit()
+    return {"Authorization": f"Bearer {create_access_token(subject=admin.id, role_id=role.id, role_name='Admin')}"}
+
+
+async def test_csv_import_reports_each_row_and_dry_run_writes_nothing(client, db):
+    headers = await admin_headers(db)
+    db.add(Role(name="Professor"))
+    await db.commit()
+    # o formato do /export/csv (BOM, ";", "Função") com a coluna da password
+    csv_data = ("\ufeff" + "\r\n".join([
+        "Nome;Username;Email;Função;Status;Password",
+        "Ana;ana;ana@escola.pt;professor;active;secret123",
+        "Rui;rui;rui@escola.pt;Diretor;active;secret123",
+        "Ana 2;ana2;ana@escola.pt;Professor;active;secret123",
+        "Eva;eva;eva@escola.pt;Professor;active;abc",
+    ])).encode("utf-8")
+    files = {"file": ("turma.csv", csv_data, "text/csv")}
+
+    dry = await client.post("/api/v1/users/import/csv", params={"dry_run": True}, files=files, headers=headers)
+    assert dry.status_code == 200, dry.text
+    report = dry.json()
+    assert (report["total"], report["valid"], report["created"], report["dry_run"]) == (4, 1, 0, True)
+    assert {e["row"]: e["errors"][0] for e in report["errors"]} == {
+        2: "role: unknown role 'Diretor'",
+        3: "email: duplicated in row 1",
+        4: "password: String should have at least 6 characters",
+    }
+    assert (await db.execute(select(User).where(User.username == "ana"))).first() is None
+
+    res = await client.post("/api/v1/users/import/csv", files=files, headers=headers)
+    assert res.status_code == 200, res.text
+    assert (res.json()["valid"], res.json()["created"]) == (1, 1)
+    ana = (await db.execute(select(User).where(User.username == "ana"))).scalar_one()
+    assert await password_hasher.verify("secret123", ana.password)
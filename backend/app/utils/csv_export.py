@@ -1,31 +1,82 @@
 import csv
 import io
-from typing import Iterable, Callable, Sequence
+import os
+from typing import AsyncIterable, AsyncIterator, Iterable, Callable, Sequence, Union
 from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 
-def stream_csv(
-    filename: str,
+async def iter_csv(
     header: Sequence[str],
-    rows: Iterable,
+    rows: Union[Iterable, AsyncIterable],
     row_mapper: Callable[[object], Sequence[object]],
     delimiter: str = ";",
-):
-    def iter_csv():
-        yield "\ufeff" 
+    flush_every: int = 500,
+) -> AsyncIterator[str]:
+    # Gera o cabeçalho logo de início e depois um bloco a cada `flush_every` linhas,
+    # por isso a memória fica constante mesmo com milhões de linhas.
+    output = io.StringIO()
+    writer = csv.writer(output, delimiter=delimiter)
+
+    def drain() -> str:
+        chunk = output.getvalue()
+        output.seek(0)
+        output.truncate(0)
+        return chunk
 
-        output = io.StringIO()
-        writer = csv.writer(output, delimiter=delimiter)
+    yield "﻿"
 
-        writer.writerow(header)
+    writer.writerow(header)
+    yield drain()
 
+    pending = 0
+    if hasattr(rows, "__aiter__"):
+        async for item in rows:
+            writer.writerow(row_mapper(item))
+            pending += 1
+            if pending >= flush_every:
+                yield drain()
+                pending = 0
+    else:
         for item in rows:
             writer.writerow(row_mapper(item))
+            pending += 1
+            if pending >= flush_every:
+                yield drain()
+                pending = 0
 
-        yield output.getvalue()
-        output.close()
+    if pending:
+        yield drain()
+    output.close()
 
+def stream_csv(
+    filename: str,
+    header: Sequence[str],
+    rows: Union[Iterable, AsyncIterable],
+    row_mapper: Callable[[object], Sequence[object]],
+    delimiter: str = ";",
+    flush_every: int = 500,
+):
     return StreamingResponse(
-        iter_csv(),
+        iter_csv(header, rows, row_mapper, delimiter, flush_every),
         media_type="text/csv; charset=utf-8",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
+
+async def write_csv(
+    path: str,
+    header: Sequence[str],
+    rows: Union[Iterable, AsyncIterable],
+    row_mapper: Callable[[object], Sequence[object]],
+    delimiter: str = ";",
+    flush_every: int = 500,
+) -> None:
+    # Mesmo formato do stream_csv, para um ficheiro (exports em background). Escreve num
+    # .part e só o renomeia no fim, para nunca servir um ficheiro a meio.
+    part_path = f"{path}.part"
+    out = await run_in_threadpool(open, part_path, "w", encoding="utf-8", newline="")
+    try:
+        async for chunk in iter_csv(header, rows, row_mapper, delimiter, flush_every):
+            await run_in_threadpool(out.write, chunk)
+    finally:
+        await run_in_threadpool(out.close)
+    await run_in_threadpool(os.replace, part_path, path)
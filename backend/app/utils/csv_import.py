@@ -0,0 +1,29 @@
+import csv
+import io
+from typing import Mapping
+
+
+def read_csv_rows(data: bytes, columns: Mapping[str, str]) -> list[dict[str, str]]:
+    # Lê um CSV (o do export, com BOM e ";", ou um simples com ",") para dicionários.
+    # `columns` mapeia o cabeçalho (sem maiúsculas) para o nome do campo; colunas
+    # desconhecidas e células vazias são ignoradas para os defaults do schema se aplicarem.
+    text = data.decode("utf-8-sig")
+    first_line = text.split("\n", 1)[0]
+    delimiter = ";" if first_line.count(";") >= first_line.count(",") else ","
+
+    reader = csv.reader(io.StringIO(text), delimiter=delimiter)
+    header = next(reader, None)
+    if not header:
+        return []
+    fields = [columns.get(h.strip().casefold()) for h in header]
+
+    rows: list[dict[str, str]] = []
+    for values in reader:
+        if not any(v.strip() for v in values):
+            continue
+        rows.append({
+            field: value.strip()
+            for field, value in zip(fields, values)
+            if field and value.strip()
+        })
+    return rows
@@ -0,0 +1,109 @@
+import hashlib
+import logging
+import os
+import uuid
+from typing import Optional
+
+from fastapi import HTTPException, UploadFile, status
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.jobs import job_runner, JobContext
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow é opcional: sem ele não há miniaturas
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+THUMBS_DIR = "thumbs"
+
+
+def sniff_image_ext(head: bytes) -> Optional[str]:
+    # tipo real pelos magic bytes, ignorando o content-type/extensão enviados pelo cliente
+    if head.startswith(b"\xff\xd8\xff"):
+        return ".jpg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return ".png"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return ".webp"
+    return None
+
+
+async def save_upload(file: UploadFile, upload_dir: str, max_bytes: int) -> str:
+    # Copia o upload para disco em blocos de CHUNK_SIZE (escritas num thread, fora do
+    # event loop) e devolve o nome do ficheiro. Acima de max_bytes responde 413.
+    # O nome é o hash do conteúdo: o URL nunca muda de conteúdo e pode ser cache "immutable".
+    head = await file.read(CHUNK_SIZE)
+    ext = sniff_image_ext(head)
+    if ext is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Formato de imagem inválido")
+
+    os.makedirs(upload_dir, exist_ok=True)
+    part_path = os.path.join(upload_dir, f"{uuid.uuid4().hex}.part")
+    digest = hashlib.sha256()
+
+    out = await run_in_threadpool(open, part_path, "wb")
+    written = 0
+    try:
+        chunk = head
+        while chunk:
+            written += len(chunk)
+            if written > max_bytes:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"Imagem maior que {max_bytes // (1024 * 1024)} MB",
+                )
+            digest.update(chunk)
+            await run_in_threadpool(out.write, chunk)
+            chunk = await file.read(CHUNK_SIZE)
+    except BaseException:
+        await run_in_threadpool(out.close)
+        await run_in_threadpool(_remove_quietly, part_path)
+        raise
+
+    await run_in_threadpool(out.close)
+
+    # o mesmo conteúdo já enviado antes acaba no mesmo ficheiro
+    filename = f"{digest.hexdigest()[:32]}{ext}"
+    await run_in_threadpool(os.replace, part_path, os.path.join(upload_dir, filename))
+    return filename
+
+
+def thumbnail_name(filename: str, size: int) -> str:
+    stem = os.path.splitext(filename)[0]
+    return f"{THUMBS_DIR}/{stem}_{size}.webp"
+
+
+def generate_thumbnails(upload_dir: str, filename: str, sizes: list[int]) -> None:
+    # Corre no job media.thumbnails (num thread): miniaturas WebP com o lado maior = size
+    if Image is None:
+        logger.warning("Pillow not installed; skipping thumbnails for %s", filename)
+        return
+
+    src = os.path.join(upload_dir, filename)
+    os.makedirs(os.path.join(upload_dir, THUMBS_DIR), exist_ok=True)
+    try:
+        with Image.open(src) as img:
+            img = img.convert("RGBA") if img.mode in ("P", "LA") else img
+            for size in sizes:
+                thumb = img.copy()
+                thumb.thumbnail((size, size))
+                thumb.save(os.path.join(upload_dir, thumbnail_name(filename, size)), "WEBP", quality=80, method=4)
+    except Exception:
+        logger.exception("Thumbnail generation failed for %s", src)
+
+
+@job_runner.handler("media.thumbnails", concurrency=2)
+async def thumbnails_job(job: JobContext) -> None:
+    p = job.payload
+    await run_in_threadpool(generate_thumbnails, p["upload_dir"], p["filename"], p["sizes"])
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,87 @@
+import base64
+import binascii
+import datetime as dt
+import json
+from typing import Any, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import ColumnElement, Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+
+def encode_cursor(key: Optional[dt.datetime | float], id_: str) -> str:
+    # key é o created_at (listagens normais) ou a relevância (pesquisa com q=)
+    raw = json.dumps([key.isoformat() if isinstance(key, dt.datetime) else key, id_])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[Optional[dt.datetime | float], str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        key, id_ = json.loads(raw)
+        if isinstance(key, str):
+            key = dt.datetime.fromisoformat(key)
+        elif key is not None and not isinstance(key, (int, float)):
+            raise ValueError(key)
+        return key, str(id_)
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+async def paginate(
+    db: AsyncSession,
+    stmt: Select,
+    model: Any,
+    *,
+    cursor: Optional[str] = None,
+    limit: int = settings.PAGE_SIZE_DEFAULT,
+    rank: Optional[ColumnElement] = None,
+) -> dict:
+    # Paginação por keyset em (created_at, id) descendente: cada página é um
+    # "WHERE (created_at, id) < (último)" + LIMIT, com o mesmo custo seja qual for a página.
+    # Modelos sem created_at (ex.: QuizAttempt, Answer) paginam só pelo id.
+    # Com rank (pesquisa) a ordem passa a (relevância, id) e o cursor guarda a relevância.
+    limit = max(1, min(limit, settings.PAGE_SIZE_MAX))
+    created_col = getattr(model, "created_at", None)
+
+    if rank is not None:
+        key_col = rank
+        stmt = stmt.add_columns(rank.label("search_rank"))
+    else:
+        key_col = created_col
+
+    if key_col is not None:
+        keys = (key_col, model.id)
+    else:
+        keys = (model.id,)
+
+    if cursor:
+        key, last_id = decode_cursor(cursor)
+        if key_col is not None:
+            expected = (int, float) if rank is not None else dt.datetime
+            if not isinstance(key, expected):
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+            stmt = stmt.where(tuple_(*keys) < tuple_(key, last_id))
+        else:
+            stmt = stmt.where(model.id < last_id)
+
+    stmt = stmt.order_by(*(k.desc() for k in keys)).limit(limit + 1)
+    result = await db.execute(stmt)
+    if rank is not None:
+        rows = list(result.all())
+        items = [row[0] for row in rows]
+        ranks = [row[1] for row in rows]
+    else:
+        items = list(result.scalars().all())
+        ranks = None
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        last = items[-1]
+        key = ranks[limit - 1] if ranks is not None else getattr(last, "created_at", None)
+        next_cursor = encode_cursor(key, last.id)
+
+    return {"items": items, "next_cursor": next_cursor}
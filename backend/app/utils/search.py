@@ -0,0 +1,23 @@
+from sqlalchemy import ColumnElement, Float, func, literal, or_
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search_clause(q: str, *columns: InstrumentedAttribute) -> ColumnElement[bool]:
+    # Substring (ILIKE) ou palavra parecida (operador <% do pg_trgm, tolera erros de
+    # escrita). Ambos usam os índices GIN gin_trgm_ops da migração de pesquisa.
+    q = q.strip()
+    term = f"%{_escape_like(q)}%"
+    return or_(
+        *(col.ilike(term, escape="\\") for col in columns),
+        *(literal(q).op("<%")(col) for col in columns),
+    )
+
+
+def search_rank(q: str, *columns: InstrumentedAttribute) -> ColumnElement[float]:
+    # relevância 0..1: melhor word_similarity entre o termo e as colunas
+    q = q.strip()
+    return func.greatest(*(func.word_similarity(q, col) for col in columns), type_=Float)
@@ -0,0 +1,175 @@
+import os
+import re
+import stat as stat_module
+from email.utils import formatdate
+from mimetypes import guess_type
+from typing import Optional
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response, StreamingResponse
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+
+from app.core.config import settings
+
+# Nomes gerados pelos uploads (hash do conteúdo ou uuid hex, opcionalmente "_<tamanho>"
+# nas miniaturas): nunca são reescritos, por isso podem ficar em cache para sempre.
+_IMMUTABLE_NAME = re.compile(r"^[0-9a-f]{32}(_\d+)?$")
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+# variantes pré-comprimidas procuradas ao lado do original (ex.: logo.svg.br)
+_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+_RANGE_CHUNK = 64 * 1024
+
+
+class _WholeFileResponse(FileResponse):
+    # O Range válido já foi tratado em _range_response; um Range ignorado (vários
+    # intervalos) não pode chegar ao FileResponse, que desde o Starlette 0.39 o aplicaria.
+    async def __call__(self, scope, receive, send) -> None:
+        headers = [(k, v) for k, v in scope["headers"] if k != b"range"]
+        await super().__call__({**scope, "headers": headers}, receive, send)
+
+
+class MediaFiles(StaticFiles):
+    # StaticFiles com Cache-Control longo + ETag forte para ficheiros imutáveis, pedidos
+    # Range, variantes .br/.gz e, opcionalmente, X-Accel-Redirect/X-Sendfile para que
+    # o proxy da frente (nginx/Apache) sirva os bytes em vez do worker Python.
+
+    def file_response(self, full_path, stat_result, scope, status_code: int = 200) -> Response:
+        request_headers = Headers(scope=scope)
+        rel_path = os.path.relpath(full_path, self.directory)
+        stem = os.path.splitext(os.path.basename(full_path))[0]
+        immutable = bool(_IMMUTABLE_NAME.match(stem))
+
+        headers = {
+            "Cache-Control": (
+                f"public, max-age={settings.MEDIA_CACHE_MAX_AGE}, immutable"
+                if immutable
+                else "public, max-age=0, must-revalidate"
+            ),
+            "Accept-Ranges": "bytes",
+        }
+        range_header = request_headers.get("range")
+        if range_header and not self._single_range(range_header):
+            # vários intervalos ou sintaxe desconhecida: ignora-se o Range e serve-se 200
+            range_header = None
+
+        # A variante .br/.gz só é escolhida sem sendfile nem Range. Tem bytes diferentes do
+        # original, por isso o ETag leva o encoding; e qualquer resposta de um caminho com
+        # variantes depende do Accept-Encoding (Vary), incluindo a do original e os 304.
+        variants = self._variants(full_path)
+        encoded = None
+        if variants and not settings.MEDIA_SENDFILE_HEADER and not range_header:
+            encoded = self._negotiate(variants, request_headers.get("accept-encoding", ""))
+        if variants:
+            headers["Vary"] = "Accept-Encoding"
+
+        etag = stem if immutable else f"{int(stat_result.st_mtime):x}-{stat_result.st_size:x}"
+        if encoded:
+            etag = f"{etag}-{encoded[0]}"
+        headers["ETag"] = f'"{etag}"'
+        headers["Last-Modified"] = formatdate(stat_result.st_mtime, usegmt=True)
+
+        if self.is_not_modified(Headers(headers), request_headers):
+            return NotModifiedResponse(Headers(headers))
+
+        media_type = guess_type(full_path)[0] or "application/octet-stream"
+
+        if settings.MEDIA_SENDFILE_HEADER:
+            headers[settings.MEDIA_SENDFILE_HEADER] = self._sendfile_target(full_path, rel_path)
+            return Response(status_code=status_code, headers=headers, media_type=media_type)
+
+        if range_header:
+            return self._range_response(full_path, stat_result.st_size, range_header, headers, media_type)
+
+        if encoded:
+            encoding, variant_path = encoded
+            headers["Content-Encoding"] = encoding
+            return _WholeFileResponse(variant_path, status_code=status_code, headers=headers, media_type=media_type)
+
+        return _WholeFileResponse(
+            full_path,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+            stat_result=stat_result,
+        )
+
+    def _sendfile_target(self, full_path: str, rel_path: str) -> str:
+        # X-Accel-Redirect (nginx) quer um URI interno; X-Sendfile (Apache/lighttpd) o caminho
+        if settings.MEDIA_SENDFILE_HEADER.lower() == "x-accel-redirect":
+            return f"{settings.MEDIA_SENDFILE_PREFIX.rstrip('/')}/{rel_path.replace(os.sep, '/')}"
+        return os.path.abspath(full_path)
+
+    def _variants(self, full_path: str) -> list[tuple[str, str]]:
+        # (encoding, caminho) das variantes pré-comprimidas que existem, por preferência
+        variants = []
+        for encoding, suffix in _ENCODINGS:
+            variant = full_path + suffix
+            try:
+                if stat_module.S_ISREG(os.stat(variant).st_mode):
+                    variants.append((encoding, variant))
+            except FileNotFoundError:
+                continue
+        return variants
+
+    def _negotiate(self, variants: list[tuple[str, str]], accept_encoding: str) -> Optional[tuple[str, str]]:
+        # encoding -> q; "gzip;q=0" (ou "*;q=0") recusa explicitamente o encoding
+        weights: dict[str, float] = {}
+        for entry in accept_encoding.split(","):
+            name, _, params = entry.partition(";")
+            name = name.strip().lower()
+            if not name:
+                continue
+            q = 1.0
+            for param in params.split(";"):
+                key, _, value = param.partition("=")
+                if key.strip().lower() == "q":
+                    try:
+                        q = float(value)
+                    except ValueError:
+                        q = 0.0
+            weights[name] = q
+        for encoding, variant in variants:
+            if weights.get(encoding, weights.get("*", 0.0)) > 0:
+                return encoding, variant
+        return None
+
+    @staticmethod
+    def _single_range(range_header: str) -> bool:
+        m = _RANGE.match(range_header.strip())
+        return bool(m and (m.group(1) or m.group(2)))
+
+    def _range_response(self, full_path: str, size: int, range_header: str, headers: dict, media_type: str) -> Response:
+        # um só intervalo ("bytes=a-b", "bytes=a-", "bytes=-n", ver _single_range); fora
+        # do ficheiro é 416
+        m = _RANGE.match(range_header.strip())
+        if m.group(1):
+            start = int(m.group(1))
+            end = int(m.group(2)) if m.group(2) else size - 1
+        else:
+            start = max(0, size - int(m.group(2)))
+            end = size - 1
+        end = min(end, size - 1)
+
+        if start > end or start >= size:
+            return Response(
+                status_code=416,
+                headers={**headers, "Content-Range": f"bytes */{size}"},
+            )
+
+        def iter_range():
+            with open(full_path, "rb") as f:
+                f.seek(start)
+                remaining = end - start + 1
+                while remaining > 0:
+                    chunk = f.read(min(_RANGE_CHUNK, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    yield chunk
+
+        headers = {
+            **headers,
+            "Content-Range": f"bytes {start}-{end}/{size}",
+            "Content-Length": str(end - start + 1),
+        }
+        return StreamingResponse(iter_range(), status_code=206, headers=headers, media_type=media_type)
@@ -0,0 +1,79 @@
+# Testes (pytest + anyio + httpx). Os que usam a BD precisam de um Postgres descartável em
+# TEST_DATABASE_URL: as tabelas são recriadas no início da sessão e esvaziadas depois de
+# cada teste. Sem essa variável esses testes são ignorados.
+#
+#   TEST_DATABASE_URL=postgresql+asyncpg://.../islanders_test python -m pytest -q
+#   ... --update-query-baseline   # regrava query_baseline.json
+
+import os
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+if TEST_DATABASE_URL:
+    # antes de qualquer import da app: a engine é criada a partir de settings.DATABASE_URL
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+
+import httpx
+import pytest
+from sqlalchemy import text
+
+pytest_plugins = ["app.testing.pytest_query_guard"]
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def schema(anyio_backend):
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL não definido")
+
+    from app.db import base  # noqa: F401 (regista os modelos)
+    from app.db.session import Base, engine
+
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    yield
+    await engine.dispose()
+
+
+async def _reset_state() -> None:
+    # caches em memória do processo: guardam ids de linhas que o TRUNCATE apagou
+    from app.core.security import clear_principals
+    from app.core.rate_limit import LocalRateLimitBackend, rate_limiter
+    from app.services.badge_service import badge_cache
+    from app.services.quiz_attempt_service import answer_key_cache
+    from app.services.quiz_service import quiz_full_cache
+
+    clear_principals()
+    badge_cache.clear()
+    answer_key_cache.clear()
+    await quiz_full_cache.invalidate_all()
+    if isinstance(rate_limiter.backend, LocalRateLimitBackend):
+        rate_limiter.backend = LocalRateLimitBackend()
+
+
+@pytest.fixture
+async def db(schema):
+    from app.db.session import Base, async_session, engine
+
+    async with async_session() as session:
+        yield session
+
+    tables = ", ".join(t.name for t in Base.metadata.sorted_tables)
+    async with engine.begin() as conn:
+        await conn.execute(text(f"TRUNCATE {tables} CASCADE"))
+    await _reset_state()
+
+
+@pytest.fixture
+async def client(db):
+    # pedidos à app pelo ASGI, sem servidor (o lifespan não corre: sem jobs nem buffer)
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
@@ -0,0 +1,6 @@
+// Miniatura WebP gerada pelo backend em cada upload:
+// /media/courses/abc.jpg -> /media/courses/thumbs/abc_200.webp
+export function thumbnailPath(path: string, size = 200): string {
+  const m = path.match(/^(.*\/media\/(?:courses|users))\/([^/]+)\.(?:jpe?g|png|webp)$/i);
+  return m ? `${m[1]}/thumbs/${m[2]}_${size}.webp` : path;
+}
@@ -0,0 +1,35 @@
+import { HttpClient, HttpParams } from '@angular/common/http';
+import { firstValueFrom } from 'rxjs';
+
+export interface Page<T> {
+  items: T[];
+  next_cursor: string | null;
+}
+
+// Igual ao PAGE_SIZE_MAX do backend
+export const PAGE_SIZE_MAX = 200;
+
+// Limite dos selects que listam uma tabela inteira (cursos, vídeos, quizzes, opções)
+export const SELECT_LIMIT = 1000;
+
+// Uma página de uma listagem por cursor (o next_cursor da anterior, ou null para a primeira).
+export function listPage<T>(http: HttpClient, url: string, cursor?: string | null, limit = PAGE_SIZE_MAX): Promise<Page<T>> {
+  let params = new HttpParams().set('limit', String(Math.min(Math.max(1, limit), PAGE_SIZE_MAX)));
+  if (cursor) params = params.set('cursor', cursor);
+  return firstValueFrom(http.get<Page<T>>(url, { params }));
+}
+
+// Para selects/lookups que precisam da lista: segue o next_cursor, mas nunca passa de `max`
+// itens (limite explícito em cada chamada, para uma tabela grande não vir inteira).
+export async function listAll<T>(http: HttpClient, url: string, max: number): Promise<T[]> {
+  const items: T[] = [];
+  let cursor: string | null = null;
+
+  do {
+    const page: Page<T> = await listPage<T>(http, url, cursor, max - items.length);
+    items.push(...page.items);
+    cursor = page.next_cursor;
+  } while (cursor && items.length < max);
+
+  return items;
+}
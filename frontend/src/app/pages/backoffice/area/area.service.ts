@@ -2,6 +2,7 @@ import { Inject, Injectable, inject } from '@angular/core';
 import { HttpClient, HttpParams } from '@angular/common/http';
 import { first, firstValueFrom } from 'rxjs';
 import { RoleOut, RoleUpdatePayload } from '../role/role.service';
+import { Page, listPage, listAll } from '../../../core/http/pagination';
 
 const API_BASE = 'http://127.0.0.1:8000/api/v1'; 
 
@@ -28,12 +29,13 @@ export class AreaService {
     private http = inject(HttpClient);
     private base = `${API_BASE}/areas`;
 
-    list(skip = 0, limit?: number): Promise<AreaOut[]> {
-        let params = new HttpParams().set('skip', String(skip));
-        if (limit !== undefined) {
-            params = params.set('limit', String(limit));
-        }
-        return firstValueFrom(this.http.get<AreaOut[]>(`${this.base}/`, { params }));
+    list(cursor?: string | null, limit?: number): Promise<Page<AreaOut>> {
+        return listPage<AreaOut>(this.http, `${this.base}/`, cursor, limit);
+    }
+
+    // selects/lookups: até `max` itens
+    listAll(max: number): Promise<AreaOut[]> {
+        return listAll<AreaOut>(this.http, `${this.base}/`, max);
     }
 
     get(area_id: string): Promise<AreaOut> {
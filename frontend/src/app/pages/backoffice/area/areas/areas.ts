@@ -4,7 +4,7 @@ import { RouterLink } from '@angular/router';
 import { FormsModule } from '@angular/forms';
 import { AreaService, AreaOut } from '../area.service';
 import { AuthState } from '../../../frontoffice/auth/auth.state';
-import { createPagination } from '../../shared/pagination';
+import { createPagination, createCursorLoader } from '../../shared/pagination';
 
 @Component({
   standalone: true,
@@ -40,10 +40,14 @@ export class Areas {
   changePage = this.pager.changePage;
   resetPage = this.pager.resetPage;
 
+  loader = createCursorLoader(cursor => this.srv.list(cursor));
+  hasMore = this.loader.hasMore;
+  loadingMore = this.loader.loadingMore;
+
   async ngOnInit() {
     this.loading.set(true);
     try {
-      const data = await this.srv.list(0, 50);
+      const data = await this.loader.first();
       this.areas.set(data);
       this.resetPage();
     } finally {
@@ -51,6 +55,11 @@ export class Areas {
     }
   }
 
+  async loadMore() {
+    const data = await this.loader.more();
+    this.areas.update(prev => [...prev, ...data]);
+  }
+
   resetFilters() {
     this.q.set('');
     this.resetPage();
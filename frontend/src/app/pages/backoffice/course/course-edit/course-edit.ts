@@ -79,8 +79,8 @@ export class CourseEdit implements OnInit {
     this.loading.set(true);
     try {
       const [areas, modalities, course] = await Promise.all([
-        this.areasSvc.list(0, 50),
-        this.modalitiesSvc.list(0, 20),
+        this.areasSvc.listAll(50),
+        this.modalitiesSvc.listAll(20),
         this.coursesSvc.getOne(this.courseId),
       ]);
 
@@ -1,6 +1,7 @@
 import { Injectable, inject } from '@angular/core';
 import { HttpClient, HttpParams } from '@angular/common/http';
 import { firstValueFrom } from 'rxjs';
+import { Page, listPage, listAll } from '../../../core/http/pagination';
 
 const API_BASE = 'http://127.0.0.1:8000/api/v1';  
 
@@ -62,13 +63,13 @@ export class CourseService {
     private http = inject(HttpClient);
     private base = `${API_BASE}/courses`;  
     
-    list(skip = 0, limit?: number): Promise<CourseOut[]> {
-    let params = new HttpParams().set('skip', String(skip));
-
-    if (limit !== undefined) {
-        params = params.set('limit', String(limit));
+    list(cursor?: string | null, limit?: number): Promise<Page<CourseOut>> {
+        return listPage<CourseOut>(this.http, `${this.base}/`, cursor, limit);
     }
-    return firstValueFrom(this.http.get<CourseOut[]>(`${this.base}/`, { params }));
+
+    // selects/lookups: até `max` itens
+    listAll(max: number): Promise<CourseOut[]> {
+        return listAll<CourseOut>(this.http, `${this.base}/`, max);
     }
 
     getOne(course_id: string): Promise<CourseOut> {
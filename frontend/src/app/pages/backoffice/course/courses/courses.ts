@@ -5,7 +5,7 @@ import { Router, RouterLink } from '@angular/router';
 import { CourseService, CourseOut } from '../course.service';
 import { AreaService, AreaOut } from '../../area/area.service';
 import { ModalityService, ModalityOut } from '../../modality/modality.service';
-import { createPagination } from '../../shared/pagination'; // <-- ajuste o path se precisar
+import { createPagination, createCursorLoader } from '../../shared/pagination'; // <-- ajuste o path se precisar
 
 type StatusLabel = 'Ativo' | 'Inativo';
 
@@ -86,39 +86,22 @@ export class Courses implements OnInit {
   changePage = this.pager.changePage;
   resetPage = this.pager.resetPage;
 
+  loader = createCursorLoader(cursor => this.coursesSvc.list(cursor));
+  hasMore = this.loader.hasMore;
+  loadingMore = this.loader.loadingMore;
+
   async ngOnInit() {
     this.loading.set(true);
     try {
-      const areas = await this.areasSvc.list(0, 50);
+      const areas = await this.areasSvc.listAll(50);
       this.areas.set(areas);
 
-      const modalities = await this.modalitySvc.list(0, 20);
+      const modalities = await this.modalitySvc.listAll(20);
       this.modalities.set(modalities);
 
-      const data: CourseOut[] = await this.coursesSvc.list(0);
-
-      this.courses.set(
-        data.map(c => {
-          const firstAreaId = c.area_ids && c.area_ids.length > 0 ? c.area_ids[0] : null;
-
-          return {
-            id: c.id,
-            title: c.title,
-            description: c.description ?? null,
-            area_id: firstAreaId,
-            areaName: firstAreaId ? (this.areasMap().get(firstAreaId) ?? 'Geral') : 'Geral',
-            modality_id: c.modality_id ?? null,
-            modalityName: c.modality_id ? (this.modalitiesMap().get(c.modality_id) ?? 'Geral') : 'Geral',
-            status: c.status === 'active' ? 'Ativo' : 'Inativo',
-            num_hours: c.num_hours ?? null,
-            credits: c.credits ?? null,
-            price: c.price ?? null,
-            photo: c.photo ?? null,
-            created_at: c.created_at,
-            updated_at: c.updated_at,
-          } as CourseRow;
-        })
-      );
+      const data: CourseOut[] = await this.loader.first();
+
+      this.courses.set(this.toRows(data));
 
       this.resetPage(); // antes era this.page.set(1)
     } finally {
@@ -126,6 +109,34 @@ export class Courses implements OnInit {
     }
   }
 
+  private toRows(data: CourseOut[]): CourseRow[] {
+    return data.map(c => {
+      const firstAreaId = c.area_ids && c.area_ids.length > 0 ? c.area_ids[0] : null;
+
+      return {
+        id: c.id,
+        title: c.title,
+        description: c.description ?? null,
+        area_id: firstAreaId,
+        areaName: firstAreaId ? (this.areasMap().get(firstAreaId) ?? 'Geral') : 'Geral',
+        modality_id: c.modality_id ?? null,
+        modalityName: c.modality_id ? (this.modalitiesMap().get(c.modality_id) ?? 'Geral') : 'Geral',
+        status: c.status === 'active' ? 'Ativo' : 'Inativo',
+        num_hours: c.num_hours ?? null,
+        credits: c.credits ?? null,
+        price: c.price ?? null,
+        photo: c.photo ?? null,
+        created_at: c.created_at,
+        updated_at: c.updated_at,
+      } as CourseRow;
+    });
+  }
+
+  async loadMore() {
+    const data = await this.loader.more();
+    this.courses.update(prev => [...prev, ...this.toRows(data)]);
+  }
+
   resetFilters() {
     this.q.set('');
     this.areaId.set('');
@@ -26,11 +26,38 @@ export interface TopStudent {
   value: number;
 }
 
+export interface DashboardSnapshot {
+  summary: Summary;
+  average_grade: AverageGrade;
+  grades_by_course: LabelValue[];
+  grades_by_quiz: LabelValue[];
+  grades_by_user: LabelValue[];
+  grade_distribution: GradeDistribution[];
+  top_students: TopStudent[];
+  users_over_time: LabelValue[];
+  quiz_attempts_over_time: LabelValue[];
+  courses_by_area: LabelValue[];
+}
+
 
 @Injectable({ providedIn: 'root' })
 export class DashboardService {
   constructor(private http: HttpClient) {}
 
+  getSnapshot(
+    usersRange: '1m' | '6m' | '1y' = '1m',
+    roleId?: string,
+    attemptsRange: '1m' | '6m' | '1y' = '1m',
+    quizId?: string
+  ): Promise<DashboardSnapshot> {
+    let params = new HttpParams()
+      .set('users_range', usersRange)
+      .set('attempts_range', attemptsRange);
+    if (roleId) params = params.set('role_id', roleId);
+    if (quizId) params = params.set('quiz_id', quizId);
+    return firstValueFrom(this.http.get<DashboardSnapshot>(`${API_BASE}/snapshot`, { params }));
+  }
+
   getTopStudents(): Promise<TopStudent[]> {
     return firstValueFrom(this.http.get<TopStudent[]>(`${API_BASE}/top-students`));
   }
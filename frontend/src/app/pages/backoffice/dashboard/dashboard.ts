@@ -79,27 +79,21 @@ export class Dashboard implements AfterViewInit {
     this.loading.set(true);
     try {
       console.log('LOAD DATA - usersOverTimeRange, roleId:', this.usersOverTimeRange, this.usersOverTimeRoleId);
-      const [
-        summary,
-        users,
-        courses,
-        quizzes,
-        distribution,
-        topStudents,
-        usersOverTime,
-        quizAttempts,
-        coursesByArea
-      ] = await Promise.all([
-        this.srv.getSummary(),
-        this.srv.getGradesByUser(),
-        this.srv.getGradesByCourse(),
-        this.srv.getGradesByQuiz(),
-        this.srv.getGradeDistribution(),
-        this.srv.getTopStudents(),
-        this.srv.getUsersOverTime(this.usersOverTimeRange, this.usersOverTimeRoleId),
-        this.srv.getQuizAttemptsOverTime(this.quizAttemptsRange, this.selectedFilter),
-        this.srv.getCoursesByArea()
-      ]);
+      const snapshot = await this.srv.getSnapshot(
+        this.usersOverTimeRange,
+        this.usersOverTimeRoleId,
+        this.quizAttemptsRange,
+        this.selectedFilter
+      );
+      const summary = snapshot.summary;
+      const users = snapshot.grades_by_user;
+      const courses = snapshot.grades_by_course;
+      const quizzes = snapshot.grades_by_quiz;
+      const distribution = snapshot.grade_distribution;
+      const topStudents = snapshot.top_students;
+      const usersOverTime = snapshot.users_over_time;
+      const quizAttempts = snapshot.quiz_attempts_over_time;
+      const coursesByArea = snapshot.courses_by_area;
 
       this.kpis.set(summary);
       this.users.set(users);
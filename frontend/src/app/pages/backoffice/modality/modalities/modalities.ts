@@ -4,7 +4,7 @@ import { RouterLink } from '@angular/router';
 import { FormsModule } from '@angular/forms';
 import { ModalityOut, ModalityService } from '../modality.service';
 import { AuthState } from '../../../frontoffice/auth/auth.state';
-import { createPagination } from '../../shared/pagination';
+import { createPagination, createCursorLoader } from '../../shared/pagination';
 
 @Component({
   standalone: true,
@@ -40,16 +40,25 @@ export class Modalities {
   changePage = this.pager.changePage;
   resetPage = this.pager.resetPage;
 
+  loader = createCursorLoader(cursor => this.srv.list(cursor));
+  hasMore = this.loader.hasMore;
+  loadingMore = this.loader.loadingMore;
+
   async ngOnInit() {
     this.loading.set(true);
     try {
-      const data = await this.srv.list(0, 20);
+      const data = await this.loader.first();
       this.modalities.set(data);
     } finally {
       this.loading.set(false);
     }
   }
 
+  async loadMore() {
+    const data = await this.loader.more();
+    this.modalities.update(prev => [...prev, ...data]);
+  }
+
   resetFilters() {
     this.q.set('');
     this.resetPage();
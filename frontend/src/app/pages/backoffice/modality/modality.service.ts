@@ -1,6 +1,7 @@
 import { Injectable, inject } from '@angular/core';
 import { HttpClient, HttpParams } from '@angular/common/http';
 import { firstValueFrom } from 'rxjs';
+import { Page, listPage, listAll } from '../../../core/http/pagination';
 
 const API_BASE = 'http://127.0.0.1:8000/api/v1'; 
 
@@ -27,14 +28,13 @@ export class ModalityService {
   private http = inject(HttpClient);
   private base = `${API_BASE}/modalities`;
 
-  list(skip = 0, limit?: number): Promise<ModalityOut[]> {
-    let params = new HttpParams().set('skip', String(skip));
-
-    if (limit !== undefined) {
-      params = params.set('limit', String(Math.min(Math.max(1, limit), 100)));
-    }
+  list(cursor?: string | null, limit?: number): Promise<Page<ModalityOut>> {
+    return listPage<ModalityOut>(this.http, `${this.base}/`, cursor, limit);
+  }
 
-    return firstValueFrom(this.http.get<ModalityOut[]>(`${this.base}/`, { params }));
+  // selects/lookups: até `max` itens
+  listAll(max: number): Promise<ModalityOut[]> {
+    return listAll<ModalityOut>(this.http, `${this.base}/`, max);
   }
 
   get(modality_id: string): Promise<ModalityOut> {
@@ -2,6 +2,7 @@
 import { Injectable, inject } from '@angular/core';
 import { HttpClient, HttpParams } from '@angular/common/http';
 import { firstValueFrom } from 'rxjs';
+import { Page, listPage, listAll } from '../../../core/http/pagination';
 
 const API_BASE = 'http://127.0.0.1:8000/api/v1';
 
@@ -25,15 +26,13 @@ export class OptionService {
   private http = inject(HttpClient);
   private base = `${API_BASE}/options`;
 
-  list(skip = 0, limit?: number): Promise<OptionOut[]> {
-    let params = new HttpParams().set('skip', String(skip));
+  list(cursor?: string | null, limit?: number): Promise<Page<OptionOut>> {
+    return listPage<OptionOut>(this.http, `${this.base}/`, cursor, limit);
+  }
 
-    if (limit !== undefined) {
-      params = params.set('limit', String(limit));
-    }
-    return firstValueFrom(
-      this.http.get<OptionOut[]>(`${this.base}/`, { params })
-    );
+  // selects/lookups: até `max` itens
+  listAll(max: number): Promise<OptionOut[]> {
+    return listAll<OptionOut>(this.http, `${this.base}/`, max);
   }
 
   getOne(option_id: string): Promise<OptionOut> {
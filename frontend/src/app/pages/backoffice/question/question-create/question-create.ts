@@ -7,6 +7,7 @@ import { QuestionService, QuestionCreatePayload } from '../question.service';
 import { QuizService, QuizOut } from '../../quiz/quiz.service';
 import { OptionService, OptionOut } from '../option.service';
 import { QuestionOptionsService } from '../question-option.service';
+import { SELECT_LIMIT } from '../../../../core/http/pagination';
 
 interface SelectedOpt { id: string; text: string; }
 
@@ -80,7 +81,7 @@ export class QuestionCreate implements OnInit {
   async ngOnInit() {
     this.loading.set(true);
     try {
-      const quizzes = await this.quizzesSvc.list(0);
+      const quizzes = await this.quizzesSvc.listAll(SELECT_LIMIT);
       this.quizzes.set(quizzes);
     } finally {
       this.loading.set(false);
@@ -94,7 +95,7 @@ export class QuestionCreate implements OnInit {
 
     this.optionsLoading.set(true);
     try {
-      const opts = await this.optionsSvc.list(0);
+      const opts = await this.optionsSvc.listAll(SELECT_LIMIT);
       this.options.set(opts);
 
       const ids = opts.map(o => o.id);
@@ -7,6 +7,7 @@ import { QuestionService, QuestionUpdatePayload } from '../question.service';
 import { QuizService, QuizOut } from '../../quiz/quiz.service';
 import { OptionService, OptionOut } from '../option.service';
 import { QuestionOptionsService, QuestionOptionOut } from '../question-option.service';
+import { SELECT_LIMIT } from '../../../../core/http/pagination';
 
 interface SelectedOpt { id: string; text: string; }
 
@@ -92,10 +93,10 @@ export class QuestionEdit implements OnInit {
 
     this.loading.set(true);
     try {
-      const quizzes = await this.quizzesSvc.list(0);
+      const quizzes = await this.quizzesSvc.listAll(SELECT_LIMIT);
       this.quizzes.set(quizzes);
 
-      const opts = await this.optionsSvc.list(0);
+      const opts = await this.optionsSvc.listAll(SELECT_LIMIT);
       this.options.set(opts);
 
       const optIds = opts.map(o => o.id);
@@ -2,6 +2,7 @@
 import { Injectable, inject } from '@angular/core';
 import { HttpClient, HttpParams } from '@angular/common/http';
 import { firstValueFrom } from 'rxjs';
+import { Page, listPage, listAll } from '../../../core/http/pagination';
 
 const API_BASE = 'http://127.0.0.1:8000/api/v1';
 
@@ -31,16 +32,13 @@ export class QuestionService {
   private http = inject(HttpClient);
   private base = `${API_BASE}/questions`;
 
-  list(skip = 0, limit?: Number): Promise<QuestionOut[]> {
-    let params = new HttpParams().set('skip', String(skip));
-
-    if (limit !== undefined) {
-      params = params.set('limit', String(limit));
-    }
+  list(cursor?: string | null, limit?: number): Promise<Page<QuestionOut>> {
+    return listPage<QuestionOut>(this.http, `${this.base}/`, cursor, limit);
+  }
 
-    return firstValueFrom(
-      this.http.get<QuestionOut[]>(`${this.base}/`, { params })
-    );
+  // selects/lookups: até `max` itens
+  listAll(max: number): Promise<QuestionOut[]> {
+    return listAll<QuestionOut>(this.http, `${this.base}/`, max);
   }
 
   getOne(question_id: string): Promise<QuestionOut> {
@@ -2,7 +2,8 @@ import { Component, OnInit, computed, signal, inject } from '@angular/core';
 import { CommonModule } from '@angular/common';
 import { FormsModule } from '@angular/forms';
 import { RouterLink } from '@angular/router';
-import { createPagination } from '../../shared/pagination';
+import { createPagination, createCursorLoader } from '../../shared/pagination';
+import { SELECT_LIMIT } from '../../../../core/http/pagination';
 
 import { QuestionService, QuestionOut } from '../question.service';
 import { QuizService, QuizOut } from '../../quiz/quiz.service';
@@ -63,28 +64,18 @@ export class Questions implements OnInit {
   changePage = this.pager.changePage;
   resetPage = this.pager.resetPage;
 
+  loader = createCursorLoader(cursor => this.questionsSvc.list(cursor));
+  hasMore = this.loader.hasMore;
+  loadingMore = this.loader.loadingMore;
+
   async ngOnInit() {
     this.loading.set(true);
     try {
-      const quizzes = await this.quizzesSvc.list(0);
+      const quizzes = await this.quizzesSvc.listAll(SELECT_LIMIT);
       this.quizzes.set(quizzes);
-      const quizMap = this.quizzesMap();
-
-      const qs: QuestionOut[] = await this.questionsSvc.list(0);
 
-      const ids = qs.map(x => x.id);
-      const countsMap = ids.length ? await this.qOptSvc.counts(ids) : {};
-
-      this.questions.set(
-        qs.map(q => ({
-          id: q.id,
-          text: q.text,
-          quiz_id: q.quiz_id,
-          quizName: quizMap.get(q.quiz_id) ?? '—',
-          optionCount: countsMap[q.id] ?? 0,
-          created_at: q.created_at,
-        }))
-      );
+      const qs: QuestionOut[] = await this.loader.first();
+      this.questions.set(await this.toRows(qs));
 
       this.resetPage();
     } finally {
@@ -92,6 +83,26 @@ export class Questions implements OnInit {
     }
   }
 
+  private async toRows(qs: QuestionOut[]): Promise<QuestionRow[]> {
+    const quizMap = this.quizzesMap();
+    const ids = qs.map(x => x.id);
+    const countsMap = ids.length ? await this.qOptSvc.counts(ids) : {};
+
+    return qs.map(q => ({
+      id: q.id,
+      text: q.text,
+      quiz_id: q.quiz_id,
+      quizName: quizMap.get(q.quiz_id) ?? '—',
+      optionCount: countsMap[q.id] ?? 0,
+      created_at: q.created_at,
+    }));
+  }
+
+  async loadMore() {
+    const rows = await this.toRows(await this.loader.more());
+    this.questions.update(prev => [...prev, ...rows]);
+  }
+
   resetFilters() {
     this.q.set('');
     this.quizNameFilter.set('');
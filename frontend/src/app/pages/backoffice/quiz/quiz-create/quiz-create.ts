@@ -49,8 +49,8 @@ export class QuizCreate implements OnInit {
     this.loading.set(true);
     try {
       const [courses, videos] = await Promise.all([
-        this.coursesSvc.list(0, 100),
-        this.videosSvc.list(0, 50),
+        this.coursesSvc.listAll(100),
+        this.videosSvc.listAll(50),
       ]);
 
       this.courses.set(courses);
@@ -6,6 +6,7 @@ import { ActivatedRoute, Router } from '@angular/router';
 import { QuizService, QuizOut, QuizUpdatePayload } from '../quiz.service';
 import { CourseService, CourseOut } from '../../course/course.service';
 import { VideoService, VideoOut } from '../../video/video.service';
+import { SELECT_LIMIT } from '../../../../core/http/pagination';
 
 @Component({
   standalone: true,
@@ -59,8 +60,8 @@ export class QuizEdit implements OnInit {
     this.loading.set(true);
     try {
       const [courses, videos, quiz] = await Promise.all([
-        this.coursesSvc.list(0),
-        this.videosSvc.list(0),
+        this.coursesSvc.listAll(SELECT_LIMIT),
+        this.videosSvc.listAll(SELECT_LIMIT),
         this.quizSvc.getOne(this.quizId),
       ]);
 
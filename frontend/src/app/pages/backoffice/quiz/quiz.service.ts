@@ -1,6 +1,7 @@
 import { Injectable, inject } from '@angular/core';
 import { HttpClient, HttpParams } from '@angular/common/http';
 import { firstValueFrom } from 'rxjs';
+import { Page, listPage, listAll } from '../../../core/http/pagination';
 
 const API_BASE = 'http://127.0.0.1:8000/api/v1';  
 
@@ -42,13 +43,13 @@ export class QuizService {
   private http = inject(HttpClient);
   private base = `${API_BASE}/quizzes`;  
 
-  list(skip = 0, limit?: Number): Promise<QuizOut[]> {
-  let params = new HttpParams().set('skip', String(skip));
-
-  if (limit !== undefined) {
-    params = params.set('limit', String(limit));
+  list(cursor?: string | null, limit?: number): Promise<Page<QuizOut>> {
+    return listPage<QuizOut>(this.http, `${this.base}/`, cursor, limit);
   }
-    return firstValueFrom(this.http.get<QuizOut[]>(`${this.base}/`, { params }));
+
+  // selects/lookups: até `max` itens
+  listAll(max: number): Promise<QuizOut[]> {
+    return listAll<QuizOut>(this.http, `${this.base}/`, max);
   }
 
   getOne(quiz_id: string): Promise<QuizOut> {
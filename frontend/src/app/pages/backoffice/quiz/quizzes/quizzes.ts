@@ -3,11 +3,12 @@ import { CommonModule } from '@angular/common';
 import { FormsModule } from '@angular/forms';
 import { Router, RouterLink } from '@angular/router';
 
-import { QuizService } from '../quiz.service';
+import { QuizService, QuizOut } from '../quiz.service';
 import { CourseService, CourseOut } from '../../course/course.service';
 import { VideoService, VideoOut } from '../../video/video.service';
 
-import { createPagination } from '../../shared/pagination';
+import { createPagination, createCursorLoader } from '../../shared/pagination';
+import { SELECT_LIMIT } from '../../../../core/http/pagination';
 
 export type StatusLabel = 'Ativo' | 'Inativo';
 
@@ -88,41 +89,23 @@ export class Quizzes implements OnInit {
   changePage = this.pager.changePage;
   resetPage = this.pager.resetPage;
 
+  loader = createCursorLoader(cursor => this.quizzesSvc.list(cursor));
+  hasMore = this.loader.hasMore;
+  loadingMore = this.loader.loadingMore;
+
   async ngOnInit() {
     this.loading.set(true);
     try {
       const [courses, videos, quizzes] = await Promise.all([
-        this.coursesSvc.list(0),
-        this.videosSvc.list(0),
-        this.quizzesSvc.list(0),
+        this.coursesSvc.listAll(SELECT_LIMIT),
+        this.videosSvc.listAll(SELECT_LIMIT),
+        this.loader.first(),
       ]);
 
       this.courses.set(courses);
       this.videos.set(videos);
 
-      this.quizzes.set(
-        quizzes.map(q => {
-          const courseName = this.coursesMap().get(q.course_id) ?? 'Sem curso';
-          const videoTitle = q.video_id
-            ? this.videosMap().get(q.video_id) ?? 'Sem título'
-            : null;
-            
-
-
-
-          return {
-            id: q.id,
-            title: q.title,
-            description: q.description ?? null,
-            status: q.status === 'active' ? 'Ativo' : 'Inativo',
-            course_id: q.course_id,
-            courseName,
-            video_id: q.video_id ?? null,
-            videoTitle,
-            created_at: q.created_at,
-          } as QuizRow;
-        })
-      );
+      this.quizzes.set(this.toRows(quizzes));
 
       this.resetPage();
     } catch (e) {
@@ -133,6 +116,32 @@ export class Quizzes implements OnInit {
     }
   }
 
+  private toRows(quizzes: QuizOut[]): QuizRow[] {
+    return quizzes.map(q => {
+      const courseName = this.coursesMap().get(q.course_id) ?? 'Sem curso';
+      const videoTitle = q.video_id
+        ? this.videosMap().get(q.video_id) ?? 'Sem título'
+        : null;
+
+      return {
+        id: q.id,
+        title: q.title,
+        description: q.description ?? null,
+        status: q.status === 'active' ? 'Ativo' : 'Inativo',
+        course_id: q.course_id,
+        courseName,
+        video_id: q.video_id ?? null,
+        videoTitle,
+        created_at: q.created_at,
+      } as QuizRow;
+    });
+  }
+
+  async loadMore() {
+    const quizzes = await this.loader.more();
+    this.quizzes.update(prev => [...prev, ...this.toRows(quizzes)]);
+  }
+
   resetFilters() {
     this.q.set('');
     this.status.set('');
@@ -1,6 +1,7 @@
 import { Injectable, inject } from '@angular/core';
 import { HttpClient, HttpParams } from '@angular/common/http';
 import { firstValueFrom } from 'rxjs';
+import { Page, listPage, listAll } from '../../../core/http/pagination';
 
 const API_BASE = 'http://127.0.0.1:8000/api/v1'; 
 
@@ -27,13 +28,13 @@ export class RoleService {
   private http = inject(HttpClient);
   private base = `${API_BASE}/roles`;
 
-  list(skip = 0, limit?: Number): Promise<RoleOut[]> {
-    let params = new HttpParams().set('skip', String(skip));
+  list(cursor?: string | null, limit?: number): Promise<Page<RoleOut>> {
+    return listPage<RoleOut>(this.http, `${this.base}/`, cursor, limit);
+  }
 
-    if (limit !== undefined) {
-      params = params.set('limit', String(limit));
-    }
-    return firstValueFrom(this.http.get<RoleOut[]>(`${this.base}/`, { params }));
+  // selects/lookups: até `max` itens
+  listAll(max: number): Promise<RoleOut[]> {
+    return listAll<RoleOut>(this.http, `${this.base}/`, max);
   }
 
   get(role_id: string): Promise<RoleOut> {
@@ -3,7 +3,7 @@ import { CommonModule } from '@angular/common';
 import { RouterLink } from '@angular/router';
 import { RoleService, RoleOut } from '../../role/role.service';
 import { FormsModule } from '@angular/forms';
-import { createPagination } from '../../shared/pagination';
+import { createPagination, createCursorLoader } from '../../shared/pagination';
 
 @Component({
   standalone: true,
@@ -39,16 +39,25 @@ export class Roles {
   changePage = this.pager.changePage;
   resetPage = this.pager.resetPage;
 
+  loader = createCursorLoader(cursor => this.srv.list(cursor));
+  hasMore = this.loader.hasMore;
+  loadingMore = this.loader.loadingMore;
+
   async ngOnInit() {
     this.loading.set(true);
     try {
-      const data = await this.srv.list(0, 20);
+      const data = await this.loader.first();
       this.roles.set(data);
     } finally {
       this.loading.set(false);
     }
   }
 
+  async loadMore() {
+    const data = await this.loader.more();
+    this.roles.update(prev => [...prev, ...data]);
+  }
+
   resetFilters() {
     this.q.set('');
     this.resetPage();
@@ -1,4 +1,5 @@
 import { Signal, computed, signal } from '@angular/core';
+import { Page } from '../../../core/http/pagination';
 
 export function createPagination<T>(filtered: Signal<T[]>, initialPageSize = 10) {
   const page = signal(1);
@@ -40,3 +41,37 @@ export function createPagination<T>(filtered: Signal<T[]>, initialPageSize = 10)
     resetPage,
   };
 }
+
+// Listagem do backend por cursor: `first` traz a primeira página e `more` a seguinte,
+// para a página acrescentar à lista em vez de pedir a tabela inteira.
+export function createCursorLoader<T>(fetchPage: (cursor: string | null) => Promise<Page<T>>) {
+  const nextCursor = signal<string | null>(null);
+  const loadingMore = signal(false);
+  const hasMore = computed(() => nextCursor() !== null);
+
+  async function first(): Promise<T[]> {
+    const page = await fetchPage(null);
+    nextCursor.set(page.next_cursor);
+    return page.items;
+  }
+
+  async function more(): Promise<T[]> {
+    const cursor = nextCursor();
+    if (!cursor || loadingMore()) return [];
+    loadingMore.set(true);
+    try {
+      const page = await fetchPage(cursor);
+      nextCursor.set(page.next_cursor);
+      return page.items;
+    } finally {
+      loadingMore.set(false);
+    }
+  }
+
+  return {
+    hasMore,
+    loadingMore,
+    first,
+    more,
+  };
+}
@@ -55,7 +55,7 @@ export class UserCreate implements OnInit {
   async ngOnInit() {
     this.loading.set(true);
     try {
-      const roles = await this.rolesSvc.list(0, 20);
+      const roles = await this.rolesSvc.listAll(20);
       this.roles.set(roles);
     } catch (e) {
       console.error('Erro ao carregar roles', e);
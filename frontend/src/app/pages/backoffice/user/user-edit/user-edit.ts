@@ -67,7 +67,7 @@ export class UserEdit implements OnInit {
     this.loading.set(true);
     try {
       const [roles, user] = await Promise.all([
-        this.rolesSvc.list(0, 20),
+        this.rolesSvc.listAll(20),
         this.usersSvc.getOne(this.userId),
       ]);
 
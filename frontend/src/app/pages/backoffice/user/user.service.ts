@@ -1,6 +1,7 @@
 import { Injectable, inject } from '@angular/core';
 import { HttpClient, HttpParams } from '@angular/common/http';
 import { firstValueFrom } from 'rxjs';
+import { Page, listPage, listAll } from '../../../core/http/pagination';
 
 const API_BASE = 'http://127.0.0.1:8000/api/v1';
 
@@ -51,11 +52,13 @@ export class UsersService {
   private http = inject(HttpClient);
   private base = `${API_BASE}/users`;
 
-  list(skip = 0, limit?: number): Promise<UserOut[]> {
-    let params = new HttpParams().set('skip', String(skip));
-    if (limit !== undefined) params = params.set('limit', String(limit));
+  list(cursor?: string | null, limit?: number): Promise<Page<UserOut>> {
+    return listPage<UserOut>(this.http, `${this.base}/`, cursor, limit);
+  }
 
-    return firstValueFrom(this.http.get<UserOut[]>(`${this.base}/`, { params }));
+  // selects/lookups: até `max` itens
+  listAll(max: number): Promise<UserOut[]> {
+    return listAll<UserOut>(this.http, `${this.base}/`, max);
   }
 
   getOne(user_id: string): Promise<UserOut> {
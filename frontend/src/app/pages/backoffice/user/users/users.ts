@@ -4,7 +4,8 @@ import { FormsModule } from '@angular/forms';
 import { Router, RouterLink } from '@angular/router';
 import { UsersService, UserOut } from  '../user.service';
 import { RoleService, RoleOut } from '../../role/role.service';
-import { createPagination } from '../../shared/pagination';
+import { createPagination, createCursorLoader } from '../../shared/pagination';
+import { thumbnailPath } from '../../../../core/http/media';
 
 type StatusLabel = 'Ativo' | 'Inativo';
 
@@ -20,6 +21,7 @@ interface UserRow {
   status: StatusLabel;
   created_at: string;
   avatar?: string | null;
+  avatarFull?: string | null;
   gender: GenderLabel;
   birthdate?: string | null;
 }
@@ -86,6 +88,10 @@ export class Users implements OnInit {
   changePage = this.pager.changePage;
   resetPage = this.pager.resetPage;
 
+  loader = createCursorLoader(cursor => this.usersSvc.list(cursor));
+  hasMore = this.loader.hasMore;
+  loadingMore = this.loader.loadingMore;
+
   private mapGender(g?: string | null): GenderLabel {
     if (!g) return '';
     if (g === 'male') return 'Masculino';
@@ -97,31 +103,39 @@ export class Users implements OnInit {
   async ngOnInit() {
     this.loading.set(true);
     try {
-      const roles = await this.rolesSvc.list(0, 20);
+      const roles = await this.rolesSvc.listAll(20);
       this.roles.set(roles);
 
-      const data: UserOut[] = await this.usersSvc.list(0, 200);
-      this.users.set(
-        data.map(u => ({
-          id: u.id,
-          name: u.name,
-          username: u.username,
-          email: u.email,
-          role_id: u.role_id ?? null,
-          roleName: u.role_id ? (this.rolesMap().get(u.role_id) ?? 'Guest') : 'Guest',
-          status: u.status === 'active' ? 'Ativo' : 'Inativo',
-          created_at: u.created_at,
-          avatar: this.buildAvatarUrl(u.photo ?? null),
-          gender: this.mapGender((u as any).gender ?? null),
-          birthdate: (u as any).birthdate ?? null,
-        }))
-      );
+      const data: UserOut[] = await this.loader.first();
+      this.users.set(this.toRows(data));
       this.resetPage();
     } finally {
       this.loading.set(false);
     }
   }
 
+  private toRows(data: UserOut[]): UserRow[] {
+    return data.map(u => ({
+      id: u.id,
+      name: u.name,
+      username: u.username,
+      email: u.email,
+      role_id: u.role_id ?? null,
+      roleName: u.role_id ? (this.rolesMap().get(u.role_id) ?? 'Guest') : 'Guest',
+      status: u.status === 'active' ? 'Ativo' : 'Inativo',
+      created_at: u.created_at,
+      avatar: this.buildAvatarUrl(u.photo ? thumbnailPath(u.photo) : null),
+      avatarFull: this.buildAvatarUrl(u.photo ?? null),
+      gender: this.mapGender((u as any).gender ?? null),
+      birthdate: (u as any).birthdate ?? null,
+    }));
+  }
+
+  async loadMore() {
+    const data = await this.loader.more();
+    this.users.update(prev => [...prev, ...this.toRows(data)]);
+  }
+
   resetFilters() {
     this.q.set('');
     this.roleId.set('');
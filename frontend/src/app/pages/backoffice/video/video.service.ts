@@ -1,6 +1,7 @@
 import { Injectable, inject } from '@angular/core';
 import { HttpClient, HttpParams } from '@angular/common/http';
 import { firstValueFrom } from 'rxjs';
+import { Page, listPage, listAll } from '../../../core/http/pagination';
 
 const API_BASE = 'http://127.0.0.1:8000/api/v1';
 
@@ -30,15 +31,13 @@ export class VideoService {
   private http = inject(HttpClient);
   private base = `${API_BASE}/videos`;
 
-  list(skip = 0, limit?: Number): Promise<VideoOut[]> {
-    let params = new HttpParams().set('skip', String(skip));
+  list(cursor?: string | null, limit?: number): Promise<Page<VideoOut>> {
+    return listPage<VideoOut>(this.http, `${this.base}/`, cursor, limit);
+  }
 
-    if (limit !== undefined) {
-      params = params.set('limit', String(limit));
-    }
-    return firstValueFrom(
-      this.http.get<VideoOut[]>(`${this.base}/`, { params })
-    );
+  // selects/lookups: até `max` itens
+  listAll(max: number): Promise<VideoOut[]> {
+    return listAll<VideoOut>(this.http, `${this.base}/`, max);
   }
 
   getOne(video_id: string): Promise<VideoOut> {
@@ -3,7 +3,7 @@ import { CommonModule } from '@angular/common';
 import { FormsModule } from '@angular/forms';
 import { Router, RouterLink } from '@angular/router';
 import { VideoService, VideoOut } from  '../video.service';
-import { createPagination } from '../../shared/pagination';
+import { createPagination, createCursorLoader } from '../../shared/pagination';
 
 interface VideoRow {
   id: string;
@@ -53,21 +53,17 @@ export class Videos implements OnInit {
   changePage = this.pager.changePage;
   resetPage = this.pager.resetPage;
 
+  loader = createCursorLoader(cursor => this.videosSvc.list(cursor));
+  hasMore = this.loader.hasMore;
+  loadingMore = this.loader.loadingMore;
+
   async ngOnInit() {
     this.loading.set(true);
 
     try {
-      const data: VideoOut[] = await this.videosSvc.list(0);
-
-      this.videos.set(
-        data.map(v => ({
-          id: v.id,
-          title: v.title,
-          description: v.description ?? null,
-          video_url: v.video_url,
-          created_at: v.created_at,
-        }))
-      );
+      const data: VideoOut[] = await this.loader.first();
+
+      this.videos.set(this.toRows(data));
 
       this.resetPage();
     } finally {
@@ -75,6 +71,21 @@ export class Videos implements OnInit {
     }
   }
 
+  private toRows(data: VideoOut[]): VideoRow[] {
+    return data.map(v => ({
+      id: v.id,
+      title: v.title,
+      description: v.description ?? null,
+      video_url: v.video_url,
+      created_at: v.created_at,
+    }));
+  }
+
+  async loadMore() {
+    const data = await this.loader.more();
+    this.videos.update(prev => [...prev, ...this.toRows(data)]);
+  }
+
   resetFilters() {
     this.q.set('');
     this.resetPage();
@@ -1,6 +1,7 @@
 import { Component, OnInit, signal, inject } from '@angular/core';
 import { RouterLink } from '@angular/router';
 import { CommonModule } from '@angular/common';
+import { thumbnailPath } from '../../../core/http/media';
 import { FormsModule } from '@angular/forms';
 import { CourseService, CourseOut } from '../../backoffice/course/course.service';
 import { ModalityService, ModalityOut } from '../../backoffice/modality/modality.service';
@@ -16,6 +17,7 @@ interface CourseCard {
   hours: number;
   price: number;
   image: string;
+  fullImage: string;
   link: string;
 }
 
@@ -52,9 +54,9 @@ export class CoursesList implements OnInit {
         ModalityOut[],
         AreaOut[]
       ] = await Promise.all([
-        this.coursesSvc.list(0, 100),
-        this.modalitiesSvc.list(0, 100),
-        this.areasSvc.list(0, 100),
+        this.coursesSvc.listAll(100),
+        this.modalitiesSvc.listAll(100),
+        this.areasSvc.listAll(100),
       ]);
 
       const modalityMap = new Map(modalitiesData.map(m => [m.id, m.name]));
@@ -76,7 +78,8 @@ export class CoursesList implements OnInit {
           areas: (c.area_ids ?? []).map(id => areaMap.get(id)!).filter(Boolean),
           hours: c.num_hours ?? 0,
           price: c.price ?? 0,
-          image: c.photo ? `${BACKEND_URL}${c.photo}` : '',
+          image: c.photo ? `${BACKEND_URL}${thumbnailPath(c.photo)}` : '',
+          fullImage: c.photo ? `${BACKEND_URL}${c.photo}` : '',
           link: `/curso/${c.id}`,
         }));
 
@@ -3,6 +3,7 @@ import { RouterLink } from '@angular/router';
 import { CourseService, CourseOut } from '../../backoffice/course/course.service';
 import { ModalityService, ModalityOut } from '../../backoffice/modality/modality.service';
 import { CommonModule } from '@angular/common';
+import { thumbnailPath } from '../../../core/http/media';
 
 interface CourseCard {
   id: string;
@@ -13,6 +14,7 @@ interface CourseCard {
   hours: number;
   price: number;
   image: string;
+  fullImage: string;
   link: string;
 }
 
@@ -35,8 +37,8 @@ export class Home implements OnInit {
 
     try {
       const [data, modalities]: [CourseOut[], ModalityOut[]] = await Promise.all([
-        this.coursesSvc.list(0, 100),
-        this.modalitiesSvc.list(0, 100)
+        this.coursesSvc.listAll(100),
+        this.modalitiesSvc.listAll(100)
       ]);
 
       const modalityMap = new Map(modalities.map(m => [m.id, m.name]));
@@ -52,7 +54,8 @@ export class Home implements OnInit {
           modality_name: modalityMap.get(c.modality_id ?? ''),
           hours: c.num_hours ?? 0,
           price: c.price ?? 0,
-          image: c.photo ? `${BACKEND_URL}${c.photo}` : '',
+          image: c.photo ? `${BACKEND_URL}${thumbnailPath(c.photo)}` : '',
+          fullImage: c.photo ? `${BACKEND_URL}${c.photo}` : '',
           link: `/curso/${c.id}`
         }));
 
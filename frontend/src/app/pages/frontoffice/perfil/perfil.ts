@@ -139,7 +139,7 @@ export class Perfil implements OnInit {
       const currentUser = this.auth.user();
       if (!currentUser) throw new Error('Usuário não está logado');
 
-      const rolesList = await this.rolesSvc.list(0, 50);
+      const rolesList = await this.rolesSvc.listAll(50);
       this.roles.set(rolesList);
 
       const userData = await this.usersSvc.getOne(currentUser.id);
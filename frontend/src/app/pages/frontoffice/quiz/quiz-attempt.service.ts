@@ -32,6 +32,17 @@ export interface FinishAttemptOut {
   badge_awarded?: BadgeOut | null;
 }
 
+export interface AttemptAnswerIn {
+  question_id: string;
+  option_id?: string | null;
+}
+
+export interface AttemptAnswersOut {
+  answers: { id: string; attempt_id: string; question_id: string; option_id?: string | null }[];
+  attempt?: QuizAttemptOut | null;
+  badge_awarded?: BadgeOut | null;
+}
+
 @Injectable({ providedIn: 'root' })
 export class QuizAttemptService {
   private http = inject(HttpClient);
@@ -45,6 +56,12 @@ export class QuizAttemptService {
     return firstValueFrom(this.http.post<FinishAttemptOut>(`${this.base}/${attemptId}/finish`, {}));
   }
 
+  submitAnswers(attemptId: string, answers: AttemptAnswerIn[], finish = false): Promise<AttemptAnswersOut> {
+    return firstValueFrom(
+      this.http.post<AttemptAnswersOut>(`${this.base}/${attemptId}/answers`, { answers, finish })
+    );
+  }
+
   listByUser(userId: string): Promise<QuizAttemptOut[]> {
     return firstValueFrom(
       this.http.get<QuizAttemptOut[]>(`${this.base}/by_user/${userId}`)
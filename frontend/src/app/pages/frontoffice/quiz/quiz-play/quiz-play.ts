@@ -6,7 +6,6 @@ import { QuizService, QuizOut } from '../../../backoffice/quiz/quiz.service';
 import { QuestionService, QuestionOut } from '../../../backoffice/question/question.service';
 import { OptionService, OptionOut } from '../../../backoffice/question/option.service';
 import { QuestionOptionsService } from '../../../backoffice/question/question-option.service';
-import { AnswerService } from '../answer.service';
 import { BadgeOut, QuizAttemptService } from '../quiz-attempt.service';
 
 type QuestionVM = {
@@ -34,7 +33,6 @@ export class QuizPlay implements OnInit {
   private questionsSvc = inject(QuestionService);
   private optionsSvc = inject(OptionService);
   private qOptSvc = inject(QuestionOptionsService);
-  private answersSvc = inject(AnswerService);
   private attemptsSvc = inject(QuizAttemptService);
 
   loading = signal(false);
@@ -89,10 +87,10 @@ export class QuizPlay implements OnInit {
       const quiz = await this.quizzesSvc.getOne(this.quizId);
       this.quiz.set(quiz);
 
-      const allQuestions: QuestionOut[] = await this.questionsSvc.list(0, 100);
+      const allQuestions: QuestionOut[] = await this.questionsSvc.listAll(100);
       const quizQuestions = allQuestions.filter(q => q.quiz_id === this.quizId);
 
-      const allOptions: OptionOut[] = await this.optionsSvc.list(0, 100);
+      const allOptions: OptionOut[] = await this.optionsSvc.listAll(100);
       const optMap = new Map(allOptions.map(o => [o.id, o.text]));
 
       const vms: QuestionVM[] = [];
@@ -188,18 +186,16 @@ export class QuizPlay implements OnInit {
         finished_at: null,
       });
 
-      await Promise.all(
-        this.questions().map(q =>
-          this.answersSvc.create({
-            attempt_id: attempt.id,
-            question_id: q.id,
-            option_id: this.selectedByQuestion()[q.id],
-          })
-        )
+      // todas as respostas num só pedido, corrigidas na mesma transação
+      const finished = await this.attemptsSvc.submitAnswers(
+        attempt.id,
+        this.questions().map(q => ({
+          question_id: q.id,
+          option_id: this.selectedByQuestion()[q.id],
+        })),
+        true
       );
-
-      const finished = await this.attemptsSvc.finish(attempt.id);
-      this.finalScore.set(finished.attempt.score);
+      this.finalScore.set(finished.attempt!.score);
       this.badgeAwarded.set(finished.badge_awarded ?? null);
       this.showScoreModal.set(true);
 